@@ -12,6 +12,8 @@ def create_api_app(config):
     # 설정
     app.config['JWT_SECRET_KEY'] = config['authentication']['jwt_secret_key']
     app.config['JWT_ACCESS_TOKEN_EXPIRES'] = config['authentication']['jwt_access_token_expires']
+    # 토큰 오류(401/422)를 Flask-RESTful 이 500 으로 바꾸지 않고 JWT 오류 처리기로 전달
+    app.config['PROPAGATE_EXCEPTIONS'] = True
     
     # CORS 설정
     CORS(app, origins=config['api']['cors_origins'])
@@ -0,0 +1,787 @@
+# api/routes.py - API 라우트 정의
+
+from flask import request, Response, stream_with_context
+from flask_restful import Resource, reqparse, inputs
+from flask_jwt_extended import jwt_required
+import sqlite3
+import pandas as pd
+from datetime import datetime
+import logging
+
+from core.database import get_connection, transaction, run_write
+from core.events import publish
+from modules.inventory.stock import post_stock, InsufficientStockError, ItemNotFoundError
+from modules.inventory.valuation import get_valuation, get_valuation_method, VALUE_COLUMNS
+from modules.inventory.checkpoints import balances_as_of, month_end_report
+from modules.inventory.safety_stock import propose_safety_stock, get_proposals, apply_proposals
+from modules.inventory.bom import explode, requirements, implode, where_used, set_bom
+from modules.mes.ingest import ingest_production, IngestError
+from modules.mes.rollups import get_hourly_summary
+from modules.mes.oee import get_oee, record_downtime, set_standard, GROUP_COLUMNS, SHIFTS
+from modules.mes.telemetry import get_series
+from modules.mes.scheduler import create_work_order, schedule_orders, get_gantt
+from modules.mes.export import fetch_page, decode_cursor, stream_ndjson, stream_csv
+from modules.quality.genealogy import trace, get_lot_events, recall_report, link_lots, record_shipment
+from .auth import Login, CurrentUser, UserList, check_permission, current_identity
+
+logger = logging.getLogger(__name__)
+
+
+class QueryArgument(reqparse.Argument):
+    """쿼리 문자열 인자 - GET 요청에는 JSON 본문이 없으므로 args 에서만 읽음"""
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('location', 'args')
+        super().__init__(*args, **kwargs)
+
+
+# 생산 실적 스트리밍 내보내기 형식
+STREAM_FORMATS = {
+    'ndjson': (stream_ndjson, 'application/x-ndjson'),
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+}
+
+# MES API
+class ProductionList(Resource):
+    """생산 실적 목록 API"""
+    @jwt_required()
+    def get(self):
+        """키셋 페이지 조회 (format=ndjson/csv 이면 스트리밍 내보내기)"""
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('start_date', type=str, default=None)
+        parser.add_argument('end_date', type=str, default=None)
+        parser.add_argument('limit', type=int, default=None)
+        parser.add_argument('cursor', type=str, default=None)
+        parser.add_argument('format', type=str, default='json', choices=('json', 'ndjson', 'csv'))
+        args = parser.parse_args()
+        
+        if args['cursor']:
+            try:
+                decode_cursor(args['cursor'])
+            except ValueError:
+                return {'message': 'Invalid cursor'}, 400
+        
+        try:
+            if args['format'] != 'json':
+                stream, mimetype = STREAM_FORMATS[args['format']]
+                chunks = stream(args['start_date'], args['end_date'],
+                                cursor=args['cursor'], limit=args['limit'])
+                return Response(stream_with_context(chunks), mimetype=mimetype, headers={
+                    'Content-Disposition': f"attachment; filename=work_logs.{args['format']}"
+                })
+            
+            records, next_cursor = fetch_page(args['start_date'], args['end_date'],
+                                              args['limit'], args['cursor'])
+            return {
+                'data': records,
+                'total': len(records),
+                'next_cursor': next_cursor
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get production list error: {e}")
+            return {'message': 'Internal server error'}, 500
+    
+    @jwt_required()
+    def post(self):
+        """생산 실적 등록"""
+        parser = reqparse.RequestParser()
+        parser.add_argument('lot_number', required=True)
+        parser.add_argument('work_date', required=True)
+        parser.add_argument('process', required=True)
+        parser.add_argument('plan_qty', type=int, required=True)
+        parser.add_argument('prod_qty', type=int, required=True)
+        parser.add_argument('defect_qty', type=int, default=0)
+        args = parser.parse_args()
+        
+        current_user = current_identity()
+        
+        try:
+            with transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO work_logs 
+                    (lot_number, work_date, process, worker_id, 
+                     plan_qty, prod_qty, defect_qty)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (args['lot_number'], args['work_date'], args['process'],
+                      current_user['user_id'], args['plan_qty'], 
+                      args['prod_qty'], args['defect_qty']))
+                
+                work_id = cursor.lastrowid
+            
+            publish('mes')
+            return {
+                'message': 'Production record created',
+                'id': work_id
+            }, 201
+            
+        except Exception as e:
+            logger.error(f"Create production record error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class ProductionBatch(Resource):
+    """생산 실적 일괄 등록 API (JSON 배열 / NDJSON / CSV)"""
+    @jwt_required()
+    def post(self):
+        """유효한 행만 한 트랜잭션에서 등록하고 행별 오류 반환"""
+        current_user = current_identity()
+        
+        try:
+            result = ingest_production(request.get_data(), request.mimetype,
+                                       worker_id=current_user['user_id'])
+        except IngestError as e:
+            return {'message': str(e)}, e.status
+        except Exception as e:
+            logger.error(f"Bulk production ingest error: {e}")
+            return {'message': 'Internal server error'}, 500
+        
+        if result['inserted']:
+            publish('mes')
+        
+        if not result['error_count']:
+            status = 201
+        elif result['inserted']:
+            status = 207
+        else:
+            status = 400
+        return result, status
+
+class ProductionHourly(Resource):
+    """시간대별 생산 실적 API (시간대별 집계 테이블)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('date', type=str, default=None)
+        parser.add_argument('process', type=str, default=None)
+        args = parser.parse_args()
+        
+        work_date = args['date'] or datetime.now().strftime('%Y-%m-%d')
+        
+        try:
+            df = get_hourly_summary(f"{work_date} 00:00", f"{work_date} 23:00", args['process'])
+            return {
+                'date': work_date,
+                'data': df.to_dict('records'),
+                'total_prod': int(df['total_prod'].sum()) if len(df) else 0
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get hourly production error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class OeeSummary(Resource):
+    """OEE 조회 API (교대별 OEE 집계)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('start_date', type=str, required=True)
+        parser.add_argument('end_date', type=str, required=True)
+        parser.add_argument('group_by', type=str, default='line_code')
+        parser.add_argument('process', type=str, default=None)
+        parser.add_argument('line_code', type=str, default=None)
+        args = parser.parse_args()
+        
+        group_by = [c.strip() for c in args['group_by'].split(',') if c.strip()]
+        if any(c not in GROUP_COLUMNS for c in group_by):
+            return {'message': f"group_by must be in {', '.join(GROUP_COLUMNS)}"}, 400
+        
+        try:
+            df = get_oee(args['start_date'], args['end_date'], by=group_by,
+                         process=args['process'], line_code=args['line_code'])
+            columns = group_by + ['availability', 'performance', 'quality', 'oee',
+                                  'planned_min', 'run_min', 'prod_qty', 'good_qty']
+            return {
+                'data': df[columns].to_dict('records'),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get OEE error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class DowntimeEvents(Resource):
+    """비가동 이력 등록 API"""
+    @jwt_required()
+    def post(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument('event_date', required=True)
+        parser.add_argument('process', required=True)
+        parser.add_argument('duration_min', type=float, required=True)
+        parser.add_argument('shift', default=None, choices=tuple(SHIFTS))
+        parser.add_argument('line_code', default='')
+        parser.add_argument('start_time', default=None)
+        parser.add_argument('reason_code', default=None)
+        parser.add_argument('planned', type=inputs.boolean, default=False)
+        parser.add_argument('remarks', default=None)
+        args = parser.parse_args()
+        
+        current_user = current_identity()
+        
+        try:
+            with transaction() as conn:
+                event_id = record_downtime(
+                    conn, args['event_date'], args['process'], args['duration_min'],
+                    shift=args['shift'], line_code=args['line_code'],
+                    reason_code=args['reason_code'], planned=args['planned'],
+                    start_time=args['start_time'], remarks=args['remarks'],
+                    created_by=current_user['user_id']
+                )
+            
+            publish('mes')
+            return {
+                'message': 'Downtime event created',
+                'id': event_id
+            }, 201
+            
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Create downtime event error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class OeeStandards(Resource):
+    """OEE 기준 정보(이상 사이클 타임) 등록 API"""
+    @check_permission('manager')
+    def post(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument('process', required=True)
+        parser.add_argument('ideal_cycle_sec', type=float, required=True)
+        parser.add_argument('line_code', default='')
+        parser.add_argument('shift_minutes', type=float, default=480)
+        args = parser.parse_args()
+        
+        if args['ideal_cycle_sec'] <= 0 or args['shift_minutes'] <= 0:
+            return {'message': 'ideal_cycle_sec and shift_minutes must be positive'}, 400
+        
+        try:
+            set_standard(args['process'], args['ideal_cycle_sec'],
+                         line_code=args['line_code'], shift_minutes=args['shift_minutes'])
+            publish('mes')
+            return {'message': 'OEE standard saved'}, 200
+            
+        except Exception as e:
+            logger.error(f"Save OEE standard error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class WorkOrderList(Resource):
+    """작업지시 등록 API (라우팅 공정 작업 생성)"""
+    @jwt_required()
+    def post(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument('order_no', required=True)
+        parser.add_argument('product_code', required=True)
+        parser.add_argument('quantity', type=int, required=True)
+        parser.add_argument('due_date', required=True)
+        parser.add_argument('priority', type=int, default=5, choices=range(1, 10))
+        parser.add_argument('release_date', default=None)
+        parser.add_argument('lot_number', default=None)
+        parser.add_argument('sales_order_number', default=None)
+        parser.add_argument('schedule', type=inputs.boolean, default=False)
+        args = parser.parse_args()
+        
+        try:
+            with transaction(immediate=True) as conn:
+                operations = create_work_order(
+                    conn, args['order_no'], args['product_code'], args['quantity'], args['due_date'],
+                    priority=args['priority'], release_date=args['release_date'],
+                    lot_number=args['lot_number'], sales_order_number=args['sales_order_number']
+                )
+            
+            # 요청 시 현재 순서를 유지한 채 새 작업지시만 끼워 넣음
+            result = schedule_orders(keep_sequence=True) if args['schedule'] else None
+            if result is None:
+                publish('mes')
+            return {
+                'message': 'Work order created',
+                'order_no': args['order_no'],
+                'operations': operations,
+                'schedule': result
+            }, 201
+            
+        except sqlite3.IntegrityError:
+            return {'message': 'Work order already exists'}, 409
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Create work order error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class WorkOrderSchedule(Resource):
+    """작업지시 일정 API (조회 / 전체 재계획)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('start', type=str, default=None)
+        parser.add_argument('end', type=str, default=None)
+        parser.add_argument('resource_code', type=str, default=None)
+        args = parser.parse_args()
+        
+        try:
+            df = get_gantt(args['start'], args['end'], args['resource_code'])
+            return {
+                'data': df.to_dict('records'),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get schedule error: {e}")
+            return {'message': 'Internal server error'}, 500
+    
+    @check_permission('manager')
+    def post(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument('time_limit', type=float, default=0.5)
+        args = parser.parse_args()
+        
+        try:
+            return schedule_orders(time_limit=min(max(args['time_limit'], 0), 10)), 200
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Schedule work orders error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class TelemetrySeries(Resource):
+    """설비 텔레메트리 시계열 조회 API (원본 / 1분 / 1시간)"""
+    RESOLUTIONS = {'raw': None, '1m': 60, '1h': 3600}
+    
+    @jwt_required()
+    def get(self, tag):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('start', type=str, default=None)
+        parser.add_argument('end', type=str, default=None)
+        parser.add_argument('resolution', type=str, default='1m', choices=tuple(self.RESOLUTIONS))
+        args = parser.parse_args()
+        
+        try:
+            end = datetime.fromisoformat(args['end']).timestamp() if args['end'] else datetime.now().timestamp()
+            start = datetime.fromisoformat(args['start']).timestamp() if args['start'] else end - 3600
+        except ValueError:
+            return {'message': 'start/end must be ISO datetime'}, 400
+        
+        try:
+            df = get_series(tag, start, end, self.RESOLUTIONS[args['resolution']])
+            df['ts'] = [datetime.fromtimestamp(ts).isoformat(timespec='seconds') for ts in df['ts']]
+            return {
+                'tag': tag,
+                'resolution': args['resolution'],
+                'data': df.to_dict('records'),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get telemetry series error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+# 품질 API
+def _records(df):
+    """DataFrame -> JSON 행 목록 (결측은 null)"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+class LotTrace(Resource):
+    """LOT 계보 추적 API"""
+    @jwt_required()
+    def get(self, lot_number):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('direction', type=str, default='forward', choices=('forward', 'backward'))
+        parser.add_argument('events', type=inputs.boolean, default=False)
+        args = parser.parse_args()
+        
+        try:
+            result = trace(lot_number, args['direction'])
+            response = {
+                'lot_number': lot_number,
+                'direction': args['direction'],
+                'lots': result['lots'],
+                'links': _records(result['links']),
+                'truncated': result['truncated']
+            }
+            if args['events']:
+                response['events'] = _records(get_lot_events(lot_number, args['direction']))
+            return response, 200
+            
+        except Exception as e:
+            logger.error(f"Trace lot error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class LotRecall(Resource):
+    """리콜 보고 API (LOT 이 들어간 하위 LOT 의 출하 고객/성적서)"""
+    @jwt_required()
+    def get(self, lot_number):
+        try:
+            report = recall_report(lot_number)
+            return {
+                'lot_number': lot_number,
+                'affected_lots': report['affected_lots'],
+                'customers': _records(report['customers']),
+                'shipments': _records(report['shipments']),
+                'certificates': _records(report['certificates'])
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Recall report error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class LotLinks(Resource):
+    """투입/산출 LOT 연결 등록 API (목록 일괄)"""
+    @jwt_required()
+    def post(self):
+        links = request.get_json(silent=True)
+        if isinstance(links, dict):
+            links = links.get('links', [links])
+        if not isinstance(links, list) or not links:
+            return {'message': 'No links'}, 400
+        
+        try:
+            with transaction(immediate=True) as conn:
+                count = link_lots(conn, links)
+            
+            publish('quality')
+            return {
+                'message': 'Lot links saved',
+                'count': count
+            }, 201
+            
+        except (ValueError, AttributeError, TypeError) as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Save lot links error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class LotShipments(Resource):
+    """출하 LOT 등록 API"""
+    @jwt_required()
+    def post(self):
+        parser = reqparse.RequestParser()
+        parser.add_argument('lot_number', required=True)
+        parser.add_argument('ship_date', required=True)
+        parser.add_argument('customer_code', required=True)
+        parser.add_argument('order_number', default=None)
+        parser.add_argument('delivery_number', default=None)
+        parser.add_argument('product_code', default=None)
+        parser.add_argument('quantity', type=float, default=None)
+        args = parser.parse_args()
+        
+        try:
+            with transaction() as conn:
+                shipment_id = record_shipment(
+                    conn, args['lot_number'], args['ship_date'], args['customer_code'],
+                    order_number=args['order_number'], delivery_number=args['delivery_number'],
+                    product_code=args['product_code'], quantity=args['quantity']
+                )
+            
+            publish('quality')
+            return {
+                'message': 'Shipment created',
+                'id': shipment_id
+            }, 201
+            
+        except Exception as e:
+            logger.error(f"Create shipment error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+# 재고 API
+class InventoryList(Resource):
+    """재고 현황 API"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('category', type=str, default=None)
+        parser.add_argument('low_stock', type=inputs.boolean, default=False)
+        args = parser.parse_args()
+        
+        try:
+            conn = get_connection()
+            
+            query = "SELECT * FROM item_master WHERE 1=1"
+            params = []
+            
+            if args['category']:
+                query += " AND category = ?"
+                params.append(args['category'])
+            
+            if args['low_stock']:
+                query += " AND current_stock < safety_stock"
+            
+            query += " ORDER BY item_code"
+            
+            df = pd.read_sql_query(query, conn, params=params)
+            conn.close()
+            
+            return {
+                'data': df.to_dict('records'),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get inventory list error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class InventoryValuation(Resource):
+    """재고 평가 API (이동평균 / FIFO 증분 평가액)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('method', type=str, default=None, choices=tuple(VALUE_COLUMNS))
+        parser.add_argument('category', type=str, default=None)
+        args = parser.parse_args()
+        
+        try:
+            method = args['method'] or get_valuation_method()
+            df = get_valuation(method, args['category'])
+            return {
+                'method': method,
+                'data': _records(df),
+                'total': len(df),
+                'total_value': float(df['stock_value'].sum())
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get inventory valuation error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class InventoryAsOf(Resource):
+    """기준일 재고 API (기간말 체크포인트 + 이후 이동)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('date', type=str, required=True)
+        parser.add_argument('item_code', type=str, default=None)
+        parser.add_argument('warehouse', type=str, default=None)
+        parser.add_argument('month_end_from', type=str, default=None)
+        args = parser.parse_args()
+        
+        try:
+            datetime.strptime(args['date'], '%Y-%m-%d')
+            if args['month_end_from']:
+                datetime.strptime(args['month_end_from'], '%Y-%m')
+        except ValueError:
+            return {'message': 'Invalid date'}, 400
+        
+        try:
+            if args['month_end_from']:
+                # month_end_from ~ date 가 속한 달의 월말 재고
+                df = month_end_report(args['month_end_from'], args['date'][:7], args['item_code'])
+            else:
+                df = balances_as_of(args['date'], args['item_code'], args['warehouse'])
+            return {
+                'date': args['date'],
+                'data': _records(df),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get inventory as-of error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class InventorySafetyStock(Resource):
+    """안전재고/발주점 최적화 API (제안 조회 / 계산 / 적용)"""
+    @jwt_required()
+    def get(self):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('status', type=str, default='proposed', choices=('proposed', 'applied'))
+        parser.add_argument('limit', type=int, default=None)
+        args = parser.parse_args()
+        
+        try:
+            df = get_proposals(args['status'], args['limit'])
+            return {
+                'status': args['status'],
+                'data': _records(df),
+                'total': len(df)
+            }, 200
+            
+        except Exception as e:
+            logger.error(f"Get safety stock proposals error: {e}")
+            return {'message': 'Internal server error'}, 500
+    
+    @check_permission('manager')
+    def post(self):
+        """{'action': 'compute', 'service_level'?, 'as_of'?} 또는 {'action': 'apply', 'item_codes'?}"""
+        body = request.get_json(silent=True) or {}
+        action = body.get('action', 'compute')
+        
+        try:
+            if action == 'apply':
+                item_codes = body.get('item_codes')
+                if item_codes is not None and not isinstance(item_codes, list):
+                    return {'message': 'item_codes must be a list'}, 400
+                applied = run_write(apply_proposals, item_codes)
+                publish('inventory')
+                return {'message': 'Proposals applied', 'applied': applied}, 200
+            if action != 'compute':
+                return {'message': "action must be 'compute' or 'apply'"}, 400
+            
+            service_level = body.get('service_level')
+            summary = propose_safety_stock(float(service_level) if service_level is not None else None,
+                                           body.get('as_of'))
+            return {'message': 'Proposals computed', **summary}, 200
+            
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Safety stock optimizer error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class StockMovement(Resource):
+    """재고 이동 API"""
+    @jwt_required()
+    def post(self):
+        """재고 입출고 등록"""
+        parser = reqparse.RequestParser()
+        parser.add_argument('movement_date', required=True)
+        parser.add_argument('movement_type', required=True, choices=('in', 'out'))
+        parser.add_argument('item_code', required=True)
+        parser.add_argument('quantity', type=int, required=True)
+        parser.add_argument('warehouse', default='wh1')
+        parser.add_argument('remarks', default=None)
+        parser.add_argument('unit_cost', type=float, default=None)
+        args = parser.parse_args()
+        
+        if args['quantity'] <= 0:
+            return {'message': 'Quantity must be positive'}, 400
+        if args['unit_cost'] is not None and args['unit_cost'] < 0:
+            return {'message': 'Unit cost must not be negative'}, 400
+        
+        qty = args['quantity'] if args['movement_type'] == 'in' else -args['quantity']
+        
+        try:
+            movement_id = post_stock(
+                args['movement_date'], f"{args['movement_type'].upper()}_api",
+                args['item_code'], qty, args['warehouse'], args['remarks'], check_stock=True,
+                unit_cost=args['unit_cost']
+            )
+            
+            publish('inventory')
+            return {
+                'message': 'Stock movement created',
+                'id': movement_id
+            }, 201
+            
+        except ItemNotFoundError:
+            return {'message': 'Item not found'}, 404
+        except InsufficientStockError:
+            return {'message': 'Insufficient stock'}, 400
+        except Exception as e:
+            logger.error(f"Create stock movement error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class BomStructure(Resource):
+    """BOM 정전개 / 등록 API"""
+    @jwt_required()
+    def get(self, item_code):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('view', type=str, default='indented', choices=('indented', 'summary'))
+        parser.add_argument('quantity', type=float, default=1)
+        parser.add_argument('as_of', type=str, default=None)
+        parser.add_argument('max_level', type=int, default=None)
+        parser.add_argument('leaves_only', type=inputs.boolean, default=False)
+        args = parser.parse_args()
+        
+        try:
+            if args['view'] == 'summary':
+                df = requirements(item_code, args['quantity'], args['as_of'], args['leaves_only'])
+            else:
+                df = explode(item_code, args['quantity'], args['as_of'], args['max_level'])
+            return {
+                'item_code': item_code,
+                'view': args['view'],
+                'data': _records(df),
+                'total': len(df)
+            }, 200
+            
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Explode BOM error: {e}")
+            return {'message': 'Internal server error'}, 500
+    
+    @check_permission('manager')
+    def post(self, item_code):
+        """BOM 등록/개정 - {'components': [{'component_code', 'quantity', 'scrap_rate'?}], 'valid_from'?}"""
+        body = request.get_json(silent=True) or {}
+        components = body.get('components')
+        if not isinstance(components, list):
+            return {'message': 'components must be a list'}, 400
+        
+        try:
+            count = set_bom(
+                item_code,
+                [(c['component_code'], c['quantity'], c.get('scrap_rate')) for c in components],
+                valid_from=body.get('valid_from')
+            )
+            
+            publish('inventory')
+            return {
+                'message': 'BOM saved',
+                'item_code': item_code,
+                'count': count
+            }, 201
+            
+        except (KeyError, TypeError) as e:
+            return {'message': f"Invalid component: {e}"}, 400
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Save BOM error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+class BomWhereUsed(Resource):
+    """BOM 사용처 API (as_of 를 주면 해당일 기준 역전개 소요량 포함)"""
+    @jwt_required()
+    def get(self, item_code):
+        parser = reqparse.RequestParser(argument_class=QueryArgument)
+        parser.add_argument('as_of', type=str, default=None)
+        parser.add_argument('top_only', type=inputs.boolean, default=False)
+        args = parser.parse_args()
+        
+        try:
+            if args['as_of']:
+                df = implode(item_code, args['as_of'])
+                if args['top_only']:
+                    df = df[df['is_top']]
+            else:
+                df = where_used(item_code, args['top_only'])
+            return {
+                'item_code': item_code,
+                'data': _records(df),
+                'total': len(df)
+            }, 200
+            
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        except Exception as e:
+            logger.error(f"BOM where-used error: {e}")
+            return {'message': 'Internal server error'}, 500
+
+def register_routes(api):
+    """API 라우트 등록"""
+    # 인증
+    api.add_resource(Login, '/api/auth/login')
+    api.add_resource(CurrentUser, '/api/auth/me')
+    api.add_resource(UserList, '/api/users')
+    
+    # MES
+    api.add_resource(ProductionList, '/api/production')
+    api.add_resource(ProductionBatch, '/api/production/batch')
+    api.add_resource(ProductionHourly, '/api/production/hourly')
+    api.add_resource(OeeSummary, '/api/oee')
+    api.add_resource(DowntimeEvents, '/api/oee/downtime')
+    api.add_resource(OeeStandards, '/api/oee/standards')
+    api.add_resource(WorkOrderList, '/api/work-orders')
+    api.add_resource(WorkOrderSchedule, '/api/work-orders/schedule')
+    api.add_resource(TelemetrySeries, '/api/telemetry/<string:tag>')
+    
+    # 품질
+    api.add_resource(LotTrace, '/api/lots/<string:lot_number>/trace')
+    api.add_resource(LotRecall, '/api/lots/<string:lot_number>/recall')
+    api.add_resource(LotLinks, '/api/lots/links')
+    api.add_resource(LotShipments, '/api/lots/shipments')
+    
+    # 재고
+    api.add_resource(InventoryList, '/api/inventory')
+    api.add_resource(StockMovement, '/api/inventory/movements')
+    api.add_resource(InventoryValuation, '/api/inventory/valuation')
+    api.add_resource(InventoryAsOf, '/api/inventory/as-of')
+    api.add_resource(InventorySafetyStock, '/api/inventory/safety-stock')
+    api.add_resource(BomStructure, '/api/bom/<string:item_code>')
+    api.add_resource(BomWhereUsed, '/api/bom/<string:item_code>/where-used')
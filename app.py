@@ -17,6 +17,16 @@ import plotly.express as px
 import hashlib
 import threading
 
+from core.database import configure as configure_database, get_connection
+from core.migrations import migrate
+from core.dashboard import dashboard_snapshot, configure_dashboard
+from core.refresh import create_refresh_components, register_refresh_callbacks
+from core.write_buffer import configure_write_buffer
+from modules.mes.gateway import configure_telemetry
+from modules.mes.andon import register_andon
+from modules.mes.scheduler import progress_sync
+from modules.inventory.stock import post_movement
+
 # 로깅 설정
 import os
 os.makedirs('logs', exist_ok=True)  # logs 디렉토리 자동 생성
@@ -138,901 +148,12 @@ def save_config(config):
 # 데이터베이스 초기화
 def init_database():
     """데이터베이스 초기화"""
-    os.makedirs('data', exist_ok=True)
-    conn = sqlite3.connect('data/database.db')
+    # 스키마는 core/migrations 의 버전 파일로 관리
+    migrate()
+
+    conn = get_connection()
     cursor = conn.cursor()
     
-    # 기본 시스템 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            role TEXT DEFAULT 'user',
-            department TEXT,
-            email TEXT,
-            phone TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 작업 로그 테이블 (MES)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS work_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lot_number TEXT NOT NULL,
-            work_date DATE NOT NULL,
-            process TEXT NOT NULL,
-            worker_id INTEGER,
-            plan_qty INTEGER,
-            prod_qty INTEGER,
-            defect_qty INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 시스템 설정 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS system_config (
-            key TEXT PRIMARY KEY,
-            value TEXT,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 폼 템플릿 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS form_templates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            config TEXT NOT NULL,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 품목 마스터 테이블 (재고관리용)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS item_master (
-            item_code TEXT PRIMARY KEY,
-            item_name TEXT NOT NULL,
-            category TEXT,
-            unit TEXT DEFAULT 'EA',
-            safety_stock INTEGER DEFAULT 0,
-            current_stock INTEGER DEFAULT 0,
-            unit_price REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 재고 이동 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS stock_movements (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            movement_date DATE NOT NULL,
-            movement_type TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            warehouse TEXT,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    # 재고 조정 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS stock_adjustments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            adjustment_date DATE NOT NULL,
-            item_code TEXT NOT NULL,
-            adjustment_type TEXT,
-            before_qty INTEGER,
-            after_qty INTEGER,
-            difference INTEGER,
-            reason TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    # 거래처 마스터 (구매관리)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS supplier_master (
-            supplier_code TEXT PRIMARY KEY,
-            supplier_name TEXT NOT NULL,
-            business_no TEXT,
-            ceo_name TEXT,
-            contact_person TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            payment_terms TEXT DEFAULT 'CASH',
-            lead_time INTEGER DEFAULT 7,
-            rating INTEGER DEFAULT 3,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 발주서 헤더
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS purchase_orders (
-            po_number TEXT PRIMARY KEY,
-            po_date DATE NOT NULL,
-            supplier_code TEXT NOT NULL,
-            delivery_date DATE,
-            warehouse TEXT,
-            total_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            remarks TEXT,
-            created_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (supplier_code) REFERENCES supplier_master (supplier_code)
-        )
-    ''')
-    
-    # 발주서 상세
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS purchase_order_details (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            po_number TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            unit_price REAL NOT NULL,
-            amount REAL NOT NULL,
-            received_qty INTEGER DEFAULT 0,
-            remarks TEXT,
-            FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    # 입고 예정
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS receiving_schedule (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            po_number TEXT NOT NULL,
-            scheduled_date DATE NOT NULL,
-            item_code TEXT NOT NULL,
-            expected_qty INTEGER NOT NULL,
-            received_qty INTEGER DEFAULT 0,
-            status TEXT DEFAULT 'pending',
-            FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    # 입고 검수
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS receiving_inspection (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            receiving_date DATE NOT NULL,
-            po_number TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            received_qty INTEGER NOT NULL,
-            accepted_qty INTEGER NOT NULL,
-            rejected_qty INTEGER DEFAULT 0,
-            inspection_result TEXT,
-            inspector_id INTEGER,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    # 자동 발주 규칙
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS auto_po_rules (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            item_code TEXT NOT NULL,
-            supplier_code TEXT NOT NULL,
-            reorder_point INTEGER NOT NULL,
-            order_qty INTEGER NOT NULL,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code),
-            FOREIGN KEY (supplier_code) REFERENCES supplier_master (supplier_code)
-        )
-    ''')
-    
-    # 계정과목 마스터 (회계관리)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS account_master (
-            account_code TEXT PRIMARY KEY,
-            account_name TEXT NOT NULL,
-            account_type TEXT NOT NULL,
-            parent_code TEXT,
-            level INTEGER DEFAULT 1,
-            is_control BOOLEAN DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 전표 헤더
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS journal_header (
-            voucher_no TEXT PRIMARY KEY,
-            voucher_date DATE NOT NULL,
-            voucher_type TEXT NOT NULL,
-            description TEXT,
-            total_debit REAL DEFAULT 0,
-            total_credit REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            created_by INTEGER,
-            approved_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    # 전표 상세
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS journal_details (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            voucher_no TEXT NOT NULL,
-            line_no INTEGER NOT NULL,
-            account_code TEXT NOT NULL,
-            debit_amount REAL DEFAULT 0,
-            credit_amount REAL DEFAULT 0,
-            description TEXT,
-            cost_center TEXT,
-            FOREIGN KEY (voucher_no) REFERENCES journal_header (voucher_no),
-            FOREIGN KEY (account_code) REFERENCES account_master (account_code)
-        )
-    ''')
-    
-    # 세금계산서
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tax_invoice (
-            invoice_no TEXT PRIMARY KEY,
-            invoice_date DATE NOT NULL,
-            invoice_type TEXT NOT NULL,
-            customer_code TEXT,
-            supplier_code TEXT,
-            business_no TEXT,
-            company_name TEXT,
-            ceo_name TEXT,
-            address TEXT,
-            supply_amount REAL DEFAULT 0,
-            tax_amount REAL DEFAULT 0,
-            total_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            voucher_no TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (voucher_no) REFERENCES journal_header (voucher_no)
-        )
-    ''')
-    
-    # 예산 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS budget_master (
-            budget_id TEXT PRIMARY KEY,
-            budget_year INTEGER NOT NULL,
-            budget_month INTEGER,
-            department TEXT,
-            account_code TEXT NOT NULL,
-            budget_amount REAL DEFAULT 0,
-            actual_amount REAL DEFAULT 0,
-            variance REAL DEFAULT 0,
-            status TEXT DEFAULT 'active',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (account_code) REFERENCES account_master (account_code)
-        )
-    ''')
-    
-    # 원가 계산
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS cost_calculation (
-            calc_id TEXT PRIMARY KEY,
-            calc_date DATE NOT NULL,
-            product_code TEXT NOT NULL,
-            material_cost REAL DEFAULT 0,
-            labor_cost REAL DEFAULT 0,
-            overhead_cost REAL DEFAULT 0,
-            total_cost REAL DEFAULT 0,
-            production_qty INTEGER DEFAULT 0,
-            unit_cost REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 결산 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS closing_master (
-            closing_id TEXT PRIMARY KEY,
-            closing_year INTEGER NOT NULL,
-            closing_month INTEGER NOT NULL,
-            closing_type TEXT NOT NULL,
-            status TEXT DEFAULT 'open',
-            closed_date TIMESTAMP,
-            closed_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (closed_by) REFERENCES users (id)
-        )
-    ''')
-    
-    # 고정자산 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS fixed_asset (
-            asset_code TEXT PRIMARY KEY,
-            asset_name TEXT NOT NULL,
-            asset_type TEXT,
-            acquisition_date DATE NOT NULL,
-            acquisition_cost REAL DEFAULT 0,
-            depreciation_method TEXT DEFAULT 'straight',
-            useful_life INTEGER DEFAULT 5,
-            salvage_value REAL DEFAULT 0,
-            accumulated_depreciation REAL DEFAULT 0,
-            book_value REAL DEFAULT 0,
-            disposal_date DATE,
-            disposal_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'active',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # === V1.1 품질관리 테이블 ===
-    
-    # 입고검사 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS incoming_inspection (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            inspection_no TEXT UNIQUE NOT NULL,
-            inspection_date DATE NOT NULL,
-            po_number TEXT,
-            item_code TEXT NOT NULL,
-            lot_number TEXT,
-            received_qty INTEGER NOT NULL,
-            sample_qty INTEGER NOT NULL,
-            passed_qty INTEGER NOT NULL,
-            failed_qty INTEGER DEFAULT 0,
-            inspection_result TEXT NOT NULL,
-            defect_codes TEXT,
-            inspector_id INTEGER,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code),
-            FOREIGN KEY (inspector_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 공정검사 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS process_inspection (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            inspection_no TEXT UNIQUE NOT NULL,
-            inspection_date DATE NOT NULL,
-            work_order_no TEXT,
-            process_code TEXT,
-            item_code TEXT NOT NULL,
-            lot_number TEXT,
-            production_qty INTEGER NOT NULL,
-            sample_qty INTEGER NOT NULL,
-            passed_qty INTEGER NOT NULL,
-            failed_qty INTEGER DEFAULT 0,
-            inspection_result TEXT NOT NULL,
-            defect_codes TEXT,
-            inspector_id INTEGER,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code),
-            FOREIGN KEY (inspector_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 출하검사 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS final_inspection (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            inspection_no TEXT UNIQUE NOT NULL,
-            inspection_date DATE NOT NULL,
-            order_number TEXT,
-            product_code TEXT NOT NULL,
-            lot_number TEXT,
-            inspection_qty INTEGER NOT NULL,
-            sample_qty INTEGER NOT NULL,
-            passed_qty INTEGER NOT NULL,
-            failed_qty INTEGER DEFAULT 0,
-            inspection_result TEXT NOT NULL,
-            defect_codes TEXT,
-            inspector_id INTEGER,
-            certificate_no TEXT,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (inspector_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 불량유형 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS defect_types (
-            defect_code TEXT PRIMARY KEY,
-            defect_name TEXT NOT NULL,
-            defect_category TEXT,
-            severity_level INTEGER DEFAULT 3,
-            description TEXT,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 불량이력 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS defect_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            defect_date DATE NOT NULL,
-            inspection_no TEXT,
-            defect_code TEXT NOT NULL,
-            item_code TEXT,
-            defect_qty INTEGER NOT NULL,
-            defect_location TEXT,
-            cause_analysis TEXT,
-            corrective_action TEXT,
-            prevention_action TEXT,
-            responsible_person TEXT,
-            status TEXT DEFAULT 'open',
-            closed_date DATE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (defect_code) REFERENCES defect_types (defect_code)
-        )
-    ''')
-    
-    # 측정장비 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS measurement_equipment (
-            equipment_id TEXT PRIMARY KEY,
-            equipment_name TEXT NOT NULL,
-            equipment_type TEXT,
-            manufacturer TEXT,
-            model_no TEXT,
-            serial_no TEXT,
-            calibration_cycle INTEGER DEFAULT 365,
-            last_calibration_date DATE,
-            next_calibration_date DATE,
-            calibration_certificate_no TEXT,
-            location TEXT,
-            status TEXT DEFAULT 'active',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # SPC 데이터 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS spc_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            measurement_date TIMESTAMP NOT NULL,
-            process_code TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            characteristic TEXT NOT NULL,
-            measurement_value REAL NOT NULL,
-            sample_no INTEGER,
-            subgroup_no INTEGER,
-            usl REAL,
-            lsl REAL,
-            target REAL,
-            operator_id INTEGER,
-            equipment_id TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (operator_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 품질 성적서 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS quality_certificates (
-            certificate_no TEXT PRIMARY KEY,
-            issue_date DATE NOT NULL,
-            customer_code TEXT,
-            order_number TEXT,
-            product_code TEXT NOT NULL,
-            lot_number TEXT,
-            test_items TEXT,
-            test_results TEXT,
-            overall_result TEXT NOT NULL,
-            issued_by INTEGER,
-            approved_by INTEGER,
-            file_path TEXT,
-            status TEXT DEFAULT 'draft',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (issued_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    # === V1.0 영업관리 테이블 ===
-    
-    # 고객 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS customers (
-            customer_code TEXT PRIMARY KEY,
-            customer_name TEXT NOT NULL,
-            business_no TEXT,
-            ceo_name TEXT,
-            contact_person TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            grade TEXT DEFAULT 'Bronze',  -- VIP, Gold, Silver, Bronze
-            payment_terms TEXT DEFAULT 'NET30',
-            credit_limit REAL DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 견적서 헤더
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS quotations (
-            quote_number TEXT PRIMARY KEY,
-            quote_date DATE NOT NULL,
-            customer_code TEXT NOT NULL,
-            validity_date DATE NOT NULL,
-            total_amount REAL DEFAULT 0,
-            discount_rate REAL DEFAULT 0,
-            discount_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',  -- draft, sent, reviewing, won, lost, expired
-            notes TEXT,
-            created_by INTEGER,
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            sent_date TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    # 견적서 상세
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS quotation_details (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            quote_number TEXT NOT NULL,
-            line_no INTEGER NOT NULL,
-            product_code TEXT,
-            product_name TEXT NOT NULL,
-            description TEXT,
-            quantity INTEGER NOT NULL,
-            unit_price REAL NOT NULL,
-            amount REAL NOT NULL,
-            FOREIGN KEY (quote_number) REFERENCES quotations (quote_number)
-        )
-    ''')
-    
-    # 수주 헤더
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_orders (
-            order_number TEXT PRIMARY KEY,
-            order_date DATE NOT NULL,
-            customer_code TEXT NOT NULL,
-            quote_number TEXT,
-            delivery_date DATE,
-            total_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'received',  -- received, confirmed, in_production, ready_for_delivery, completed, cancelled
-            payment_status TEXT DEFAULT 'pending',  -- pending, partial, completed
-            shipping_address TEXT,
-            notes TEXT,
-            created_by INTEGER,
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (quote_number) REFERENCES quotations (quote_number),
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    # 수주 상세
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_order_details (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            order_number TEXT NOT NULL,
-            line_no INTEGER NOT NULL,
-            product_code TEXT,
-            product_name TEXT NOT NULL,
-            description TEXT,
-            quantity INTEGER NOT NULL,
-            unit_price REAL NOT NULL,
-            amount REAL NOT NULL,
-            delivered_qty INTEGER DEFAULT 0,
-            FOREIGN KEY (order_number) REFERENCES sales_orders (order_number)
-        )
-    ''')
-    
-    # 영업 활동
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_activities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            activity_date DATE NOT NULL,
-            activity_type TEXT NOT NULL,  -- call, email, meeting, demo, follow_up
-            customer_code TEXT,
-            contact_person TEXT,
-            subject TEXT,
-            description TEXT,
-            result TEXT,
-            next_action TEXT,
-            next_action_date DATE,
-            sales_person_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (sales_person_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 영업 기회 (Opportunity)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_opportunities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            opportunity_name TEXT NOT NULL,
-            customer_code TEXT NOT NULL,
-            estimated_amount REAL DEFAULT 0,
-            probability INTEGER DEFAULT 50,  -- 0-100%
-            expected_close_date DATE,
-            stage TEXT DEFAULT 'prospecting',  -- prospecting, qualification, proposal, negotiation, closed_won, closed_lost
-            source TEXT,  -- referral, website, cold_call, exhibition, etc.
-            competitor TEXT,
-            sales_person_id INTEGER,
-            description TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (sales_person_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 제품 마스터 (영업용)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS products (
-            product_code TEXT PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category TEXT,
-            description TEXT,
-            unit_price REAL DEFAULT 0,
-            cost_price REAL DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 가격 정책
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS price_policies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            policy_name TEXT NOT NULL,
-            customer_grade TEXT,  -- VIP, Gold, Silver, Bronze
-            product_category TEXT,
-            discount_rate REAL DEFAULT 0,
-            min_quantity INTEGER DEFAULT 1,
-            effective_date DATE NOT NULL,
-            expiry_date DATE,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 배송 정보
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS deliveries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            delivery_number TEXT UNIQUE NOT NULL,
-            order_number TEXT NOT NULL,
-            delivery_date DATE,
-            tracking_number TEXT,
-            delivery_company TEXT,
-            delivery_status TEXT DEFAULT 'preparing',  -- preparing, shipped, in_transit, delivered, failed
-            recipient_name TEXT,
-            recipient_phone TEXT,
-            delivery_address TEXT,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (order_number) REFERENCES sales_orders (order_number)
-        )
-    ''')
-    
-    # 고객 연락 이력
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS customer_contacts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            customer_code TEXT NOT NULL,
-            contact_date DATE NOT NULL,
-            contact_type TEXT NOT NULL,  -- phone, email, visit, video_call
-            contact_person TEXT,
-            subject TEXT,
-            content TEXT,
-            result TEXT,
-            sales_person_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (sales_person_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 매출 목표
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_targets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            target_year INTEGER NOT NULL,
-            target_month INTEGER,
-            sales_person_id INTEGER,
-            customer_code TEXT,
-            product_category TEXT,
-            target_amount REAL NOT NULL,
-            actual_amount REAL DEFAULT 0,
-            achievement_rate REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (sales_person_id) REFERENCES users (id),
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code)
-        )
-    ''')
-    
-    # === V1.2 인사관리 테이블 ===
-    
-    # 직원 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS employees (
-            emp_id TEXT PRIMARY KEY,
-            emp_name TEXT NOT NULL,
-            emp_name_en TEXT,
-            department TEXT NOT NULL,
-            position TEXT NOT NULL,
-            hire_date DATE NOT NULL,
-            birth_date DATE,
-            gender TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            emergency_contact TEXT,
-            emergency_phone TEXT,
-            employee_type TEXT DEFAULT 'regular',
-            work_status TEXT DEFAULT 'active',
-            resignation_date DATE,
-            photo BLOB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 근태 기록
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS attendance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            work_date DATE NOT NULL,
-            check_in_time TIMESTAMP,
-            check_out_time TIMESTAMP,
-            work_hours REAL DEFAULT 0,
-            overtime_hours REAL DEFAULT 0,
-            status TEXT DEFAULT 'normal',
-            late_minutes INTEGER DEFAULT 0,
-            early_leave_minutes INTEGER DEFAULT 0,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            UNIQUE(emp_id, work_date)
-        )
-    ''')
-    
-    # 휴가 신청
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS leave_requests (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            leave_type TEXT NOT NULL,
-            start_date DATE NOT NULL,
-            end_date DATE NOT NULL,
-            leave_days REAL NOT NULL,
-            reason TEXT,
-            status TEXT DEFAULT 'pending',
-            approver_id TEXT,
-            approval_date TIMESTAMP,
-            approval_comment TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            FOREIGN KEY (approver_id) REFERENCES employees (emp_id)
-        )
-    ''')
-    
-    # 급여 정보
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS salary (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            salary_month TEXT NOT NULL,
-            basic_salary REAL DEFAULT 0,
-            position_allowance REAL DEFAULT 0,
-            meal_allowance REAL DEFAULT 0,
-            transport_allowance REAL DEFAULT 0,
-            overtime_pay REAL DEFAULT 0,
-            bonus REAL DEFAULT 0,
-            other_allowance REAL DEFAULT 0,
-            total_earning REAL DEFAULT 0,
-            income_tax REAL DEFAULT 0,
-            resident_tax REAL DEFAULT 0,
-            health_insurance REAL DEFAULT 0,
-            pension REAL DEFAULT 0,
-            employment_insurance REAL DEFAULT 0,
-            accident_insurance REAL DEFAULT 0,
-            other_deduction REAL DEFAULT 0,
-            total_deduction REAL DEFAULT 0,
-            net_salary REAL DEFAULT 0,
-            payment_date DATE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            UNIQUE(emp_id, salary_month)
-        )
-    ''')
-    
-    # 부서 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS departments (
-            dept_code TEXT PRIMARY KEY,
-            dept_name TEXT NOT NULL,
-            dept_name_en TEXT,
-            parent_dept TEXT,
-            dept_head TEXT,
-            location TEXT,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (dept_head) REFERENCES employees (emp_id)
-        )
-    ''')
-    
-    # 직급 마스터
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS positions (
-            position_code TEXT PRIMARY KEY,
-            position_name TEXT NOT NULL,
-            position_name_en TEXT,
-            position_level INTEGER,
-            min_salary REAL,
-            max_salary REAL,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # === V1.2 API 테이블 ===
-    
-    # API 토큰
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS api_tokens (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            token TEXT UNIQUE NOT NULL,
-            name TEXT,
-            permissions TEXT,
-            expires_at TIMESTAMP,
-            last_used_at TIMESTAMP,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # API 로그
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS api_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            endpoint TEXT NOT NULL,
-            method TEXT NOT NULL,
-            user_id INTEGER,
-            ip_address TEXT,
-            request_body TEXT,
-            response_code INTEGER,
-            response_time REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    
     # 기본 관리자 계정 생성 (V1.2: 비밀번호 해시화)
     cursor.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'")
     if cursor.fetchone()[0] == 0:
@@ -1053,9 +174,13 @@ def init_database():
             ('ITEM005', '베어링 6201', '부품', 'EA', 50, 80, 3000)
         ]
         cursor.executemany(
-            "INSERT INTO item_master (item_code, item_name, category, unit, safety_stock, current_stock, unit_price) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            sample_items
+            "INSERT INTO item_master (item_code, item_name, category, unit, safety_stock, current_stock, unit_price) VALUES (?, ?, ?, ?, ?, 0, ?)",
+            [(code, name, category, unit, safety, price) for code, name, category, unit, safety, _, price in sample_items]
         )
+        # 기초재고는 재고 이동으로 기록 (창고 잔액과 현재고 일치)
+        for code, _, _, _, _, stock, _ in sample_items:
+            post_movement(conn, datetime.now().strftime('%Y-%m-%d'), 'OPENING', code, stock,
+                          remarks='기초재고')
     
     # 기본 고객 데이터 추가 (V1.0)
     cursor.execute("SELECT COUNT(*) FROM customers")
@@ -1092,6 +217,8 @@ def init_database():
 
 # 설정 로드
 config = load_config()
+configure_database(config['database'])
+configure_dashboard(config['system'])
 
 # 앱 초기화
 app = dash.Dash(
@@ -1108,6 +235,11 @@ app = dash.Dash(
 server = app.server
 server.secret_key = secrets.token_hex(16)
 
+# 현장 안돈 보드 (/andon) - 목표 불량률은 품질 설정을 기본값으로 사용
+andon_settings = {'target_defect_rate': config['quality'].get('target_defect_rate', 2.0)}
+andon_settings.update(config.get('andon') or {})
+register_andon(server, andon_settings)
+
 # 네비게이션 바
 def create_navbar():
     """네비게이션 바 생성"""
@@ -1392,9 +524,12 @@ app.layout = html.Div([
     dcc.Store(id='session-store', storage_type='session'),
     create_navbar(),
     html.Div(id='page-content'),
-    dcc.Interval(id='interval-component', interval=config['system']['update_interval'])
+    *create_refresh_components(config['system']['update_interval'])
 ])
 
+# 갱신 스케줄러 (SSE 푸시, 숨김 탭/미변경 데이터는 갱신하지 않음)
+register_refresh_callbacks(app)
+
 # 페이지 라우팅 콜백
 @app.callback(
     Output('page-content', 'children'),
@@ -1783,7 +918,7 @@ def handle_login(login_clicks, guest_clicks, username, password):
             return dash.no_update, dbc.Alert("사용자 ID와 비밀번호를 입력하세요.", color="warning"), dash.no_update
         
         # 데이터베이스에서 사용자 확인 (V1.2: 비밀번호 해시 비교)
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         cursor = conn.cursor()
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         cursor.execute("SELECT id, role FROM users WHERE username = ? AND password = ?", (username, password_hash))
@@ -1809,33 +944,21 @@ def handle_login(login_clicks, guest_clicks, username, password):
      Output('low-stock-items', 'children'),
      Output('recent-activities', 'children'),
      Output('system-alerts', 'children')],
-    Input('interval-component', 'n_intervals')
+    [Input('refresh-tick', 'data'),
+     Input('refresh-dashboard', 'data')]
 )
-def update_dashboard(n):
-    """대시보드 실시간 업데이트"""
-    conn = sqlite3.connect('data/database.db')
-    
-    # 오늘의 생산량
-    today = datetime.now().strftime('%Y-%m-%d')
-    cursor = conn.cursor()
-    cursor.execute("SELECT SUM(prod_qty) FROM work_logs WHERE work_date = ?", (today,))
-    today_production = cursor.fetchone()[0] or 0
+def update_dashboard(tick, pushed):
+    """대시보드 실시간 업데이트 - 공용 스냅샷을 렌더링 (세션별 DB 조회 없음)"""
+    stats = dashboard_snapshot.get()
+    if stats is None:
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update
     
-    # 재고 부족 품목
-    cursor.execute("SELECT COUNT(*) FROM item_master WHERE current_stock < safety_stock")
-    low_stock = cursor.fetchone()[0] or 0
+    today_production = stats['today_production']
+    low_stock = stats['low_stock']
     
     # 최근 활동
-    activities_query = """
-        SELECT 'MES' as module, '작업 입력' as action, created_at 
-        FROM work_logs 
-        ORDER BY created_at DESC 
-        LIMIT 5
-    """
-    activities_df = pd.read_sql_query(activities_query, conn)
-    
     activities_list = []
-    for _, row in activities_df.iterrows():
+    for row in stats['activities']:
         activities_list.append(
             html.Div([
                 html.I(className="fas fa-circle text-primary me-2", style={"fontSize": "8px"}),
@@ -1859,121 +982,61 @@ def update_dashboard(n):
             ], color="warning", className="mb-2")
         )
     
-    # V1.0 영업관리 알림
-    try:
-        # 견적서 만료 임박 알림
-        cursor.execute("""
-            SELECT COUNT(*) FROM quotations 
-            WHERE validity_date <= date('now', '+3 days') 
-            AND status IN ('sent', 'reviewing')
-        """)
-        expiring_quotes = cursor.fetchone()[0]
-        
-        if expiring_quotes > 0:
-            alerts.append(
-                dbc.Alert([
-                    html.I(className="fas fa-clock me-2"),
-                    f"{expiring_quotes}개 견적서가 곧 만료됩니다."
-                ], color="info", className="mb-2")
-            )
-    except:
-        pass  # 테이블이 없을 경우 무시
+    # V1.0 영업관리 알림 - 견적서 만료 임박 (테이블이 없으면 None)
+    if stats['expiring_quotes']:
+        alerts.append(
+            dbc.Alert([
+                html.I(className="fas fa-clock me-2"),
+                f"{stats['expiring_quotes']}개 견적서가 곧 만료됩니다."
+            ], color="info", className="mb-2")
+        )
     
     # V1.1 품질관리 알림
-    try:
-        # 교정 예정 장비 알림
-        cursor.execute("""
-            SELECT COUNT(*) FROM measurement_equipment 
-            WHERE next_calibration_date <= date('now', '+30 days')
-            AND status = 'active'
-        """)
-        calibration_due = cursor.fetchone()[0]
-        
-        if calibration_due > 0:
-            alerts.append(
-                dbc.Alert([
-                    html.I(className="fas fa-tools me-2"),
-                    f"{calibration_due}개 측정 장비의 교정이 예정되어 있습니다."
-                ], color="info", className="mb-2")
-            )
-        
-        # 중대 불량 알림
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM defect_history dh
-            JOIN defect_types dt ON dh.defect_code = dt.defect_code
-            WHERE dt.severity_level = 1
-            AND dh.status != 'closed'
-        """)
-        critical_defects = cursor.fetchone()[0]
-        
-        if critical_defects > 0:
-            alerts.append(
-                dbc.Alert([
-                    html.I(className="fas fa-exclamation-circle me-2"),
-                    f"{critical_defects}건의 중대 불량이 처리 중입니다."
-                ], color="danger", className="mb-2")
-            )
-    except:
-        pass  # 테이블이 없을 경우 무시
+    if stats['calibration_due']:
+        alerts.append(
+            dbc.Alert([
+                html.I(className="fas fa-tools me-2"),
+                f"{stats['calibration_due']}개 측정 장비의 교정이 예정되어 있습니다."
+            ], color="info", className="mb-2")
+        )
+    
+    if stats['critical_defects']:
+        alerts.append(
+            dbc.Alert([
+                html.I(className="fas fa-exclamation-circle me-2"),
+                f"{stats['critical_defects']}건의 중대 불량이 처리 중입니다."
+            ], color="danger", className="mb-2")
+        )
     
     # V1.2 인사관리 알림
-    try:
-        # 미승인 휴가 신청
-        cursor.execute("""
-            SELECT COUNT(*) FROM leave_requests 
-            WHERE status = 'pending'
-        """)
-        pending_leaves = cursor.fetchone()[0]
-        
-        if pending_leaves > 0:
-            alerts.append(
-                dbc.Alert([
-                    html.I(className="fas fa-calendar-alt me-2"),
-                    f"{pending_leaves}건의 휴가 신청이 승인 대기 중입니다."
-                ], color="info", className="mb-2")
-            )
-        
-        # 오늘 출근하지 않은 직원
-        cursor.execute("""
-            SELECT COUNT(*) FROM employees e
-            WHERE e.work_status = 'active'
-            AND e.emp_id NOT IN (
-                SELECT emp_id FROM attendance WHERE work_date = ?
-            )
-        """, (today,))
-        absent_employees = cursor.fetchone()[0]
-        
-        if absent_employees > 0 and datetime.now().hour > 10:  # 오전 10시 이후
-            alerts.append(
-                dbc.Alert([
-                    html.I(className="fas fa-user-clock me-2"),
-                    f"{absent_employees}명의 직원이 아직 출근하지 않았습니다."
-                ], color="warning", className="mb-2")
-            )
-    except:
-        pass  # 테이블이 없을 경우 무시
+    if stats['pending_leaves']:
+        alerts.append(
+            dbc.Alert([
+                html.I(className="fas fa-calendar-alt me-2"),
+                f"{stats['pending_leaves']}건의 휴가 신청이 승인 대기 중입니다."
+            ], color="info", className="mb-2")
+        )
     
-    # 목표 달성 알림
-    cursor.execute("""
-        SELECT COUNT(*) FROM work_logs 
-        WHERE work_date = ? AND prod_qty >= plan_qty
-    """, (today,))
-    achieved = cursor.fetchone()[0]
+    if stats['absent_employees'] and datetime.now().hour > 10:  # 오전 10시 이후
+        alerts.append(
+            dbc.Alert([
+                html.I(className="fas fa-user-clock me-2"),
+                f"{stats['absent_employees']}명의 직원이 아직 출근하지 않았습니다."
+            ], color="warning", className="mb-2")
+        )
     
-    if achieved > 0:
+    # 목표 달성 알림
+    if stats['achieved'] > 0:
         alerts.append(
             dbc.Alert([
                 html.I(className="fas fa-check-circle me-2"),
-                f"오늘 {achieved}건의 작업이 목표를 달성했습니다!"
+                f"오늘 {stats['achieved']}건의 작업이 목표를 달성했습니다!"
             ], color="success", className="mb-2")
         )
     
     if not alerts:
         alerts = [html.P("새로운 알림이 없습니다.", className="text-muted")]
     
-    conn.close()
-    
     return (
         f"{today_production:,}",
         f"{low_stock:,}",
@@ -2037,6 +1100,7 @@ def save_settings(n_clicks, mes_enabled, inventory_enabled, purchase_enabled,
     config['system']['language'] = language
     
     save_config(config)
+    configure_dashboard(config['system'])
     
     return dbc.Alert(
         [
@@ -2105,6 +1169,15 @@ if __name__ == '__main__':
     # 데이터베이스 초기화
     init_database()
     
+    # 쓰기 버퍼 (마이그레이션 후 시작 - 저널 미적용 작업 재실행)
+    configure_write_buffer(config['database'].get('write_buffer'))
+    
+    # 설비 텔레메트리 수집 게이트웨이
+    configure_telemetry(config.get('telemetry'))
+    
+    # 작업 실적 -> 작업지시 진행 반영 (백그라운드)
+    progress_sync.start()
+    
     # V1.2: API 서버 실행 (별도 스레드)
     if config.get('api', {}).get('enabled', False):
         def run_api():
@@ -6,7 +6,6 @@ import dash_bootstrap_components as dbc
 from datetime import datetime, timedelta
 import yaml
 import os
-import sqlite3
 import json
 import logging
 from flask import session
@@ -15,6 +14,8 @@ import pandas as pd
 import plotly.graph_objs as go
 import plotly.express as px
 
+from core.database import get_connection
+
 # 로깅 설정
 import os
 os.makedirs('logs', exist_ok=True)  # logs 디렉토리 자동 생성
@@ -82,7 +83,7 @@ def save_config(config):
 def init_database():
     """데이터베이스 초기화 - MES 관련 테이블만"""
     os.makedirs('data', exist_ok=True)
-    conn = sqlite3.connect('data/database.db')
+    conn = get_connection()
     cursor = conn.cursor()
     
     # 기본 시스템 테이블
@@ -582,7 +583,7 @@ def handle_login(login_clicks, guest_clicks, username, password):
             return dash.no_update, dbc.Alert("사용자 ID와 비밀번호를 입력하세요.", color="warning"), dash.no_update
         
         # 데이터베이스에서 사용자 확인
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         cursor = conn.cursor()
         cursor.execute("SELECT id, role FROM users WHERE username = ? AND password = ?", (username, password))
         user = cursor.fetchone()
@@ -611,7 +612,7 @@ def handle_login(login_clicks, guest_clicks, username, password):
 )
 def update_dashboard(n):
     """대시보드 실시간 업데이트"""
-    conn = sqlite3.connect('data/database.db')
+    conn = get_connection()
     
     # 오늘의 생산량
     today = datetime.now().strftime('%Y-%m-%d')
@@ -0,0 +1,48 @@
+/* assets/push.js - 서버 푸시(SSE) 수신 후 영향받는 모듈만 갱신 */
+
+(function () {
+    var push = window.mesPush = {connected: false, pending: {}};
+    var ALL_TOPICS = ['dashboard', 'mes', 'inventory', 'purchase', 'sales', 'quality', 'hr', 'accounting'];
+
+    if (!window.EventSource) {
+        return;  // 미지원 브라우저는 interval 폴링으로 동작
+    }
+
+    function flush() {
+        if (document.hidden || !Object.keys(push.pending).length) {
+            return;
+        }
+        var trigger = document.getElementById('push-trigger');
+        if (trigger) {
+            trigger.click();
+        }
+    }
+
+    var source = new EventSource('/events');
+    var reconnecting = false;
+
+    source.onopen = function () {
+        push.connected = true;
+        // 끊긴 동안의 변경은 알 수 없으므로 전체 갱신
+        if (reconnecting) {
+            ALL_TOPICS.forEach(function (topic) { push.pending[topic] = Date.now(); });
+            flush();
+        }
+        reconnecting = false;
+    };
+
+    source.onerror = function () {
+        // EventSource 가 자동 재연결하며, 그동안은 폴링으로 대체
+        push.connected = false;
+        reconnecting = true;
+    };
+
+    source.addEventListener('change', function (e) {
+        var event = JSON.parse(e.data);
+        event.topics.forEach(function (topic) { push.pending[topic] = event.seq; });
+        flush();
+    });
+
+    // 숨겨져 있던 탭이 다시 보이면 밀린 갱신 처리
+    document.addEventListener('visibilitychange', flush);
+})();
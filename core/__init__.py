@@ -0,0 +1,5 @@
+# core/__init__.py - 공통 핵심 기능 (데이터베이스 등)
+
+from .database import configure, get_connection, transaction
+
+__all__ = ['configure', 'get_connection', 'transaction']
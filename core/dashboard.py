@@ -0,0 +1,127 @@
+# core/dashboard.py - 메인 대시보드 집계 (공용 스냅샷)
+
+from datetime import datetime, date
+import logging
+
+from core.database import get_connection, data_version
+from core.snapshot import SnapshotService
+from core.events import broker
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_count(cursor, query, params=()):
+    """모듈 테이블이 없을 수 있는 집계 - 실패 시 None"""
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
+    except Exception:
+        return None
+
+
+def collect_dashboard_stats():
+    """대시보드 표시용 집계 한 번 계산"""
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        # 오늘의 생산량 / 목표 달성 작업 (일별 집계 테이블)
+        cursor.execute("""
+            SELECT SUM(prod_qty), SUM(achieved_count)
+            FROM work_log_daily_summary
+            WHERE work_date = ?
+        """, (today,))
+        today_production, achieved = cursor.fetchone()
+        today_production = today_production or 0
+        achieved = achieved or 0
+
+        # 재고 부족 품목
+        cursor.execute("SELECT COUNT(*) FROM item_master WHERE current_stock < safety_stock")
+        low_stock = cursor.fetchone()[0] or 0
+
+        # 최근 활동
+        cursor.execute("""
+            SELECT 'MES' as module, '작업 입력' as action, created_at
+            FROM work_logs
+            ORDER BY created_at DESC
+            LIMIT 5
+        """)
+        activities = [
+            {'module': module, 'action': action, 'created_at': created_at}
+            for module, action, created_at in cursor.fetchall()
+        ]
+
+        return {
+            'generated_at': now,
+            'today_production': today_production,
+            'low_stock': low_stock,
+            'activities': activities,
+            'achieved': achieved,
+            # V1.0 영업관리 - 견적서 만료 임박
+            'expiring_quotes': _optional_count(cursor, """
+                SELECT COUNT(*) FROM quotations
+                WHERE validity_date <= date('now', '+3 days')
+                AND status IN ('sent', 'reviewing')
+            """),
+            # V1.1 품질관리 - 교정 예정 장비, 중대 불량
+            'calibration_due': _optional_count(cursor, """
+                SELECT COUNT(*) FROM measurement_equipment
+                WHERE next_calibration_date <= date('now', '+30 days')
+                AND status = 'active'
+            """),
+            'critical_defects': _optional_count(cursor, """
+                SELECT COUNT(*)
+                FROM defect_history dh
+                JOIN defect_types dt ON dh.defect_code = dt.defect_code
+                WHERE dt.severity_level = 1
+                AND dh.status != 'closed'
+            """),
+            # V1.2 인사관리 - 미승인 휴가, 미출근 직원
+            'pending_leaves': _optional_count(cursor, """
+                SELECT COUNT(*) FROM leave_requests
+                WHERE status = 'pending'
+            """),
+            'absent_employees': _optional_count(cursor, """
+                SELECT COUNT(*) FROM employees e
+                WHERE e.work_status = 'active'
+                AND e.emp_id NOT IN (
+                    SELECT emp_id FROM attendance WHERE work_date = ?
+                )
+            """, (today,))
+        }
+    finally:
+        conn.close()
+
+
+def _dashboard_version():
+    """데이터 변경 또는 날짜 변경 시 재계산"""
+    return (data_version(), date.today())
+
+
+def _notify_dashboard(snapshot):
+    """새 스냅샷 계산 시 대시보드 화면에 푸시"""
+    broker.publish('dashboard')
+
+
+# 프로세스 전체에서 공유하는 대시보드 스냅샷
+dashboard_snapshot = SnapshotService(
+    'dashboard', collect_dashboard_stats,
+    version=_dashboard_version, on_update=_notify_dashboard
+)
+
+
+def _on_change(event):
+    # 모듈 쓰기 이벤트가 오면 다음 주기를 기다리지 않고 재계산
+    if 'dashboard' not in event['topics']:
+        dashboard_snapshot.request_refresh()
+
+
+broker.add_listener(_on_change)
+
+
+def configure_dashboard(system_config):
+    """system.update_interval(ms) 을 스냅샷 갱신 주기로 사용"""
+    dashboard_snapshot.set_interval(system_config.get('update_interval', 2000) / 1000)
@@ -0,0 +1,396 @@
+# core/database.py - 공용 SQLite 데이터 접근 계층
+
+import os
+import re
+import queue
+import sqlite3
+import time
+import random
+import threading
+import logging
+from contextlib import contextmanager
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = 'data/database.db'
+
+# 연결마다 적용되는 PRAGMA (config.yaml 의 database 섹션으로 덮어쓸 수 있음)
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',      # 읽기와 쓰기가 서로 막지 않도록 WAL 사용
+    'synchronous': 'NORMAL',    # WAL 모드에서 안전한 수준의 fsync
+    'cache_size': -20000,       # 페이지 캐시 약 20MB (음수 = KB 단위)
+    'mmap_size': 268435456,     # 256MB 메모리 맵 I/O
+    'busy_timeout': 5000,       # 잠금 대기 (밀리초)
+    'temp_store': 'MEMORY',
+}
+
+_settings = {
+    'path': DEFAULT_DB_PATH,
+    'pool_size': 8,
+    'cached_statements': 256,
+    'pragmas': dict(DEFAULT_PRAGMAS),
+}
+_pool = queue.LifoQueue()
+_pool_lock = threading.Lock()
+_generation = 0
+_local = threading.local()
+# 감시 연결 - serial 은 프로세스 재시작 후에도 토큰이 겹치지 않도록 시각으로 시작
+_watcher = {'conn': None, 'generation': None, 'serial': int(time.time())}
+_watcher_lock = threading.Lock()
+
+# 커밋 리스너 - 커밋된 쓰기 대상 테이블 집합('*' = 스키마 변경 등 전체)과
+# 커밋 직전의 data_version() 토큰을 전달
+_commit_listeners = []
+
+_WRITE_PATTERN = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)"
+    r"\s+(?:[\"`\[]?(\w+)[\"`\]]?\.)?[\"`\[]?(\w+)",
+    re.IGNORECASE
+)
+_SCHEMA_PATTERN = re.compile(r"^\s*(?:CREATE|DROP|ALTER)\b", re.IGNORECASE)
+# 연결 전용 임시 객체 (CREATE TEMP ... / temp.이름) - 다른 연결의 캐시와 무관
+_TEMP_SCHEMA_PATTERN = re.compile(
+    r"^\s*(?:CREATE\s+TEMP(?:ORARY)?\b"
+    r"|(?:CREATE|DROP|ALTER)\s+(?:TABLE|INDEX|VIEW|TRIGGER)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    r"[\"`\[]?temp[\"`\]]?\.)",
+    re.IGNORECASE
+)
+
+# run_write() 의 잠금 경합(SQLITE_BUSY/LOCKED) 재시도 횟수
+BUSY_RETRIES = 5
+# 재시도 대기 (초) - 0.01 * 2^시도 를 상한까지 늘리고 그 안에서 무작위
+BUSY_BACKOFF_BASE = 0.01
+BUSY_BACKOFF_CAP = 0.5
+
+
+def _written_table(sql):
+    """쓰기 문장의 대상 테이블 (조회 문장은 None)"""
+    match = _WRITE_PATTERN.match(sql)
+    if match:
+        schema, table = match.groups()
+        if schema and schema.lower() == 'temp':
+            return None
+        return table.lower()
+    if _SCHEMA_PATTERN.match(sql) and not _TEMP_SCHEMA_PATTERN.match(sql):
+        return '*'
+    return None
+
+
+class TrackingCursor(sqlite3.Cursor):
+    """쓰기 대상 테이블을 연결에 기록하는 커서"""
+
+    def execute(self, sql, *args):
+        self.connection._track(sql, *args)
+        return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        self.connection._track(sql)
+        return super().executemany(sql, *args)
+
+    def executescript(self, script):
+        self.connection._written.add('*')
+        return super().executescript(script)
+
+
+class PooledConnection(sqlite3.Connection):
+    """풀에서 관리되는 연결
+
+    close() 는 실제로 연결을 닫지 않고 풀에 반환하므로 기존 콜백의
+    ``conn = ...; ...; conn.close()`` 패턴을 그대로 사용할 수 있다.
+    연결별 statement cache 가 유지되어 같은 SQL 은 다시 컴파일되지 않는다.
+    쓰기 문장의 대상 테이블을 모아 두었다가 커밋 시 커밋 리스너에 알린다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._written = set()
+
+    def _track(self, sql, params=()):
+        table = _written_table(sql)
+        if table:
+            self._written.add(table)
+        captured = getattr(_local, 'captured', None)
+        if captured is not None:
+            captured.append((sql, params))
+
+    def cursor(self, factory=TrackingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, *args):
+        self._track(sql, *args)
+        return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        self._track(sql)
+        return super().executemany(sql, *args)
+
+    def executescript(self, script):
+        self._written.add('*')
+        return super().executescript(script)
+
+    def commit(self):
+        # 쓰기가 있으면 아직 쓰기 잠금을 가진 상태라 이 시점과 커밋 사이에
+        # 다른 연결의 커밋이 끼어들 수 없다 - 리스너는 이 토큰으로 외부 쓰기를 판단
+        before = data_version() if self._written else None
+        super().commit()
+        written, self._written = self._written, set()
+        if written:
+            for listener in list(_commit_listeners):
+                listener(written, before)
+
+    def rollback(self):
+        self._written = set()
+        super().rollback()
+
+    def close(self):
+        _release(self)
+
+    def _close(self):
+        super().close()
+
+
+def add_commit_listener(listener):
+    """커밋 리스너 등록 - listener(tables, before) 는 쓰기 커밋 직후 호출된다
+
+    before 는 커밋 직전의 data_version() 토큰이다.
+    """
+    if listener not in _commit_listeners:
+        _commit_listeners.append(listener)
+
+
+def configure(db_config=None):
+    """데이터베이스 설정 적용 (config['database'])"""
+    global _generation
+    db_config = db_config or {}
+
+    with _pool_lock:
+        _settings['path'] = db_config.get('path', DEFAULT_DB_PATH)
+        _settings['pool_size'] = db_config.get('pool_size', 8)
+        _settings['cached_statements'] = db_config.get('cached_statements', 256)
+        _settings['pragmas'] = dict(DEFAULT_PRAGMAS)
+        _settings['pragmas'].update(db_config.get('pragmas') or {})
+        _generation += 1
+
+    close_all()
+    logger.info(f"데이터베이스 설정: {_settings['path']}")
+
+
+def get_db_path():
+    """현재 데이터베이스 파일 경로"""
+    return _settings['path']
+
+
+def _open():
+    """새 연결 생성 및 PRAGMA 적용"""
+    path = _settings['path']
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(
+        path,
+        timeout=_settings['pragmas'].get('busy_timeout', 5000) / 1000,
+        check_same_thread=False,
+        cached_statements=_settings['cached_statements'],
+        factory=PooledConnection
+    )
+    for name, value in _settings['pragmas'].items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    conn._generation = _generation
+    return conn
+
+
+def get_connection():
+    """풀에서 연결 가져오기
+
+    같은 스레드에서 이미 사용 중인 연결이 있으면 그 연결을 재사용한다.
+    사용 후에는 반드시 ``conn.close()`` 로 반환해야 한다.
+    """
+    held = getattr(_local, 'conn', None)
+    if held is not None:
+        _local.depth += 1
+        return held
+
+    conn = None
+    while conn is None:
+        try:
+            candidate = _pool.get_nowait()
+        except queue.Empty:
+            conn = _open()
+            break
+        if candidate._generation == _generation:
+            conn = candidate
+        else:
+            candidate._close()
+
+    _local.conn = conn
+    _local.depth = 1
+    return conn
+
+
+def _release(conn):
+    """연결을 풀에 반환"""
+    if getattr(_local, 'conn', None) is conn:
+        _local.depth -= 1
+        if _local.depth > 0:
+            return
+        _local.conn = None
+
+    try:
+        if conn.in_transaction:
+            # 커밋되지 않은 작업은 다음 사용자에게 넘기지 않음
+            conn.rollback()
+    except sqlite3.ProgrammingError:
+        return
+
+    if conn._generation != _generation or _pool.qsize() >= _settings['pool_size']:
+        conn._close()
+    else:
+        _pool.put(conn)
+
+
+def close_all():
+    """풀에 있는 모든 연결 종료"""
+    while True:
+        try:
+            _pool.get_nowait()._close()
+        except queue.Empty:
+            break
+
+
+def data_version():
+    """데이터베이스 변경 버전 토큰
+
+    풀과 별도인 감시 연결의 ``PRAGMA data_version`` 을 사용한다. 다른
+    연결(다른 프로세스 포함)이 커밋할 때마다 값이 바뀌므로, 토큰이 같으면
+    마지막 확인 이후 변경된 데이터가 없다.
+    """
+    with _watcher_lock:
+        conn = _watcher['conn']
+        if conn is None or _watcher['generation'] != _generation:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(_settings['path'], check_same_thread=False)
+            _watcher.update(conn=conn, generation=_generation, serial=_watcher['serial'] + 1)
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return f"{_watcher['serial']}.{version}"
+
+
+@contextmanager
+def transaction(immediate=False):
+    """트랜잭션 컨텍스트
+
+    정상 종료 시 커밋, 예외 발생 시 롤백한다. 쓰기 경합이 예상되는
+    작업은 ``immediate=True`` 로 시작 시점에 쓰기 잠금을 확보한다.
+    이미 트랜잭션 중인 연결에서는 SAVEPOINT 로 중첩된다.
+    """
+    conn = get_connection()
+    nested = conn.in_transaction
+    try:
+        if nested:
+            conn.execute("SAVEPOINT nested_tx")
+        elif immediate:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        if nested:
+            conn.execute("RELEASE SAVEPOINT nested_tx")
+        else:
+            conn.commit()
+    except Exception:
+        if nested:
+            conn.execute("ROLLBACK TO SAVEPOINT nested_tx")
+            conn.execute("RELEASE SAVEPOINT nested_tx")
+        else:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+@contextmanager
+def capture_queries():
+    """이 스레드에서 execute() 로 실행되는 (SQL, 파라미터) 목록 수집
+
+    실행계획 점검처럼 실제 코드가 보내는 쿼리를 그대로 확인할 때 사용한다.
+    """
+    captured = []
+    _local.captured = captured
+    try:
+        yield captured
+    finally:
+        _local.captured = None
+
+
+def is_busy(error):
+    """잠금 경합 오류 여부 (SQLITE_BUSY / SQLITE_LOCKED)"""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code is not None:
+        return code & 0xff in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return 'locked' in str(error) or 'busy' in str(error)
+
+
+def busy_backoff(attempt):
+    """잠금 경합 재시도 전 대기 (지수 백오프, 상한 BUSY_BACKOFF_CAP)"""
+    time.sleep(random.uniform(0, min(BUSY_BACKOFF_BASE * 2 ** attempt, BUSY_BACKOFF_CAP)))
+
+
+def run_write(func, *args, retries=BUSY_RETRIES, **kwargs):
+    """func(conn, *args, **kwargs) 를 쓰기 트랜잭션에서 실행하고 결과 반환
+
+    BEGIN IMMEDIATE 로 시작 시점에 쓰기 잠금을 잡으므로 func 안의 조회와
+    갱신 사이에 다른 연결의 쓰기가 끼어들지 않는다. busy_timeout 이 지나도
+    잠금을 얻지 못하면(SQLITE_BUSY) 롤백 후 잠시 쉬었다가 처음부터 다시
+    실행한다. 이미 트랜잭션 중인 연결에서는 바깥 트랜잭션을 다시 실행할 수
+    없으므로 SAVEPOINT 로 한 번만 실행한다.
+    """
+    held = getattr(_local, 'conn', None)
+    if held is not None and held.in_transaction:
+        retries = 0
+    for attempt in range(retries + 1):
+        try:
+            with transaction(immediate=True) as conn:
+                return func(conn, *args, **kwargs)
+        except sqlite3.OperationalError as e:
+            if attempt == retries or not is_busy(e):
+                raise
+            logger.debug(f"쓰기 잠금 경합, 재시도 {attempt + 1}/{retries}: {e}")
+            busy_backoff(attempt)
+
+
+def fetch_one(query, params=()):
+    """단일 행 조회"""
+    conn = get_connection()
+    try:
+        return conn.execute(query, params).fetchone()
+    finally:
+        conn.close()
+
+
+def fetch_all(query, params=()):
+    """전체 행 조회"""
+    conn = get_connection()
+    try:
+        return conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+
+def fetch_scalar(query, params=(), default=0):
+    """단일 값 조회"""
+    row = fetch_one(query, params)
+    if row is None or row[0] is None:
+        return default
+    return row[0]
+
+
+def read_df(query, params=None):
+    """쿼리 결과를 DataFrame 으로 조회"""
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
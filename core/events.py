@@ -0,0 +1,127 @@
+# core/events.py - 데이터 변경 이벤트 브로커 및 SSE 스트림
+#
+# 쓰기 작업이 커밋된 뒤 publish('inventory') 처럼 영향받는 모듈(토픽)을
+# 알리면 /events 에 연결된 모든 브라우저로 Server-Sent Events 가 전송된다.
+# 클라이언트(assets/push.js)는 해당 토픽의 refresh-<topic> 스토어만 갱신하므로
+# 영향받는 컴포넌트만 다시 그려진다. 이벤트에는 데이터가 아닌 토픽만 담는다.
+
+import json
+import time
+import queue
+import threading
+import logging
+
+from flask import Response, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+# 화면 갱신 단위 (refresh-<topic> 스토어)
+TOPICS = ('dashboard', 'mes', 'inventory', 'purchase', 'sales', 'quality', 'hr', 'accounting')
+
+HEARTBEAT_SECONDS = 15
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class EventBroker:
+    """프로세스 내 발행/구독"""
+
+    def __init__(self):
+        self._subscribers = set()
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def subscribe(self):
+        """구독 큐 생성"""
+        q = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def add_listener(self, listener):
+        """서버 내부 수신자 등록 - listener(event)"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def publish(self, *topics):
+        """변경 이벤트 발행"""
+        unknown = set(topics) - set(TOPICS)
+        if unknown:
+            raise ValueError(f"알 수 없는 토픽: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            self._seq += 1
+            event = {'seq': self._seq, 'topics': list(topics), 'ts': time.time()}
+            subscribers = list(self._subscribers)
+            listeners = list(self._listeners)
+
+        for q in subscribers:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                # 처리하지 못하는 클라이언트는 가장 오래된 이벤트를 버린다
+                try:
+                    q.get_nowait()
+                    q.put_nowait(event)
+                except (queue.Empty, queue.Full):
+                    pass
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"이벤트 수신자 오류: {e}")
+        return event
+
+
+broker = EventBroker()
+
+
+def publish(*topics):
+    """쓰기 커밋 후 영향받는 토픽 알림"""
+    return broker.publish(*topics)
+
+
+def format_sse(event, name='change'):
+    """SSE 메시지 형식"""
+    return f"id: {event['seq']}\nevent: {name}\ndata: {json.dumps(event)}\n\n"
+
+
+def stream_events(q, heartbeat=HEARTBEAT_SECONDS):
+    """구독 큐를 SSE 스트림으로 변환 (연결 종료 시 구독 해제)"""
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                yield format_sse(q.get(timeout=heartbeat))
+            except queue.Empty:
+                # 프록시 타임아웃 방지용 주석 라인
+                yield ": ping\n\n"
+    finally:
+        broker.unsubscribe(q)
+
+
+def register_event_stream(server, path='/events'):
+    """Flask 서버에 SSE 엔드포인트 등록"""
+
+    @server.route(path)
+    def event_stream():
+        q = broker.subscribe()
+        return Response(
+            stream_with_context(stream_events(q)),
+            mimetype='text/event-stream',
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+
+    return event_stream
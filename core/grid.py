@@ -0,0 +1,336 @@
+# core/grid.py - 서버 측 페이지/정렬/필터 목록 그리드
+#
+# 목록 화면은 전체 결과를 pandas 로 읽어 html.Tr 를 만드는 대신 SqlGrid 를 사용한다.
+# dash_table.DataTable 의 page/sort/filter_action='custom' 요청을 화이트리스트
+# 컬럼 기준의 파라미터 SQL 로 바꾸고, 화면에 보이는 한 페이지만 조회해 전송한다.
+#
+# 다음 페이지는 직전 페이지 마지막 행의 정렬 키 이후를 찾는 키셋 방식으로 조회한다.
+# 기준점은 그리드별 dcc.Store 에 보관하며 조회 조건/정렬/데이터 버전이 바뀌면 버린다.
+# 기준점이 없는 페이지(임의 이동)나 NULL 허용 컬럼 정렬은 OFFSET 으로 조회한다.
+
+import json
+import math
+import hashlib
+import logging
+
+from dash import dcc, html, dash_table, Input, Output, State, callback_context, no_update
+
+from core.database import get_connection, data_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_ANCHORS = 200
+
+# DataTable filter_query 연산자 -> SQL 비교 연산자
+COMPARE_OPERATORS = {
+    'eq': '=', '=': '=',
+    'ne': '!=', '!=': '!=',
+    'lt': '<', '<': '<',
+    'le': '<=', '<=': '<=',
+    'gt': '>', '>': '>',
+    'ge': '>=', '>=': '>=',
+}
+
+TABLE_STYLE = {
+    'style_table': {'overflowX': 'auto'},
+    'style_cell': {'padding': '6px', 'fontSize': '14px', 'textAlign': 'left'},
+    'style_header': {'fontWeight': 'bold', 'backgroundColor': '#f8f9fa'},
+    'style_data_conditional': [
+        {'if': {'row_index': 'odd'}, 'backgroundColor': '#f8f9fa'},
+    ],
+}
+
+
+# 배지 색상명 -> 글자색
+BADGE_COLORS = {
+    'primary': '#0d6efd',
+    'secondary': '#6c757d',
+    'success': '#198754',
+    'danger': '#dc3545',
+    'warning': '#cc9a06',
+    'info': '#0aa2c0',
+    'dark': '#212529',
+}
+
+
+def _label(value):
+    return value[0] if isinstance(value, tuple) else value
+
+
+def label_case(expr, mapping, default=None):
+    """코드 값을 표시명으로 바꾸는 CASE 식 (상수 매핑 전용)
+
+    mapping 값은 표시명 또는 (표시명, 배지 색상) 튜플.
+    """
+    def quote(value):
+        return "'" + str(value).replace("'", "''") + "'"
+
+    whens = " ".join(f"WHEN {quote(code)} THEN {quote(_label(label))}" for code, label in mapping.items())
+    fallback = quote(default) if default is not None else expr
+    return f"CASE {expr} {whens} ELSE {fallback} END"
+
+
+def badge_styles(column_id, mapping):
+    """표시명별 글자색 조건부 스타일 (mapping 값은 (표시명, 배지 색상))"""
+    return [
+        {'if': {'filter_query': f'{{{column_id}}} = "{label}"', 'column_id': column_id},
+         'color': BADGE_COLORS.get(color, BADGE_COLORS['secondary']), 'fontWeight': 'bold'}
+        for label, color in mapping.values()
+    ]
+
+
+def _normalize_operator(op):
+    """대소문자 구분 접두어(i/s)를 제거한 연산자"""
+    op = op.lower()
+    if op in COMPARE_OPERATORS or op in ('contains', 'datestartswith'):
+        return op
+    if op[:1] in ('i', 's') and len(op) > 1:
+        return _normalize_operator(op[1:])
+    return None
+
+
+def _parse_value(raw):
+    """필터 값의 따옴표 제거"""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in ('"', "'", '`'):
+        return raw[1:-1].replace('\\' + raw[0], raw[0])
+    return raw
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class SqlGrid:
+    """SQL 조회 결과를 페이지 단위로 보여주는 DataTable
+
+    columns: [{'id', 'name', 'sql', 'type', 'format', 'nullable'}, ...]
+      sql 은 SELECT/WHERE/ORDER BY 에 그대로 사용하는 식이며 없으면 id 를 쓴다.
+      정렬/필터는 여기 등록된 컬럼으로만 가능하다. nullable=False 인 컬럼만
+      키셋 조회에 사용한다.
+    key: 행을 유일하게 구분하는 NOT NULL 식 (정렬 동점 처리)
+    default_sort: DataTable sort_by 형식 [{'column_id', 'direction'}, ...]
+    where: 항상 적용되는 조건 (예: 'is_active = 1')
+    """
+
+    def __init__(self, grid_id, from_sql, columns, key, default_sort=(), where=None,
+                 page_size=DEFAULT_PAGE_SIZE, style_data_conditional=()):
+        self.grid_id = grid_id
+        self.cursor_id = f"{grid_id}-cursor"
+        self.from_sql = from_sql
+        self.columns = [dict(c) for c in columns]
+        self.column_map = {c['id']: c for c in self.columns}
+        self.key = key
+        self.default_sort = list(default_sort)
+        self.where = where
+        self.page_size = page_size
+        self.style_data_conditional = list(style_data_conditional)
+
+    # ---- 레이아웃 ----
+
+    def table_columns(self):
+        """DataTable columns 정의"""
+        result = []
+        for c in self.columns:
+            column = {'id': c['id'], 'name': c['name']}
+            for prop in ('type', 'format', 'presentation'):
+                if prop in c:
+                    column[prop] = c[prop]
+            result.append(column)
+        return result
+
+    def layout(self, **table_props):
+        """DataTable 및 키셋 기준점 저장소"""
+        props = dict(TABLE_STYLE)
+        props['style_data_conditional'] = TABLE_STYLE['style_data_conditional'] + self.style_data_conditional
+        props.update(table_props)
+        return html.Div([
+            dash_table.DataTable(
+                id=self.grid_id,
+                columns=self.table_columns(),
+                data=[],
+                page_current=0,
+                page_size=self.page_size,
+                page_count=1,
+                page_action='custom',
+                sort_action='custom',
+                sort_mode='multi',
+                sort_by=[],
+                filter_action='custom',
+                filter_query='',
+                **props
+            ),
+            dcc.Store(id=self.cursor_id)
+        ])
+
+    # ---- SQL 변환 ----
+
+    def _sql(self, column):
+        return column.get('sql', column['id'])
+
+    def parse_filter(self, filter_query):
+        """DataTable filter_query -> (조건 목록, 파라미터 목록)
+
+        등록되지 않은 컬럼이나 지원하지 않는 연산자는 무시한다.
+        """
+        clauses, params = [], []
+        if not filter_query:
+            return clauses, params
+
+        for part in filter_query.split(' && '):
+            part = part.strip()
+            if not part.startswith('{') or '}' not in part:
+                continue
+            column_id, rest = part[1:].split('}', 1)
+            column = self.column_map.get(column_id)
+            pieces = rest.strip().split(None, 1)
+            if column is None or len(pieces) != 2:
+                continue
+
+            op = _normalize_operator(pieces[0])
+            value = _parse_value(pieces[1])
+            expr = self._sql(column)
+
+            if op == 'contains':
+                clauses.append(f"{expr} LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(value)}%")
+            elif op == 'datestartswith':
+                clauses.append(f"{expr} LIKE ? ESCAPE '\\'")
+                params.append(f"{_escape_like(value)}%")
+            elif op in COMPARE_OPERATORS:
+                if column.get('type') == 'numeric':
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        continue
+                clauses.append(f"{expr} {COMPARE_OPERATORS[op]} ?")
+                params.append(value)
+        return clauses, params
+
+    def order_terms(self, sort_by=None):
+        """정렬 식 [(sql, 'asc'|'desc', nullable), ...] - 마지막은 항상 key"""
+        terms = []
+        for sort in (sort_by or self.default_sort):
+            column = self.column_map.get(sort.get('column_id'))
+            if column is None:
+                continue
+            direction = 'asc' if sort.get('direction') == 'asc' else 'desc'
+            terms.append((self._sql(column), direction, column.get('nullable', True)))
+        last_direction = terms[-1][1] if terms else 'desc'
+        terms.append((self.key, last_direction, False))
+        return terms
+
+    @staticmethod
+    def _seek(terms, anchor):
+        """키셋 조건: 정렬 순서상 anchor 이후의 행"""
+        ors, params = [], []
+        for i, (expr, direction, _) in enumerate(terms):
+            ands = [f"{terms[j][0]} = ?" for j in range(i)]
+            ands.append(f"{expr} {'>' if direction == 'asc' else '<'} ?")
+            ors.append("(" + " AND ".join(ands) + ")")
+            params.extend(anchor[:i + 1])
+        return "(" + " OR ".join(ors) + ")", params
+
+    # ---- 조회 ----
+
+    def fetch(self, page_current=0, page_size=None, sort_by=None, filter_query='',
+              where=(), params=(), cursor=None):
+        """한 페이지 조회
+
+        반환값: (records, page_count, total, cursor)
+        cursor 는 다음 호출에 그대로 넘기는 키셋 기준점 ({'signature', 'anchors'}).
+        """
+        page_size = page_size or self.page_size
+        clauses = ([self.where] if self.where else []) + list(where)
+        args = list(params)
+        filter_clauses, filter_params = self.parse_filter(filter_query)
+        clauses += filter_clauses
+        args += filter_params
+        terms = self.order_terms(sort_by)
+
+        signature = hashlib.sha1(
+            json.dumps([clauses, args, terms, data_version()], default=str).encode()
+        ).hexdigest()
+        anchors = {}
+        if cursor and cursor.get('signature') == signature:
+            anchors = dict(cursor.get('anchors') or {})
+
+        where_sql = (" WHERE " + " AND ".join(f"({c})" for c in clauses)) if clauses else ""
+
+        conn = get_connection()
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM {self.from_sql}{where_sql}", args).fetchone()[0]
+            page_count = max(1, math.ceil(total / page_size))
+            page = min(max(page_current or 0, 0), page_count - 1)
+
+            anchor = anchors.get(str(page - 1))
+            seek_sql, seek_params, offset = "", [], page * page_size
+            if page > 0 and anchor is not None and not any(nullable for _, _, nullable in terms):
+                seek, seek_params = self._seek(terms, anchor)
+                seek_sql = (" AND " if where_sql else " WHERE ") + seek
+                offset = 0
+
+            select = ", ".join(f"{self._sql(c)} AS {c['id']}" for c in self.columns)
+            sort_keys = ", ".join(f"{expr} AS _sort{i}" for i, (expr, _, _) in enumerate(terms))
+            order = ", ".join(f"{expr} {direction.upper()}" for expr, direction, _ in terms)
+            query = (f"SELECT {select}, {sort_keys} FROM {self.from_sql}{where_sql}{seek_sql} "
+                     f"ORDER BY {order} LIMIT ? OFFSET ?")
+            rows = conn.execute(query, args + seek_params + [page_size, offset]).fetchall()
+        finally:
+            conn.close()
+
+        width = len(self.columns)
+        ids = [c['id'] for c in self.columns]
+        records = [dict(zip(ids, row[:width])) for row in rows]
+
+        if rows:
+            anchors[str(page)] = list(rows[-1][width:])
+            if len(anchors) > MAX_ANCHORS:
+                anchors = {k: v for k, v in anchors.items() if abs(int(k) - page) < MAX_ANCHORS // 2}
+
+        return records, page_count, total, {'signature': signature, 'anchors': anchors}
+
+    # ---- 콜백 ----
+
+    def register(self, app, inputs=(), states=(), scope=None):
+        """그리드 조회 콜백 등록
+
+        inputs/states 는 모듈 조회 조건 컴포넌트이며 scope(*inputs 값, *states 값) 은
+        (where 목록, 파라미터 목록)을 반환한다. 페이지 이동 외의 변경은 첫 페이지로 돌아간다.
+        """
+        inputs, states = list(inputs), list(states)
+
+        @app.callback(
+            [Output(self.grid_id, 'data'),
+             Output(self.grid_id, 'page_count'),
+             Output(self.grid_id, 'page_current'),
+             Output(self.cursor_id, 'data')],
+            [Input(self.grid_id, 'page_current'),
+             Input(self.grid_id, 'page_size'),
+             Input(self.grid_id, 'sort_by'),
+             Input(self.grid_id, 'filter_query')] + inputs,
+            [State(self.cursor_id, 'data')] + states
+        )
+        def update_grid(page_current, page_size, sort_by, filter_query, *values):
+            input_values = values[:len(inputs)]
+            cursor = values[len(inputs)]
+            state_values = values[len(inputs) + 1:]
+
+            triggered = {t['prop_id'] for t in callback_context.triggered}
+            paging = triggered <= {f"{self.grid_id}.page_current", f"{self.grid_id}.page_size"}
+            page = page_current if paging else 0
+
+            where, params = scope(*input_values, *state_values) if scope else ((), ())
+            try:
+                records, page_count, _, cursor = self.fetch(
+                    page, page_size, sort_by, filter_query, where, params, cursor
+                )
+            except Exception as e:
+                logger.error(f"{self.grid_id} 조회 오류: {e}")
+                return [], 1, no_update, None
+
+            page = min(page or 0, page_count - 1)
+            return records, page_count, (no_update if page == page_current else page), cursor
+
+        return update_grid
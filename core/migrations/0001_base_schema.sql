@@ -0,0 +1,1002 @@
+-- 0001_base_schema.sql - 기본 스키마 (app.init_database 및 scripts/create_*_tables.py 통합)
+
+-- 기본 시스템 테이블
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL,
+    role TEXT DEFAULT 'user',
+    department TEXT,
+    email TEXT,
+    phone TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 작업 로그 테이블 (MES)
+CREATE TABLE IF NOT EXISTS work_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lot_number TEXT NOT NULL,
+    work_date DATE NOT NULL,
+    process TEXT NOT NULL,
+    worker_id INTEGER,
+    plan_qty INTEGER,
+    prod_qty INTEGER,
+    defect_qty INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES users (id)
+);
+
+-- 시스템 설정 테이블
+CREATE TABLE IF NOT EXISTS system_config (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 폼 템플릿 테이블
+CREATE TABLE IF NOT EXISTS form_templates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    config TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 품목 마스터 테이블 (재고관리용)
+CREATE TABLE IF NOT EXISTS item_master (
+    item_code TEXT PRIMARY KEY,
+    item_name TEXT NOT NULL,
+    category TEXT,
+    unit TEXT DEFAULT 'EA',
+    safety_stock INTEGER DEFAULT 0,
+    current_stock INTEGER DEFAULT 0,
+    unit_price REAL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 재고 이동 테이블
+CREATE TABLE IF NOT EXISTS stock_movements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    movement_date DATE NOT NULL,
+    movement_type TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    warehouse TEXT,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- 재고 조정 테이블
+CREATE TABLE IF NOT EXISTS stock_adjustments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    adjustment_date DATE NOT NULL,
+    item_code TEXT NOT NULL,
+    adjustment_type TEXT,
+    before_qty INTEGER,
+    after_qty INTEGER,
+    difference INTEGER,
+    reason TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- 거래처 마스터 (구매관리)
+CREATE TABLE IF NOT EXISTS supplier_master (
+    supplier_code TEXT PRIMARY KEY,
+    supplier_name TEXT NOT NULL,
+    business_no TEXT,
+    ceo_name TEXT,
+    contact_person TEXT,
+    phone TEXT,
+    email TEXT,
+    address TEXT,
+    payment_terms TEXT DEFAULT 'CASH',
+    lead_time INTEGER DEFAULT 7,
+    rating INTEGER DEFAULT 3,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 발주서 헤더
+CREATE TABLE IF NOT EXISTS purchase_orders (
+    po_number TEXT PRIMARY KEY,
+    po_date DATE NOT NULL,
+    supplier_code TEXT NOT NULL,
+    delivery_date DATE,
+    warehouse TEXT,
+    total_amount REAL DEFAULT 0,
+    status TEXT DEFAULT 'draft',
+    approved_by INTEGER,
+    approved_date TIMESTAMP,
+    remarks TEXT,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (supplier_code) REFERENCES supplier_master (supplier_code)
+);
+
+-- 발주서 상세
+CREATE TABLE IF NOT EXISTS purchase_order_details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    po_number TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    unit_price REAL NOT NULL,
+    amount REAL NOT NULL,
+    received_qty INTEGER DEFAULT 0,
+    remarks TEXT,
+    FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- 입고 예정
+CREATE TABLE IF NOT EXISTS receiving_schedule (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    po_number TEXT NOT NULL,
+    scheduled_date DATE NOT NULL,
+    item_code TEXT NOT NULL,
+    expected_qty INTEGER NOT NULL,
+    received_qty INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'pending',
+    FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- 입고 검수
+CREATE TABLE IF NOT EXISTS receiving_inspection (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    receiving_date DATE NOT NULL,
+    po_number TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    received_qty INTEGER NOT NULL,
+    accepted_qty INTEGER NOT NULL,
+    rejected_qty INTEGER DEFAULT 0,
+    inspection_result TEXT,
+    inspector_id INTEGER,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- 자동 발주 규칙
+CREATE TABLE IF NOT EXISTS auto_po_rules (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_code TEXT NOT NULL,
+    supplier_code TEXT NOT NULL,
+    reorder_point INTEGER NOT NULL,
+    order_qty INTEGER NOT NULL,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code),
+    FOREIGN KEY (supplier_code) REFERENCES supplier_master (supplier_code)
+);
+
+-- 계정과목 마스터 (회계관리)
+CREATE TABLE IF NOT EXISTS account_master (
+    account_code TEXT PRIMARY KEY,
+    account_name TEXT NOT NULL,
+    account_type TEXT NOT NULL,
+    parent_code TEXT,
+    level INTEGER DEFAULT 1,
+    is_control BOOLEAN DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 전표 헤더
+CREATE TABLE IF NOT EXISTS journal_header (
+    voucher_no TEXT PRIMARY KEY,
+    voucher_date DATE NOT NULL,
+    voucher_type TEXT NOT NULL,
+    description TEXT,
+    total_debit REAL DEFAULT 0,
+    total_credit REAL DEFAULT 0,
+    status TEXT DEFAULT 'draft',
+    created_by INTEGER,
+    approved_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (created_by) REFERENCES users (id),
+    FOREIGN KEY (approved_by) REFERENCES users (id)
+);
+
+-- 전표 상세
+CREATE TABLE IF NOT EXISTS journal_details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    voucher_no TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    account_code TEXT NOT NULL,
+    debit_amount REAL DEFAULT 0,
+    credit_amount REAL DEFAULT 0,
+    description TEXT,
+    cost_center TEXT,
+    FOREIGN KEY (voucher_no) REFERENCES journal_header (voucher_no),
+    FOREIGN KEY (account_code) REFERENCES account_master (account_code)
+);
+
+-- 세금계산서
+CREATE TABLE IF NOT EXISTS tax_invoice (
+    invoice_no TEXT PRIMARY KEY,
+    invoice_date DATE NOT NULL,
+    invoice_type TEXT NOT NULL,
+    customer_code TEXT,
+    supplier_code TEXT,
+    business_no TEXT,
+    company_name TEXT,
+    ceo_name TEXT,
+    address TEXT,
+    supply_amount REAL DEFAULT 0,
+    tax_amount REAL DEFAULT 0,
+    total_amount REAL DEFAULT 0,
+    status TEXT DEFAULT 'draft',
+    voucher_no TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (voucher_no) REFERENCES journal_header (voucher_no)
+);
+
+-- 예산 마스터
+CREATE TABLE IF NOT EXISTS budget_master (
+    budget_id TEXT PRIMARY KEY,
+    budget_year INTEGER NOT NULL,
+    budget_month INTEGER,
+    department TEXT,
+    account_code TEXT NOT NULL,
+    budget_amount REAL DEFAULT 0,
+    actual_amount REAL DEFAULT 0,
+    variance REAL DEFAULT 0,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (account_code) REFERENCES account_master (account_code)
+);
+
+-- 원가 계산
+CREATE TABLE IF NOT EXISTS cost_calculation (
+    calc_id TEXT PRIMARY KEY,
+    calc_date DATE NOT NULL,
+    product_code TEXT NOT NULL,
+    material_cost REAL DEFAULT 0,
+    labor_cost REAL DEFAULT 0,
+    overhead_cost REAL DEFAULT 0,
+    total_cost REAL DEFAULT 0,
+    production_qty INTEGER DEFAULT 0,
+    unit_cost REAL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 결산 마스터
+CREATE TABLE IF NOT EXISTS closing_master (
+    closing_id TEXT PRIMARY KEY,
+    closing_year INTEGER NOT NULL,
+    closing_month INTEGER NOT NULL,
+    closing_type TEXT NOT NULL,
+    status TEXT DEFAULT 'open',
+    closed_date TIMESTAMP,
+    closed_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (closed_by) REFERENCES users (id)
+);
+
+-- 고정자산 마스터
+CREATE TABLE IF NOT EXISTS fixed_asset (
+    asset_code TEXT PRIMARY KEY,
+    asset_name TEXT NOT NULL,
+    asset_type TEXT,
+    acquisition_date DATE NOT NULL,
+    acquisition_cost REAL DEFAULT 0,
+    depreciation_method TEXT DEFAULT 'straight',
+    useful_life INTEGER DEFAULT 5,
+    salvage_value REAL DEFAULT 0,
+    accumulated_depreciation REAL DEFAULT 0,
+    book_value REAL DEFAULT 0,
+    disposal_date DATE,
+    disposal_amount REAL DEFAULT 0,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 입고검사 테이블
+CREATE TABLE IF NOT EXISTS incoming_inspection (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inspection_no TEXT UNIQUE NOT NULL,
+    inspection_date DATE NOT NULL,
+    po_number TEXT,
+    item_code TEXT NOT NULL,
+    lot_number TEXT,
+    received_qty INTEGER NOT NULL,
+    sample_qty INTEGER NOT NULL,
+    passed_qty INTEGER NOT NULL,
+    failed_qty INTEGER DEFAULT 0,
+    inspection_result TEXT NOT NULL,
+    defect_codes TEXT,
+    inspector_id INTEGER,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code),
+    FOREIGN KEY (inspector_id) REFERENCES users (id)
+);
+
+-- 공정검사 테이블
+CREATE TABLE IF NOT EXISTS process_inspection (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inspection_no TEXT UNIQUE NOT NULL,
+    inspection_date DATE NOT NULL,
+    work_order_no TEXT,
+    process_code TEXT,
+    item_code TEXT NOT NULL,
+    lot_number TEXT,
+    production_qty INTEGER NOT NULL,
+    sample_qty INTEGER NOT NULL,
+    passed_qty INTEGER NOT NULL,
+    failed_qty INTEGER DEFAULT 0,
+    inspection_result TEXT NOT NULL,
+    defect_codes TEXT,
+    inspector_id INTEGER,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code),
+    FOREIGN KEY (inspector_id) REFERENCES users (id)
+);
+
+-- 출하검사 테이블
+CREATE TABLE IF NOT EXISTS final_inspection (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inspection_no TEXT UNIQUE NOT NULL,
+    inspection_date DATE NOT NULL,
+    order_number TEXT,
+    product_code TEXT NOT NULL,
+    lot_number TEXT,
+    inspection_qty INTEGER NOT NULL,
+    sample_qty INTEGER NOT NULL,
+    passed_qty INTEGER NOT NULL,
+    failed_qty INTEGER DEFAULT 0,
+    inspection_result TEXT NOT NULL,
+    defect_codes TEXT,
+    inspector_id INTEGER,
+    certificate_no TEXT,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (inspector_id) REFERENCES users (id)
+);
+
+-- 불량유형 마스터
+CREATE TABLE IF NOT EXISTS defect_types (
+    defect_code TEXT PRIMARY KEY,
+    defect_name TEXT NOT NULL,
+    defect_category TEXT,
+    severity_level INTEGER DEFAULT 3,
+    description TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 불량이력 테이블
+CREATE TABLE IF NOT EXISTS defect_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    defect_date DATE NOT NULL,
+    inspection_no TEXT,
+    defect_code TEXT NOT NULL,
+    item_code TEXT,
+    defect_qty INTEGER NOT NULL,
+    defect_location TEXT,
+    cause_analysis TEXT,
+    corrective_action TEXT,
+    prevention_action TEXT,
+    responsible_person TEXT,
+    status TEXT DEFAULT 'open',
+    closed_date DATE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (defect_code) REFERENCES defect_types (defect_code)
+);
+
+-- 측정장비 마스터
+CREATE TABLE IF NOT EXISTS measurement_equipment (
+    equipment_id TEXT PRIMARY KEY,
+    equipment_name TEXT NOT NULL,
+    equipment_type TEXT,
+    manufacturer TEXT,
+    model_no TEXT,
+    serial_no TEXT,
+    calibration_cycle INTEGER DEFAULT 365,
+    last_calibration_date DATE,
+    next_calibration_date DATE,
+    calibration_certificate_no TEXT,
+    location TEXT,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- SPC 데이터 테이블
+CREATE TABLE IF NOT EXISTS spc_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    measurement_date TIMESTAMP NOT NULL,
+    process_code TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    characteristic TEXT NOT NULL,
+    measurement_value REAL NOT NULL,
+    sample_no INTEGER,
+    subgroup_no INTEGER,
+    usl REAL,
+    lsl REAL,
+    target REAL,
+    operator_id INTEGER,
+    equipment_id TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (operator_id) REFERENCES users (id)
+);
+
+-- 품질 성적서 테이블
+CREATE TABLE IF NOT EXISTS quality_certificates (
+    certificate_no TEXT PRIMARY KEY,
+    issue_date DATE NOT NULL,
+    customer_code TEXT,
+    order_number TEXT,
+    product_code TEXT NOT NULL,
+    lot_number TEXT,
+    test_items TEXT,
+    test_results TEXT,
+    overall_result TEXT NOT NULL,
+    issued_by INTEGER,
+    approved_by INTEGER,
+    file_path TEXT,
+    status TEXT DEFAULT 'draft',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (issued_by) REFERENCES users (id),
+    FOREIGN KEY (approved_by) REFERENCES users (id)
+);
+
+-- 고객 마스터
+CREATE TABLE IF NOT EXISTS customers (
+    customer_code TEXT PRIMARY KEY,
+    customer_name TEXT NOT NULL,
+    business_no TEXT,
+    ceo_name TEXT,
+    contact_person TEXT,
+    phone TEXT,
+    email TEXT,
+    address TEXT,
+    grade TEXT DEFAULT 'Bronze',  -- VIP, Gold, Silver, Bronze
+    payment_terms TEXT DEFAULT 'NET30',
+    credit_limit REAL DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 견적서 헤더
+CREATE TABLE IF NOT EXISTS quotations (
+    quote_number TEXT PRIMARY KEY,
+    quote_date DATE NOT NULL,
+    customer_code TEXT NOT NULL,
+    validity_date DATE NOT NULL,
+    total_amount REAL DEFAULT 0,
+    discount_rate REAL DEFAULT 0,
+    discount_amount REAL DEFAULT 0,
+    status TEXT DEFAULT 'draft',  -- draft, sent, reviewing, won, lost, expired
+    notes TEXT,
+    created_by INTEGER,
+    approved_by INTEGER,
+    approved_date TIMESTAMP,
+    sent_date TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
+    FOREIGN KEY (created_by) REFERENCES users (id),
+    FOREIGN KEY (approved_by) REFERENCES users (id)
+);
+
+-- 견적서 상세
+CREATE TABLE IF NOT EXISTS quotation_details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    quote_number TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    product_code TEXT,
+    product_name TEXT NOT NULL,
+    description TEXT,
+    quantity INTEGER NOT NULL,
+    unit_price REAL NOT NULL,
+    amount REAL NOT NULL,
+    FOREIGN KEY (quote_number) REFERENCES quotations (quote_number)
+);
+
+-- 수주 헤더
+CREATE TABLE IF NOT EXISTS sales_orders (
+    order_number TEXT PRIMARY KEY,
+    order_date DATE NOT NULL,
+    customer_code TEXT NOT NULL,
+    quote_number TEXT,
+    delivery_date DATE,
+    total_amount REAL DEFAULT 0,
+    status TEXT DEFAULT 'received',  -- received, confirmed, in_production, ready_for_delivery, completed, cancelled
+    payment_status TEXT DEFAULT 'pending',  -- pending, partial, completed
+    shipping_address TEXT,
+    notes TEXT,
+    created_by INTEGER,
+    approved_by INTEGER,
+    approved_date TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
+    FOREIGN KEY (quote_number) REFERENCES quotations (quote_number),
+    FOREIGN KEY (created_by) REFERENCES users (id),
+    FOREIGN KEY (approved_by) REFERENCES users (id)
+);
+
+-- 수주 상세
+CREATE TABLE IF NOT EXISTS sales_order_details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_number TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    product_code TEXT,
+    product_name TEXT NOT NULL,
+    description TEXT,
+    quantity INTEGER NOT NULL,
+    unit_price REAL NOT NULL,
+    amount REAL NOT NULL,
+    delivered_qty INTEGER DEFAULT 0,
+    FOREIGN KEY (order_number) REFERENCES sales_orders (order_number)
+);
+
+-- 영업 활동
+CREATE TABLE IF NOT EXISTS sales_activities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    activity_date DATE NOT NULL,
+    activity_type TEXT NOT NULL,  -- call, email, meeting, demo, follow_up
+    customer_code TEXT,
+    contact_person TEXT,
+    subject TEXT,
+    description TEXT,
+    result TEXT,
+    next_action TEXT,
+    next_action_date DATE,
+    sales_person_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
+    FOREIGN KEY (sales_person_id) REFERENCES users (id)
+);
+
+-- 영업 기회 (Opportunity)
+CREATE TABLE IF NOT EXISTS sales_opportunities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    opportunity_name TEXT NOT NULL,
+    customer_code TEXT NOT NULL,
+    estimated_amount REAL DEFAULT 0,
+    probability INTEGER DEFAULT 50,  -- 0-100%
+    expected_close_date DATE,
+    stage TEXT DEFAULT 'prospecting',  -- prospecting, qualification, proposal, negotiation, closed_won, closed_lost
+    source TEXT,  -- referral, website, cold_call, exhibition, etc.
+    competitor TEXT,
+    sales_person_id INTEGER,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
+    FOREIGN KEY (sales_person_id) REFERENCES users (id)
+);
+
+-- 제품 마스터 (영업용)
+CREATE TABLE IF NOT EXISTS products (
+    product_code TEXT PRIMARY KEY,
+    product_name TEXT NOT NULL,
+    category TEXT,
+    description TEXT,
+    unit_price REAL DEFAULT 0,
+    cost_price REAL DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 가격 정책
+CREATE TABLE IF NOT EXISTS price_policies (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    policy_name TEXT NOT NULL,
+    customer_grade TEXT,  -- VIP, Gold, Silver, Bronze
+    product_category TEXT,
+    discount_rate REAL DEFAULT 0,
+    min_quantity INTEGER DEFAULT 1,
+    effective_date DATE NOT NULL,
+    expiry_date DATE,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 배송 정보
+CREATE TABLE IF NOT EXISTS deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    delivery_number TEXT UNIQUE NOT NULL,
+    order_number TEXT NOT NULL,
+    delivery_date DATE,
+    tracking_number TEXT,
+    delivery_company TEXT,
+    delivery_status TEXT DEFAULT 'preparing',  -- preparing, shipped, in_transit, delivered, failed
+    recipient_name TEXT,
+    recipient_phone TEXT,
+    delivery_address TEXT,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (order_number) REFERENCES sales_orders (order_number)
+);
+
+-- 고객 연락 이력
+CREATE TABLE IF NOT EXISTS customer_contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    customer_code TEXT NOT NULL,
+    contact_date DATE NOT NULL,
+    contact_type TEXT NOT NULL,  -- phone, email, visit, video_call
+    contact_person TEXT,
+    subject TEXT,
+    content TEXT,
+    result TEXT,
+    sales_person_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
+    FOREIGN KEY (sales_person_id) REFERENCES users (id)
+);
+
+-- 매출 목표
+CREATE TABLE IF NOT EXISTS sales_targets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target_year INTEGER NOT NULL,
+    target_month INTEGER,
+    sales_person_id INTEGER,
+    customer_code TEXT,
+    product_category TEXT,
+    target_amount REAL NOT NULL,
+    actual_amount REAL DEFAULT 0,
+    achievement_rate REAL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (sales_person_id) REFERENCES users (id),
+    FOREIGN KEY (customer_code) REFERENCES customers (customer_code)
+);
+
+-- 직원 마스터
+CREATE TABLE IF NOT EXISTS employees (
+    emp_id TEXT PRIMARY KEY,
+    emp_name TEXT NOT NULL,
+    emp_name_en TEXT,
+    department TEXT NOT NULL,
+    position TEXT NOT NULL,
+    hire_date DATE NOT NULL,
+    birth_date DATE,
+    gender TEXT,
+    phone TEXT,
+    email TEXT,
+    address TEXT,
+    emergency_contact TEXT,
+    emergency_phone TEXT,
+    employee_type TEXT DEFAULT 'regular',
+    work_status TEXT DEFAULT 'active',
+    resignation_date DATE,
+    photo BLOB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 근태 기록
+CREATE TABLE IF NOT EXISTS attendance (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    emp_id TEXT NOT NULL,
+    work_date DATE NOT NULL,
+    check_in_time TIMESTAMP,
+    check_out_time TIMESTAMP,
+    work_hours REAL DEFAULT 0,
+    overtime_hours REAL DEFAULT 0,
+    status TEXT DEFAULT 'normal',
+    late_minutes INTEGER DEFAULT 0,
+    early_leave_minutes INTEGER DEFAULT 0,
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
+    UNIQUE(emp_id, work_date)
+);
+
+-- 휴가 신청
+CREATE TABLE IF NOT EXISTS leave_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    emp_id TEXT NOT NULL,
+    leave_type TEXT NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    leave_days REAL NOT NULL,
+    reason TEXT,
+    status TEXT DEFAULT 'pending',
+    approver_id TEXT,
+    approval_date TIMESTAMP,
+    approval_comment TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
+    FOREIGN KEY (approver_id) REFERENCES employees (emp_id)
+);
+
+-- 급여 정보
+CREATE TABLE IF NOT EXISTS salary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    emp_id TEXT NOT NULL,
+    salary_month TEXT NOT NULL,
+    basic_salary REAL DEFAULT 0,
+    position_allowance REAL DEFAULT 0,
+    meal_allowance REAL DEFAULT 0,
+    transport_allowance REAL DEFAULT 0,
+    overtime_pay REAL DEFAULT 0,
+    bonus REAL DEFAULT 0,
+    other_allowance REAL DEFAULT 0,
+    total_earning REAL DEFAULT 0,
+    income_tax REAL DEFAULT 0,
+    resident_tax REAL DEFAULT 0,
+    health_insurance REAL DEFAULT 0,
+    pension REAL DEFAULT 0,
+    employment_insurance REAL DEFAULT 0,
+    accident_insurance REAL DEFAULT 0,
+    other_deduction REAL DEFAULT 0,
+    total_deduction REAL DEFAULT 0,
+    net_salary REAL DEFAULT 0,
+    payment_date DATE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
+    UNIQUE(emp_id, salary_month)
+);
+
+-- 부서 마스터
+CREATE TABLE IF NOT EXISTS departments (
+    dept_code TEXT PRIMARY KEY,
+    dept_name TEXT NOT NULL,
+    dept_name_en TEXT,
+    parent_dept TEXT,
+    dept_head TEXT,
+    location TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (dept_head) REFERENCES employees (emp_id)
+);
+
+-- 직급 마스터
+CREATE TABLE IF NOT EXISTS positions (
+    position_code TEXT PRIMARY KEY,
+    position_name TEXT NOT NULL,
+    position_name_en TEXT,
+    position_level INTEGER,
+    min_salary REAL,
+    max_salary REAL,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- API 토큰
+CREATE TABLE IF NOT EXISTS api_tokens (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    token TEXT UNIQUE NOT NULL,
+    name TEXT,
+    permissions TEXT,
+    expires_at TIMESTAMP,
+    last_used_at TIMESTAMP,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+-- API 로그
+CREATE TABLE IF NOT EXISTS api_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    endpoint TEXT NOT NULL,
+    method TEXT NOT NULL,
+    user_id INTEGER,
+    ip_address TEXT,
+    request_body TEXT,
+    response_code INTEGER,
+    response_time REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+-- === 보조 테이블 (scripts/create_hr_tables.py, create_quality_tables.py, setup_v1_3.py) ===
+
+-- annual_leave
+CREATE TABLE IF NOT EXISTS annual_leave (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    total_days REAL DEFAULT 15,
+    used_days REAL DEFAULT 0,
+    remaining_days REAL DEFAULT 15,
+    carried_over REAL DEFAULT 0,
+    adjustment_days REAL DEFAULT 0,
+    adjustment_reason TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id),
+    UNIQUE(employee_id, year)
+);
+
+-- payroll
+CREATE TABLE IF NOT EXISTS payroll (
+    payroll_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    pay_year INTEGER NOT NULL,
+    pay_month INTEGER NOT NULL,
+    base_salary REAL DEFAULT 0,
+    overtime_pay REAL DEFAULT 0,
+    bonus REAL DEFAULT 0,
+    allowances REAL DEFAULT 0,
+    gross_salary REAL DEFAULT 0,
+    income_tax REAL DEFAULT 0,
+    health_insurance REAL DEFAULT 0,
+    pension REAL DEFAULT 0,
+    employment_insurance REAL DEFAULT 0,
+    other_deductions REAL DEFAULT 0,
+    net_salary REAL DEFAULT 0,
+    insurance_company REAL DEFAULT 0,  -- 회사 부담 보험료
+    pay_date DATE,
+    status TEXT DEFAULT 'draft',  -- draft, confirmed, paid
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id),
+    UNIQUE(employee_id, pay_year, pay_month)
+);
+
+-- payroll_details
+CREATE TABLE IF NOT EXISTS payroll_details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payroll_id INTEGER NOT NULL,
+    item_type TEXT NOT NULL,  -- earning, deduction
+    item_code TEXT NOT NULL,
+    item_name TEXT NOT NULL,
+    amount REAL DEFAULT 0,
+    remarks TEXT,
+    FOREIGN KEY (payroll_id) REFERENCES payroll (payroll_id)
+);
+
+-- performance_evaluation
+CREATE TABLE IF NOT EXISTS performance_evaluation (
+    eval_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    eval_year INTEGER NOT NULL,
+    eval_period TEXT NOT NULL,  -- annual, semi-annual, quarterly
+    evaluator_id TEXT NOT NULL,
+    eval_type TEXT NOT NULL,  -- supervisor, peer, self, subordinate
+    performance_score INTEGER,
+    competency_score INTEGER,
+    overall_score INTEGER,
+    grade TEXT,  -- S, A, B, C, D
+    strengths TEXT,
+    improvements TEXT,
+    development_plan TEXT,
+    status TEXT DEFAULT 'draft',  -- draft, submitted, confirmed
+    submitted_date TIMESTAMP,
+    confirmed_date TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id),
+    FOREIGN KEY (evaluator_id) REFERENCES employees (employee_id)
+);
+
+-- training_programs
+CREATE TABLE IF NOT EXISTS training_programs (
+    program_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    program_name TEXT NOT NULL,
+    program_type TEXT,  -- mandatory, optional, external, internal
+    description TEXT,
+    instructor TEXT,
+    start_date DATE,
+    end_date DATE,
+    duration_hours INTEGER,
+    location TEXT,
+    max_participants INTEGER,
+    cost REAL DEFAULT 0,
+    status TEXT DEFAULT 'planned',  -- planned, ongoing, completed, cancelled
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- training_history
+CREATE TABLE IF NOT EXISTS training_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    program_id INTEGER NOT NULL,
+    employee_id TEXT NOT NULL,
+    enrollment_date DATE,
+    completion_date DATE,
+    attendance_rate REAL,
+    test_score INTEGER,
+    certificate_no TEXT,
+    status TEXT DEFAULT 'enrolled',  -- enrolled, completed, failed, dropped
+    feedback TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (program_id) REFERENCES training_programs (program_id),
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id)
+);
+
+-- organization_history
+CREATE TABLE IF NOT EXISTS organization_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    change_date DATE NOT NULL,
+    change_type TEXT NOT NULL,  -- join, promotion, transfer, resignation
+    from_department TEXT,
+    to_department TEXT,
+    from_position TEXT,
+    to_position TEXT,
+    from_salary REAL,
+    to_salary REAL,
+    reason TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id)
+);
+
+-- employment_contracts
+CREATE TABLE IF NOT EXISTS employment_contracts (
+    contract_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    contract_type TEXT NOT NULL,  -- permanent, fixed-term
+    start_date DATE NOT NULL,
+    end_date DATE,
+    position TEXT NOT NULL,
+    department TEXT NOT NULL,
+    base_salary REAL NOT NULL,
+    work_hours_per_week INTEGER DEFAULT 40,
+    probation_period INTEGER DEFAULT 3,  -- months
+    annual_leave_days INTEGER DEFAULT 15,
+    special_terms TEXT,
+    file_path TEXT,
+    status TEXT DEFAULT 'active',  -- active, expired, terminated
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id)
+);
+
+-- benefits
+CREATE TABLE IF NOT EXISTS benefits (
+    benefit_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    benefit_name TEXT NOT NULL,
+    benefit_type TEXT,  -- insurance, allowance, facility, other
+    description TEXT,
+    eligibility TEXT,
+    amount REAL,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- employee_benefits
+CREATE TABLE IF NOT EXISTS employee_benefits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id TEXT NOT NULL,
+    benefit_id INTEGER NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (employee_id),
+    FOREIGN KEY (benefit_id) REFERENCES benefits (benefit_id)
+);
+
+-- inspection_standards
+CREATE TABLE IF NOT EXISTS inspection_standards (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_code TEXT NOT NULL,
+    inspection_type TEXT NOT NULL,  -- incoming, process, final
+    inspection_item TEXT NOT NULL,
+    inspection_method TEXT,
+    standard_value TEXT,
+    tolerance_upper REAL,
+    tolerance_lower REAL,
+    sampling_plan TEXT,
+    aql REAL,  -- Acceptable Quality Level
+    is_critical BOOLEAN DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+-- quality_costs
+CREATE TABLE IF NOT EXISTS quality_costs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cost_date DATE NOT NULL,
+    cost_category TEXT NOT NULL,  -- prevention, appraisal, internal_failure, external_failure
+    cost_item TEXT NOT NULL,
+    amount REAL NOT NULL,
+    department TEXT,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- system_log
+CREATE TABLE IF NOT EXISTS system_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    action TEXT NOT NULL,
+    module TEXT,
+    details TEXT,
+    ip_address TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
@@ -0,0 +1,69 @@
+-- 0002_hot_query_indexes.sql - 콜백/대시보드 조회용 보조 인덱스
+
+-- MES: 일자/공정별 조회, 최근 활동, LOT 추적
+CREATE INDEX IF NOT EXISTS idx_work_logs_work_date ON work_logs (work_date, process);
+CREATE INDEX IF NOT EXISTS idx_work_logs_process_date ON work_logs (process, work_date);
+CREATE INDEX IF NOT EXISTS idx_work_logs_worker_date ON work_logs (worker_id, work_date);
+CREATE INDEX IF NOT EXISTS idx_work_logs_created_at ON work_logs (created_at);
+CREATE INDEX IF NOT EXISTS idx_work_logs_lot_number ON work_logs (lot_number);
+
+-- 재고: 기간별 입출고 추이, 품목별 이력, 최근 이력
+CREATE INDEX IF NOT EXISTS idx_stock_movements_date_item ON stock_movements (movement_date, item_code);
+CREATE INDEX IF NOT EXISTS idx_stock_movements_item_date ON stock_movements (item_code, movement_date);
+CREATE INDEX IF NOT EXISTS idx_stock_movements_created_at ON stock_movements (created_at);
+CREATE INDEX IF NOT EXISTS idx_stock_adjustments_created_at ON stock_adjustments (created_at);
+CREATE INDEX IF NOT EXISTS idx_stock_adjustments_item ON stock_adjustments (item_code);
+CREATE INDEX IF NOT EXISTS idx_item_master_category ON item_master (category);
+
+-- 구매
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_status_date ON purchase_orders (status, po_date);
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_po_date ON purchase_orders (po_date);
+CREATE INDEX IF NOT EXISTS idx_purchase_orders_supplier ON purchase_orders (supplier_code, po_date);
+CREATE INDEX IF NOT EXISTS idx_po_details_po_number ON purchase_order_details (po_number);
+CREATE INDEX IF NOT EXISTS idx_po_details_item ON purchase_order_details (item_code);
+CREATE INDEX IF NOT EXISTS idx_receiving_schedule_status_date ON receiving_schedule (status, scheduled_date);
+CREATE INDEX IF NOT EXISTS idx_receiving_schedule_po_item ON receiving_schedule (po_number, item_code);
+CREATE INDEX IF NOT EXISTS idx_receiving_inspection_created_at ON receiving_inspection (created_at);
+CREATE INDEX IF NOT EXISTS idx_receiving_inspection_po ON receiving_inspection (po_number, item_code);
+CREATE INDEX IF NOT EXISTS idx_auto_po_rules_item ON auto_po_rules (item_code, is_active);
+
+-- 회계
+CREATE INDEX IF NOT EXISTS idx_journal_header_date_status ON journal_header (voucher_date, status);
+CREATE INDEX IF NOT EXISTS idx_journal_header_status ON journal_header (status, voucher_date);
+CREATE INDEX IF NOT EXISTS idx_journal_details_voucher ON journal_details (voucher_no, line_no);
+CREATE INDEX IF NOT EXISTS idx_journal_details_account ON journal_details (account_code);
+CREATE INDEX IF NOT EXISTS idx_tax_invoice_date_type ON tax_invoice (invoice_date, invoice_type);
+
+-- 품질: 일자별 검사 현황, LOT 추적, 불량 현황, SPC
+CREATE INDEX IF NOT EXISTS idx_incoming_inspection_date ON incoming_inspection (inspection_date);
+CREATE INDEX IF NOT EXISTS idx_incoming_inspection_lot ON incoming_inspection (lot_number);
+CREATE INDEX IF NOT EXISTS idx_process_inspection_date ON process_inspection (inspection_date);
+CREATE INDEX IF NOT EXISTS idx_process_inspection_lot ON process_inspection (lot_number);
+CREATE INDEX IF NOT EXISTS idx_final_inspection_date ON final_inspection (inspection_date);
+CREATE INDEX IF NOT EXISTS idx_final_inspection_lot ON final_inspection (lot_number);
+CREATE INDEX IF NOT EXISTS idx_quality_certificates_lot ON quality_certificates (lot_number);
+CREATE INDEX IF NOT EXISTS idx_defect_history_date ON defect_history (defect_date);
+CREATE INDEX IF NOT EXISTS idx_defect_history_code_status ON defect_history (defect_code, status);
+CREATE INDEX IF NOT EXISTS idx_measurement_equipment_calibration ON measurement_equipment (status, next_calibration_date);
+CREATE INDEX IF NOT EXISTS idx_spc_data_series ON spc_data (process_code, item_code, characteristic, measurement_date);
+
+-- 영업
+CREATE INDEX IF NOT EXISTS idx_quotations_status_validity ON quotations (status, validity_date);
+CREATE INDEX IF NOT EXISTS idx_quotations_date ON quotations (quote_date);
+CREATE INDEX IF NOT EXISTS idx_quotations_customer ON quotations (customer_code);
+CREATE INDEX IF NOT EXISTS idx_quotation_details_quote ON quotation_details (quote_number);
+CREATE INDEX IF NOT EXISTS idx_sales_orders_date ON sales_orders (order_date);
+CREATE INDEX IF NOT EXISTS idx_sales_orders_status ON sales_orders (status, delivery_date);
+CREATE INDEX IF NOT EXISTS idx_sales_orders_customer ON sales_orders (customer_code);
+CREATE INDEX IF NOT EXISTS idx_sales_order_details_order ON sales_order_details (order_number);
+CREATE INDEX IF NOT EXISTS idx_sales_activities_date ON sales_activities (activity_date);
+CREATE INDEX IF NOT EXISTS idx_deliveries_order ON deliveries (order_number);
+
+-- 인사
+CREATE INDEX IF NOT EXISTS idx_attendance_work_date ON attendance (work_date, emp_id);
+CREATE INDEX IF NOT EXISTS idx_leave_requests_status ON leave_requests (status, start_date);
+CREATE INDEX IF NOT EXISTS idx_leave_requests_emp ON leave_requests (emp_id);
+CREATE INDEX IF NOT EXISTS idx_employees_status_dept ON employees (work_status, department);
+
+-- API
+CREATE INDEX IF NOT EXISTS idx_api_logs_created_at ON api_logs (created_at);
@@ -0,0 +1,136 @@
+-- 0003_work_log_rollup.sql - 작업 실적 일별 집계 (일자 × 공정 × 작업자)
+--
+-- work_logs 의 INSERT/UPDATE/DELETE 트리거가 같은 트랜잭션 안에서 집계를
+-- 갱신하므로 콜백, API, 스크립트 어느 경로로 저장해도 항상 일치한다.
+-- worker_id 가 없는 실적은 0 으로 집계한다.
+-- achievement_sum / achievement_count 는 계획수량이 있는 행의 달성률 합계/건수
+-- (AVG(prod_qty / plan_qty * 100) 재현용), achieved_count 는 목표 달성 건수.
+
+CREATE TABLE IF NOT EXISTS work_log_daily_summary (
+    work_date DATE NOT NULL,
+    process TEXT NOT NULL,
+    worker_id INTEGER NOT NULL DEFAULT 0,
+    log_count INTEGER NOT NULL DEFAULT 0,
+    plan_qty INTEGER NOT NULL DEFAULT 0,
+    prod_qty INTEGER NOT NULL DEFAULT 0,
+    defect_qty INTEGER NOT NULL DEFAULT 0,
+    achievement_sum REAL NOT NULL DEFAULT 0,
+    achievement_count INTEGER NOT NULL DEFAULT 0,
+    achieved_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (work_date, process, worker_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_work_log_summary_process ON work_log_daily_summary (process, work_date);
+CREATE INDEX IF NOT EXISTS idx_work_log_summary_worker ON work_log_daily_summary (worker_id, work_date);
+
+-- 기존 실적 적재
+INSERT INTO work_log_daily_summary
+    (work_date, process, worker_id, log_count, plan_qty, prod_qty, defect_qty,
+     achievement_sum, achievement_count, achieved_count)
+SELECT work_date, process, COALESCE(worker_id, 0),
+       COUNT(*),
+       COALESCE(SUM(plan_qty), 0),
+       COALESCE(SUM(prod_qty), 0),
+       COALESCE(SUM(defect_qty), 0),
+       COALESCE(SUM(CASE WHEN plan_qty > 0 AND prod_qty IS NOT NULL
+                         THEN CAST(prod_qty AS REAL) / plan_qty * 100 END), 0),
+       SUM(CASE WHEN plan_qty > 0 AND prod_qty IS NOT NULL THEN 1 ELSE 0 END),
+       SUM(CASE WHEN prod_qty >= plan_qty THEN 1 ELSE 0 END)
+FROM work_logs
+GROUP BY work_date, process, COALESCE(worker_id, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_summary_insert
+AFTER INSERT ON work_logs
+BEGIN
+    INSERT INTO work_log_daily_summary
+        (work_date, process, worker_id, log_count, plan_qty, prod_qty, defect_qty,
+         achievement_sum, achievement_count, achieved_count)
+    VALUES (
+        NEW.work_date, NEW.process, COALESCE(NEW.worker_id, 0), 1,
+        COALESCE(NEW.plan_qty, 0), COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0),
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL
+             THEN CAST(NEW.prod_qty AS REAL) / NEW.plan_qty * 100 ELSE 0 END,
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL THEN 1 ELSE 0 END,
+        CASE WHEN NEW.prod_qty >= NEW.plan_qty THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (work_date, process, worker_id) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        plan_qty = plan_qty + excluded.plan_qty,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty,
+        achievement_sum = achievement_sum + excluded.achievement_sum,
+        achievement_count = achievement_count + excluded.achievement_count,
+        achieved_count = achieved_count + excluded.achieved_count;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_summary_delete
+AFTER DELETE ON work_logs
+BEGIN
+    UPDATE work_log_daily_summary SET
+        log_count = log_count - 1,
+        plan_qty = plan_qty - COALESCE(OLD.plan_qty, 0),
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0),
+        achievement_sum = achievement_sum -
+            CASE WHEN OLD.plan_qty > 0 AND OLD.prod_qty IS NOT NULL
+                 THEN CAST(OLD.prod_qty AS REAL) / OLD.plan_qty * 100 ELSE 0 END,
+        achievement_count = achievement_count -
+            CASE WHEN OLD.plan_qty > 0 AND OLD.prod_qty IS NOT NULL THEN 1 ELSE 0 END,
+        achieved_count = achieved_count -
+            CASE WHEN OLD.prod_qty >= OLD.plan_qty THEN 1 ELSE 0 END
+    WHERE work_date = OLD.work_date
+      AND process = OLD.process
+      AND worker_id = COALESCE(OLD.worker_id, 0);
+
+    DELETE FROM work_log_daily_summary
+    WHERE work_date = OLD.work_date
+      AND process = OLD.process
+      AND worker_id = COALESCE(OLD.worker_id, 0)
+      AND log_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_summary_update
+AFTER UPDATE OF work_date, process, worker_id, plan_qty, prod_qty, defect_qty ON work_logs
+BEGIN
+    UPDATE work_log_daily_summary SET
+        log_count = log_count - 1,
+        plan_qty = plan_qty - COALESCE(OLD.plan_qty, 0),
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0),
+        achievement_sum = achievement_sum -
+            CASE WHEN OLD.plan_qty > 0 AND OLD.prod_qty IS NOT NULL
+                 THEN CAST(OLD.prod_qty AS REAL) / OLD.plan_qty * 100 ELSE 0 END,
+        achievement_count = achievement_count -
+            CASE WHEN OLD.plan_qty > 0 AND OLD.prod_qty IS NOT NULL THEN 1 ELSE 0 END,
+        achieved_count = achieved_count -
+            CASE WHEN OLD.prod_qty >= OLD.plan_qty THEN 1 ELSE 0 END
+    WHERE work_date = OLD.work_date
+      AND process = OLD.process
+      AND worker_id = COALESCE(OLD.worker_id, 0);
+
+    DELETE FROM work_log_daily_summary
+    WHERE work_date = OLD.work_date
+      AND process = OLD.process
+      AND worker_id = COALESCE(OLD.worker_id, 0)
+      AND log_count <= 0;
+
+    INSERT INTO work_log_daily_summary
+        (work_date, process, worker_id, log_count, plan_qty, prod_qty, defect_qty,
+         achievement_sum, achievement_count, achieved_count)
+    VALUES (
+        NEW.work_date, NEW.process, COALESCE(NEW.worker_id, 0), 1,
+        COALESCE(NEW.plan_qty, 0), COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0),
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL
+             THEN CAST(NEW.prod_qty AS REAL) / NEW.plan_qty * 100 ELSE 0 END,
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL THEN 1 ELSE 0 END,
+        CASE WHEN NEW.prod_qty >= NEW.plan_qty THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (work_date, process, worker_id) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        plan_qty = plan_qty + excluded.plan_qty,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty,
+        achievement_sum = achievement_sum + excluded.achievement_sum,
+        achievement_count = achievement_count + excluded.achievement_count,
+        achieved_count = achieved_count + excluded.achieved_count;
+END;
@@ -0,0 +1,36 @@
+-- 0004_stock_balances.sql - 품목 × 창고별 재고 잔액
+--
+-- 재고 이동(stock_movements)을 원장으로 하고 stock_balances 는 그 합계를
+-- 품목/창고 단위로 유지한다. 이동 기록과 같은 트랜잭션에서
+-- modules/inventory/stock.py 의 post_movement() 로만 갱신한다.
+-- item_master.current_stock 은 창고 합계와 일치해야 한다.
+
+CREATE TABLE IF NOT EXISTS stock_balances (
+    item_code TEXT NOT NULL,
+    warehouse TEXT NOT NULL,
+    quantity INTEGER NOT NULL DEFAULT 0,
+    last_movement_id INTEGER,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (item_code, warehouse),
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_stock_balances_warehouse ON stock_balances (warehouse, item_code);
+
+-- 이동 기록 없이 등록된 현재고는 기초재고 이동으로 원장에 반영 (기본 창고 wh1)
+INSERT INTO stock_movements (movement_date, movement_type, item_code, quantity, warehouse, remarks)
+SELECT date('now'), 'OPENING', im.item_code,
+       im.current_stock - COALESCE(sm.total, 0), 'wh1', '기초재고 (잔액 테이블 도입)'
+FROM item_master im
+LEFT JOIN (
+    SELECT item_code, SUM(quantity) as total
+    FROM stock_movements
+    GROUP BY item_code
+) sm ON sm.item_code = im.item_code
+WHERE im.current_stock != COALESCE(sm.total, 0);
+
+-- 원장에서 잔액 적재
+INSERT INTO stock_balances (item_code, warehouse, quantity, last_movement_id)
+SELECT item_code, COALESCE(warehouse, 'wh1'), SUM(quantity), MAX(id)
+FROM stock_movements
+GROUP BY item_code, COALESCE(warehouse, 'wh1');
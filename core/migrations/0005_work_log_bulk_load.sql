@@ -0,0 +1,37 @@
+-- 0005_work_log_bulk_load.sql - 생산 실적 일괄 등록 시 행 단위 집계 트리거 생략
+--
+-- 일괄 등록(modules/mes/ingest.py)은 쓰기 트랜잭션 안에서 work_log_bulk_load 에
+-- 행을 넣어 INSERT 트리거를 건너뛰고, 등록한 범위를 한 번에 집계한 뒤
+-- 같은 트랜잭션에서 행을 지운다. 커밋 시점에는 항상 비어 있으므로 다른
+-- 연결의 INSERT 는 기존처럼 트리거로 집계된다.
+
+CREATE TABLE IF NOT EXISTS work_log_bulk_load (
+    started_id INTEGER NOT NULL
+);
+
+DROP TRIGGER IF EXISTS trg_work_logs_summary_insert;
+
+CREATE TRIGGER trg_work_logs_summary_insert
+AFTER INSERT ON work_logs
+WHEN NOT EXISTS (SELECT 1 FROM work_log_bulk_load)
+BEGIN
+    INSERT INTO work_log_daily_summary
+        (work_date, process, worker_id, log_count, plan_qty, prod_qty, defect_qty,
+         achievement_sum, achievement_count, achieved_count)
+    VALUES (
+        NEW.work_date, NEW.process, COALESCE(NEW.worker_id, 0), 1,
+        COALESCE(NEW.plan_qty, 0), COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0),
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL
+             THEN CAST(NEW.prod_qty AS REAL) / NEW.plan_qty * 100 ELSE 0 END,
+        CASE WHEN NEW.plan_qty > 0 AND NEW.prod_qty IS NOT NULL THEN 1 ELSE 0 END,
+        CASE WHEN NEW.prod_qty >= NEW.plan_qty THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (work_date, process, worker_id) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        plan_qty = plan_qty + excluded.plan_qty,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty,
+        achievement_sum = achievement_sum + excluded.achievement_sum,
+        achievement_count = achievement_count + excluded.achievement_count,
+        achieved_count = achieved_count + excluded.achieved_count;
+END;
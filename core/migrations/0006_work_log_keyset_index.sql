@@ -0,0 +1,6 @@
+-- 0006_work_log_keyset_index.sql - 생산 실적 API 키셋 페이지/스트리밍 내보내기
+--
+-- (work_date, id) 순서로 인덱스를 읽어 정렬용 임시 B-tree 없이 첫 행부터
+-- 바로 내보내고, 다음 페이지는 마지막 (work_date, id) 위치에서 이어 읽는다.
+
+CREATE INDEX IF NOT EXISTS idx_work_logs_date_id ON work_logs (work_date, id);
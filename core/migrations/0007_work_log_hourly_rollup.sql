@@ -0,0 +1,100 @@
+-- 0007_work_log_hourly_rollup.sql - 작업 실적 시간대별 집계 (시각 × 공정)
+--
+-- 실적 등록 시각(work_logs.created_at, UTC)을 서버 현지 시각의 정시 단위
+-- ('YYYY-MM-DD HH:00')로 묶어 유지한다. 일별 집계(0003)와 같이 트리거가
+-- 같은 트랜잭션에서 갱신하고, 일괄 등록 구간(0005)에서는 INSERT 트리거를
+-- 건너뛰어 modules/mes/rollups.py 의 bulk_load() 가 범위 단위로 집계한다.
+-- created_at 이 없는 실적은 집계하지 않는다.
+
+CREATE TABLE IF NOT EXISTS work_log_hourly_summary (
+    hour_start TEXT NOT NULL,
+    process TEXT NOT NULL,
+    log_count INTEGER NOT NULL DEFAULT 0,
+    plan_qty INTEGER NOT NULL DEFAULT 0,
+    prod_qty INTEGER NOT NULL DEFAULT 0,
+    defect_qty INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour_start, process)
+) WITHOUT ROWID;
+
+-- 기존 실적 적재
+INSERT INTO work_log_hourly_summary
+    (hour_start, process, log_count, plan_qty, prod_qty, defect_qty)
+SELECT strftime('%Y-%m-%d %H:00', created_at, 'localtime'), process,
+       COUNT(*),
+       COALESCE(SUM(plan_qty), 0),
+       COALESCE(SUM(prod_qty), 0),
+       COALESCE(SUM(defect_qty), 0)
+FROM work_logs
+WHERE created_at IS NOT NULL
+GROUP BY strftime('%Y-%m-%d %H:00', created_at, 'localtime'), process;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_hourly_insert
+AFTER INSERT ON work_logs
+WHEN NEW.created_at IS NOT NULL AND NOT EXISTS (SELECT 1 FROM work_log_bulk_load)
+BEGIN
+    INSERT INTO work_log_hourly_summary
+        (hour_start, process, log_count, plan_qty, prod_qty, defect_qty)
+    VALUES (
+        strftime('%Y-%m-%d %H:00', NEW.created_at, 'localtime'), NEW.process, 1,
+        COALESCE(NEW.plan_qty, 0), COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0)
+    )
+    ON CONFLICT (hour_start, process) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        plan_qty = plan_qty + excluded.plan_qty,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_hourly_delete
+AFTER DELETE ON work_logs
+WHEN OLD.created_at IS NOT NULL
+BEGIN
+    UPDATE work_log_hourly_summary SET
+        log_count = log_count - 1,
+        plan_qty = plan_qty - COALESCE(OLD.plan_qty, 0),
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0)
+    WHERE hour_start = strftime('%Y-%m-%d %H:00', OLD.created_at, 'localtime')
+      AND process = OLD.process;
+
+    DELETE FROM work_log_hourly_summary
+    WHERE hour_start = strftime('%Y-%m-%d %H:00', OLD.created_at, 'localtime')
+      AND process = OLD.process
+      AND log_count <= 0;
+END;
+
+-- 수정은 이전 값 차감 + 새 값 가산 (created_at 이 NULL 로 바뀌는 경우 포함)
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_hourly_update_old
+AFTER UPDATE OF created_at, process, plan_qty, prod_qty, defect_qty ON work_logs
+WHEN OLD.created_at IS NOT NULL
+BEGIN
+    UPDATE work_log_hourly_summary SET
+        log_count = log_count - 1,
+        plan_qty = plan_qty - COALESCE(OLD.plan_qty, 0),
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0)
+    WHERE hour_start = strftime('%Y-%m-%d %H:00', OLD.created_at, 'localtime')
+      AND process = OLD.process;
+
+    DELETE FROM work_log_hourly_summary
+    WHERE hour_start = strftime('%Y-%m-%d %H:00', OLD.created_at, 'localtime')
+      AND process = OLD.process
+      AND log_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_hourly_update_new
+AFTER UPDATE OF created_at, process, plan_qty, prod_qty, defect_qty ON work_logs
+WHEN NEW.created_at IS NOT NULL
+BEGIN
+    INSERT INTO work_log_hourly_summary
+        (hour_start, process, log_count, plan_qty, prod_qty, defect_qty)
+    VALUES (
+        strftime('%Y-%m-%d %H:00', NEW.created_at, 'localtime'), NEW.process, 1,
+        COALESCE(NEW.plan_qty, 0), COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0)
+    )
+    ON CONFLICT (hour_start, process) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        plan_qty = plan_qty + excluded.plan_qty,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty;
+END;
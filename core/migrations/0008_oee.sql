@@ -0,0 +1,210 @@
+-- 0008_oee.sql - 설비종합효율(OEE) 기준 정보, 비가동 이력, 교대별 집계
+--
+-- work_logs 에 라인(line_code)과 교대(shift)를 추가한다. 교대가 없는 실적은
+-- 등록 시각(현지 시각)으로 정한다: A 06~14시, B 14~22시, C 22~06시
+-- (modules/mes/oee.py 의 SHIFTS 와 같음). 라인이 없는 실적은 '' 로 집계한다.
+--
+-- oee_shift_summary 는 일자 × 교대 × 라인 × 공정 단위로 생산/불량 수량과
+-- 비가동 시간을 유지한다. work_logs 와 downtime_events 트리거가 같은
+-- 트랜잭션에서 갱신하며, 일괄 등록 구간(0005)에서는 work_logs INSERT 트리거를
+-- 건너뛰고 modules/mes/rollups.py 의 bulk_load() 가 범위 단위로 집계한다.
+-- 이상 사이클 타임은 조회 시 oee_standards 와 결합한다 (line_code '' 는
+-- 공정 기본값).
+
+ALTER TABLE work_logs ADD COLUMN line_code TEXT;
+ALTER TABLE work_logs ADD COLUMN shift TEXT;
+
+CREATE TABLE IF NOT EXISTS oee_standards (
+    line_code TEXT NOT NULL DEFAULT '',
+    process TEXT NOT NULL,
+    ideal_cycle_sec REAL NOT NULL CHECK (ideal_cycle_sec > 0),
+    shift_minutes REAL NOT NULL DEFAULT 480 CHECK (shift_minutes > 0),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (line_code, process)
+);
+
+-- planned = 1 은 계획 정지(휴식, 예방보전 등) - 가동 계획 시간에서 제외
+CREATE TABLE IF NOT EXISTS downtime_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_date DATE NOT NULL,
+    shift TEXT NOT NULL,
+    line_code TEXT NOT NULL DEFAULT '',
+    process TEXT NOT NULL,
+    start_time TEXT,
+    duration_min REAL NOT NULL CHECK (duration_min >= 0),
+    reason_code TEXT,
+    planned INTEGER NOT NULL DEFAULT 0,
+    remarks TEXT,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_downtime_events_date_line ON downtime_events (event_date, line_code);
+
+CREATE TABLE IF NOT EXISTS oee_shift_summary (
+    work_date DATE NOT NULL,
+    shift TEXT NOT NULL,
+    line_code TEXT NOT NULL,
+    process TEXT NOT NULL,
+    log_count INTEGER NOT NULL DEFAULT 0,
+    prod_qty INTEGER NOT NULL DEFAULT 0,
+    defect_qty INTEGER NOT NULL DEFAULT 0,
+    downtime_min REAL NOT NULL DEFAULT 0,
+    planned_stop_min REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (work_date, shift, line_code, process)
+) WITHOUT ROWID;
+
+-- 기존 실적 적재 (기존 행은 line_code/shift 가 없음)
+INSERT INTO oee_shift_summary (work_date, shift, line_code, process, log_count, prod_qty, defect_qty)
+SELECT work_date,
+       CASE WHEN CAST(strftime('%H', created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+            WHEN CAST(strftime('%H', created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+            ELSE 'C' END,
+       '', process, COUNT(*), COALESCE(SUM(prod_qty), 0), COALESCE(SUM(defect_qty), 0)
+FROM work_logs
+GROUP BY 1, 2, 3, 4;
+
+-- ---- work_logs ----
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_oee_insert
+AFTER INSERT ON work_logs
+WHEN NOT EXISTS (SELECT 1 FROM work_log_bulk_load)
+BEGIN
+    INSERT INTO oee_shift_summary (work_date, shift, line_code, process, log_count, prod_qty, defect_qty)
+    VALUES (
+        NEW.work_date,
+        COALESCE(NEW.shift,
+                 CASE WHEN CAST(strftime('%H', NEW.created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+                      WHEN CAST(strftime('%H', NEW.created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+                      ELSE 'C' END),
+        COALESCE(NEW.line_code, ''), NEW.process, 1,
+        COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0)
+    )
+    ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_oee_delete
+AFTER DELETE ON work_logs
+BEGIN
+    UPDATE oee_shift_summary SET
+        log_count = log_count - 1,
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0)
+    WHERE work_date = OLD.work_date
+      AND shift = COALESCE(OLD.shift,
+                           CASE WHEN CAST(strftime('%H', OLD.created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+                                WHEN CAST(strftime('%H', OLD.created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+                                ELSE 'C' END)
+      AND line_code = COALESCE(OLD.line_code, '')
+      AND process = OLD.process;
+
+    DELETE FROM oee_shift_summary
+    WHERE log_count <= 0 AND downtime_min <= 1e-9 AND planned_stop_min <= 1e-9
+      AND work_date = OLD.work_date
+      AND line_code = COALESCE(OLD.line_code, '')
+      AND process = OLD.process;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_oee_update_old
+AFTER UPDATE OF work_date, created_at, shift, line_code, process, prod_qty, defect_qty ON work_logs
+BEGIN
+    UPDATE oee_shift_summary SET
+        log_count = log_count - 1,
+        prod_qty = prod_qty - COALESCE(OLD.prod_qty, 0),
+        defect_qty = defect_qty - COALESCE(OLD.defect_qty, 0)
+    WHERE work_date = OLD.work_date
+      AND shift = COALESCE(OLD.shift,
+                           CASE WHEN CAST(strftime('%H', OLD.created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+                                WHEN CAST(strftime('%H', OLD.created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+                                ELSE 'C' END)
+      AND line_code = COALESCE(OLD.line_code, '')
+      AND process = OLD.process;
+
+    DELETE FROM oee_shift_summary
+    WHERE log_count <= 0 AND downtime_min <= 1e-9 AND planned_stop_min <= 1e-9
+      AND work_date = OLD.work_date
+      AND line_code = COALESCE(OLD.line_code, '')
+      AND process = OLD.process;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_work_logs_oee_update_new
+AFTER UPDATE OF work_date, created_at, shift, line_code, process, prod_qty, defect_qty ON work_logs
+BEGIN
+    INSERT INTO oee_shift_summary (work_date, shift, line_code, process, log_count, prod_qty, defect_qty)
+    VALUES (
+        NEW.work_date,
+        COALESCE(NEW.shift,
+                 CASE WHEN CAST(strftime('%H', NEW.created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+                      WHEN CAST(strftime('%H', NEW.created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+                      ELSE 'C' END),
+        COALESCE(NEW.line_code, ''), NEW.process, 1,
+        COALESCE(NEW.prod_qty, 0), COALESCE(NEW.defect_qty, 0)
+    )
+    ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+        log_count = log_count + excluded.log_count,
+        prod_qty = prod_qty + excluded.prod_qty,
+        defect_qty = defect_qty + excluded.defect_qty;
+END;
+
+-- ---- downtime_events ----
+
+CREATE TRIGGER IF NOT EXISTS trg_downtime_oee_insert
+AFTER INSERT ON downtime_events
+BEGIN
+    INSERT INTO oee_shift_summary (work_date, shift, line_code, process, downtime_min, planned_stop_min)
+    VALUES (
+        NEW.event_date, NEW.shift, NEW.line_code, NEW.process,
+        CASE WHEN NEW.planned THEN 0 ELSE NEW.duration_min END,
+        CASE WHEN NEW.planned THEN NEW.duration_min ELSE 0 END
+    )
+    ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+        downtime_min = downtime_min + excluded.downtime_min,
+        planned_stop_min = planned_stop_min + excluded.planned_stop_min;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_downtime_oee_delete
+AFTER DELETE ON downtime_events
+BEGIN
+    UPDATE oee_shift_summary SET
+        downtime_min = downtime_min - CASE WHEN OLD.planned THEN 0 ELSE OLD.duration_min END,
+        planned_stop_min = planned_stop_min - CASE WHEN OLD.planned THEN OLD.duration_min ELSE 0 END
+    WHERE work_date = OLD.event_date AND shift = OLD.shift
+      AND line_code = OLD.line_code AND process = OLD.process;
+
+    DELETE FROM oee_shift_summary
+    WHERE log_count <= 0 AND downtime_min <= 1e-9 AND planned_stop_min <= 1e-9
+      AND work_date = OLD.event_date AND shift = OLD.shift
+      AND line_code = OLD.line_code AND process = OLD.process;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_downtime_oee_update_old
+AFTER UPDATE OF event_date, shift, line_code, process, duration_min, planned ON downtime_events
+BEGIN
+    UPDATE oee_shift_summary SET
+        downtime_min = downtime_min - CASE WHEN OLD.planned THEN 0 ELSE OLD.duration_min END,
+        planned_stop_min = planned_stop_min - CASE WHEN OLD.planned THEN OLD.duration_min ELSE 0 END
+    WHERE work_date = OLD.event_date AND shift = OLD.shift
+      AND line_code = OLD.line_code AND process = OLD.process;
+
+    DELETE FROM oee_shift_summary
+    WHERE log_count <= 0 AND downtime_min <= 1e-9 AND planned_stop_min <= 1e-9
+      AND work_date = OLD.event_date AND shift = OLD.shift
+      AND line_code = OLD.line_code AND process = OLD.process;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_downtime_oee_update_new
+AFTER UPDATE OF event_date, shift, line_code, process, duration_min, planned ON downtime_events
+BEGIN
+    INSERT INTO oee_shift_summary (work_date, shift, line_code, process, downtime_min, planned_stop_min)
+    VALUES (
+        NEW.event_date, NEW.shift, NEW.line_code, NEW.process,
+        CASE WHEN NEW.planned THEN 0 ELSE NEW.duration_min END,
+        CASE WHEN NEW.planned THEN NEW.duration_min ELSE 0 END
+    )
+    ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+        downtime_min = downtime_min + excluded.downtime_min,
+        planned_stop_min = planned_stop_min + excluded.planned_stop_min;
+END;
@@ -0,0 +1,38 @@
+-- 0009_lot_genealogy.sql - LOT 계보 (투입/산출 연결, 출하 이력)
+--
+-- lot_links 는 투입 LOT(parent_lot)이 산출 LOT(child_lot)에 들어간 관계다.
+-- 정방향 추적(자재 -> 제품)은 parent_lot, 역방향 추적(제품 -> 자재)은
+-- child_lot 인덱스로 한 단계씩 따라간다 (modules/quality/genealogy.py).
+-- lot_shipments 는 출하된 LOT 과 고객/수주/납품 번호를 연결한다.
+-- 검사/성적서/작업 실적은 각 테이블의 lot_number 인덱스(0002)로 조회한다.
+
+CREATE TABLE IF NOT EXISTS lot_links (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    parent_lot TEXT NOT NULL,
+    child_lot TEXT NOT NULL,
+    link_type TEXT NOT NULL DEFAULT 'consume',  -- consume, split, merge, rework
+    item_code TEXT,
+    quantity REAL,
+    work_log_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CHECK (parent_lot <> child_lot)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lot_links_parent_child ON lot_links (parent_lot, child_lot, link_type);
+CREATE INDEX IF NOT EXISTS idx_lot_links_child_parent ON lot_links (child_lot, parent_lot);
+
+CREATE TABLE IF NOT EXISTS lot_shipments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lot_number TEXT NOT NULL,
+    ship_date DATE NOT NULL,
+    customer_code TEXT NOT NULL,
+    order_number TEXT,
+    delivery_number TEXT,
+    product_code TEXT,
+    quantity REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_lot_shipments_lot ON lot_shipments (lot_number);
+CREATE INDEX IF NOT EXISTS idx_lot_shipments_customer ON lot_shipments (customer_code, ship_date);
+CREATE INDEX IF NOT EXISTS idx_lot_shipments_delivery ON lot_shipments (delivery_number);
@@ -0,0 +1,11 @@
+-- 0010_write_buffer.sql - 쓰기 버퍼(core/write_buffer) 저널 적용 위치
+--
+-- 쓰기 버퍼는 접수한 작업을 저널 파일에 먼저 기록하고, 묶음(그룹 커밋)을
+-- 적용하는 트랜잭션 안에서 마지막으로 적용한 저널 번호를 함께 갱신한다.
+-- 재시작 시 이 번호 이후의 저널 항목만 다시 적용하므로 중복 적용되지 않는다.
+
+CREATE TABLE IF NOT EXISTS write_buffer_state (
+    journal TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
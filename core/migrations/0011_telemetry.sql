@@ -0,0 +1,50 @@
+-- 0011_telemetry.sql - 설비 텔레메트리 시계열 저장소 (modules/mes/telemetry)
+--
+-- 수집 포인트는 행 단위로 저장하지 않는다. 태그별로 메모리에 모았다가
+-- 플러시 주기마다 한 블록(타임스탬프/값 배열, zlib 압축)을 한 행으로
+-- 기록하고, 같은 트랜잭션에서 1분/1시간 집계를 갱신한다. 계수기(counter)
+-- 태그의 증가량은 feed 주기마다 태그당 한 건의 work_logs 로 등록되어
+-- 일별/시간별/OEE 집계 트리거에 반영된다.
+
+-- 태그 정보 (counter: 누적 생산 계수기, gauge: 센서 값)
+-- last_value/last_ts 는 다음 블록의 증가량 계산용, fed_until 은 MES 반영 위치
+CREATE TABLE IF NOT EXISTS telemetry_tags (
+    tag TEXT PRIMARY KEY,
+    kind TEXT NOT NULL DEFAULT 'gauge' CHECK (kind IN ('counter', 'gauge')),
+    line_code TEXT,
+    process TEXT,
+    unit TEXT,
+    description TEXT,
+    last_value REAL,
+    last_ts REAL,
+    fed_until INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 원본 블록 - ts: 첫 시각(ms, int64) + 간격(ms, int32) 배열, vals: float64 배열
+CREATE TABLE IF NOT EXISTS telemetry_chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tag TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    point_count INTEGER NOT NULL,
+    ts BLOB NOT NULL,
+    vals BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_telemetry_chunks_tag_end ON telemetry_chunks (tag, end_ts);
+
+-- 다운샘플 (resolution 초 단위 버킷: 60 = 1분, 3600 = 1시간)
+-- delta 는 계수기 증가량 (리셋되면 리셋 후 값부터 다시 셈)
+CREATE TABLE IF NOT EXISTS telemetry_rollups (
+    tag TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    point_count INTEGER NOT NULL,
+    sum_value REAL NOT NULL,
+    min_value REAL NOT NULL,
+    max_value REAL NOT NULL,
+    last_value REAL NOT NULL,
+    delta REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag, resolution, bucket)
+) WITHOUT ROWID;
@@ -0,0 +1,66 @@
+-- 0012_scheduling.sql - 작업지시 / 공정 순서(라우팅) / 설비 자원 / 유한 능력 일정
+--
+-- 작업지시(work_orders)는 등록 시 품목 라우팅(routings)의 공정별 작업
+-- (work_order_operations)으로 펼쳐진다. 스케줄러(modules/mes/scheduler)가
+-- 작업마다 자원과 계획 시작/종료 시각을 정해 같은 행에 기록한다.
+-- 작업 실적(work_logs)은 작업지시 LOT 번호 + 공정으로 작업에 연결된다.
+
+-- 설비 자원 - capacity 는 동시에 처리할 수 있는 대수, efficiency 는 표준 대비 속도
+CREATE TABLE IF NOT EXISTS resources (
+    resource_code TEXT PRIMARY KEY,
+    resource_name TEXT,
+    process TEXT NOT NULL,
+    line_code TEXT,
+    capacity INTEGER NOT NULL DEFAULT 1 CHECK (capacity > 0),
+    efficiency REAL NOT NULL DEFAULT 1.0 CHECK (efficiency > 0),
+    is_active BOOLEAN DEFAULT 1
+);
+
+CREATE INDEX IF NOT EXISTS idx_resources_process ON resources (process);
+
+-- 품목별 공정 순서 (분 단위 준비 시간 + 개당 가공 시간)
+CREATE TABLE IF NOT EXISTS routings (
+    product_code TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    process TEXT NOT NULL,
+    setup_min REAL NOT NULL DEFAULT 0,
+    run_min REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_code, seq)
+);
+
+-- 작업지시 (planned -> released -> in_progress -> completed / cancelled)
+CREATE TABLE IF NOT EXISTS work_orders (
+    order_no TEXT PRIMARY KEY,
+    product_code TEXT NOT NULL,
+    quantity INTEGER NOT NULL CHECK (quantity > 0),
+    due_date TIMESTAMP NOT NULL,
+    release_date TIMESTAMP,
+    priority INTEGER NOT NULL DEFAULT 5,
+    lot_number TEXT,
+    sales_order_number TEXT,
+    status TEXT NOT NULL DEFAULT 'released',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_work_orders_status ON work_orders (status, due_date);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_work_orders_lot ON work_orders (lot_number);
+
+-- 작업지시 공정별 작업과 계획 일정
+CREATE TABLE IF NOT EXISTS work_order_operations (
+    order_no TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    process TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    completed_qty INTEGER NOT NULL DEFAULT 0,
+    setup_min REAL NOT NULL DEFAULT 0,
+    run_min REAL NOT NULL DEFAULT 0,
+    resource_code TEXT,
+    start_time TIMESTAMP,
+    end_time TIMESTAMP,
+    status TEXT NOT NULL DEFAULT 'open',   -- open, short, completed
+    PRIMARY KEY (order_no, seq),
+    FOREIGN KEY (order_no) REFERENCES work_orders (order_no)
+);
+
+CREATE INDEX IF NOT EXISTS idx_work_order_operations_resource
+    ON work_order_operations (resource_code, start_time);
@@ -0,0 +1,60 @@
+-- 0013_bom.sql - 다단계 BOM (유효 기간) 및 역전개(where-used) 폐포
+--
+-- bom_lines 는 상위 품목(parent_code) 1단위에 들어가는 하위 품목 소요량이다.
+-- valid_from 이상, valid_to 미만인 날짜에 유효하며 같은 상위 품목의 새 판은
+-- 기존 행의 valid_to 를 닫고 새 행을 추가한다 (modules/inventory/bom.py).
+--
+-- bom_where_used 는 하위 품목 -> 이를 (몇 단계 아래든) 사용하는 모든 상위
+-- 품목의 폐포로, 유효 기간과 관계없이 어느 판에든 들어간 적이 있으면 포함한다.
+-- bom_revision 은 bom_lines 가 바뀔 때마다 트리거로 올라가는 판 번호로,
+-- 전개 결과 캐시 키와 폐포 최신 여부 (closure_revision) 확인에 사용한다.
+
+CREATE TABLE IF NOT EXISTS bom_lines (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    parent_code TEXT NOT NULL,
+    component_code TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    scrap_rate REAL NOT NULL DEFAULT 0,
+    seq INTEGER NOT NULL DEFAULT 10,
+    valid_from DATE NOT NULL DEFAULT '0001-01-01',
+    valid_to DATE NOT NULL DEFAULT '9999-12-31',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CHECK (parent_code <> component_code),
+    CHECK (quantity > 0),
+    CHECK (valid_from < valid_to)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_bom_lines_parent ON bom_lines (parent_code, component_code, valid_from);
+CREATE INDEX IF NOT EXISTS idx_bom_lines_component ON bom_lines (component_code, parent_code);
+
+CREATE TABLE IF NOT EXISTS bom_where_used (
+    component_code TEXT NOT NULL,
+    ancestor_code TEXT NOT NULL,
+    min_level INTEGER NOT NULL,
+    PRIMARY KEY (component_code, ancestor_code)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_bom_where_used_ancestor ON bom_where_used (ancestor_code);
+
+CREATE TABLE IF NOT EXISTS bom_revision (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    revision INTEGER NOT NULL DEFAULT 0,
+    closure_revision INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO bom_revision (id) VALUES (1);
+
+CREATE TRIGGER IF NOT EXISTS trg_bom_lines_insert AFTER INSERT ON bom_lines
+BEGIN
+    UPDATE bom_revision SET revision = revision + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_bom_lines_update AFTER UPDATE ON bom_lines
+BEGIN
+    UPDATE bom_revision SET revision = revision + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_bom_lines_delete AFTER DELETE ON bom_lines
+BEGIN
+    UPDATE bom_revision SET revision = revision + 1 WHERE id = 1;
+END;
@@ -0,0 +1,48 @@
+-- 0014_stock_valuation.sql - 품목별 재고 평가 (이동평균 / 선입선출 원가층)
+--
+-- stock_valuation 은 품목별 수량, 이동평균 단가와 평가액, 선입선출(FIFO)
+-- 평가액을 유지한다. stock_cost_layers 는 입고마다 하나씩 쌓이는 원가층으로
+-- 출고 시 가장 오래된 층부터 remaining 을 차감한다. 둘 다 post_movement()
+-- 에서 이동과 같은 트랜잭션으로 증분 갱신한다 (modules/inventory/valuation.py).
+--
+-- stock_movements.unit_cost 는 입고 단가 또는 출고 시점의 이동평균 단가이다.
+
+ALTER TABLE stock_movements ADD COLUMN unit_cost REAL;
+
+CREATE TABLE IF NOT EXISTS stock_valuation (
+    item_code TEXT PRIMARY KEY,
+    quantity INTEGER NOT NULL DEFAULT 0,
+    avg_cost REAL NOT NULL DEFAULT 0,
+    avg_value REAL NOT NULL DEFAULT 0,
+    fifo_value REAL NOT NULL DEFAULT 0,
+    last_movement_id INTEGER,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID;
+
+-- remaining 이 음수인 층은 재고보다 많이 출고한 부족분 (다음 입고가 먼저 채움)
+CREATE TABLE IF NOT EXISTS stock_cost_layers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_code TEXT NOT NULL,
+    movement_id INTEGER,
+    received_date DATE,
+    quantity INTEGER NOT NULL,
+    remaining INTEGER NOT NULL,
+    unit_cost REAL NOT NULL
+);
+
+-- 출고 시 품목의 남은 층을 오래된 순으로 찾는 부분 인덱스 (소진된 층은 제외)
+CREATE INDEX IF NOT EXISTS idx_stock_cost_layers_open
+    ON stock_cost_layers (item_code, id) WHERE remaining != 0;
+
+-- 도입 시점 현재고는 품목 기준 단가(unit_price)로 기초 원가층 하나를 만든다
+INSERT INTO stock_cost_layers (item_code, movement_id, received_date, quantity, remaining, unit_cost)
+SELECT item_code, NULL, date('now'), current_stock, current_stock, COALESCE(unit_price, 0)
+FROM item_master
+WHERE current_stock != 0;
+
+INSERT INTO stock_valuation (item_code, quantity, avg_cost, avg_value, fifo_value, last_movement_id)
+SELECT im.item_code, im.current_stock, COALESCE(im.unit_price, 0),
+       im.current_stock * COALESCE(im.unit_price, 0), im.current_stock * COALESCE(im.unit_price, 0),
+       (SELECT MAX(id) FROM stock_movements sm WHERE sm.item_code = im.item_code)
+FROM item_master im
+WHERE im.current_stock != 0;
@@ -0,0 +1,65 @@
+-- 0015_stock_checkpoints.sql - 기간말 재고 잔액 체크포인트 (기준일 재고 조회)
+--
+-- stock_checkpoints 는 checkpoint_date 까지(해당 일 포함)의 이동을 반영한
+-- 품목/창고별 잔액이다 (0 인 잔액은 저장하지 않음). 완성된 체크포인트
+-- 날짜는 stock_checkpoint_log 에 기록하며, 기준일 재고는 그 이전의 가장
+-- 가까운 체크포인트 + 이후 이동으로 계산한다 (modules/inventory/checkpoints.py).
+--
+-- 이미 만든 체크포인트 날짜 이전으로 소급 등록/수정/삭제된 이동은 아래
+-- 트리거가 이후 체크포인트 잔액에 바로 더하거나 빼므로 다시 만들 필요가 없다.
+
+CREATE TABLE IF NOT EXISTS stock_checkpoints (
+    checkpoint_date DATE NOT NULL,
+    item_code TEXT NOT NULL,
+    warehouse TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    PRIMARY KEY (checkpoint_date, item_code, warehouse)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stock_checkpoint_log (
+    checkpoint_date DATE PRIMARY KEY,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_stock_checkpoints_insert
+AFTER INSERT ON stock_movements
+WHEN NEW.movement_date <= (SELECT MAX(checkpoint_date) FROM stock_checkpoint_log)
+BEGIN
+    INSERT INTO stock_checkpoints (checkpoint_date, item_code, warehouse, quantity)
+    SELECT checkpoint_date, NEW.item_code, COALESCE(NEW.warehouse, 'wh1'), NEW.quantity
+    FROM stock_checkpoint_log
+    WHERE checkpoint_date >= NEW.movement_date
+    ON CONFLICT (checkpoint_date, item_code, warehouse) DO UPDATE SET
+        quantity = quantity + excluded.quantity;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stock_checkpoints_delete
+AFTER DELETE ON stock_movements
+WHEN OLD.movement_date <= (SELECT MAX(checkpoint_date) FROM stock_checkpoint_log)
+BEGIN
+    INSERT INTO stock_checkpoints (checkpoint_date, item_code, warehouse, quantity)
+    SELECT checkpoint_date, OLD.item_code, COALESCE(OLD.warehouse, 'wh1'), -OLD.quantity
+    FROM stock_checkpoint_log
+    WHERE checkpoint_date >= OLD.movement_date
+    ON CONFLICT (checkpoint_date, item_code, warehouse) DO UPDATE SET
+        quantity = quantity + excluded.quantity;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stock_checkpoints_update
+AFTER UPDATE OF movement_date, item_code, quantity, warehouse ON stock_movements
+WHEN MIN(OLD.movement_date, NEW.movement_date) <= (SELECT MAX(checkpoint_date) FROM stock_checkpoint_log)
+BEGIN
+    INSERT INTO stock_checkpoints (checkpoint_date, item_code, warehouse, quantity)
+    SELECT checkpoint_date, OLD.item_code, COALESCE(OLD.warehouse, 'wh1'), -OLD.quantity
+    FROM stock_checkpoint_log
+    WHERE checkpoint_date >= OLD.movement_date
+    ON CONFLICT (checkpoint_date, item_code, warehouse) DO UPDATE SET
+        quantity = quantity + excluded.quantity;
+    INSERT INTO stock_checkpoints (checkpoint_date, item_code, warehouse, quantity)
+    SELECT checkpoint_date, NEW.item_code, COALESCE(NEW.warehouse, 'wh1'), NEW.quantity
+    FROM stock_checkpoint_log
+    WHERE checkpoint_date >= NEW.movement_date
+    ON CONFLICT (checkpoint_date, item_code, warehouse) DO UPDATE SET
+        quantity = quantity + excluded.quantity;
+END;
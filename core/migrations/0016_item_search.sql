@@ -0,0 +1,48 @@
+-- 0016_item_search.sql - 품목 검색 색인 (FTS5 trigram)
+--
+-- item_search 는 item_master 를 원본으로 하는 외부 콘텐츠 FTS5 테이블이다.
+-- trigram 토크나이저는 세 글자 단위로 색인하므로 한글 이름의 중간 부분
+-- 문자열도 찾을 수 있고 대소문자를 구분하지 않는다. 색인은 아래 트리거로
+-- 품목 등록/수정/삭제와 같은 트랜잭션에서 갱신된다 (현재고 변경은 제외).
+-- item_master 에 INSERT OR REPLACE 를 쓰면 삭제 트리거가 실행되지 않으므로
+-- 등록은 INSERT ... ON CONFLICT DO UPDATE 로 한다.
+--
+-- item_search_vocab 은 trigram 별 품목 수로, 오타 검색 시 흔한 trigram 을
+-- 제외하는 데 쓴다 (modules/inventory/search.py).
+
+CREATE VIRTUAL TABLE IF NOT EXISTS item_search USING fts5(
+    item_code, item_name, category,
+    content = 'item_master', content_rowid = 'rowid',
+    tokenize = 'trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS item_search_vocab USING fts5vocab(item_search, 'row');
+
+CREATE TRIGGER IF NOT EXISTS trg_item_search_insert
+AFTER INSERT ON item_master
+BEGIN
+    INSERT INTO item_search (rowid, item_code, item_name, category)
+    VALUES (NEW.rowid, NEW.item_code, NEW.item_name, NEW.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_item_search_delete
+AFTER DELETE ON item_master
+BEGIN
+    INSERT INTO item_search (item_search, rowid, item_code, item_name, category)
+    VALUES ('delete', OLD.rowid, OLD.item_code, OLD.item_name, OLD.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_item_search_update
+AFTER UPDATE OF item_code, item_name, category ON item_master
+BEGIN
+    INSERT INTO item_search (item_search, rowid, item_code, item_name, category)
+    VALUES ('delete', OLD.rowid, OLD.item_code, OLD.item_name, OLD.category);
+    INSERT INTO item_search (rowid, item_code, item_name, category)
+    VALUES (NEW.rowid, NEW.item_code, NEW.item_name, NEW.category);
+END;
+
+-- 기존 품목 색인
+INSERT INTO item_search (item_search) VALUES ('rebuild');
+
+-- 1~2 글자 검색어(trigram 미만)의 품목명 접두 검색용
+CREATE INDEX IF NOT EXISTS idx_item_master_name ON item_master (item_name);
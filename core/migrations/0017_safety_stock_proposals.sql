@@ -0,0 +1,29 @@
+-- 0017_safety_stock_proposals.sql - 안전재고/발주점 최적화 제안
+--
+-- modules/inventory/safety_stock.py 가 출고 수요와 리드타임 분포로 계산한
+-- 품목별 안전재고/발주점을 여기에 제안으로 저장한다. 검토 후 적용하면
+-- item_master.safety_stock 과 auto_po_rules.reorder_point 에 반영되고
+-- status 가 'applied' 로 바뀐다. 다시 계산하면 품목별 제안을 덮어쓴다.
+--
+-- demand_* 는 일 수요량, lead_time_* 는 일 단위이며 lead_time_source 는
+-- 리드타임 출처 ('item' 품목 입고 실적 / 'supplier' 거래처 입고 실적 /
+-- 'master' supplier_master.lead_time / 'default' 기본값) 이다.
+
+CREATE TABLE IF NOT EXISTS safety_stock_proposals (
+    item_code TEXT PRIMARY KEY,
+    demand_mean REAL NOT NULL DEFAULT 0,
+    demand_std REAL NOT NULL DEFAULT 0,
+    lead_time_mean REAL NOT NULL DEFAULT 0,
+    lead_time_std REAL NOT NULL DEFAULT 0,
+    lead_time_source TEXT,
+    service_level REAL NOT NULL,
+    current_safety_stock INTEGER,
+    safety_stock INTEGER NOT NULL DEFAULT 0,
+    reorder_point INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'proposed',
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    applied_at TIMESTAMP,
+    FOREIGN KEY (item_code) REFERENCES item_master (item_code)
+);
+
+CREATE INDEX IF NOT EXISTS idx_safety_stock_proposals_status ON safety_stock_proposals (status);
@@ -0,0 +1,36 @@
+# core/migrations/0018_setup_columns.py - 이전 설치 스크립트 스키마 컬럼 복원
+#
+# 0001 은 app.init_database 스키마를 기준으로 만들어져 scripts/setup_v1_3.py 가
+# 만들던 테이블의 일부 컬럼이 빠졌다 (샘플 데이터 입력이 실패). 이전 설치
+# 스크립트로 만든 데이터베이스에는 이미 있으므로 없는 컬럼만 추가한다.
+
+COLUMNS = [
+    ('defect_types', 'corrective_action', 'TEXT'),
+    ('item_master', 'location', 'TEXT'),
+    ('item_master', 'barcode', 'TEXT'),
+    ('stock_movements', 'lot_number', 'TEXT'),
+    ('stock_movements', 'created_by', 'INTEGER REFERENCES users (id)'),
+    ('incoming_inspection', 'defect_type', 'TEXT'),
+    ('incoming_inspection', 'defect_description', 'TEXT'),
+    ('incoming_inspection', 'approval_status', "TEXT DEFAULT 'pending'"),
+    ('incoming_inspection', 'approved_by', 'INTEGER REFERENCES users (id)'),
+    ('incoming_inspection', 'approved_date', 'TIMESTAMP'),
+    ('measurement_equipment', 'calibration_date', 'DATE'),
+    ('measurement_equipment', 'responsible_person', 'INTEGER REFERENCES users (id)'),
+    ('inspection_standards', 'upper_limit', 'REAL'),
+    ('inspection_standards', 'lower_limit', 'REAL'),
+    ('inspection_standards', 'unit', 'TEXT'),
+    ('inspection_standards', 'sampling_rate', 'REAL DEFAULT 100'),
+    ('work_logs', 'start_time', 'TIMESTAMP'),
+    ('work_logs', 'end_time', 'TIMESTAMP'),
+    ('system_config', 'description', 'TEXT'),
+]
+
+
+def upgrade(conn):
+    existing = {}
+    for table, column, definition in COLUMNS:
+        if table not in existing:
+            existing[table] = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing[table]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
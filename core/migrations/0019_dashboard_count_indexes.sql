@@ -0,0 +1,9 @@
+-- 0019_dashboard_count_indexes.sql - 대시보드/구매 요약 건수 조회용 인덱스
+--
+-- 재고 부족 품목(current_stock < safety_stock)은 두 컬럼 비교라 일반 인덱스로
+-- 좁힐 수 없으므로 부분 인덱스로 부족 품목만 모아 둔다. 중대 불량 건수는
+-- 불량 유형(severity_level)에서 시작해 defect_history 를 유형별로 찾는다.
+
+CREATE INDEX IF NOT EXISTS idx_item_master_low_stock ON item_master (item_code)
+    WHERE current_stock < safety_stock;
+CREATE INDEX IF NOT EXISTS idx_defect_types_severity ON defect_types (severity_level);
@@ -0,0 +1,153 @@
+# core/migrations/__init__.py - 버전 기반 스키마 마이그레이션
+#
+# 마이그레이션 파일은 이 디렉토리에 ``NNNN_설명.sql`` 또는 ``NNNN_설명.py`` 로
+# 추가한다. 적용된 버전은 schema_version 테이블에 기록되며 한 번 적용된
+# 파일은 수정하지 않는다 (forward-only). 스키마 변경은 항상 새 번호의
+# 파일로 추가한다. .py 파일은 ``upgrade(conn)`` 함수를 제공해야 하며, 트랜잭션이
+# 유지되도록 executescript() 대신 execute() 를 사용한다.
+
+import os
+import re
+import sqlite3
+import hashlib
+import importlib.util
+import logging
+
+from core.database import get_connection, transaction
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+_FILENAME = re.compile(r'^(\d{4})_(\w+)\.(sql|py)$')
+
+
+def discover():
+    """마이그레이션 파일 목록 (버전 순)"""
+    migrations = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = _FILENAME.match(filename)
+        if match:
+            migrations.append({
+                'version': int(match.group(1)),
+                'name': match.group(2),
+                'path': os.path.join(MIGRATIONS_DIR, filename),
+                'kind': match.group(3)
+            })
+
+    migrations.sort(key=lambda m: m['version'])
+    versions = [m['version'] for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("중복된 마이그레이션 버전이 있습니다.")
+    return migrations
+
+
+def _checksum(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _ensure_version_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.commit()
+
+
+def applied_versions(conn):
+    """적용된 버전 {version: checksum}"""
+    _ensure_version_table(conn)
+    return dict(conn.execute("SELECT version, checksum FROM schema_version").fetchall())
+
+
+def current_version():
+    """현재 스키마 버전 (미적용 시 0)"""
+    conn = get_connection()
+    try:
+        applied = applied_versions(conn)
+        return max(applied) if applied else 0
+    finally:
+        conn.close()
+
+
+def split_statements(script):
+    """SQL 스크립트를 문장 단위로 분리 (트리거 본문 포함)"""
+    statements = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        if not buffer and line.strip().startswith('--'):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ''
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+def _apply(conn, migration):
+    if migration['kind'] == 'sql':
+        with open(migration['path'], encoding='utf-8') as f:
+            for statement in split_statements(f.read()):
+                conn.execute(statement)
+    else:
+        spec = importlib.util.spec_from_file_location(
+            f"core.migrations.m{migration['version']:04d}", migration['path']
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.upgrade(conn)
+
+
+def migrate(target=None):
+    """미적용 마이그레이션을 순서대로 적용
+
+    각 마이그레이션은 schema_version 기록과 함께 하나의 트랜잭션으로
+    적용된다. 적용된 버전 목록을 반환한다.
+    """
+    conn = get_connection()
+    try:
+        applied = applied_versions(conn)
+    finally:
+        conn.close()
+
+    newly_applied = []
+    for migration in discover():
+        version = migration['version']
+        if target is not None and version > target:
+            break
+
+        checksum = _checksum(migration['path'])
+        if version in applied:
+            if applied[version] != checksum:
+                logger.warning(
+                    f"적용된 마이그레이션이 변경되었습니다: {version:04d}_{migration['name']}"
+                )
+            continue
+
+        with transaction(immediate=True) as conn:
+            _apply(conn, migration)
+            conn.execute(
+                "INSERT INTO schema_version (version, name, checksum) VALUES (?, ?, ?)",
+                (version, migration['name'], checksum)
+            )
+
+        logger.info(f"마이그레이션 적용: {version:04d}_{migration['name']}")
+        newly_applied.append(version)
+
+    return newly_applied
+
+
+def pending():
+    """미적용 마이그레이션 목록"""
+    conn = get_connection()
+    try:
+        applied = applied_versions(conn)
+    finally:
+        conn.close()
+    return [m for m in discover() if m['version'] not in applied]
@@ -0,0 +1,155 @@
+# core/query_cache.py - 테이블 쓰기 버전 기반 조회 결과 캐시
+#
+# 같은 조회(SQL + 파라미터)를 세션/주기마다 다시 실행하지 않도록 결과를
+# 크기 제한 LRU 에 보관한다. 키에는 쿼리가 읽는 테이블들의 쓰기 버전이
+# 포함되며, 버전은 풀 연결의 커밋 리스너(core.database)가 쓰기 대상 테이블
+# 기준으로 올린다. 모듈 저장 콜백과 API POST 는 모두 풀 연결로 커밋하므로
+# 별도 호출 없이 관련 캐시가 무효화된다.
+#
+# 다른 프로세스(스크립트 등)의 쓰기는 PRAGMA data_version 변화로 감지해
+# 캐시 전체를 비운다. 외부 쓰기 뒤 조회 없이 로컬 커밋이 이어져도 커밋 직전
+# 토큰을 비교하므로 외부 쓰기가 묻히지 않는다.
+
+import re
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import pandas as pd
+
+from core import database
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+# 트리거로 함께 갱신되는 테이블
+TRIGGER_TABLES = {
+    'work_logs': ('work_log_daily_summary', 'work_log_hourly_summary', 'oee_shift_summary'),
+    'downtime_events': ('oee_shift_summary',),
+}
+
+_TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN)\s+[\"`\[]?(\w+)", re.IGNORECASE)
+
+
+def referenced_tables(query):
+    """쿼리가 읽는 테이블 이름 (FROM/JOIN 기준)"""
+    return tuple(sorted({name.lower() for name in _TABLE_PATTERN.findall(query)}))
+
+
+def _params_key(params):
+    """파라미터 키 - 이름 파라미터(dict)는 이름과 값을 함께 사용"""
+    if isinstance(params, Mapping):
+        return tuple(sorted(params.items()))
+    return tuple(params or ())
+
+
+class QueryCache:
+    """쓰기 버전 키 LRU 캐시"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._epoch = 0
+        self._data_version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _check_external_writes(self):
+        """추적되지 않은 커밋이 있으면 전체 무효화"""
+        current = database.data_version()
+        with self._lock:
+            if self._data_version is not None and current != self._data_version:
+                self._epoch += 1
+                self._entries.clear()
+            self._data_version = current
+
+    def key(self, query, params, tables):
+        with self._lock:
+            versions = tuple(self._versions.get(t, 0) for t in tables)
+            return (query, _params_key(params), versions, self._epoch)
+
+    def get_or_compute(self, query, params, compute, tables=None):
+        """캐시된 결과 반환 (없으면 compute() 결과 저장)"""
+        self._check_external_writes()
+        tables = tables if tables is not None else referenced_tables(query)
+        key = self.key(query, params, tables)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, tables=None):
+        """테이블 쓰기 버전 증가 (tables 가 없거나 '*' 포함 시 전체)"""
+        with self._lock:
+            if not tables or '*' in tables:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            for table in tables:
+                for name in (table,) + TRIGGER_TABLES.get(table, ()):
+                    self._versions[name] = self._versions.get(name, 0) + 1
+
+    def on_commit(self, tables, before=None):
+        """커밋 리스너 - 쓰기 버전 반영 후 data_version 기준점 갱신
+
+        커밋 직전 토큰(before)이 기준점과 다르면 그 사이 추적되지 않은 외부
+        커밋이 있었던 것이므로, 기준점을 옮기기 전에 전체 무효화한다.
+        """
+        with self._lock:
+            external = self._data_version is not None and before != self._data_version
+        self.invalidate(None if external else tables)
+        current = database.data_version()
+        with self._lock:
+            self._data_version = current
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._data_version = None
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+query_cache = QueryCache()
+database.add_commit_listener(query_cache.on_commit)
+
+
+def _cached(query, params, compute):
+    conn = database.get_connection()
+    try:
+        # 쓰기 트랜잭션 중인 연결은 커밋 전 데이터를 볼 수 있으므로 캐시하지 않음
+        if conn.in_transaction:
+            return compute(conn)
+        return query_cache.get_or_compute(query, params, lambda: compute(conn))
+    finally:
+        conn.close()
+
+
+def cached_df(query, params=None):
+    """read_df 의 캐시 버전 - 호출자가 수정해도 되도록 복사본을 반환"""
+    df = _cached(query, params, lambda conn: pd.read_sql_query(query, conn, params=params))
+    return df.copy()
+
+
+def cached_all(query, params=()):
+    """fetch_all 의 캐시 버전"""
+    return list(_cached(query, params, lambda conn: tuple(conn.execute(query, params).fetchall())))
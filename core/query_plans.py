@@ -0,0 +1,167 @@
+# core/query_plans.py - 주요 콜백 쿼리 실행계획 점검 (EXPLAIN QUERY PLAN)
+
+import re
+import logging
+
+from core.database import get_connection, capture_queries
+
+logger = logging.getLogger(__name__)
+
+# 대용량 테이블 판단 기준 (행 수)
+LARGE_TABLE_ROWS = 1000
+
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+_READ = re.compile(r'^\s*(?:SELECT|WITH)\b', re.I)
+_INDEX = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+# 조건 없는 전체 건수 (그리드 합계 등) - 어떤 인덱스로도 줄일 수 없으므로 제외
+_COUNT_ALL = re.compile(r'^\s*SELECT COUNT\(\*\) FROM (?:(?!\bWHERE\b)[^()])*$', re.I)
+
+# 예시 인자에 쓰는 조회 기간
+EXAMPLE_PERIOD = ('2026-01-01', '2026-01-31')
+
+
+def _grid(grid, scope):
+    """SqlGrid 콜백과 같은 경로 - scope(*인자) 조건으로 첫 페이지 조회"""
+    def fetch(*args):
+        where, params = scope(*args)
+        return grid.fetch(where=where, params=params)
+    return fetch
+
+
+# 주기적으로 실행되는 콜백 쿼리 - 콜백이 쓰는 상수/함수를 그대로 사용한다.
+# (이름, SQL 상수 또는 호출 가능 객체, 예시 인자) - 호출 가능 객체는 실행하면서
+# 보낸 조회 문장을 모두 점검하므로 코드가 바뀌어도 목록이 따로 놀지 않는다.
+# 인사관리 화면은 scripts/create_hr_tables.py 스키마(attendance_date, employee_id)를
+# 사용해 마이그레이션 스키마에서는 실행되지 않으므로 제외한다.
+def hot_queries():
+    """점검 대상 목록 [(이름, SQL 또는 호출 가능 객체, 예시 인자), ...]"""
+    from core.dashboard import collect_dashboard_stats
+    from modules.mes import rollups, oee, export
+    from modules.mes.layouts import WORK_LOG_GRID
+    from modules.mes.callbacks import work_log_scope
+    from modules.inventory.layouts import INOUT_HISTORY_GRID
+    from modules.inventory.callbacks import STOCK_TREND_QUERY, ADJUST_HISTORY_QUERY
+    from modules.purchase.layouts import PO_LIST_GRID
+    from modules.purchase.callbacks import (po_list_scope, ACTIVE_PO_QUERY, PENDING_DELIVERY_QUERY,
+                                            INSPECTION_HISTORY_QUERY)
+    from modules.accounting.layouts import VOUCHER_LIST_GRID
+    from modules.accounting.callbacks import voucher_list_scope
+    from modules.quality.callbacks import DAILY_INSPECTIONS_QUERY, DEFECT_PARETO_QUERY
+    from modules.sales.layouts import QUOTATION_LIST_GRID
+    from modules.sales.callbacks import quotation_list_scope
+
+    start, end = EXAMPLE_PERIOD
+    return [
+        ('dashboard.stats', collect_dashboard_stats, ()),
+        ('mes.work_log_grid', _grid(WORK_LOG_GRID, work_log_scope), (1, None, start, end, '조립')),
+        ('mes.period_totals', rollups.get_period_totals, (start, end, '조립')),
+        ('mes.daily_summary', rollups.get_daily_summary, (start, end)),
+        ('mes.process_summary', rollups.get_process_summary, (start, end, '조립')),
+        ('mes.worker_summary', rollups.get_worker_summary, (start, end)),
+        ('mes.hourly_summary', rollups.get_hourly_summary, (f"{start} 00:00", f"{start} 23:00")),
+        ('mes.oee_shift_rows', oee.get_shift_rows, (start, end)),
+        ('api.production_page', export.fetch_page,
+         (start, end, 100, export.encode_cursor(end, 1000))),
+        ('inventory.inout_history', _grid(INOUT_HISTORY_GRID, lambda: ([], [])), ()),
+        ('inventory.stock_trend', STOCK_TREND_QUERY, ()),
+        ('inventory.adjust_history', ADJUST_HISTORY_QUERY, ()),
+        ('purchase.active_po', ACTIVE_PO_QUERY, ()),
+        ('purchase.pending_delivery', PENDING_DELIVERY_QUERY, ()),
+        ('purchase.po_list', _grid(PO_LIST_GRID, po_list_scope),
+         (1, None, None, start, end, 'approved', 'all')),
+        ('purchase.inspection_history', INSPECTION_HISTORY_QUERY, ()),
+        ('accounting.voucher_list', _grid(VOUCHER_LIST_GRID, voucher_list_scope),
+         (1, None, start, end, 'all', 'draft')),
+        ('quality.daily_inspections', DAILY_INSPECTIONS_QUERY, (start, start, start)),
+        ('quality.defect_pareto', DEFECT_PARETO_QUERY, (start, end)),
+        ('sales.quote_list', _grid(QUOTATION_LIST_GRID, quotation_list_scope),
+         (1, None, start, end, 'all', 'all')),
+    ]
+
+
+def statements(name, source, args=()):
+    """점검할 (이름, SQL, 파라미터) 목록 - 호출 가능 객체는 실행해서 보낸 조회 문장을 수집"""
+    if isinstance(source, str):
+        return [(name, source, args)]
+    with capture_queries() as captured:
+        source(*args)
+    return [(name, sql, params) for sql, params in captured if _READ.match(sql)]
+
+
+
+def explain(conn, query, params=()):
+    """EXPLAIN QUERY PLAN 결과 (detail 문자열 목록)"""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    return [row[-1] for row in rows]
+
+
+def table_sizes(conn):
+    """테이블별 행 수"""
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )]
+    return {t: conn.execute(f'SELECT COUNT(*) FROM "{t}"').fetchone()[0] for t in tables}
+
+
+def partial_indexes(conn):
+    """부분 인덱스 (CREATE INDEX ... WHERE) 이름 집합"""
+    return {name for name, sql in conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ) if re.search(r'\)\s*WHERE\b', sql, re.I)}
+
+
+def check_query_plans(queries=None, min_rows=LARGE_TABLE_ROWS):
+    """대용량 테이블을 전체 스캔하는 쿼리 목록
+
+    반환값: [{'name', 'table', 'rows', 'detail'}, ...]
+    """
+    queries = hot_queries() if queries is None else queries
+    checked = []
+    for name, source, args in queries:
+        try:
+            checked += statements(name, source, args)
+        except Exception as e:
+            logger.warning(f"쿼리 수집 실패 ({name}): {e}")
+
+    conn = get_connection()
+    try:
+        sizes = table_sizes(conn)
+        partial = partial_indexes(conn)
+        findings = []
+        for name, query, params in checked:
+            try:
+                plan = explain(conn, query, params)
+            except Exception as e:
+                logger.warning(f"실행계획 조회 실패 ({name}): {e}")
+                continue
+
+            # 정렬용 임시 B-tree 없이 읽은 순서대로 LIMIT 에서 멈추는 스캔은 제외
+            limited = (re.search(r'\bLIMIT\b', query, re.I)
+                       and not any('TEMP B-TREE' in detail for detail in plan))
+            for detail in plan:
+                match = _SCAN.match(detail)
+                if not match or limited or _COUNT_ALL.match(query):
+                    continue
+                # 부분 인덱스 스캔은 조건에 맞는 행만 읽음
+                index = _INDEX.search(detail)
+                if index and index.group(1) in partial:
+                    continue
+                table = match.group(1)
+                # 별칭으로 표시된 경우 FROM/JOIN 절에서 원래 테이블명을 찾음
+                rows = sizes.get(table)
+                if rows is None:
+                    alias = re.search(
+                        r'(?:FROM|JOIN)\s+(\w+)\s+(?:AS\s+)?' + re.escape(table) + r'\b', query, re.I
+                    )
+                    rows = sizes.get(alias.group(1)) if alias else None
+                    table = alias.group(1) if alias else table
+                if rows is not None and rows >= min_rows:
+                    findings.append({
+                        'name': name,
+                        'table': table,
+                        'rows': rows,
+                        'detail': detail
+                    })
+        return findings
+    finally:
+        conn.close()
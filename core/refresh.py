@@ -0,0 +1,100 @@
+# core/refresh.py - 서버 푸시/화면 표시/데이터 변경 기반 갱신 스케줄러
+#
+# 화면 갱신은 모듈별 refresh-<topic> 스토어가 바뀔 때 일어난다.
+#   1. 푸시 (기본)  /events SSE 로 받은 토픽만 push-trigger 를 통해 갱신한다.
+#   2. 폴링 (대체)  SSE 연결이 끊긴 동안에만 interval-component 틱을 사용한다.
+#      refresh-tick   (클라이언트) 브라우저 탭이 숨겨져 있거나 SSE 연결 중이면 버린다.
+#      refresh-signal (서버)       data_version 이 마지막 신호와 같으면 no_update.
+# 다른 모듈/탭의 콜백은 출력 컴포넌트가 화면에 없어 Dash 가 호출하지 않는다.
+
+import json
+
+import dash
+from dash import dcc, html, Input, Output, State
+
+from core.database import data_version
+from core.events import TOPICS, register_event_stream
+
+INTERVAL_ID = 'interval-component'
+TICK_ID = 'refresh-tick'
+SIGNAL_ID = 'refresh-signal'
+PUSH_TRIGGER_ID = 'push-trigger'
+
+
+def topic_store_id(topic):
+    """토픽별 갱신 스토어 id"""
+    return f"refresh-{topic}"
+
+
+def create_refresh_components(interval):
+    """레이아웃에 추가할 주기/신호 컴포넌트"""
+    return [
+        dcc.Interval(id=INTERVAL_ID, interval=interval),
+        dcc.Store(id=TICK_ID),
+        dcc.Store(id=SIGNAL_ID),
+        # assets/push.js 가 SSE 이벤트 수신 시 클릭
+        html.Button(id=PUSH_TRIGGER_ID, n_clicks=0, style={'display': 'none'}),
+        *[dcc.Store(id=topic_store_id(topic)) for topic in TOPICS]
+    ]
+
+
+def next_signal(last_signal):
+    """데이터 변경 시에만 새 신호, 아니면 dash.no_update"""
+    version = data_version()
+    if last_signal and last_signal.get('version') == version:
+        return dash.no_update
+    return {'version': version}
+
+
+def register_refresh_callbacks(app):
+    """갱신 스케줄러 콜백 및 SSE 엔드포인트 등록"""
+    register_event_stream(app.server)
+
+    topic_outputs = [Output(topic_store_id(topic), 'data', allow_duplicate=True) for topic in TOPICS]
+
+    # 푸시 이벤트 - 수신된 토픽의 스토어만 갱신
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            var push = window.mesPush;
+            var topics = %s;
+            if (!push || !Object.keys(push.pending).length) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            var result = topics.map(function(topic) {
+                var seq = push.pending[topic];
+                return seq === undefined ? window.dash_clientside.no_update : {seq: seq};
+            });
+            push.pending = {};
+            return result;
+        }
+        """ % json.dumps(list(TOPICS)),
+        topic_outputs,
+        Input(PUSH_TRIGGER_ID, 'n_clicks'),
+        prevent_initial_call=True
+    )
+
+    # 숨겨진 브라우저 탭, 또는 SSE 연결 중에는 서버 요청 없이 틱을 무시
+    app.clientside_callback(
+        """
+        function(n_intervals) {
+            if (document.hidden || (window.mesPush && window.mesPush.connected)) {
+                return window.dash_clientside.no_update;
+            }
+            return n_intervals;
+        }
+        """,
+        Output(TICK_ID, 'data'),
+        Input(INTERVAL_ID, 'n_intervals')
+    )
+
+    @app.callback(
+        [Output(SIGNAL_ID, 'data'),
+         *[Output(topic_store_id(topic), 'data') for topic in TOPICS]],
+        Input(TICK_ID, 'data'),
+        State(SIGNAL_ID, 'data')
+    )
+    def schedule_refresh(tick, last_signal):
+        """데이터베이스 변경 여부 확인 (폴링 대체 경로)"""
+        signal = next_signal(last_signal)
+        return [signal] * (len(TOPICS) + 1)
@@ -0,0 +1,104 @@
+# core/snapshot.py - 프로세스 공용 스냅샷 서비스
+#
+# 여러 세션이 같은 집계를 주기적으로 조회하는 경우, 백그라운드 스레드가
+# 주기마다 한 번만 계산하고 모든 콜백은 메모리의 최신 스냅샷을 읽는다.
+# version 함수를 주면 그 값이 바뀐 경우에만 다시 계산한다. request_refresh()
+# 로 다음 주기를 기다리지 않고 즉시 재계산을 요청할 수 있다.
+
+import time
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotService:
+    """주기적으로 갱신되는 공용 스냅샷"""
+
+    def __init__(self, name, compute, interval=2.0, version=None, on_update=None):
+        self.name = name
+        self.compute = compute
+        self.interval = interval
+        self.version = version
+        self.on_update = on_update
+        self._version_key = None
+        self._snapshot = None
+        self._updated_at = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    @property
+    def updated_at(self):
+        """마지막 갱신 시각 (time.time 기준)"""
+        return self._updated_at
+
+    def set_interval(self, seconds):
+        """갱신 주기 변경 (다음 주기부터 적용)"""
+        self.interval = max(float(seconds), 0.1)
+
+    def refresh(self):
+        """스냅샷 즉시 재계산 - 실패 시 이전 스냅샷 유지"""
+        with self._refresh_lock:
+            try:
+                key = self.version() if self.version else None
+                if key is not None and key == self._version_key and self._snapshot is not None:
+                    return self._snapshot
+                snapshot = self.compute()
+            except Exception as e:
+                logger.error(f"{self.name} 스냅샷 계산 오류: {e}")
+                return self._snapshot
+
+            with self._lock:
+                self._snapshot = snapshot
+                self._version_key = key
+                self._updated_at = time.time()
+
+        if self.on_update:
+            try:
+                self.on_update(snapshot)
+            except Exception as e:
+                logger.error(f"{self.name} 스냅샷 갱신 알림 오류: {e}")
+        return snapshot
+
+    def request_refresh(self, *args):
+        """백그라운드 스레드에 즉시 재계산 요청 (이벤트 수신자로 사용 가능)"""
+        self._wake.set()
+
+    def get(self):
+        """최신 스냅샷 반환 (최초 호출 시 계산 후 백그라운드 갱신 시작)"""
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        self.start()
+        return snapshot
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"snapshot-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """백그라운드 갱신 중지"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.refresh()
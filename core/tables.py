@@ -0,0 +1,97 @@
+# core/tables.py - 공용 테이블 렌더링 도구 (벡터화)
+#
+# 파생 컬럼(달성률, 불량률, 재고 상태, 합격률, 배지 색상)은 행 단위
+# df.apply / iterrows 대신 NumPy/pandas 연산으로 한 번에 계산한다.
+# 표는 컬럼별로 셀 목록을 만든 뒤 zip 으로 한 번만 순회해 행을 만든다.
+
+import numpy as np
+import pandas as pd
+from dash import html
+import dash_bootstrap_components as dbc
+
+# 재고 상태 배지 색상
+STOCK_STATUS_COLORS = {
+    '부족': 'danger',
+    '과잉': 'warning',
+    '정상': 'success',
+}
+
+
+def _values(column):
+    return pd.to_numeric(pd.Series(column), errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+def ratio(numerator, denominator, cap=None, digits=1):
+    """백분율 (분모가 0 이하이면 0)"""
+    num, den = _values(numerator), _values(denominator)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(den > 0, num / np.where(den > 0, den, 1) * 100, 0.0)
+    if cap is not None:
+        rate = np.minimum(rate, cap)
+    return np.round(rate, digits)
+
+
+def achievement_rate(plan_qty, prod_qty):
+    """달성률 (%, 최대 100)"""
+    return ratio(prod_qty, plan_qty, cap=100)
+
+
+def defect_rate(defect_qty, prod_qty):
+    """불량률 (%)"""
+    return ratio(defect_qty, prod_qty)
+
+
+def pass_rate(passed_qty, sample_qty):
+    """합격률 (%) - 샘플이 없으면 NaN"""
+    rate = ratio(passed_qty, sample_qty)
+    return np.where(_values(sample_qty) > 0, rate, np.nan)
+
+
+def stock_status(current_stock, safety_stock):
+    """재고 상태 ('부족' / '과잉' / '정상')"""
+    current, safety = _values(current_stock), _values(safety_stock)
+    return np.select([current < safety, current > safety * 2], ['부족', '과잉'], default='정상')
+
+
+def badge_colors(values, mapping, default='secondary'):
+    """값별 배지 색상 배열"""
+    return pd.Series(values).map(mapping).fillna(default).to_numpy()
+
+
+def number_cells(values, fmt='{:,.0f}', empty='-'):
+    """숫자 표시 문자열 (결측은 empty)"""
+    series = pd.Series(values)
+    return [fmt.format(v) if v is not None and v == v else empty for v in series.tolist()]
+
+
+def badge_cells(labels, colors, **badge_props):
+    """배지 셀 목록"""
+    return [dbc.Badge(label, color=color, **badge_props) for label, color in zip(labels, colors)]
+
+
+def text_cells(values, empty='-'):
+    """문자열 셀 목록 (결측/빈 값은 empty)"""
+    return [v if v not in (None, '') and v == v else empty for v in pd.Series(values).tolist()]
+
+
+def table_rows(*columns):
+    """컬럼별 셀 목록 -> html.Tr 목록"""
+    return [html.Tr([html.Td(cell) for cell in cells]) for cells in zip(*columns)]
+
+
+def render_table(headers, *columns, **table_props):
+    """헤더와 컬럼별 셀 목록으로 dbc.Table 생성"""
+    props = {'striped': True, 'bordered': True, 'hover': True, 'responsive': True}
+    props.update(table_props)
+    return dbc.Table(
+        [html.Thead(html.Tr([html.Th(h) for h in headers])),
+         html.Tbody(table_rows(*columns))],
+        **props
+    )
+
+
+def table_records(df, columns=None):
+    """DataTable 용 행 데이터 (필요한 컬럼만)"""
+    if columns is not None:
+        df = df[list(columns)]
+    return df.to_dict('records')
@@ -0,0 +1,362 @@
+# core/write_buffer.py - 현장 입력용 쓰기 버퍼 (그룹 커밋)
+#
+# 작업 실적/입출고처럼 짧은 쓰기가 여러 단말에서 동시에 들어오면 요청마다
+# 연결을 잡고 커밋하면서 쓰기 잠금을 두고 경합한다. 쓰기 버퍼를 켜면
+# (config.yaml database.write_buffer.enabled) 요청은 큐에 작업을 넣고,
+# 단일 쓰기 스레드가 쌓인 작업을 한 트랜잭션으로 묶어 커밋한다.
+#
+#   접수(queued)    저널 파일에 기록·fsync 되고 큐에 들어감 - 프로세스가 죽거나
+#                   OS 가 멈춰도 (정전 포함) 재시작 시 다시 적용된다
+#   완료(committed) 데이터베이스에 커밋됨
+#   실패(failed)    작업이 예외를 발생시킴 (같은 묶음의 다른 작업은 커밋됨)
+#
+# 작업마다 SAVEPOINT 로 감싸므로 (transaction() 중첩) 실패한 작업의 변경만
+# 되돌린다. 저널 적용 위치(write_buffer_state.last_seq)는 묶음과 같은
+# 트랜잭션에서 갱신된다 (core/migrations/0010). 저널에 기록할 수 있도록
+# 작업은 이름으로 등록하고 인자는 JSON 으로 직렬화 가능해야 한다.
+# 저널 fsync 는 그룹으로 묶는다 - 한 접수자가 fsync 하는 동안 들어온 접수는
+# 다음 fsync 한 번으로 함께 디스크에 내려간다.
+
+import os
+import json
+import queue
+import sqlite3
+import threading
+import logging
+
+from core.database import transaction, run_write, is_busy, busy_backoff
+from core.events import publish
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+COMMITTED = 'committed'
+FAILED = 'failed'
+
+# 화면 콜백이 완료를 기다리는 최대 시간 (초) - 넘으면 접수 상태로 응답
+ACK_TIMEOUT = 2.0
+
+DEFAULT_SETTINGS = {
+    'enabled': False,
+    'journal': 'data/write_buffer.journal',
+    'max_batch': 500,
+    'busy_retries': 3,
+}
+
+# 저널 파일이 이 크기를 넘고 대기 작업이 없으면 비운다
+JOURNAL_ROTATE_BYTES = 4 * 1024 * 1024
+
+# 등록된 작업 {이름: (func(conn, *args), 토픽)}
+_operations = {}
+
+_STOP = object()
+
+
+def register_operation(name, func, topics=()):
+    """버퍼로 실행할 작업 등록 - func(conn, *args) 는 호출자 트랜잭션 안에서 실행"""
+    _operations[name] = (func, tuple(topics))
+
+
+class WriteTicket:
+    """작업 접수표 - 상태(queued/committed/failed)와 결과"""
+
+    def __init__(self, seq, name, args):
+        self.seq = seq
+        self.name = name
+        self.args = args
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self._done = threading.Event()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """완료/실패까지 대기 후 상태 반환 (시간 초과 시 queued)"""
+        self._done.wait(timeout)
+        return self.status
+
+    def _finish(self, status, result=None, error=None):
+        self.status, self.result, self.error = status, result, error
+        self._done.set()
+
+
+class WriteBuffer:
+    """단일 쓰기 스레드 그룹 커밋 버퍼"""
+
+    def __init__(self, journal=None, max_batch=500, busy_retries=3):
+        self.journal = journal
+        self.max_batch = max_batch
+        self.busy_retries = busy_retries
+        self.stats = {'batches': 0, 'committed': 0, 'failed': 0}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._synced = 0        # 디스크까지 내려간 마지막 저널 seq
+        self._sync_lock = threading.Lock()
+        self._last = None
+        self._file = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """저널의 미적용 작업을 다시 넣고 쓰기 스레드 시작"""
+        if self.running:
+            return
+        if self.journal:
+            self._recover()
+        self._thread = threading.Thread(target=self._run, name='write-buffer', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """대기 작업을 모두 커밋한 뒤 쓰기 스레드 종료"""
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def submit(self, name, *args):
+        """작업 접수 (저널 기록·fsync 후 큐에 추가) - WriteTicket 반환"""
+        if name not in _operations:
+            raise KeyError(f"등록되지 않은 작업: {name}")
+        if not self.running:
+            raise RuntimeError("쓰기 버퍼가 시작되지 않았습니다.")
+
+        line = json.dumps([name, list(args)], ensure_ascii=False) if self.journal else None
+        with self._lock:
+            self._seq += 1
+            ticket = WriteTicket(self._seq, name, args)
+            if line is not None:
+                # flush 만으로는 OS 버퍼에 머물러 OS 가 멈추면 잃으므로 아래에서 fsync
+                self._file.write(f"{ticket.seq}\t{line}\n")
+                self._file.flush()
+            self._last = ticket
+            self._queue.put(ticket)
+        if line is not None:
+            self._sync_journal(ticket.seq)
+        return ticket
+
+    def _sync_journal(self, seq):
+        """seq 까지 저널 fsync - 앞선 접수자의 fsync 에 포함됐으면 건너뜀"""
+        with self._sync_lock:
+            if self._synced >= seq:
+                return
+            with self._lock:
+                # 지금까지 flush 된 접수를 모두 한 번에 내림
+                target = self._seq
+                fd = self._file.fileno()
+            os.fsync(fd)
+            self._synced = target
+
+    def flush(self, timeout=None):
+        """지금까지 접수된 작업이 모두 처리될 때까지 대기"""
+        last = self._last
+        return last is None or last._done.wait(timeout)
+
+    # 쓰기 스레드
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            stop = item is _STOP
+            batch = [] if stop else [item]
+            # 커밋하는 동안 쌓인 작업을 한 묶음으로
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            if batch:
+                self._commit(batch)
+            if stop:
+                return
+
+    def _apply(self, conn, batch):
+        """묶음 적용 - 작업별 결과 [(ticket, result, error)]"""
+        outcomes = []
+        for ticket in batch:
+            func, _ = _operations.get(ticket.name, (None, ()))
+            try:
+                if func is None:
+                    raise KeyError(f"등록되지 않은 작업: {ticket.name}")
+                with transaction() as savepoint:
+                    outcomes.append((ticket, func(savepoint, *ticket.args), None))
+            except Exception as e:
+                outcomes.append((ticket, None, e))
+        if self.journal:
+            _save_position(conn, self.journal, batch[-1].seq)
+        return outcomes
+
+    def _commit(self, batch):
+        for attempt in range(self.busy_retries + 1):
+            try:
+                with transaction(immediate=True) as conn:
+                    outcomes = self._apply(conn, batch)
+                break
+            except sqlite3.OperationalError as e:
+                if attempt < self.busy_retries and is_busy(e):
+                    # 바로 다시 시도하면 잠금을 가진 연결과 경합만 반복
+                    logger.debug(f"쓰기 버퍼 잠금 경합, 재시도 {attempt + 1}/{self.busy_retries}: {e}")
+                    busy_backoff(attempt)
+                    continue
+                return self._fail_batch(batch, e)
+            except Exception as e:
+                return self._fail_batch(batch, e)
+
+        topics = set()
+        for ticket, result, error in outcomes:
+            if error is None:
+                topics.update(_operations[ticket.name][1])
+                ticket._finish(COMMITTED, result)
+            else:
+                logger.warning(f"쓰기 버퍼 작업 실패 ({ticket.name} #{ticket.seq}): {error}")
+                ticket._finish(FAILED, error=error)
+
+        failed = sum(1 for _, _, error in outcomes if error is not None)
+        self.stats['batches'] += 1
+        self.stats['committed'] += len(batch) - failed
+        self.stats['failed'] += failed
+        if topics:
+            publish(*sorted(topics))
+        self._rotate(batch[-1].seq)
+
+    def _fail_batch(self, batch, error):
+        """묶음 전체 실패 - 재시작 시 다시 적용되지 않도록 위치만 기록"""
+        logger.error(f"쓰기 버퍼 커밋 실패 ({len(batch)}건): {error}")
+        if self.journal:
+            try:
+                with transaction(immediate=True) as conn:
+                    _save_position(conn, self.journal, batch[-1].seq)
+            except sqlite3.Error as e:
+                logger.error(f"쓰기 버퍼 저널 위치 기록 실패: {e}")
+        for ticket in batch:
+            ticket._finish(FAILED, error=error)
+        self.stats['batches'] += 1
+        self.stats['failed'] += len(batch)
+
+    # 저널
+
+    def _rotate(self, committed_seq):
+        """대기 작업이 없으면 커진 저널 비우기"""
+        if not self._file:
+            return
+        with self._lock:
+            if self._seq == committed_seq and self._file.tell() > JOURNAL_ROTATE_BYTES:
+                self._file.truncate(0)
+                self._file.seek(0)
+
+    def _recover(self):
+        """저널을 열고 마지막 적용 위치 이후 작업을 큐에 다시 넣음"""
+        directory = os.path.dirname(self.journal)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with transaction() as conn:
+            row = conn.execute("SELECT last_seq FROM write_buffer_state WHERE journal = ?",
+                               (self.journal,)).fetchone()
+        last_seq = row[0] if row else 0
+
+        pending = []
+        if os.path.exists(self.journal):
+            with open(self.journal, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        seq, payload = line.rstrip('\n').split('\t', 1)
+                        name, args = json.loads(payload)
+                    except ValueError:
+                        # 기록 도중 종료된 마지막 줄
+                        continue
+                    if int(seq) > last_seq:
+                        pending.append(WriteTicket(int(seq), name, tuple(args)))
+
+        # 등록되지 않은 작업을 실패로 넘기면 적용 위치가 기록되어 저널 항목을 잃는다
+        unknown = sorted({t.name for t in pending if t.name not in _operations})
+        if unknown:
+            raise RuntimeError(f"저널에 등록되지 않은 작업이 있습니다: {', '.join(unknown)}")
+        self._seq = self._synced = max([last_seq] + [t.seq for t in pending])
+        created = not os.path.exists(self.journal)
+        self._file = open(self.journal, 'a', encoding='utf-8')
+        if created and hasattr(os, 'O_DIRECTORY'):
+            # 새 저널 파일의 디렉터리 항목도 디스크에 남도록
+            fd = os.open(directory or '.', os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        if pending:
+            logger.info(f"쓰기 버퍼 저널 복구: {len(pending)}건")
+            for ticket in pending:
+                self._queue.put(ticket)
+            self._last = pending[-1]
+
+
+def _save_position(conn, journal, seq):
+    conn.execute("""
+        INSERT INTO write_buffer_state (journal, last_seq, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (journal) DO UPDATE SET
+            last_seq = excluded.last_seq,
+            updated_at = excluded.updated_at
+    """, (journal, seq))
+
+
+_buffer = None
+
+
+def configure_write_buffer(buffer_config=None):
+    """쓰기 버퍼 설정 적용 (config['database']['write_buffer'])"""
+    global _buffer
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(buffer_config or {})
+
+    if _buffer is not None:
+        _buffer.stop()
+        _buffer = None
+    if settings['enabled']:
+        _buffer = WriteBuffer(settings['journal'] or None, settings['max_batch'],
+                              settings['busy_retries'])
+        _buffer.start()
+        logger.info(f"쓰기 버퍼 사용: {settings['journal']}")
+    return _buffer
+
+
+def get_write_buffer():
+    """설정된 쓰기 버퍼 (사용하지 않으면 None)"""
+    return _buffer
+
+
+def execute(name, *args, timeout=ACK_TIMEOUT):
+    """등록된 작업 실행
+
+    쓰기 버퍼가 켜져 있으면 접수 후 timeout 초까지 완료를 기다리고, 꺼져
+    있으면 바로 쓰기 트랜잭션으로 실행한다 (잠금 경합 시 재시도, run_write). 어느 쪽이든 WriteTicket 을 반환하므로
+    호출자는 status 로 완료/접수/실패를 표시한다.
+    """
+    if _buffer is not None and _buffer.running:
+        ticket = _buffer.submit(name, *args)
+        ticket.wait(timeout)
+        return ticket
+
+    func, topics = _operations[name]
+    ticket = WriteTicket(None, name, args)
+    try:
+        result = run_write(func, *args)
+    except Exception as e:
+        ticket._finish(FAILED, error=e)
+        return ticket
+    ticket._finish(COMMITTED, result)
+    if topics:
+        publish(*topics)
+    return ticket
@@ -11,8 +11,26 @@ import pandas as pd
 import json
 import logging
 
+from core.database import get_connection, transaction
+from core.events import publish
+from .layouts import VOUCHER_LIST_GRID
+
 logger = logging.getLogger(__name__)
 
+
+def voucher_list_scope(n_clicks, pushed, start_date, end_date, v_type, status):
+    """전표 리스트 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where = ["voucher_date BETWEEN ? AND ?"]
+    params = [start_date, end_date]
+    if v_type != 'all':
+        where.append("voucher_type = ?")
+        params.append(v_type)
+    if status != 'all':
+        where.append("status = ?")
+        params.append(status)
+    return where, params
+
+
 def register_accounting_callbacks(app):
     """회계관리 모듈 콜백 등록"""
     
@@ -53,11 +71,11 @@ def register_accounting_callbacks(app):
          Output('pending-vouchers', 'children'),
          Output('unbalanced-vouchers', 'children'),
          Output('monthly-vouchers', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-accounting', 'data')
     )
     def update_voucher_summary(n):
         """전표 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             today = datetime.now().strftime('%Y-%m-%d')
@@ -105,145 +123,17 @@ def register_accounting_callbacks(app):
         finally:
             conn.close()
     
-    # 전표 리스트 조회
-    @app.callback(
-        Output('voucher-list-table', 'children'),
-        [Input('search-voucher-btn', 'n_clicks')],
-        [State('voucher-start-date', 'value'),
-         State('voucher-end-date', 'value'),
-         State('voucher-type-filter', 'value'),
-         State('voucher-status-filter', 'value')]
+    # 전표 리스트 그리드 (현재 페이지만 조회)
+    VOUCHER_LIST_GRID.register(
+        app,
+        inputs=[Input('search-voucher-btn', 'n_clicks'),
+                Input('refresh-accounting', 'data')],
+        states=[State('voucher-start-date', 'value'),
+                State('voucher-end-date', 'value'),
+                State('voucher-type-filter', 'value'),
+                State('voucher-status-filter', 'value')],
+        scope=voucher_list_scope
     )
-    def update_voucher_list(n_clicks, start_date, end_date, v_type, status):
-        """전표 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT 
-                voucher_no,
-                voucher_date,
-                voucher_type,
-                description,
-                total_debit,
-                total_credit,
-                status,
-                created_at
-            FROM journal_header
-            WHERE voucher_date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
-        
-        if v_type != 'all':
-            query += " AND voucher_type = ?"
-            params.append(v_type)
-        
-        if status != 'all':
-            query += " AND status = ?"
-            params.append(status)
-        
-        query += " ORDER BY voucher_date DESC, voucher_no DESC"
-        
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-            
-            if df.empty:
-                return html.Div("전표가 없습니다.", className="text-center p-4")
-            
-            # 전표 유형 한글화
-            type_mapping = {
-                'receipt': '입금',
-                'payment': '출금',
-                'transfer': '대체',
-                'sales': '매출',
-                'purchase': '매입'
-            }
-            
-            # 상태 한글화
-            status_mapping = {
-                'draft': ('작성중', 'secondary'),
-                'pending': ('승인대기', 'warning'),
-                'approved': ('승인완료', 'success'),
-                'cancelled': ('취소', 'danger')
-            }
-            
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("전표번호"),
-                        html.Th("전표일자"),
-                        html.Th("유형"),
-                        html.Th("적요"),
-                        html.Th("차변"),
-                        html.Th("대변"),
-                        html.Th("상태"),
-                        html.Th("작업")
-                    ])
-                ])
-            ]
-            
-            table_body = []
-            for idx, row in df.iterrows():
-                v_type_kr = type_mapping.get(row['voucher_type'], row['voucher_type'])
-                status_info = status_mapping.get(row['status'], ('알수없음', 'secondary'))
-                
-                # 차대 일치 여부
-                balance_check = ""
-                if row['total_debit'] != row['total_credit']:
-                    balance_check = dbc.Badge("불일치", color="danger", className="ms-1")
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['voucher_no']),
-                        html.Td(row['voucher_date']),
-                        html.Td(v_type_kr),
-                        html.Td(row['description'] or '-'),
-                        html.Td(f"₩{row['total_debit']:,.0f}"),
-                        html.Td(f"₩{row['total_credit']:,.0f}"),
-                        html.Td([
-                            dbc.Badge(status_info[0], color=status_info[1]),
-                            balance_check
-                        ]),
-                        html.Td(
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-eye"),
-                                    id={"type": "view-voucher", "index": row['voucher_no']},
-                                    color="info",
-                                    size="sm"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-voucher", "index": row['voucher_no']},
-                                    color="primary",
-                                    size="sm",
-                                    disabled=row['status'] != 'draft'
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-check"),
-                                    id={"type": "approve-voucher", "index": row['voucher_no']},
-                                    color="success",
-                                    size="sm",
-                                    disabled=row['status'] != 'pending'
-                                )
-                            ])
-                        )
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-            
-        except Exception as e:
-            logger.error(f"전표 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
     
     # 매출/매입 현황 업데이트 - ID 변경
     @app.callback(
@@ -251,11 +141,11 @@ def register_accounting_callbacks(app):
          Output('accounting-monthly-purchase', 'children'),
          Output('accounting-gross-profit', 'children'),
          Output('accounting-vat-amount', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-accounting', 'data')
     )
     def update_sales_purchase_summary(n):
         """매출/매입 현황 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             month_start = datetime.now().replace(day=1).strftime('%Y-%m-%d')
@@ -358,32 +248,31 @@ def register_accounting_callbacks(app):
             return dbc.Alert("필수 항목을 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
-            
-            # 전표번호 생성
-            cursor.execute("""
-                SELECT COUNT(*) FROM journal_header 
-                WHERE voucher_date = ?
-            """, (v_date,))
-            count = cursor.fetchone()[0]
-            voucher_no = f"JV-{v_date.replace('-', '')}-{count+1:04d}"
-            
-            # 사용자 ID
-            user_id = session_data.get('user_id', 1) if session_data else 1
-            
-            # 전표 헤더 저장
-            cursor.execute("""
-                INSERT INTO journal_header
-                (voucher_no, voucher_date, voucher_type, description,
-                 total_debit, total_credit, status, created_by)
-                VALUES (?, ?, ?, ?, 0, 0, 'draft', ?)
-            """, (voucher_no, v_date, v_type, desc, user_id))
-            
-            conn.commit()
-            conn.close()
+            # 전표번호 채번과 저장을 하나의 쓰기 트랜잭션으로 처리
+            with transaction(immediate=True) as conn:
+                cursor = conn.cursor()
+                
+                # 전표번호 생성
+                cursor.execute("""
+                    SELECT COUNT(*) FROM journal_header 
+                    WHERE voucher_date = ?
+                """, (v_date,))
+                count = cursor.fetchone()[0]
+                voucher_no = f"JV-{v_date.replace('-', '')}-{count+1:04d}"
+                
+                # 사용자 ID
+                user_id = session_data.get('user_id', 1) if session_data else 1
+                
+                # 전표 헤더 저장
+                cursor.execute("""
+                    INSERT INTO journal_header
+                    (voucher_no, voucher_date, voucher_type, description,
+                     total_debit, total_credit, status, created_by)
+                    VALUES (?, ?, ?, ?, 0, 0, 'draft', ?)
+                """, (voucher_no, v_date, v_type, desc, user_id))
             
             logger.info(f"전표 생성 완료: {voucher_no}")
+            publish('accounting')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -424,7 +313,7 @@ def register_accounting_callbacks(app):
                 }
             }
             
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
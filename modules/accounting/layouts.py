@@ -8,6 +8,51 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 
+from core.grid import SqlGrid, label_case, badge_styles
+
+# 전표 유형 표시명
+VOUCHER_TYPES = {
+    'receipt': '입금',
+    'payment': '출금',
+    'transfer': '대체',
+    'sales': '매출',
+    'purchase': '매입'
+}
+
+# 전표 상태 (표시명, 배지 색상)
+VOUCHER_STATUS = {
+    'draft': ('작성중', 'secondary'),
+    'pending': ('승인대기', 'warning'),
+    'approved': ('승인완료', 'success'),
+    'cancelled': ('취소', 'danger')
+}
+
+WON_FORMAT = {'specifier': '$,.0f', 'locale': {'symbol': ['₩', '']}}
+
+# 전표 리스트 그리드
+VOUCHER_LIST_GRID = SqlGrid(
+    'voucher-list-table',
+    "journal_header",
+    columns=[
+        {'id': 'voucher_no', 'name': '전표번호', 'nullable': False},
+        {'id': 'voucher_date', 'name': '전표일자', 'nullable': False},
+        {'id': 'voucher_type', 'name': '유형', 'nullable': False,
+         'sql': label_case('voucher_type', VOUCHER_TYPES)},
+        {'id': 'description', 'name': '적요'},
+        {'id': 'total_debit', 'name': '차변', 'type': 'numeric', 'format': WON_FORMAT},
+        {'id': 'total_credit', 'name': '대변', 'type': 'numeric', 'format': WON_FORMAT},
+        {'id': 'status', 'name': '상태', 'sql': label_case('status', VOUCHER_STATUS, '알수없음')},
+        {'id': 'balance_check', 'name': '차대', 'nullable': False,
+         'sql': "CASE WHEN total_debit != total_credit THEN '불일치' ELSE '' END"},
+    ],
+    key='voucher_no',
+    default_sort=[{'column_id': 'voucher_date', 'direction': 'desc'}],
+    style_data_conditional=badge_styles('status', VOUCHER_STATUS) + [
+        {'if': {'filter_query': '{balance_check} = "불일치"', 'column_id': 'balance_check'},
+         'color': '#dc3545', 'fontWeight': 'bold'}
+    ]
+)
+
 def create_accounting_layout():
     """회계관리 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -180,7 +225,7 @@ def create_voucher_management():
                 ], className="mb-3"),
                 
                 # 전표 리스트
-                html.Div(id="voucher-list-table")
+                VOUCHER_LIST_GRID.layout()
             ])
         ])
     ])
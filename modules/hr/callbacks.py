@@ -12,8 +12,43 @@ import json
 import logging
 import hashlib
 
+from core.database import get_connection
+from core.events import publish
+from .layouts import EMPLOYEE_LIST_GRID, ATTENDANCE_GRID
+
 logger = logging.getLogger(__name__)
 
+
+def employee_list_scope(n_clicks, search_term, dept_filter, status_filter, pushed):
+    """직원 목록 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where, params = [], []
+    if search_term:
+        where.append("(name LIKE ? OR employee_id LIKE ?)")
+        params.extend([f"%{search_term}%", f"%{search_term}%"])
+    if dept_filter != 'all':
+        where.append("department = ?")
+        params.append(dept_filter)
+    if status_filter != 'all':
+        where.append("employment_status = ?")
+        params.append(status_filter)
+    return where, params
+
+
+def attendance_scope(n_clicks, start_date, end_date, dept, employee_search):
+    """근태 조회 그리드 조회 조건 - 조회 버튼을 누르기 전에는 빈 목록"""
+    if not n_clicks:
+        return ["0"], []
+    where = ["a.attendance_date BETWEEN ? AND ?"]
+    params = [start_date, end_date]
+    if dept != 'all':
+        where.append("e.department = ?")
+        params.append(dept)
+    if employee_search:
+        where.append("(e.name LIKE ? OR e.employee_id LIKE ?)")
+        params.extend([f"%{employee_search}%", f"%{employee_search}%"])
+    return where, params
+
+
 def register_hr_callbacks(app):
     """인사관리 모듈 콜백 등록"""
     
@@ -57,11 +92,11 @@ def register_hr_callbacks(app):
          Output('present-employees', 'children'),
          Output('on-leave-employees', 'children'),
          Output('new-employees', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_hr_dashboard_metrics(n):
         """HR 대시보드 지표 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             today = datetime.now().strftime('%Y-%m-%d')
@@ -117,11 +152,11 @@ def register_hr_callbacks(app):
     # 부서별 인원 차트
     @app.callback(
         Output('dept-employee-chart', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_dept_employee_chart(n):
         """부서별 인원 현황 차트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             query = """
@@ -169,11 +204,11 @@ def register_hr_callbacks(app):
     # 월별 근태 현황 차트
     @app.callback(
         Output('monthly-attendance-chart', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_monthly_attendance_chart(n):
         """월별 근태 현황 차트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             # 최근 6개월 데이터
@@ -223,7 +258,7 @@ def register_hr_callbacks(app):
     # 오늘의 일정
     @app.callback(
         Output('today-hr-schedule', 'children'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_today_schedule(n):
         """오늘의 HR 일정"""
@@ -241,7 +276,7 @@ def register_hr_callbacks(app):
             )
         
         # 교육 일정
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("""
@@ -272,13 +307,13 @@ def register_hr_callbacks(app):
     # HR 알림
     @app.callback(
         Output('hr-notifications', 'children'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_hr_notifications(n):
         """HR 알림"""
         notifications = []
         
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         try:
             cursor = conn.cursor()
             
@@ -347,146 +382,16 @@ def register_hr_callbacks(app):
         
         return notifications
     
-    # 직원 목록 조회
-    @app.callback(
-        Output('employee-list-table', 'children'),
-        [Input('refresh-employees-btn', 'n_clicks'),
-         Input('search-employee', 'value'),
-         Input('filter-department', 'value'),
-         Input('filter-status', 'value')]
+    # 직원 목록 그리드 (현재 페이지만 조회)
+    EMPLOYEE_LIST_GRID.register(
+        app,
+        inputs=[Input('refresh-employees-btn', 'n_clicks'),
+                Input('search-employee', 'value'),
+                Input('filter-department', 'value'),
+                Input('filter-status', 'value'),
+                Input('refresh-hr', 'data')],
+        scope=employee_list_scope
     )
-    def update_employee_list(n_clicks, search_term, dept_filter, status_filter):
-        """직원 목록 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT 
-                employee_id,
-                name,
-                department,
-                position,
-                join_date,
-                mobile_phone,
-                email,
-                employment_status
-            FROM employees
-            WHERE 1=1
-        """
-        params = []
-        
-        if search_term:
-            query += " AND (name LIKE ? OR employee_id LIKE ?)"
-            params.extend([f"%{search_term}%", f"%{search_term}%"])
-        
-        if dept_filter != 'all':
-            query += " AND department = ?"
-            params.append(dept_filter)
-        
-        if status_filter != 'all':
-            query += " AND employment_status = ?"
-            params.append(status_filter)
-        
-        query += " ORDER BY employee_id"
-        
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-            
-            if df.empty:
-                return html.Div("직원이 없습니다.", className="text-center p-4")
-            
-            # 매핑
-            dept_mapping = {
-                'management': '경영지원부',
-                'production': '생산부',
-                'quality': '품질관리부',
-                'sales': '영업부',
-                'rnd': '연구개발부'
-            }
-            
-            position_mapping = {
-                'staff': '사원',
-                'senior': '주임',
-                'assistant': '대리',
-                'manager': '과장',
-                'deputy': '차장',
-                'general': '부장',
-                'director': '이사'
-            }
-            
-            status_mapping = {
-                'active': ('재직', 'success'),
-                'leave': ('휴직', 'warning'),
-                'resigned': ('퇴직', 'secondary')
-            }
-            
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("사번"),
-                        html.Th("이름"),
-                        html.Th("부서"),
-                        html.Th("직급"),
-                        html.Th("입사일"),
-                        html.Th("연락처"),
-                        html.Th("상태"),
-                        html.Th("작업")
-                    ])
-                ])
-            ]
-            
-            table_body = []
-            for idx, row in df.iterrows():
-                dept_kr = dept_mapping.get(row['department'], row['department'])
-                position_kr = position_mapping.get(row['position'], row['position'])
-                status_info = status_mapping.get(row['employment_status'], ('알수없음', 'secondary'))
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['employee_id']),
-                        html.Td(row['name']),
-                        html.Td(dept_kr),
-                        html.Td(position_kr),
-                        html.Td(row['join_date']),
-                        html.Td([
-                            html.Div(row['mobile_phone'] or '-'),
-                            html.Small(row['email'] or '-', className="text-muted")
-                        ]),
-                        html.Td(
-                            dbc.Badge(status_info[0], color=status_info[1])
-                        ),
-                        html.Td(
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-eye"),
-                                    id={"type": "view-employee", "index": row['employee_id']},
-                                    color="info",
-                                    size="sm"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-employee", "index": row['employee_id']},
-                                    color="primary",
-                                    size="sm"
-                                )
-                            ])
-                        )
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-            
-        except Exception as e:
-            logger.error(f"직원 목록 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
     
     # 직원 모달 토글
     @app.callback(
@@ -525,7 +430,7 @@ def register_hr_callbacks(app):
             return dbc.Alert("필수 항목을 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             # 사번 생성 (연도 + 순번)
@@ -550,6 +455,7 @@ def register_hr_callbacks(app):
             conn.close()
             
             logger.info(f"직원 등록 완료: {employee_id} - {name}")
+            publish('hr')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -569,11 +475,11 @@ def register_hr_callbacks(app):
          Output('absent', 'children'),
          Output('on-vacation', 'children'),
          Output('business-trip', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_attendance_summary(n):
         """오늘의 근태 현황"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             today = datetime.now().strftime('%Y-%m-%d')
@@ -607,121 +513,16 @@ def register_hr_callbacks(app):
         finally:
             conn.close()
     
-    # 근태 조회
-    @app.callback(
-        Output('attendance-table', 'children'),
-        Input('search-attendance-btn', 'n_clicks'),
-        [State('attendance-start-date', 'value'),
-         State('attendance-end-date', 'value'),
-         State('attendance-dept-filter', 'value'),
-         State('attendance-employee-search', 'value')]
+    # 근태 조회 그리드 (조회 버튼을 누르기 전에는 빈 목록)
+    ATTENDANCE_GRID.register(
+        app,
+        inputs=[Input('search-attendance-btn', 'n_clicks')],
+        states=[State('attendance-start-date', 'value'),
+                State('attendance-end-date', 'value'),
+                State('attendance-dept-filter', 'value'),
+                State('attendance-employee-search', 'value')],
+        scope=attendance_scope
     )
-    def search_attendance(n_clicks, start_date, end_date, dept, employee_search):
-        """근태 현황 조회"""
-        if not n_clicks:
-            return html.Div("조회 버튼을 클릭하세요.", className="text-center p-4")
-        
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT 
-                a.attendance_date,
-                e.employee_id,
-                e.name,
-                e.department,
-                a.check_in_time,
-                a.check_out_time,
-                a.attendance_type,
-                a.overtime_hours
-            FROM attendance a
-            JOIN employees e ON a.employee_id = e.employee_id
-            WHERE a.attendance_date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
-        
-        if dept != 'all':
-            query += " AND e.department = ?"
-            params.append(dept)
-        
-        if employee_search:
-            query += " AND (e.name LIKE ? OR e.employee_id LIKE ?)"
-            params.extend([f"%{employee_search}%", f"%{employee_search}%"])
-        
-        query += " ORDER BY a.attendance_date DESC, e.employee_id"
-        
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-            
-            if df.empty:
-                return html.Div("조회 결과가 없습니다.", className="text-center p-4")
-            
-            # 매핑
-            dept_mapping = {
-                'management': '경영지원부',
-                'production': '생산부',
-                'quality': '품질관리부',
-                'sales': '영업부',
-                'rnd': '연구개발부'
-            }
-            
-            type_mapping = {
-                'normal': ('정상', 'success'),
-                'late': ('지각', 'warning'),
-                'early': ('조퇴', 'info'),
-                'absent': ('결근', 'danger'),
-                'leave': ('휴가', 'primary'),
-                'business': ('출장', 'secondary')
-            }
-            
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("날짜"),
-                        html.Th("사번"),
-                        html.Th("이름"),
-                        html.Th("부서"),
-                        html.Th("출근"),
-                        html.Th("퇴근"),
-                        html.Th("구분"),
-                        html.Th("초과근무")
-                    ])
-                ])
-            ]
-            
-            table_body = []
-            for idx, row in df.iterrows():
-                dept_kr = dept_mapping.get(row['department'], row['department'])
-                type_info = type_mapping.get(row['attendance_type'], ('기타', 'secondary'))
-                
-                overtime_display = f"{row['overtime_hours']}H" if row['overtime_hours'] > 0 else "-"
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['attendance_date']),
-                        html.Td(row['employee_id']),
-                        html.Td(row['name']),
-                        html.Td(dept_kr),
-                        html.Td(row['check_in_time'] or '-'),
-                        html.Td(row['check_out_time'] or '-'),
-                        html.Td(dbc.Badge(type_info[0], color=type_info[1])),
-                        html.Td(overtime_display)
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-            
-        except Exception as e:
-            logger.error(f"근태 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
     
     # 근태 모달 토글
     @app.callback(
@@ -745,11 +546,11 @@ def register_hr_callbacks(app):
          Output('average-salary', 'children'),
          Output('insurance-total', 'children'),
          Output('income-tax-total', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_payroll_summary(n):
         """급여 현황 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             current_month = datetime.now().strftime('%Y-%m')
@@ -823,7 +624,7 @@ def register_hr_callbacks(app):
         if not n_clicks:
             return html.Div("급여 계산을 실행하려면 '실행' 버튼을 클릭하세요.", className="text-center p-4")
         
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
@@ -959,11 +760,11 @@ def register_hr_callbacks(app):
          Output('today-leaves', 'children'),
          Output('leave-usage-rate', 'children'),
          Output('unused-leaves', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-hr', 'data')
     )
     def update_leave_summary(n):
         """휴가 현황 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             today = datetime.now().strftime('%Y-%m-%d')
@@ -1054,7 +855,7 @@ def register_hr_callbacks(app):
     )
     def display_organization_chart(view_type):
         """조직도 표시"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             if view_type == 'hierarchy':
@@ -1104,7 +905,7 @@ def register_hr_callbacks(app):
                 }
             }
             
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -1135,7 +936,7 @@ def register_hr_callbacks(app):
 
 def create_leave_requests_list():
     """휴가 신청 목록"""
-    conn = sqlite3.connect('data/database.db')
+    conn = get_connection()
     
     try:
         query = """
@@ -8,6 +8,89 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 
+from core.grid import SqlGrid, label_case, badge_styles
+
+# 부서 표시명
+DEPARTMENTS = {
+    'management': '경영지원부',
+    'production': '생산부',
+    'quality': '품질관리부',
+    'sales': '영업부',
+    'rnd': '연구개발부'
+}
+
+# 직급 표시명
+POSITIONS = {
+    'staff': '사원',
+    'senior': '주임',
+    'assistant': '대리',
+    'manager': '과장',
+    'deputy': '차장',
+    'general': '부장',
+    'director': '이사'
+}
+
+# 재직 상태 (표시명, 배지 색상)
+EMPLOYMENT_STATUS = {
+    'active': ('재직', 'success'),
+    'leave': ('휴직', 'warning'),
+    'resigned': ('퇴직', 'secondary')
+}
+
+# 근태 구분 (표시명, 배지 색상)
+ATTENDANCE_TYPES = {
+    'normal': ('정상', 'success'),
+    'late': ('지각', 'warning'),
+    'early': ('조퇴', 'info'),
+    'absent': ('결근', 'danger'),
+    'leave': ('휴가', 'primary'),
+    'business': ('출장', 'secondary')
+}
+
+# 직원 목록 그리드
+EMPLOYEE_LIST_GRID = SqlGrid(
+    'employee-list-table',
+    "employees",
+    columns=[
+        {'id': 'employee_id', 'name': '사번', 'nullable': False},
+        {'id': 'name', 'name': '이름', 'nullable': False},
+        {'id': 'department', 'name': '부서', 'nullable': False,
+         'sql': label_case('department', DEPARTMENTS)},
+        {'id': 'position', 'name': '직급', 'nullable': False,
+         'sql': label_case('position', POSITIONS)},
+        {'id': 'join_date', 'name': '입사일', 'nullable': False},
+        {'id': 'mobile_phone', 'name': '연락처'},
+        {'id': 'email', 'name': '이메일'},
+        {'id': 'employment_status', 'name': '상태',
+         'sql': label_case('employment_status', EMPLOYMENT_STATUS, '알수없음')},
+    ],
+    key='employee_id',
+    default_sort=[{'column_id': 'employee_id', 'direction': 'asc'}],
+    style_data_conditional=badge_styles('employment_status', EMPLOYMENT_STATUS)
+)
+
+# 근태 현황 그리드
+ATTENDANCE_GRID = SqlGrid(
+    'attendance-table',
+    "attendance a JOIN employees e ON a.employee_id = e.employee_id",
+    columns=[
+        {'id': 'attendance_date', 'name': '날짜', 'sql': 'a.attendance_date', 'nullable': False},
+        {'id': 'employee_id', 'name': '사번', 'sql': 'e.employee_id', 'nullable': False},
+        {'id': 'name', 'name': '이름', 'sql': 'e.name', 'nullable': False},
+        {'id': 'department', 'name': '부서', 'nullable': False,
+         'sql': label_case('e.department', DEPARTMENTS)},
+        {'id': 'check_in_time', 'name': '출근', 'sql': 'a.check_in_time'},
+        {'id': 'check_out_time', 'name': '퇴근', 'sql': 'a.check_out_time'},
+        {'id': 'attendance_type', 'name': '구분',
+         'sql': label_case('a.attendance_type', ATTENDANCE_TYPES, '기타')},
+        {'id': 'overtime_hours', 'name': '초과근무(H)', 'sql': 'a.overtime_hours', 'type': 'numeric'},
+    ],
+    key='a.id',
+    default_sort=[{'column_id': 'attendance_date', 'direction': 'desc'},
+                  {'column_id': 'employee_id', 'direction': 'asc'}],
+    style_data_conditional=badge_styles('attendance_type', ATTENDANCE_TYPES)
+)
+
 def create_hr_layout():
     """인사관리 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -221,7 +304,7 @@ def create_employee_management():
                 ], className="mb-3"),
                 
                 # 직원 목록 테이블
-                html.Div(id="employee-list-table")
+                EMPLOYEE_LIST_GRID.layout()
             ])
         ])
     ])
@@ -354,7 +437,7 @@ def create_attendance_management():
                 ], className="mb-3"),
                 
                 # 근태 현황 테이블
-                html.Div(id="attendance-table")
+                ATTENDANCE_GRID.layout()
             ])
         ])
     ])
@@ -24,6 +24,8 @@ class ProductionSchema(Schema):
     plan_qty = fields.Int(required=True, validate=validate.Range(min=0))
     prod_qty = fields.Int(required=True, validate=validate.Range(min=0))
     defect_qty = fields.Int(validate=validate.Range(min=0))
+    line_code = fields.Str(validate=validate.Length(max=20))
+    shift = fields.Str(validate=validate.OneOf(['A', 'B', 'C']))
     achievement_rate = fields.Float(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
 
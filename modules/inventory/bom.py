@@ -0,0 +1,367 @@
+# modules/inventory/bom.py - 다단계 BOM 정전개/역전개
+#
+# bom_lines (core/migrations/0013) 를 기준일마다 한 번 읽어 상위->하위,
+# 하위->상위 인접 목록으로 메모리에 두고, 전개 결과는 품목/기준일별로 메모한다.
+# 캐시 키에는 bom_lines 트리거가 올리는 판 번호(bom_revision.revision)가
+# 들어가므로 어느 연결/프로세스에서 BOM 을 고치든 다음 조회에서 다시 읽는다.
+#
+# 총소요량(requirements)과 역전개(implode)는 도달 가능한 품목만 위상 순서로
+# 한 번씩 처리하므로, 공용 반제품이 여러 경로로 합류해도 비용은 연결 수에
+# 비례한다. "어떤 제품이 ITEM003 을 쓰는가" 는 set_bom() 이 함께 갱신하는
+# 폐포 테이블(bom_where_used)을 인덱스로 한 번 조회한다.
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import pandas as pd
+
+from core.database import get_connection, transaction
+
+# 순환 참조 방어용 최대 단계
+MAX_LEVELS = 50
+
+OPEN_FROM = '0001-01-01'
+
+EXPLODE_COLUMNS = ['level', 'parent_code', 'component_code', 'quantity_per', 'scrap_rate', 'extended_qty']
+
+_DESCENDANTS = f"""
+    WITH RECURSIVE down(code, level) AS (
+        SELECT component_code, 1 FROM bom_lines WHERE parent_code = ?
+        UNION
+        SELECT b.component_code, d.level + 1
+        FROM down d JOIN bom_lines b ON b.parent_code = d.code
+        WHERE d.level < {MAX_LEVELS}
+    )
+    SELECT DISTINCT code FROM down
+"""
+
+# 하위 품목별 모든 상위 품목과 최소 단계 (seed 로 대상 하위 품목 제한)
+_CLOSURE = f"""
+    INSERT INTO bom_where_used (component_code, ancestor_code, min_level)
+    WITH RECURSIVE up(component_code, ancestor_code, level) AS (
+        SELECT component_code, parent_code, 1 FROM bom_lines {{seed}}
+        UNION
+        SELECT u.component_code, b.parent_code, u.level + 1
+        FROM up u JOIN bom_lines b ON b.component_code = u.ancestor_code
+        WHERE u.level < {MAX_LEVELS}
+    )
+    SELECT component_code, ancestor_code, MIN(level) FROM up
+    GROUP BY component_code, ancestor_code
+"""
+
+
+class BomCycleError(ValueError):
+    """상위 품목이 자기 자신의 하위로 들어가는 구성"""
+
+    def __init__(self, parent_code, component_code):
+        self.parent_code = parent_code
+        self.component_code = component_code
+        super().__init__(f"BOM 순환 참조: {component_code} 는 {parent_code} 의 상위 품목입니다.")
+
+
+class _Memo:
+    """크기 제한 LRU (판 번호가 바뀌면 비움)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.revision = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, revision, key):
+        with self._lock:
+            if revision != self.revision:
+                self._entries.clear()
+                self.revision = revision
+                return None
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, revision, key, value):
+        with self._lock:
+            if revision != self.revision:
+                return
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_graphs = _Memo(8)
+_results = _Memo(256)
+
+
+def _as_of(value):
+    return str(value)[:10] if value else date.today().isoformat()
+
+
+def _load_graph(conn, as_of):
+    """기준일 유효 BOM -> (상위: [(하위, 소요계수, 소요량, 스크랩률)], 하위: [(상위, 소요계수)])"""
+    down, up = {}, {}
+    for parent, component, qty, scrap in conn.execute("""
+        SELECT parent_code, component_code, quantity, scrap_rate FROM bom_lines
+        WHERE valid_from <= ? AND valid_to > ?
+        ORDER BY parent_code, seq, component_code
+    """, (as_of, as_of)):
+        factor = qty * (1 + scrap)
+        down.setdefault(parent, []).append((component, factor, qty, scrap))
+        up.setdefault(component, []).append((parent, factor))
+    return down, up
+
+
+def _cached(kind, item_code, as_of, compute):
+    """(판 번호, 기준일) 인접 목록으로 compute(down, up) 결과 메모"""
+    as_of = _as_of(as_of)
+    conn = get_connection()
+    try:
+        # 판 번호를 먼저 읽어야 읽는 도중 커밋된 변경이 이전 판 키로 남지 않음
+        revision = conn.execute("SELECT revision FROM bom_revision WHERE id = 1").fetchone()[0]
+        # 쓰기 트랜잭션 중인 연결은 커밋 전 데이터를 보므로 캐시하지 않음
+        if conn.in_transaction:
+            return compute(*_load_graph(conn, as_of))
+
+        key = (kind, item_code, as_of)
+        value = _results.get(revision, key)
+        if value is None:
+            graph = _graphs.get(revision, as_of)
+            if graph is None:
+                graph = _load_graph(conn, as_of)
+                _graphs.put(revision, as_of, graph)
+            value = compute(*graph)
+            _results.put(revision, key, value)
+        return value
+    finally:
+        conn.close()
+
+
+def _propagate(edges, start):
+    """start 1단위 기준 도달 품목별 누적 계수와 최장 단계 (위상 순서, Kahn)"""
+    indegree = {start: 0}
+    stack = [start]
+    while stack:
+        for edge in edges.get(stack.pop(), ()):
+            node = edge[0]
+            if node in indegree:
+                indegree[node] += 1
+            else:
+                indegree[node] = 1
+                stack.append(node)
+
+    totals, levels = {start: 1.0}, {start: 0}
+    order, ready = [], [start]
+    while ready:
+        node = ready.pop()
+        order.append(node)
+        qty, level = totals[node], levels[node] + 1
+        for edge in edges.get(node, ()):
+            nxt = edge[0]
+            totals[nxt] = totals.get(nxt, 0.0) + qty * edge[1]
+            if level > levels.get(nxt, 0):
+                levels[nxt] = level
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                ready.append(nxt)
+
+    if len(order) != len(indegree):
+        stuck = next(node for node, count in indegree.items() if count)
+        raise BomCycleError(start, stuck)
+    return order[1:], totals, levels
+
+
+def explode(item_code, quantity=1, as_of=None, max_level=None):
+    """정전개 (indented BOM) - 상위 품목 아래 깊이 우선 순서
+
+    Returns:
+        DataFrame [level, parent_code, component_code, quantity_per, scrap_rate, extended_qty]
+        extended_qty 는 item_code quantity 개 기준 누적 소요량
+    """
+    def compute(down, up):
+        rows = []
+        stack = [(1, item_code, edge, 1.0) for edge in reversed(down.get(item_code, ()))]
+        while stack:
+            level, parent, (component, factor, qty, scrap), multiplier = stack.pop()
+            if level > MAX_LEVELS:
+                raise BomCycleError(item_code, component)
+            extended = multiplier * factor
+            rows.append((level, parent, component, qty, scrap, extended))
+            if max_level is None or level < max_level:
+                stack.extend((level + 1, component, edge, extended)
+                             for edge in reversed(down.get(component, ())))
+        return pd.DataFrame(rows, columns=EXPLODE_COLUMNS)
+
+    df = _cached(('explode', max_level), item_code, as_of, compute).copy()
+    df['extended_qty'] *= quantity
+    return df
+
+
+def requirements(item_code, quantity=1, as_of=None, leaves_only=False):
+    """총소요량 (요약 BOM) - 하위 품목별 합계
+
+    Returns:
+        DataFrame [component_code, quantity, low_level, is_leaf] (상위 -> 하위 처리 순서)
+        low_level 은 item_code 에서 가장 먼 경로의 단계 (MRP 저단계 코드)
+    """
+    def compute(down, up):
+        order, totals, levels = _propagate(down, item_code)
+        return pd.DataFrame({
+            'component_code': order,
+            'quantity': [totals[code] for code in order],
+            'low_level': [levels[code] for code in order],
+            'is_leaf': [code not in down for code in order],
+        })
+
+    df = _cached('requirements', item_code, as_of, compute)
+    if leaves_only:
+        df = df[df['is_leaf']]
+    df = df.reset_index(drop=True)
+    df['quantity'] = df['quantity'] * quantity
+    return df
+
+
+def implode(item_code, as_of=None):
+    """역전개 - 기준일에 item_code 를 사용하는 상위 품목과 상위 1단위당 소요량
+
+    Returns:
+        DataFrame [ancestor_code, quantity, level, is_top] (하위 -> 상위 처리 순서)
+    """
+    def compute(down, up):
+        order, totals, levels = _propagate(up, item_code)
+        return pd.DataFrame({
+            'ancestor_code': order,
+            'quantity': [totals[code] for code in order],
+            'level': [levels[code] for code in order],
+            'is_top': [code not in up for code in order],
+        })
+
+    return _cached('implode', item_code, as_of, compute).copy()
+
+
+def material_cost(item_code, as_of=None):
+    """최하위 품목 소요량 x 품목 단가 (item_master.unit_price) 합계 - 1단위 재료비"""
+    leaves = requirements(item_code, as_of=as_of, leaves_only=True)
+    if leaves.empty:
+        return 0.0
+    conn = get_connection()
+    try:
+        prices = dict(conn.execute("""
+            SELECT item_code, unit_price FROM item_master
+            WHERE item_code IN (SELECT value FROM json_each(?))
+        """, (json.dumps(leaves['component_code'].tolist()),)).fetchall())
+    finally:
+        conn.close()
+    return float(sum(qty * (prices.get(code) or 0)
+                     for code, qty in zip(leaves['component_code'], leaves['quantity'])))
+
+
+# ---- 사용처 폐포 ----
+
+def _rebuild_closure(conn, components=None):
+    """폐포 재계산 (components 가 없으면 전체)"""
+    if components is None:
+        conn.execute("DELETE FROM bom_where_used")
+        conn.execute(_CLOSURE.format(seed=""))
+    elif components:
+        codes = json.dumps(sorted(components))
+        conn.execute("""
+            DELETE FROM bom_where_used
+            WHERE component_code IN (SELECT value FROM json_each(?))
+        """, (codes,))
+        conn.execute(_CLOSURE.format(seed="WHERE component_code IN (SELECT value FROM json_each(?))"),
+                     (codes,))
+    conn.execute("UPDATE bom_revision SET closure_revision = revision WHERE id = 1")
+
+
+def _closure_stale(conn):
+    revision, closure_revision = conn.execute(
+        "SELECT revision, closure_revision FROM bom_revision WHERE id = 1").fetchone()
+    return revision != closure_revision
+
+
+def _ensure_closure(conn):
+    """bom_lines 를 직접 고친 경우 등 폐포가 판 번호보다 오래되었으면 전체 재계산"""
+    if _closure_stale(conn):
+        _rebuild_closure(conn)
+
+
+def rebuild_where_used():
+    """사용처 폐포 전체 재계산 (일괄 적재 후) - 행 수 반환"""
+    with transaction(immediate=True) as conn:
+        _rebuild_closure(conn)
+        return conn.execute("SELECT COUNT(*) FROM bom_where_used").fetchone()[0]
+
+
+def where_used(item_code, top_only=False):
+    """item_code 를 (몇 단계 아래든) 사용하는 모든 상위 품목 - 어느 판이든 포함
+
+    Returns:
+        DataFrame [ancestor_code, item_name, min_level, is_top]
+    """
+    conn = get_connection()
+    try:
+        if _closure_stale(conn):
+            with transaction(immediate=True) as tx:
+                _ensure_closure(tx)
+        df = pd.read_sql_query("""
+            SELECT w.ancestor_code, im.item_name, w.min_level,
+                   NOT EXISTS (SELECT 1 FROM bom_lines b WHERE b.component_code = w.ancestor_code) as is_top
+            FROM bom_where_used w
+            LEFT JOIN item_master im ON im.item_code = w.ancestor_code
+            WHERE w.component_code = ?
+            ORDER BY w.min_level, w.ancestor_code
+        """, conn, params=(item_code,))
+    finally:
+        conn.close()
+    df['is_top'] = df['is_top'].astype(bool)
+    if top_only:
+        df = df[df['is_top']].reset_index(drop=True)
+    return df
+
+
+# ---- 등록 ----
+
+def set_bom(parent_code, components, valid_from=None):
+    """상위 품목 BOM 등록/개정 - components: [(component_code, quantity[, scrap_rate]), ...] 순서대로
+
+    valid_from 을 주면 그날부터 새 판을 적용하고 기존 판은 전날까지로 닫는다.
+    없으면 parent_code 의 모든 판을 교체한다. 빈 목록은 그날부터 구성 해제.
+    """
+    lines = []
+    for i, component in enumerate(components):
+        code, qty = component[0], float(component[1])
+        scrap = float(component[2] or 0) if len(component) > 2 else 0.0
+        if not code:
+            raise ValueError("component_code is required")
+        if qty <= 0 or scrap < 0:
+            raise ValueError(f"{code}: quantity must be positive and scrap_rate non-negative")
+        lines.append((parent_code, code, qty, scrap, (i + 1) * 10))
+    codes = [line[1] for line in lines]
+    if len(set(codes)) != len(codes):
+        raise ValueError("한 BOM 에 같은 하위 품목은 한 번만 둘 수 있습니다.")
+    start = _as_of(valid_from) if valid_from else OPEN_FROM
+
+    with transaction(immediate=True) as conn:
+        _ensure_closure(conn)
+        # 하위 품목이 상위 품목 자신이거나 그 사용처이면 순환
+        ancestors = {row[0] for row in conn.execute(
+            "SELECT ancestor_code FROM bom_where_used WHERE component_code = ?", (parent_code,))}
+        for code in codes:
+            if code == parent_code or code in ancestors:
+                raise BomCycleError(parent_code, code)
+
+        before = {row[0] for row in conn.execute(_DESCENDANTS, (parent_code,))}
+        conn.execute("DELETE FROM bom_lines WHERE parent_code = ? AND valid_from >= ?",
+                     (parent_code, start))
+        conn.execute("UPDATE bom_lines SET valid_to = ? WHERE parent_code = ? AND valid_to > ?",
+                     (start, parent_code, start))
+        conn.executemany("""
+            INSERT INTO bom_lines (parent_code, component_code, quantity, scrap_rate, seq, valid_from)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [line + (start,) for line in lines])
+        after = {row[0] for row in conn.execute(_DESCENDANTS, (parent_code,))}
+
+        # 사용처가 바뀔 수 있는 품목은 parent_code 아래 (변경 전후) 품목뿐
+        _rebuild_closure(conn, before | after)
+    return len(lines)
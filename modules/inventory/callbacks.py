@@ -14,8 +14,75 @@ import logging
 import io
 import base64
 
+from core.database import get_connection, run_write
+from core.events import publish
+from core import write_buffer
+from core.tables import (ratio, stock_status, badge_colors, badge_cells, number_cells,
+                         text_cells, render_table, STOCK_STATUS_COLORS)
+from .valuation import value_column, get_total_value
+from .search import search_items
+from .stock import (adjust_stock, get_warehouse_totals, warehouse_name,
+                    InsufficientStockError, ItemNotFoundError)
+from .layouts import INOUT_HISTORY_GRID
+
 logger = logging.getLogger(__name__)
 
+# BOM 조회 화면 최대 행 수
+BOM_DISPLAY_ROWS = 500
+# 품목 마스터 검색 결과 최대 행 수
+ITEM_SEARCH_ROWS = 100
+# 입고/출고/조정 품목 검색 시 함께 보여줄 후보 수
+ITEM_PICK_CANDIDATES = 5
+# 안전재고 제안 화면 최대 행 수
+SAFETY_STOCK_DISPLAY_ROWS = 100
+
+# 재고 추이 차트 (최근 30일 입고/출고 합계)
+STOCK_TREND_QUERY = """
+    SELECT
+        movement_date,
+        SUM(CASE WHEN quantity > 0 THEN quantity ELSE 0 END) as in_qty,
+        SUM(CASE WHEN quantity < 0 THEN ABS(quantity) ELSE 0 END) as out_qty
+    FROM stock_movements
+    WHERE movement_date >= date('now', '-30 days')
+    GROUP BY movement_date
+    ORDER BY movement_date
+"""
+
+# 재고 조정 이력 (최근 10건)
+ADJUST_HISTORY_QUERY = """
+    SELECT
+        sa.adjustment_date,
+        sa.item_code,
+        im.item_name,
+        sa.adjustment_type,
+        sa.before_qty,
+        sa.after_qty,
+        sa.difference,
+        sa.reason,
+        sa.created_at
+    FROM stock_adjustments sa
+    JOIN item_master im ON sa.item_code = im.item_code
+    ORDER BY sa.created_at DESC
+    LIMIT 10
+"""
+
+
+def _pick_item(search_value):
+    """입고/출고/조정용 품목 검색 - (첫 번째 결과, 다른 후보 안내) 없으면 (None, None)"""
+    df = search_items(search_value, limit=ITEM_PICK_CANDIDATES)
+    if df.empty:
+        return None, None
+    others = None
+    if len(df) > 1:
+        others = html.Small(
+            "다른 후보: " + ", ".join(f"{r.item_code} {r.item_name}" for r in df.iloc[1:].itertuples()),
+            className="text-muted"
+        )
+    return df.iloc[0], others
+
+# 기준일 재고 화면 최대 행 수
+AS_OF_DISPLAY_ROWS = 500
+
 def register_inventory_callbacks(app):
     """재고관리 모듈 콜백 등록"""
     
@@ -28,8 +95,8 @@ def register_inventory_callbacks(app):
         """활성 탭에 따른 콘텐츠 렌더링"""
         from .layouts import (
             create_item_master, create_stock_inout, 
-            create_stock_status, create_stock_adjust,
-            create_inventory_settings
+            create_stock_status, create_stock_adjust, create_stock_as_of,
+            create_bom_view, create_inventory_settings
         )
         
         if active_tab == "item-master":
@@ -40,6 +107,10 @@ def register_inventory_callbacks(app):
             return create_stock_status()
         elif active_tab == "stock-adjust":
             return create_stock_adjust()
+        elif active_tab == "stock-as-of":
+            return create_stock_as_of()
+        elif active_tab == "bom":
+            return create_bom_view()
         elif active_tab == "inv-settings":
             return create_inventory_settings()
     
@@ -52,91 +123,56 @@ def register_inventory_callbacks(app):
     )
     def update_item_master_table(n_clicks, search_value, category):
         """품목 마스터 테이블 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = "SELECT * FROM item_master WHERE 1=1"
-        params = []
-        
-        if search_value:
-            query += " AND (item_code LIKE ? OR item_name LIKE ?)"
-            params.extend([f"%{search_value}%", f"%{search_value}%"])
-        
-        if category and category != "all":
-            query += " AND category = ?"
-            params.append(category)
+        conn = get_connection()
+        category = category if category and category != "all" else None
         
         try:
-            df = pd.read_sql_query(query, conn, params=params)
+            if search_value and search_value.strip():
+                # 색인 검색 - 순위순 상위 ITEM_SEARCH_ROWS 건
+                df = search_items(search_value, limit=ITEM_SEARCH_ROWS, category=category)
+            else:
+                query = "SELECT * FROM item_master"
+                params = []
+                if category:
+                    query += " WHERE category = ?"
+                    params.append(category)
+                df = pd.read_sql_query(query, conn, params=params)
             
             if df.empty:
                 return html.Div("등록된 품목이 없습니다.", className="text-center p-4")
             
             # 재고 상태 컬럼 추가
-            df['stock_status'] = df.apply(
-                lambda row: '부족' if row['current_stock'] < row['safety_stock'] 
-                else '과잉' if row['current_stock'] > row['safety_stock'] * 2 
-                else '정상', axis=1
-            )
+            df['stock_status'] = stock_status(df['current_stock'], df['safety_stock'])
             
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("품목코드"),
-                        html.Th("품목명"),
-                        html.Th("분류"),
-                        html.Th("단위"),
-                        html.Th("안전재고"),
-                        html.Th("현재고"),
-                        html.Th("상태"),
-                        html.Th("작업")
-                    ])
+            codes = df['item_code'].tolist()
+            action_cells = [
+                dbc.ButtonGroup([
+                    dbc.Button(
+                        html.I(className="fas fa-edit"),
+                        id={"type": "edit-item", "index": code},
+                        color="primary",
+                        size="sm"
+                    ),
+                    dbc.Button(
+                        html.I(className="fas fa-trash"),
+                        id={"type": "delete-item", "index": code},
+                        color="danger",
+                        size="sm"
+                    )
                 ])
+                for code in codes
             ]
             
-            table_body = []
-            for idx, row in df.iterrows():
-                status_badge = dbc.Badge(
-                    row['stock_status'],
-                    color="danger" if row['stock_status'] == '부족' 
-                    else "warning" if row['stock_status'] == '과잉' 
-                    else "success"
-                )
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['item_code']),
-                        html.Td(row['item_name']),
-                        html.Td(row['category']),
-                        html.Td(row['unit']),
-                        html.Td(f"{row['safety_stock']:,}"),
-                        html.Td(f"{row['current_stock']:,}"),
-                        html.Td(status_badge),
-                        html.Td([
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-item", "index": row['item_code']},
-                                    color="primary",
-                                    size="sm"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-trash"),
-                                    id={"type": "delete-item", "index": row['item_code']},
-                                    color="danger",
-                                    size="sm"
-                                )
-                            ])
-                        ])
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
+            return render_table(
+                ["품목코드", "품목명", "분류", "단위", "안전재고", "현재고", "상태", "작업"],
+                codes,
+                df['item_name'].tolist(),
+                df['category'].tolist(),
+                df['unit'].tolist(),
+                number_cells(df['safety_stock']),
+                number_cells(df['current_stock']),
+                badge_cells(df['stock_status'], badge_colors(df['stock_status'], STOCK_STATUS_COLORS)),
+                action_cells
             )
             
         except Exception as e:
@@ -159,28 +195,19 @@ def register_inventory_callbacks(app):
         if not search_value:
             return "", "EA", dbc.Alert("품목을 검색하세요", color="warning")
         
-        conn = sqlite3.connect('data/database.db')
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT item_code, item_name, unit, current_stock
-            FROM item_master 
-            WHERE item_code LIKE ? OR item_name LIKE ?
-            LIMIT 1
-        """, (f"%{search_value}%", f"%{search_value}%"))
-        
-        result = cursor.fetchone()
-        conn.close()
+        result, others = _pick_item(search_value)
         
-        if result:
+        if result is not None:
             display = dbc.Alert(
                 [
-                    html.B(f"{result[1]}"),
+                    html.B(f"{result.item_name}"),
                     html.Br(),
-                    f"현재고: {result[3]:,} {result[2]}"
+                    f"현재고: {result.current_stock:,} {result.unit}",
+                    html.Div(others) if others else None
                 ],
                 color="info"
             )
-            return result[0], result[2], display
+            return result.item_code, result.unit, display
         
         return "", "EA", dbc.Alert("품목을 찾을 수 없습니다", color="danger")
     
@@ -198,28 +225,19 @@ def register_inventory_callbacks(app):
         if not search_value:
             return "", "EA", dbc.Alert("품목을 검색하세요", color="warning")
         
-        conn = sqlite3.connect('data/database.db')
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT item_code, item_name, unit, current_stock
-            FROM item_master 
-            WHERE item_code LIKE ? OR item_name LIKE ?
-            LIMIT 1
-        """, (f"%{search_value}%", f"%{search_value}%"))
-        
-        result = cursor.fetchone()
-        conn.close()
+        result, others = _pick_item(search_value)
         
-        if result:
+        if result is not None:
             display = dbc.Alert(
                 [
-                    html.B(f"{result[1]}"),
+                    html.B(f"{result.item_name}"),
                     html.Br(),
-                    f"현재고: {result[3]:,} {result[2]}"
+                    f"현재고: {result.current_stock:,} {result.unit}",
+                    html.Div(others) if others else None
                 ],
                 color="info"
             )
-            return result[0], result[2], display
+            return result.item_code, result.unit, display
         
         return "", "EA", dbc.Alert("품목을 찾을 수 없습니다", color="danger")
     
@@ -232,34 +250,28 @@ def register_inventory_callbacks(app):
          State('in-item-code', 'value'),
          State('in-qty', 'value'),
          State('in-warehouse', 'value'),
-         State('in-remarks', 'value')],
+         State('in-remarks', 'value'),
+         State('in-unit-cost', 'value')],
         prevent_initial_call=True
     )
-    def process_stock_in(n_clicks, in_date, in_type, item_code, qty, warehouse, remarks):
+    def process_stock_in(n_clicks, in_date, in_type, item_code, qty, warehouse, remarks, unit_cost):
         """입고 처리"""
         if not all([in_date, in_type, item_code, qty, warehouse]):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning", dismissable=True)
         
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
-            
-            # 재고 이동 기록
-            cursor.execute("""
-                INSERT INTO stock_movements 
-                (movement_date, movement_type, item_code, quantity, warehouse, remarks)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (in_date, f"IN_{in_type}", item_code, qty, warehouse, remarks))
-            
-            # 현재 재고 업데이트
-            cursor.execute("""
-                UPDATE item_master 
-                SET current_stock = current_stock + ?
-                WHERE item_code = ?
-            """, (qty, item_code))
-            
-            conn.commit()
-            conn.close()
+            # 재고 이동 기록 및 창고/품목 재고 반영 (쓰기 버퍼 사용 시 그룹 커밋)
+            ticket = write_buffer.execute('inventory.post_movement', in_date, f"IN_{in_type}",
+                                          item_code, qty, warehouse, remarks, False, unit_cost)
+            if ticket.status == write_buffer.FAILED:
+                raise ticket.error
+            if ticket.status == write_buffer.QUEUED:
+                return dbc.Alert(
+                    [html.I(className="fas fa-clock me-2"),
+                     f"입고가 접수되었습니다. 처리 대기 중입니다. (접수번호 {ticket.seq})"],
+                    color="info",
+                    dismissable=True
+                )
             
             logger.info(f"입고 처리 완료: {item_code}, 수량: {qty}")
             
@@ -291,32 +303,18 @@ def register_inventory_callbacks(app):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning", dismissable=True)
         
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
-            
-            # 현재 재고 확인
-            cursor.execute("SELECT current_stock FROM item_master WHERE item_code = ?", (item_code,))
-            current_stock = cursor.fetchone()
-            
-            if not current_stock or current_stock[0] < qty:
-                return dbc.Alert("재고가 부족합니다.", color="danger", dismissable=True)
-            
-            # 재고 이동 기록
-            cursor.execute("""
-                INSERT INTO stock_movements 
-                (movement_date, movement_type, item_code, quantity, warehouse, remarks)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (out_date, f"OUT_{out_type}", item_code, -qty, warehouse, remarks))
-            
-            # 현재 재고 업데이트
-            cursor.execute("""
-                UPDATE item_master 
-                SET current_stock = current_stock - ?
-                WHERE item_code = ?
-            """, (qty, item_code))
-            
-            conn.commit()
-            conn.close()
+            # 창고 재고 확인 후 이동 기록 및 재고 반영 (쓰기 버퍼 사용 시 그룹 커밋)
+            ticket = write_buffer.execute('inventory.post_movement', out_date, f"OUT_{out_type}",
+                                          item_code, -qty, warehouse, remarks, True)
+            if ticket.status == write_buffer.FAILED:
+                raise ticket.error
+            if ticket.status == write_buffer.QUEUED:
+                return dbc.Alert(
+                    [html.I(className="fas fa-clock me-2"),
+                     f"출고가 접수되었습니다. 처리 대기 중입니다. (접수번호 {ticket.seq})"],
+                    color="info",
+                    dismissable=True
+                )
             
             logger.info(f"출고 처리 완료: {item_code}, 수량: {qty}")
             
@@ -326,106 +324,21 @@ def register_inventory_callbacks(app):
                 dismissable=True
             )
             
+        except InsufficientStockError as e:
+            return dbc.Alert(f"재고가 부족합니다. ({warehouse_name(e.warehouse)} 현재고: {e.available:,})",
+                             color="danger", dismissable=True)
         except Exception as e:
             logger.error(f"출고 처리 실패: {e}")
             return dbc.Alert(f"처리 중 오류가 발생했습니다: {str(e)}", color="danger", dismissable=True)
     
-    # 입출고 이력 테이블 업데이트
-    @app.callback(
-        Output('inout-history-table', 'children'),
-        [Input('refresh-inout-history', 'n_clicks'),
-         Input('save-in-btn', 'n_clicks'),
-         Input('save-out-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')]
+    # 입출고 이력 그리드 (현재 페이지만 조회)
+    INOUT_HISTORY_GRID.register(
+        app,
+        inputs=[Input('refresh-inout-history', 'n_clicks'),
+                Input('save-in-btn', 'n_clicks'),
+                Input('save-out-btn', 'n_clicks'),
+                Input('refresh-inventory', 'data')]
     )
-    def update_inout_history(refresh_clicks, in_clicks, out_clicks, n_intervals):
-        """입출고 이력 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT 
-                sm.movement_date,
-                sm.movement_type,
-                sm.item_code,
-                im.item_name,
-                sm.quantity,
-                sm.warehouse,
-                sm.remarks,
-                sm.created_at
-            FROM stock_movements sm
-            JOIN item_master im ON sm.item_code = im.item_code
-            ORDER BY sm.created_at DESC
-            LIMIT 20
-        """
-        
-        try:
-            df = pd.read_sql_query(query, conn)
-            
-            if df.empty:
-                return html.Div("입출고 이력이 없습니다.", className="text-center p-4")
-            
-            # 타입 한글화 및 색상 설정
-            type_mapping = {
-                'IN_purchase': ('구매입고', 'success'),
-                'IN_production': ('생산입고', 'success'),
-                'IN_return': ('반품입고', 'info'),
-                'IN_other': ('기타입고', 'secondary'),
-                'OUT_production': ('생산출고', 'danger'),
-                'OUT_sales': ('판매출고', 'danger'),
-                'OUT_disposal': ('폐기출고', 'warning'),
-                'OUT_other': ('기타출고', 'secondary')
-            }
-            
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("일자"),
-                        html.Th("구분"),
-                        html.Th("품목코드"),
-                        html.Th("품목명"),
-                        html.Th("수량"),
-                        html.Th("창고"),
-                        html.Th("비고")
-                    ])
-                ])
-            ]
-            
-            table_body = []
-            for idx, row in df.iterrows():
-                type_info = type_mapping.get(row['movement_type'], ('기타', 'secondary'))
-                type_badge = dbc.Badge(type_info[0], color=type_info[1])
-                
-                qty_display = f"{abs(row['quantity']):,}"
-                if row['quantity'] < 0:
-                    qty_display = f"-{qty_display}"
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['movement_date']),
-                        html.Td(type_badge),
-                        html.Td(row['item_code']),
-                        html.Td(row['item_name']),
-                        html.Td(qty_display, className="text-end"),
-                        html.Td(row['warehouse']),
-                        html.Td(row['remarks'] or '-')
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True,
-                size="sm"
-            )
-            
-        except Exception as e:
-            logger.error(f"입출고 이력 조회 오류: {e}")
-            return html.Div("이력 조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
     
     # 재고 현황 업데이트
     @app.callback(
@@ -437,22 +350,22 @@ def register_inventory_callbacks(app):
          Output('stock-trend-chart', 'figure'),
          Output('warehouse-stock-chart', 'figure')],
         [Input('search-stock-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')],
+         Input('refresh-inventory', 'data')],
         [State('stock-warehouse-filter', 'value'),
          State('stock-status-filter', 'value')]
     )
     def update_stock_status(n_clicks, n_intervals, warehouse, status_filter):
         """재고 현황 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             # 전체 품목 수
             total_items_query = "SELECT COUNT(DISTINCT item_code) FROM item_master"
             total_items = pd.read_sql_query(total_items_query, conn).iloc[0, 0]
             
-            # 총 재고금액
-            total_value_query = "SELECT SUM(current_stock * unit_price) FROM item_master"
-            total_value = pd.read_sql_query(total_value_query, conn).iloc[0, 0] or 0
+            # 총 재고금액 (설정한 평가 방법의 증분 평가액)
+            value_col = value_column()
+            total_value = get_total_value()
             
             # 부족/과잉 품목
             shortage_query = "SELECT COUNT(*) FROM item_master WHERE current_stock < safety_stock"
@@ -461,17 +374,39 @@ def register_inventory_callbacks(app):
             excess_query = "SELECT COUNT(*) FROM item_master WHERE current_stock > safety_stock * 2"
             excess_items = pd.read_sql_query(excess_query, conn).iloc[0, 0]
             
-            # 재고 테이블
-            stock_query = """
+            # 재고 테이블 (창고 선택 시 해당 창고 잔액 기준)
+            params = []
+            if warehouse and warehouse != 'all':
+                # 창고 재고는 품목 평가 단가(평가액 / 평가 수량)로 환산
+                stock_source = f"""
+                    (SELECT im.item_code, im.item_name, im.category, im.unit,
+                            COALESCE(sb.quantity, 0) as current_stock, im.safety_stock,
+                            COALESCE(sb.quantity, 0) * COALESCE(sv.{value_col} / NULLIF(sv.quantity, 0), 0)
+                                as stock_value
+                     FROM item_master im
+                     LEFT JOIN stock_balances sb
+                        ON sb.item_code = im.item_code AND sb.warehouse = ?
+                     LEFT JOIN stock_valuation sv ON sv.item_code = im.item_code)
+                """
+                params.append(warehouse)
+            else:
+                stock_source = f"""
+                    (SELECT im.item_code, im.item_name, im.category, im.unit,
+                            im.current_stock, im.safety_stock,
+                            COALESCE(sv.{value_col}, 0) as stock_value
+                     FROM item_master im
+                     LEFT JOIN stock_valuation sv ON sv.item_code = im.item_code)
+                """
+            
+            stock_query = f"""
                 SELECT item_code, item_name, category, unit, 
-                       current_stock, safety_stock, unit_price,
-                       current_stock * unit_price as stock_value,
+                       current_stock, safety_stock, stock_value,
                        CASE 
                            WHEN current_stock < safety_stock THEN '부족'
                            WHEN current_stock > safety_stock * 2 THEN '과잉'
                            ELSE '정상'
                        END as status
-                FROM item_master
+                FROM {stock_source}
                 WHERE 1=1
             """
             
@@ -483,69 +418,38 @@ def register_inventory_callbacks(app):
                 elif status_filter == 'normal':
                     stock_query += " AND current_stock >= safety_stock AND current_stock <= safety_stock * 2"
             
-            stock_df = pd.read_sql_query(stock_query, conn)
+            stock_df = pd.read_sql_query(stock_query, conn, params=params)
             
-            # 테이블 생성
+            # 테이블 생성 (상태 색상/재고 비율은 컬럼 단위 계산)
             if not stock_df.empty:
-                table_header = [
-                    html.Thead([
-                        html.Tr([
-                            html.Th("품목코드"),
-                            html.Th("품목명"),
-                            html.Th("분류"),
-                            html.Th("현재고"),
-                            html.Th("안전재고"),
-                            html.Th("상태"),
-                            html.Th("재고금액")
-                        ])
-                    ])
+                units = " " + stock_df['unit'].fillna('')
+                ratios = ratio(stock_df['current_stock'], stock_df['safety_stock'], digits=0)
+                colors = badge_colors(stock_df['status'], STOCK_STATUS_COLORS)
+                status_cells = [
+                    [dbc.Badge(status, color=color),
+                     html.Small(f" ({stock_ratio:.0f}%)", className="text-muted ms-1")]
+                    for status, color, stock_ratio in zip(stock_df['status'].tolist(), colors, ratios)
+                ]
+                value_cells = [
+                    html.Span(f"₩{value}", className="float-end")
+                    for value in number_cells(stock_df['stock_value'].fillna(0))
                 ]
                 
-                table_body = []
-                for idx, row in stock_df.iterrows():
-                    status_color = "danger" if row['status'] == '부족' else "warning" if row['status'] == '과잉' else "success"
-                    status_badge = dbc.Badge(row['status'], color=status_color)
-                    
-                    # 재고 비율 표시
-                    stock_ratio = (row['current_stock'] / row['safety_stock'] * 100) if row['safety_stock'] > 0 else 0
-                    
-                    table_body.append(
-                        html.Tr([
-                            html.Td(row['item_code']),
-                            html.Td(row['item_name']),
-                            html.Td(row['category']),
-                            html.Td(f"{row['current_stock']:,} {row['unit']}"),
-                            html.Td(f"{row['safety_stock']:,} {row['unit']}"),
-                            html.Td([
-                                status_badge,
-                                html.Small(f" ({stock_ratio:.0f}%)", className="text-muted ms-1")
-                            ]),
-                            html.Td(f"₩{row['stock_value']:,.0f}", className="text-end")
-                        ])
-                    )
-                
-                stock_table = dbc.Table(
-                    table_header + [html.Tbody(table_body)],
-                    striped=True,
-                    bordered=True,
-                    hover=True,
-                    responsive=True
+                stock_table = render_table(
+                    ["품목코드", "품목명", "분류", "현재고", "안전재고", "상태", "재고금액"],
+                    stock_df['item_code'].tolist(),
+                    stock_df['item_name'].tolist(),
+                    stock_df['category'].tolist(),
+                    (pd.Series(number_cells(stock_df['current_stock'])) + units).tolist(),
+                    (pd.Series(number_cells(stock_df['safety_stock'])) + units).tolist(),
+                    status_cells,
+                    value_cells
                 )
             else:
                 stock_table = html.Div("재고 데이터가 없습니다.", className="text-center p-4")
             
             # 재고 추이 차트 (최근 30일)
-            trend_query = """
-                SELECT 
-                    movement_date,
-                    SUM(CASE WHEN quantity > 0 THEN quantity ELSE 0 END) as in_qty,
-                    SUM(CASE WHEN quantity < 0 THEN ABS(quantity) ELSE 0 END) as out_qty
-                FROM stock_movements
-                WHERE movement_date >= date('now', '-30 days')
-                GROUP BY movement_date
-                ORDER BY movement_date
-            """
-            trend_df = pd.read_sql_query(trend_query, conn)
+            trend_df = pd.read_sql_query(STOCK_TREND_QUERY, conn)
             
             trend_fig = go.Figure()
             if not trend_df.empty:
@@ -583,26 +487,17 @@ def register_inventory_callbacks(app):
                 )
                 trend_fig.update_layout(title="최근 30일 입출고 추이")
             
-            # 창고별 재고 차트 (실제 데이터가 있다면)
-            warehouse_query = """
-                SELECT 
-                    '창고1' as warehouse,
-                    SUM(CASE WHEN warehouse = 'wh1' THEN quantity ELSE 0 END) as stock
-                FROM stock_movements
-                UNION ALL
-                SELECT 
-                    '창고2' as warehouse,
-                    SUM(CASE WHEN warehouse = 'wh2' THEN quantity ELSE 0 END) as stock
-                FROM stock_movements
-            """
-            warehouse_df = pd.read_sql_query(warehouse_query, conn)
+            # 창고별 재고 차트 (품목/창고 잔액 합계)
+            warehouse_totals = get_warehouse_totals()
+            warehouse_labels = [warehouse_name(wh) for wh, _ in warehouse_totals]
+            warehouse_stock = [qty for _, qty in warehouse_totals]
             
             warehouse_fig = go.Figure()
             warehouse_fig.add_trace(go.Bar(
-                x=warehouse_df['warehouse'],
-                y=warehouse_df['stock'],
-                marker_color=['#0066cc', '#17a2b8'],
-                text=warehouse_df['stock'],
+                x=warehouse_labels,
+                y=warehouse_stock,
+                marker_color=['#0066cc', '#17a2b8'] * (len(warehouse_stock) // 2 + 1),
+                text=warehouse_stock,
                 textposition='auto'
             ))
             warehouse_fig.update_layout(
@@ -649,28 +544,19 @@ def register_inventory_callbacks(app):
         if not search_value:
             return "", 0, dbc.Alert("품목을 검색하세요", color="warning")
         
-        conn = sqlite3.connect('data/database.db')
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT item_code, item_name, unit, current_stock
-            FROM item_master 
-            WHERE item_code LIKE ? OR item_name LIKE ?
-            LIMIT 1
-        """, (f"%{search_value}%", f"%{search_value}%"))
-        
-        result = cursor.fetchone()
-        conn.close()
+        result, others = _pick_item(search_value)
         
-        if result:
+        if result is not None:
             display = dbc.Alert(
                 [
-                    html.B(f"{result[1]}"),
+                    html.B(f"{result.item_name}"),
                     html.Br(),
-                    f"현재고: {result[3]:,} {result[2]}"
+                    f"현재고: {result.current_stock:,} {result.unit}",
+                    html.Div(others) if others else None
                 ],
                 color="info"
             )
-            return result[0], result[3], display
+            return result.item_code, int(result.current_stock), display
         
         return "", 0, dbc.Alert("품목을 찾을 수 없습니다", color="danger")
     
@@ -705,38 +591,12 @@ def register_inventory_callbacks(app):
                 return dash.no_update, dbc.Alert("모든 필수 항목을 입력하세요.", color="warning")
             
             try:
-                conn = sqlite3.connect('data/database.db')
-                cursor = conn.cursor()
-                
-                diff = adjusted_stock - current_stock
-                
-                # 조정 기록
-                cursor.execute("""
-                    INSERT INTO stock_adjustments
-                    (adjustment_date, item_code, adjustment_type, 
-                     before_qty, after_qty, difference, reason)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (adjust_date, item_code, adjust_type, 
-                      current_stock, adjusted_stock, diff, reason))
-                
-                # 재고 업데이트
-                cursor.execute("""
-                    UPDATE item_master 
-                    SET current_stock = ?
-                    WHERE item_code = ?
-                """, (adjusted_stock, item_code))
-                
-                # 재고 이동 기록에도 추가
-                cursor.execute("""
-                    INSERT INTO stock_movements
-                    (movement_date, movement_type, item_code, quantity, warehouse, remarks)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (adjust_date, f"ADJUST_{adjust_type}", item_code, diff, 'wh1', f"재고조정: {reason}"))
-                
-                conn.commit()
-                conn.close()
+                # 화면 조회 이후 변동을 반영해 잠금 상태의 현재고 기준으로 차이 계산
+                diff = run_write(adjust_stock, adjust_date, adjust_type, item_code,
+                                 adjusted_stock, reason)
                 
                 logger.info(f"재고 조정 완료: {item_code}, 차이: {diff}")
+                publish('inventory')
                 
                 return dash.no_update, dbc.Alert(
                     [html.I(className="fas fa-check-circle me-2"), "재고 조정이 완료되었습니다!"],
@@ -744,6 +604,8 @@ def register_inventory_callbacks(app):
                     dismissable=True
                 )
                 
+            except ItemNotFoundError:
+                return dash.no_update, dbc.Alert("품목을 찾을 수 없습니다", color="danger")
             except Exception as e:
                 logger.error(f"재고 조정 실패: {e}")
                 return dash.no_update, dbc.Alert(
@@ -758,31 +620,14 @@ def register_inventory_callbacks(app):
     @app.callback(
         Output('adjust-history-table', 'children'),
         [Input('save-adjust-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')]
+         Input('refresh-inventory', 'data')]
     )
     def update_adjust_history(n_clicks, n_intervals):
         """조정 이력 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT 
-                sa.adjustment_date,
-                sa.item_code,
-                im.item_name,
-                sa.adjustment_type,
-                sa.before_qty,
-                sa.after_qty,
-                sa.difference,
-                sa.reason,
-                sa.created_at
-            FROM stock_adjustments sa
-            JOIN item_master im ON sa.item_code = im.item_code
-            ORDER BY sa.created_at DESC
-            LIMIT 10
-        """
+        conn = get_connection()
         
         try:
-            df = pd.read_sql_query(query, conn)
+            df = pd.read_sql_query(ADJUST_HISTORY_QUERY, conn)
             
             if df.empty:
                 return html.Div("조정 이력이 없습니다.", className="text-center p-4")
@@ -853,25 +698,27 @@ def register_inventory_callbacks(app):
     )
     def export_stock_to_excel(n_clicks):
         """재고 현황 Excel 다운로드"""
-        conn = sqlite3.connect('data/database.db')
+        value_col = value_column()
+        conn = get_connection()
         
-        query = """
+        query = f"""
             SELECT 
-                item_code as '품목코드',
-                item_name as '품목명',
-                category as '분류',
-                unit as '단위',
-                current_stock as '현재고',
-                safety_stock as '안전재고',
-                unit_price as '단가',
-                current_stock * unit_price as '재고금액',
+                im.item_code as '품목코드',
+                im.item_name as '품목명',
+                im.category as '분류',
+                im.unit as '단위',
+                im.current_stock as '현재고',
+                im.safety_stock as '안전재고',
+                COALESCE(sv.{value_col} / NULLIF(sv.quantity, 0), sv.avg_cost, im.unit_price) as '평가단가',
+                COALESCE(sv.{value_col}, 0) as '재고금액',
                 CASE 
-                    WHEN current_stock < safety_stock THEN '부족'
-                    WHEN current_stock > safety_stock * 2 THEN '과잉'
+                    WHEN im.current_stock < im.safety_stock THEN '부족'
+                    WHEN im.current_stock > im.safety_stock * 2 THEN '과잉'
                     ELSE '정상'
                 END as '재고상태'
-            FROM item_master
-            ORDER BY item_code
+            FROM item_master im
+            LEFT JOIN stock_valuation sv ON sv.item_code = im.item_code
+            ORDER BY im.item_code
         """
         
         df = pd.read_sql_query(query, conn)
@@ -889,21 +736,23 @@ def register_inventory_callbacks(app):
         [State('safety-stock-ratio', 'value'),
          State('alert-criteria', 'value'),
          State('valuation-method', 'value'),
-         State('barcode-options', 'value')],
+         State('barcode-options', 'value'),
+         State('service-level', 'value')],
         prevent_initial_call=True
     )
     def save_inventory_settings(n_clicks, safety_ratio, alert_criteria, 
-                              valuation_method, barcode_options):
+                              valuation_method, barcode_options, service_level):
         """재고 설정 저장"""
         try:
             settings = {
                 'safety_stock_ratio': safety_ratio,
+                'service_level': service_level,
                 'alert_criteria': alert_criteria,
                 'valuation_method': valuation_method,
                 'barcode_options': barcode_options
             }
             
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -963,7 +812,7 @@ def register_inventory_callbacks(app):
             return dbc.Alert("필수 항목을 모두 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -974,6 +823,7 @@ def register_inventory_callbacks(app):
             
             conn.commit()
             conn.close()
+            publish('inventory')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"), "품목이 등록되었습니다!"],
@@ -985,3 +835,223 @@ def register_inventory_callbacks(app):
         except Exception as e:
             logger.error(f"품목 저장 실패: {e}")
             return dbc.Alert(f"저장 중 오류가 발생했습니다: {str(e)}", color="danger")
+    
+    # BOM 정전개 / 총소요량 / 사용처
+    @app.callback(
+        Output('bom-result', 'children'),
+        Input('bom-search-btn', 'n_clicks'),
+        [State('bom-item-code', 'value'),
+         State('bom-view', 'value'),
+         State('bom-quantity', 'value'),
+         State('bom-as-of', 'value')],
+        prevent_initial_call=True
+    )
+    def search_bom(n_clicks, item_code, view, quantity, as_of):
+        """BOM 조회 결과 (화면에는 최대 BOM_DISPLAY_ROWS 행)"""
+        from .bom import explode, requirements, where_used, material_cost
+        
+        item_code = (item_code or '').strip()
+        if not item_code:
+            return dbc.Alert("품목코드를 입력하세요.", color="warning")
+        quantity = quantity or 1
+        
+        try:
+            if view == 'where-used':
+                df = where_used(item_code)
+                if df.empty:
+                    return dbc.Alert("이 품목을 사용하는 상위 품목이 없습니다.", color="info")
+                return html.Div([
+                    dbc.Alert(f"사용처 {len(df):,}개 (최종 제품 {int(df['is_top'].sum()):,}개)", color="info"),
+                    render_table(
+                        ["상위 품목", "품목명", "최소 단계", "최종 제품"],
+                        df['ancestor_code'].tolist(),
+                        text_cells(df['item_name']),
+                        df['min_level'].tolist(),
+                        ['예' if top else '' for top in df['is_top']]
+                    )
+                ])
+            
+            if view == 'summary':
+                df = requirements(item_code, quantity, as_of)
+            else:
+                df = explode(item_code, quantity, as_of)
+            if df.empty:
+                return dbc.Alert("등록된 BOM 이 없습니다.", color="info")
+            
+            total = len(df)
+            df = df.head(BOM_DISPLAY_ROWS)
+            conn = get_connection()
+            try:
+                names = dict(conn.execute(
+                    "SELECT item_code, item_name FROM item_master WHERE item_code IN (SELECT value FROM json_each(?))",
+                    (json.dumps(df['component_code'].unique().tolist()),)
+                ).fetchall())
+            finally:
+                conn.close()
+            item_names = text_cells([names.get(code) for code in df['component_code']])
+            
+            summary = [
+                html.Span(f"{total:,}행", className="me-3"),
+                html.Span(f"재료비 {material_cost(item_code, as_of) * quantity:,.0f}원", className="me-3"),
+            ]
+            if total > BOM_DISPLAY_ROWS:
+                summary.append(dbc.Badge(f"처음 {BOM_DISPLAY_ROWS:,}행만 표시", color="warning"))
+            
+            if view == 'summary':
+                table = render_table(
+                    ["단계", "품목코드", "품목명", "총소요량", "구분"],
+                    df['low_level'].tolist(),
+                    df['component_code'].tolist(),
+                    item_names,
+                    number_cells(df['quantity'], '{:,.2f}'),
+                    ['자재' if leaf else '반제품' for leaf in df['is_leaf']]
+                )
+            else:
+                table = render_table(
+                    ["단계", "상위 품목", "품목코드", "품목명", "단위 소요량", "스크랩률", "소요량"],
+                    ['.' * (level - 1) + str(level) for level in df['level']],
+                    df['parent_code'].tolist(),
+                    df['component_code'].tolist(),
+                    item_names,
+                    number_cells(df['quantity_per'], '{:,.3g}'),
+                    number_cells(df['scrap_rate'] * 100, '{:.1f}%'),
+                    number_cells(df['extended_qty'], '{:,.2f}')
+                )
+            return html.Div([dbc.Alert(summary, color="info"), table])
+            
+        except ValueError as e:
+            return dbc.Alert(str(e), color="danger")
+        except Exception as e:
+            logger.error(f"BOM 조회 오류: {e}")
+            return dbc.Alert(f"조회 중 오류가 발생했습니다: {str(e)}", color="danger")
+    
+    # 기준일 재고 / 월말 추이
+    @app.callback(
+        Output('as-of-result', 'children'),
+        Input('as-of-search-btn', 'n_clicks'),
+        [State('as-of-date', 'value'),
+         State('as-of-item-code', 'value'),
+         State('as-of-warehouse', 'value'),
+         State('as-of-view', 'value')],
+        prevent_initial_call=True
+    )
+    def search_stock_as_of(n_clicks, as_of, item_code, warehouse, view):
+        """기준일 재고 조회 (체크포인트 + 이후 이동)"""
+        from .checkpoints import balances_as_of, month_end_report
+        
+        if not as_of:
+            return dbc.Alert("기준일을 입력하세요.", color="warning")
+        item_code = (item_code or '').strip() or None
+        warehouse = None if warehouse in (None, 'all') else warehouse
+        
+        try:
+            if view == 'month-end':
+                end = datetime.strptime(as_of, '%Y-%m-%d')
+                start = f"{end.year - (end.month < 12)}-{end.month % 12 + 1:02d}"
+                df = month_end_report(start, as_of[:7], item_code)
+                if df.empty:
+                    return dbc.Alert("해당 기간의 재고가 없습니다.", color="info")
+                monthly = df.groupby('month', as_index=False)['quantity'].sum()
+                return html.Div([
+                    dbc.Alert(f"{start} ~ {as_of[:7]} 월말 재고 ({item_code or '전체 품목'})", color="info"),
+                    render_table(
+                        ["월", "월말 재고", "품목 수"],
+                        monthly['month'].tolist(),
+                        number_cells(monthly['quantity']),
+                        number_cells(df.groupby('month')['item_code'].nunique().reindex(monthly['month']))
+                    )
+                ])
+            
+            df = balances_as_of(as_of, item_code, warehouse)
+            if df.empty:
+                return dbc.Alert(f"{as_of} 기준 재고가 없습니다.", color="info")
+            
+            total = len(df)
+            summary = [
+                html.Span(f"{as_of} 기준 {total:,}행", className="me-3"),
+                html.Span(f"합계 {df['quantity'].sum():,}", className="me-3"),
+            ]
+            if total > AS_OF_DISPLAY_ROWS:
+                summary.append(dbc.Badge(f"처음 {AS_OF_DISPLAY_ROWS:,}행만 표시", color="warning"))
+            df = df.head(AS_OF_DISPLAY_ROWS)
+            return html.Div([
+                dbc.Alert(summary, color="info"),
+                render_table(
+                    ["품목코드", "품목명", "창고", "재고"],
+                    df['item_code'].tolist(),
+                    text_cells(df['item_name']),
+                    [warehouse_name(w) for w in df['warehouse']],
+                    number_cells(df['quantity'])
+                )
+            ])
+            
+        except ValueError as e:
+            return dbc.Alert(str(e), color="danger")
+        except Exception as e:
+            logger.error(f"기준일 재고 조회 오류: {e}")
+            return dbc.Alert(f"조회 중 오류가 발생했습니다: {str(e)}", color="danger")
+    
+    # 안전재고/발주점 최적화 계산 및 적용
+    @app.callback(
+        Output('safety-stock-proposals', 'children'),
+        [Input('compute-safety-stock-btn', 'n_clicks'),
+         Input('apply-safety-stock-btn', 'n_clicks')],
+        State('service-level', 'value'),
+        prevent_initial_call=True
+    )
+    def manage_safety_stock_proposals(compute_clicks, apply_clicks, service_level):
+        """수요/리드타임 분포로 안전재고 제안 계산, 검토 후 일괄 적용"""
+        from .safety_stock import propose_safety_stock, get_proposals, apply_proposals
+        
+        ctx = callback_context
+        trigger = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
+        
+        try:
+            if trigger == 'apply-safety-stock-btn':
+                applied = run_write(apply_proposals)
+                if not applied:
+                    return dbc.Alert("적용할 제안이 없습니다. 먼저 최적화 계산을 실행하세요.", color="warning")
+                publish('inventory')
+                return dbc.Alert(
+                    [html.I(className="fas fa-check-circle me-2"),
+                     f"{applied:,}개 품목의 안전재고/발주점을 적용했습니다."],
+                    color="success",
+                    dismissable=True
+                )
+            
+            level = float(service_level) / 100 if service_level else None
+            summary = propose_safety_stock(level)
+            df = get_proposals(limit=SAFETY_STOCK_DISPLAY_ROWS)
+            header = dbc.Alert([
+                html.Span(f"{summary['start']} ~ {summary['end']} 출고 기준, "
+                          f"서비스 수준 {summary['service_level']:.1%}", className="me-3"),
+                html.Span(f"제안 {summary['proposed']:,}개 / 전체 {summary['items']:,}개 품목", className="me-3"),
+                html.Span(f"변경 {summary['changed']:,}개", className="me-3"),
+            ], color="info")
+            if df.empty:
+                return html.Div([header, html.P("기간 내 출고 이력이 있는 품목이 없습니다.", className="text-muted")])
+            
+            return html.Div([
+                header,
+                render_table(
+                    ["품목코드", "품목명", "일 수요", "수요 편차", "리드타임(일)", "리드타임 편차",
+                     "현재 안전재고", "제안 안전재고", "제안 발주점"],
+                    df['item_code'].tolist(),
+                    text_cells(df['item_name']),
+                    number_cells(df['demand_mean'], '{:,.2f}'),
+                    number_cells(df['demand_std'], '{:,.2f}'),
+                    number_cells(df['lead_time_mean'], '{:,.1f}'),
+                    number_cells(df['lead_time_std'], '{:,.1f}'),
+                    number_cells(df['current_safety_stock']),
+                    number_cells(df['safety_stock']),
+                    number_cells(df['reorder_point'])
+                ),
+                html.Small(f"현재 값과 차이가 큰 순으로 최대 {SAFETY_STOCK_DISPLAY_ROWS}개 표시",
+                           className="text-muted")
+            ])
+            
+        except ValueError as e:
+            return dbc.Alert(str(e), color="danger")
+        except Exception as e:
+            logger.error(f"안전재고 최적화 오류: {e}")
+            return dbc.Alert(f"계산 중 오류가 발생했습니다: {str(e)}", color="danger")
@@ -0,0 +1,180 @@
+# modules/inventory/checkpoints.py - 기준일 재고 조회 (기간말 잔액 체크포인트)
+#
+# 월말(또는 일말) 품목/창고별 잔액을 stock_checkpoints 에 저장해 두고
+# (core/migrations/0015), 기준일 재고는 기준일 이전의 가장 가까운 체크포인트에
+# 그 이후 이동만 더해 계산한다. 읽는 이동은 최대 한 기간분이므로 이력이
+# 몇 년이 쌓여도 조회 시간이 일정하다.
+#
+# 체크포인트는 조회 시 지난 기간말까지 없는 것만 만든다. 각 체크포인트는 직전
+# 체크포인트 + 그 사이 이동으로 만들므로 원장을 처음부터 다시 읽지 않는다.
+# 체크포인트 이전 날짜로 소급 등록된 이동은 트리거가 바로 반영한다.
+
+import calendar
+import logging
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from core.database import get_connection, read_df, run_write
+from .stock import DEFAULT_WAREHOUSE
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ('monthly', 'daily')
+DEFAULT_PERIOD = 'monthly'
+
+
+def period_ends(first, last, period=DEFAULT_PERIOD):
+    """first 가 속한 기간부터 last 까지의 기간말 날짜 목록 ('YYYY-MM-DD')"""
+    if period not in PERIODS:
+        raise ValueError(f"지원하지 않는 체크포인트 주기: {period}")
+    day = datetime.strptime(first, '%Y-%m-%d').date()
+    end = datetime.strptime(last, '%Y-%m-%d').date()
+    dates = []
+    while True:
+        if period == 'monthly':
+            day = day.replace(day=calendar.monthrange(day.year, day.month)[1])
+        if day > end:
+            return dates
+        dates.append(day.isoformat())
+        day += timedelta(days=1)
+
+
+def _latest_checkpoint(conn, as_of):
+    """as_of 이전(포함) 가장 가까운 체크포인트 날짜 (없으면 None)"""
+    row = conn.execute(
+        "SELECT MAX(checkpoint_date) FROM stock_checkpoint_log WHERE checkpoint_date <= ?", (as_of,)
+    ).fetchone()
+    return row[0]
+
+
+def _build_checkpoint(conn, checkpoint_date):
+    """직전 체크포인트 + 사이 이동으로 checkpoint_date 잔액 생성 - 저장 행 수"""
+    base = _latest_checkpoint(conn, checkpoint_date)
+    if base == checkpoint_date:
+        return None
+    conn.execute("DELETE FROM stock_checkpoints WHERE checkpoint_date = ?", (checkpoint_date,))
+    cursor = conn.execute("""
+        INSERT INTO stock_checkpoints (checkpoint_date, item_code, warehouse, quantity)
+        SELECT ?, item_code, warehouse, SUM(quantity)
+        FROM (
+            SELECT item_code, warehouse, quantity
+            FROM stock_checkpoints
+            WHERE checkpoint_date = ?
+            UNION ALL
+            SELECT item_code, COALESCE(warehouse, ?), quantity
+            FROM stock_movements
+            WHERE movement_date > ? AND movement_date <= ?
+        )
+        GROUP BY item_code, warehouse
+        HAVING SUM(quantity) != 0
+    """, (checkpoint_date, base or '', DEFAULT_WAREHOUSE, base or '', checkpoint_date))
+    conn.execute("INSERT INTO stock_checkpoint_log (checkpoint_date, row_count) VALUES (?, ?)",
+                 (checkpoint_date, cursor.rowcount))
+    return cursor.rowcount
+
+
+def _missing_checkpoints(conn, through, period):
+    row = conn.execute("SELECT MIN(movement_date) FROM stock_movements").fetchone()
+    if row[0] is None:
+        return []
+    done = conn.execute("SELECT MAX(checkpoint_date) FROM stock_checkpoint_log").fetchone()[0]
+    first = row[0] if done is None else \
+        (datetime.strptime(done, '%Y-%m-%d').date() + timedelta(days=1)).isoformat()
+    return period_ends(first[:10], through, period)
+
+
+def ensure_checkpoints(through=None, period=DEFAULT_PERIOD):
+    """through(기본: 어제)까지 지난 기간말 체크포인트 생성 - 새로 만든 날짜 목록
+
+    오늘 이후 날짜는 이동이 더 들어올 수 있으므로 만들지 않는다.
+    """
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    through = min(through or yesterday, yesterday)
+
+    conn = get_connection()
+    try:
+        missing = _missing_checkpoints(conn, through, period)
+    finally:
+        conn.close()
+    if not missing:
+        return []
+
+    def build(conn):
+        created = []
+        for checkpoint_date in _missing_checkpoints(conn, through, period):
+            if _build_checkpoint(conn, checkpoint_date) is not None:
+                created.append(checkpoint_date)
+        return created
+
+    created = run_write(build)
+    if created:
+        logger.info(f"재고 체크포인트 생성: {created[0]} ~ {created[-1]} ({len(created)}개)")
+    return created
+
+
+def create_checkpoint(checkpoint_date):
+    """지정한 날짜의 체크포인트 생성 (이미 있으면 그대로) - 저장 행 수"""
+    return run_write(_build_checkpoint, checkpoint_date)
+
+
+def balances_as_of(as_of, item_code=None, warehouse=None, period=DEFAULT_PERIOD):
+    """기준일(해당 일 포함) 품목/창고별 재고 [item_code, item_name, warehouse, quantity]
+
+    가장 가까운 이전 체크포인트 + 이후 이동만 읽는다.
+    """
+    ensure_checkpoints(as_of, period)
+
+    conn = get_connection()
+    try:
+        base = _latest_checkpoint(conn, as_of) or ''
+    finally:
+        conn.close()
+
+    filters, params = '', []
+    if item_code:
+        filters += " AND item_code = ?"
+        params.append(item_code)
+    checkpoint_filters = filters + (" AND warehouse = ?" if warehouse else "")
+    movement_filters = filters + (" AND COALESCE(warehouse, ?) = ?" if warehouse else "")
+    checkpoint_params = params + ([warehouse] if warehouse else [])
+    movement_params = params + ([DEFAULT_WAREHOUSE, warehouse] if warehouse else [])
+
+    return read_df(f"""
+        SELECT b.item_code, im.item_name, b.warehouse, SUM(b.quantity) as quantity
+        FROM (
+            SELECT item_code, warehouse, quantity
+            FROM stock_checkpoints
+            WHERE checkpoint_date = ?{checkpoint_filters}
+            UNION ALL
+            SELECT item_code, COALESCE(warehouse, ?) as warehouse, quantity
+            FROM stock_movements
+            WHERE movement_date > ? AND movement_date <= ?{movement_filters}
+        ) b
+        LEFT JOIN item_master im ON im.item_code = b.item_code
+        GROUP BY b.item_code, b.warehouse
+        HAVING SUM(b.quantity) != 0
+        ORDER BY b.item_code, b.warehouse
+    """, [base] + checkpoint_params + [DEFAULT_WAREHOUSE, base, as_of] + movement_params)
+
+
+def _month_end(month):
+    """'YYYY-MM' 의 말일"""
+    year, mon = int(month[:4]), int(month[5:7])
+    return date(year, mon, calendar.monthrange(year, mon)[1]).isoformat()
+
+
+def month_end_report(start_month, end_month, item_code=None):
+    """월말 재고 추이 [month, item_code, quantity] - start_month/end_month 는 'YYYY-MM'
+
+    지난 월말은 체크포인트를 그대로 읽고, 진행 중인 달만 이동을 더한다.
+    """
+    frames = []
+    for month_end in period_ends(f"{start_month}-01", _month_end(end_month), 'monthly'):
+        df = balances_as_of(month_end, item_code)
+        totals = df.groupby('item_code', as_index=False)['quantity'].sum()
+        totals.insert(0, 'month', month_end[:7])
+        frames.append(totals)
+    if not frames:
+        return pd.DataFrame(columns=['month', 'item_code', 'quantity'])
+    return pd.concat(frames, ignore_index=True)
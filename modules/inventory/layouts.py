@@ -9,6 +9,43 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 
+from core.grid import SqlGrid, label_case
+from .stock import WAREHOUSE_NAMES
+
+# 입출고 구분 표시명
+MOVEMENT_TYPE_LABELS = {
+    'IN_purchase': '구매입고',
+    'IN_production': '생산입고',
+    'IN_return': '반품입고',
+    'IN_other': '기타입고',
+    'OUT_production': '생산출고',
+    'OUT_sales': '판매출고',
+    'OUT_disposal': '폐기출고',
+    'OUT_other': '기타출고',
+    'OPENING': '기초재고'
+}
+
+# 입출고 이력 그리드
+INOUT_HISTORY_GRID = SqlGrid(
+    'inout-history-table',
+    "stock_movements sm JOIN item_master im ON sm.item_code = im.item_code",
+    columns=[
+        {'id': 'movement_date', 'name': '일자', 'sql': 'sm.movement_date', 'nullable': False},
+        {'id': 'movement_type', 'name': '구분', 'nullable': False,
+         'sql': label_case('sm.movement_type', MOVEMENT_TYPE_LABELS, '기타')},
+        {'id': 'item_code', 'name': '품목코드', 'sql': 'sm.item_code', 'nullable': False},
+        {'id': 'item_name', 'name': '품목명', 'sql': 'im.item_name', 'nullable': False},
+        {'id': 'quantity', 'name': '수량', 'sql': 'sm.quantity', 'type': 'numeric', 'nullable': False},
+        {'id': 'warehouse', 'name': '창고', 'sql': label_case('sm.warehouse', WAREHOUSE_NAMES)},
+        {'id': 'remarks', 'name': '비고', 'sql': 'sm.remarks'},
+    ],
+    key='sm.id',
+    style_data_conditional=[
+        {'if': {'filter_query': '{quantity} < 0', 'column_id': 'quantity'}, 'color': '#dc3545'},
+        {'if': {'filter_query': '{quantity} > 0', 'column_id': 'quantity'}, 'color': '#198754'},
+    ]
+)
+
 def create_inventory_layout():
     """재고관리 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -25,6 +62,8 @@ def create_inventory_layout():
             dbc.Tab(label="입출고", tab_id="stock-inout"),
             dbc.Tab(label="재고 현황", tab_id="stock-status"),
             dbc.Tab(label="재고 조정", tab_id="stock-adjust"),
+            dbc.Tab(label="기준일 재고", tab_id="stock-as-of"),
+            dbc.Tab(label="BOM", tab_id="bom"),
             dbc.Tab(label="설정", tab_id="inv-settings")
         ], id="inventory-tabs", active_tab="item-master"),
         
@@ -57,9 +96,13 @@ def create_item_master():
                     dbc.Col([
                         dbc.InputGroup([
                             dbc.InputGroupText(html.I(className="fas fa-search")),
-                            dbc.Input(
+                            # 입력을 멈춘 뒤 0.3초 후에 검색 (dbc.Input 은 초 단위 debounce 미지원)
+                            dcc.Input(
                                 id="item-search",
-                                placeholder="품목코드, 품목명으로 검색..."
+                                type="text",
+                                debounce=0.3,
+                                className="form-control",
+                                placeholder="품목코드, 품목명, 분류로 검색 (오타 허용)..."
                             )
                         ])
                     ], md=6),
@@ -168,7 +211,7 @@ def create_stock_inout():
                                         type="number",
                                         min=1
                                     )
-                                ], md=4),
+                                ], md=3),
                                 dbc.Col([
                                     dbc.Label("단위"),
                                     dbc.Input(
@@ -176,7 +219,16 @@ def create_stock_inout():
                                         value="EA",
                                         disabled=True
                                     )
-                                ], md=4),
+                                ], md=2),
+                                dbc.Col([
+                                    dbc.Label("입고 단가"),
+                                    dbc.Input(
+                                        id="in-unit-cost",
+                                        type="number",
+                                        min=0,
+                                        placeholder="미입력 시 평균단가"
+                                    )
+                                ], md=3),
                                 dbc.Col([
                                     dbc.Label("창고"),
                                     dbc.Select(
@@ -336,7 +388,7 @@ def create_stock_inout():
                 )
             ]),
             dbc.CardBody([
-                html.Div(id="inout-history-table")
+                INOUT_HISTORY_GRID.layout()
             ])
         ])
     ])
@@ -606,6 +658,113 @@ def create_stock_adjust():
        ], className="mt-4")
    ])
 
+def create_stock_as_of():
+    """기준일 재고 / 월말 재고 추이 조회"""
+    return html.Div([
+        dbc.Card([
+            dbc.CardHeader([
+                html.H4([html.I(className="fas fa-calendar-check me-2"), "기준일 재고"])
+            ]),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("기준일"),
+                        dbc.Input(id="as-of-date", type="date",
+                                  value=datetime.now().strftime('%Y-%m-%d'))
+                    ], md=2),
+                    dbc.Col([
+                        dbc.Label("품목코드"),
+                        dbc.Input(id="as-of-item-code", type="text", placeholder="전체")
+                    ], md=3),
+                    dbc.Col([
+                        dbc.Label("창고"),
+                        dbc.Select(
+                            id="as-of-warehouse",
+                            options=[
+                                {"label": "전체", "value": "all"},
+                                {"label": "창고1", "value": "wh1"},
+                                {"label": "창고2", "value": "wh2"}
+                            ],
+                            value="all"
+                        )
+                    ], md=2),
+                    dbc.Col([
+                        dbc.Label("조회 구분"),
+                        dbc.Select(
+                            id="as-of-view",
+                            options=[
+                                {"label": "기준일 잔액", "value": "balance"},
+                                {"label": "월말 추이 (12개월)", "value": "month-end"}
+                            ],
+                            value="balance"
+                        )
+                    ], md=3),
+                    dbc.Col([
+                        dbc.Label("　"),
+                        dbc.Button(
+                            [html.I(className="fas fa-search me-2"), "조회"],
+                            id="as-of-search-btn",
+                            color="primary",
+                            className="w-100"
+                        )
+                    ], md=2)
+                ], className="mb-3"),
+
+                dcc.Loading(html.Div(id="as-of-result"))
+            ])
+        ])
+    ])
+
+def create_bom_view():
+    """BOM 정전개 / 총소요량 / 사용처 조회"""
+    return html.Div([
+        dbc.Card([
+            dbc.CardHeader([
+                html.H4([html.I(className="fas fa-sitemap me-2"), "BOM 조회"])
+            ]),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("품목코드"),
+                        dbc.Input(id="bom-item-code", type="text", placeholder="품목코드 입력")
+                    ], md=3),
+                    dbc.Col([
+                        dbc.Label("조회 구분"),
+                        dbc.Select(
+                            id="bom-view",
+                            options=[
+                                {"label": "정전개 (단계별)", "value": "indented"},
+                                {"label": "총소요량", "value": "summary"},
+                                {"label": "사용처 (역전개)", "value": "where-used"}
+                            ],
+                            value="indented"
+                        )
+                    ], md=3),
+                    dbc.Col([
+                        dbc.Label("수량"),
+                        dbc.Input(id="bom-quantity", type="number", min=0, value=1)
+                    ], md=2),
+                    dbc.Col([
+                        dbc.Label("기준일"),
+                        dbc.Input(id="bom-as-of", type="date",
+                                  value=datetime.now().strftime('%Y-%m-%d'))
+                    ], md=2),
+                    dbc.Col([
+                        dbc.Label("　"),
+                        dbc.Button(
+                            [html.I(className="fas fa-search me-2"), "조회"],
+                            id="bom-search-btn",
+                            color="primary",
+                            className="w-100"
+                        )
+                    ], md=2)
+                ], className="mb-3"),
+
+                dcc.Loading(html.Div(id="bom-result"))
+            ])
+        ])
+    ])
+
 def create_inventory_settings():
    """재고관리 설정"""
    return dbc.Card([
@@ -654,8 +813,41 @@ def create_inventory_settings():
                                ),
                                html.Small("안전재고 도달 시 자동으로 발주 요청을 생성합니다.", className="text-muted")
                            ])
+                       ], className="mb-3"),
+                       
+                       dbc.Row([
+                           dbc.Col([
+                               dbc.Label("목표 서비스 수준 (%)"),
+                               dbc.Input(
+                                   id="service-level",
+                                   type="number",
+                                   value="95",
+                                   min="50",
+                                   max="99.9",
+                                   step="0.1"
+                               ),
+                               html.Small("출고 수요와 리드타임 분포로 안전재고/발주점을 계산할 때의 결품 없이 충족할 확률입니다.",
+                                          className="text-muted")
+                           ], md=6),
+                           dbc.Col([
+                               dbc.Label("　"),
+                               html.Div([
+                                   dbc.Button(
+                                       [html.I(className="fas fa-calculator me-2"), "최적화 계산"],
+                                       id="compute-safety-stock-btn",
+                                       color="primary",
+                                       className="me-2"
+                                   ),
+                                   dbc.Button(
+                                       [html.I(className="fas fa-check me-2"), "제안 적용"],
+                                       id="apply-safety-stock-btn",
+                                       color="success"
+                                   )
+                               ])
+                           ], md=6)
                        ])
-                   ])
+                   ]),
+                   dcc.Loading(html.Div(id="safety-stock-proposals", className="mt-3"))
                ], title="안전재고"),
                
                dbc.AccordionItem([
@@ -0,0 +1,265 @@
+# modules/inventory/safety_stock.py - 안전재고/발주점 최적화 (통계적 재고 정책)
+#
+# 품목별 일 수요(출고)와 리드타임의 평균/분산으로 목표 서비스 수준의
+# 안전재고와 발주점을 계산해 safety_stock_proposals 에 제안으로 저장한다
+# (core/migrations/0017). 검토 후 apply_proposals() 로 item_master 와
+# auto_po_rules 에 반영한다.
+#
+#   안전재고 SS  = z x sqrt(L x σd² + d² x σL²)
+#   발주점   ROP = d x L + SS
+#   (d, σd: 일 수요 평균/표준편차, L, σL: 리드타임 평균/표준편차(일),
+#    z: 서비스 수준의 표준정규 분위수)
+#
+# 리드타임은 품목 입고 실적(발주일 ~ 첫 입고일)이 충분하면 그것을, 아니면
+# 거래처 입고 실적, supplier_master.lead_time, 기본값 순으로 쓴다.
+# SQL 은 품목/일 단위 집계만 하고 이후 계산은 전 품목을 NumPy 배열로 한 번에
+# 하므로 10만 품목도 몇 초 안에 다시 계산한다.
+
+import json
+import logging
+from datetime import date, datetime, timedelta
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from core.database import get_connection, read_df, fetch_one, run_write
+
+logger = logging.getLogger(__name__)
+
+# 수요로 보는 출고 구분 (폐기/조정 제외)
+DEMAND_TYPES = ('OUT_production', 'OUT_sales', 'OUT_other')
+# 수요/리드타임 집계 기간 (일)
+DEMAND_LOOKBACK_DAYS = 180
+LEAD_TIME_LOOKBACK_DAYS = 365
+# 리드타임 실적을 쓰는 최소 입고 건수
+MIN_LEAD_SAMPLES = 3
+# 거래처 정보가 없을 때 리드타임 (supplier_master.lead_time 기본값과 같음)
+DEFAULT_LEAD_TIME = 7
+DEFAULT_SERVICE_LEVEL = 0.95
+
+
+def get_service_level():
+    """재고 설정(system_config.inventory_settings)의 목표 서비스 수준 (0~1)"""
+    row = fetch_one("SELECT value FROM system_config WHERE key = 'inventory_settings'")
+    try:
+        level = float(json.loads(row[0]).get('service_level')) / 100 if row else None
+    except (TypeError, ValueError):
+        level = None
+    return level if level and 0.5 <= level < 1 else DEFAULT_SERVICE_LEVEL
+
+
+def policy(demand_mean, demand_std, lead_time_mean, lead_time_std, service_level):
+    """안전재고/발주점 배열 (올림 정수)"""
+    if not 0 < service_level < 1:
+        raise ValueError(f"서비스 수준은 0 과 1 사이여야 합니다: {service_level}")
+    z = NormalDist().inv_cdf(service_level)
+    d = np.asarray(demand_mean, dtype=float)
+    lead = np.asarray(lead_time_mean, dtype=float)
+    safety = z * np.sqrt(lead * np.square(demand_std) + np.square(d) * np.square(lead_time_std))
+    reorder = d * lead + safety
+    # 부동소수 오차로 정수가 한 단위 올라가지 않도록 반올림 후 올림
+    return (np.ceil(np.round(safety, 6)).astype(np.int64),
+            np.ceil(np.round(reorder, 6)).astype(np.int64))
+
+
+def _mean_std(index, values, size):
+    """그룹 번호별 (표본 수, 평균, 표본 표준편차) - np.bincount 집계"""
+    count = np.bincount(index, minlength=size).astype(float)
+    total = np.bincount(index, weights=values, minlength=size)
+    squares = np.bincount(index, weights=values * values, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, total / count, 0.0)
+        var = np.where(count > 1, (squares - count * mean * mean) / (count - 1), 0.0)
+    return count, mean, np.sqrt(np.clip(var, 0, None))
+
+
+def _demand(conn, items, start, end):
+    """품목별 (출고 일수, 일 수요 평균, 일 수요 표준편차) - 출고 없는 날은 0"""
+    days = (end - start).days + 1
+    placeholders = ','.join('?' * len(DEMAND_TYPES))
+    # 일별 출고량을 품목별 (일수, 합계, 제곱합) 으로만 줄여 읽음
+    rows = conn.execute(f"""
+        SELECT item_code, COUNT(*), SUM(qty), SUM(qty * qty)
+        FROM (
+            SELECT item_code, -SUM(quantity) AS qty
+            FROM stock_movements
+            WHERE movement_date >= ? AND movement_date < ?
+              AND movement_type IN ({placeholders})
+            GROUP BY item_code, movement_date
+        )
+        GROUP BY item_code
+    """, (start.isoformat(), (end + timedelta(days=1)).isoformat(), *DEMAND_TYPES)).fetchall()
+
+    size = len(items)
+    index = items.get_indexer(np.array([r[0] for r in rows], dtype=object))
+    keep = index >= 0
+    active, total, squares = (np.zeros(size) for _ in range(3))
+    for target, column in zip((active, total, squares), range(1, 4)):
+        target[index[keep]] = np.array([r[column] for r in rows], dtype=float)[keep]
+    mean = total / days
+    var = (squares - days * mean * mean) / max(days - 1, 1)
+    return active, mean, np.sqrt(np.clip(var, 0, None))
+
+
+def _lead_times(conn, items, start, end):
+    """품목별 (리드타임 평균, 표준편차, 출처)"""
+    # 발주 품목별 첫 입고까지 걸린 일수
+    receipts = [r for r in conn.execute("""
+        SELECT ri.item_code, po.supplier_code,
+               julianday(MIN(ri.receiving_date)) - julianday(po.po_date)
+        FROM receiving_inspection ri
+        JOIN purchase_orders po ON po.po_number = ri.po_number
+        WHERE ri.receiving_date >= ? AND ri.receiving_date < ?
+        GROUP BY ri.po_number, ri.item_code
+    """, (start.isoformat(), (end + timedelta(days=1)).isoformat())) if r[2] is not None and r[2] >= 0]
+
+    # 품목의 거래처 - 사용 중인 자동 발주 규칙, 없으면 마지막 발주 거래처
+    suppliers = {item: supplier for item, supplier, _ in conn.execute("""
+        SELECT pod.item_code, po.supplier_code, MAX(po.po_date)
+        FROM purchase_order_details pod
+        JOIN purchase_orders po ON po.po_number = pod.po_number
+        GROUP BY pod.item_code
+    """)}
+    suppliers.update(conn.execute(
+        "SELECT item_code, supplier_code FROM auto_po_rules WHERE is_active = 1"
+    ).fetchall())
+    master = dict(conn.execute("SELECT supplier_code, lead_time FROM supplier_master").fetchall())
+
+    # 마지막 번호는 '거래처 없음' (실적 0건, 기준 리드타임 없음)
+    supplier_codes = pd.Index(sorted(set(master) | set(suppliers.values()) | {r[1] for r in receipts}))
+    none = len(supplier_codes)
+
+    def supplier_index(codes):
+        index = supplier_codes.get_indexer(np.asarray(codes, dtype=object))
+        return np.where(index >= 0, index, none)
+
+    days = np.array([r[2] for r in receipts], dtype=float)
+    item_index = items.get_indexer(np.array([r[0] for r in receipts], dtype=object))
+    keep = item_index >= 0
+    item_n, item_mean, item_std = _mean_std(item_index[keep], days[keep], len(items))
+    sup_n, sup_mean, sup_std = _mean_std(supplier_index([r[1] for r in receipts]), days, none + 1)
+    master_lead = np.array([master.get(code) or np.nan for code in supplier_codes] + [np.nan])
+
+    item_supplier = supplier_index(pd.Series(items).map(suppliers).to_numpy(dtype=object))
+    use_item = item_n >= MIN_LEAD_SAMPLES
+    use_supplier = ~use_item & (sup_n[item_supplier] >= MIN_LEAD_SAMPLES)
+    use_master = ~use_item & ~use_supplier & ~np.isnan(master_lead[item_supplier])
+
+    conditions = [use_item, use_supplier, use_master]
+    mean = np.select(conditions, [item_mean, sup_mean[item_supplier], master_lead[item_supplier]],
+                     DEFAULT_LEAD_TIME)
+    std = np.select(conditions[:2], [item_std, sup_std[item_supplier]], 0.0)
+    source = np.select(conditions, ['item', 'supplier', 'master'], 'default')
+    return mean, std, source
+
+
+def propose_safety_stock(service_level=None, as_of=None, lookback_days=DEMAND_LOOKBACK_DAYS):
+    """전 품목 안전재고/발주점 재계산 후 제안 저장 - 요약 dict
+
+    기간 내 수요 출고가 없는 품목은 제안하지 않는다 (기존 값 유지).
+    """
+    service_level = service_level or get_service_level()
+    end = datetime.strptime(as_of, '%Y-%m-%d').date() if as_of else date.today()
+    start = end - timedelta(days=lookback_days - 1)
+
+    conn = get_connection()
+    try:
+        rows = conn.execute("SELECT item_code, safety_stock FROM item_master ORDER BY item_code").fetchall()
+        items = pd.Index([r[0] for r in rows])
+        current = np.array([r[1] or 0 for r in rows], dtype=np.int64)
+        active, d_mean, d_std = _demand(conn, items, start, end)
+        l_mean, l_std, source = _lead_times(conn, items, end - timedelta(days=LEAD_TIME_LOOKBACK_DAYS - 1),
+                                            end)
+    finally:
+        conn.close()
+
+    safety, reorder = policy(d_mean, d_std, l_mean, l_std, service_level)
+    proposed = np.flatnonzero(active > 0)
+    records = list(zip(
+        items[proposed].tolist(),
+        np.round(d_mean[proposed], 4).tolist(), np.round(d_std[proposed], 4).tolist(),
+        np.round(l_mean[proposed], 2).tolist(), np.round(l_std[proposed], 2).tolist(),
+        source[proposed].tolist(), current[proposed].tolist(),
+        safety[proposed].tolist(), reorder[proposed].tolist()
+    ))
+
+    def save(conn):
+        conn.execute("DELETE FROM safety_stock_proposals WHERE status = 'proposed'")
+        conn.executemany("""
+            INSERT INTO safety_stock_proposals
+                (item_code, demand_mean, demand_std, lead_time_mean, lead_time_std,
+                 lead_time_source, current_safety_stock, safety_stock, reorder_point,
+                 service_level, status, computed_at, applied_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'proposed', CURRENT_TIMESTAMP, NULL)
+            ON CONFLICT (item_code) DO UPDATE SET
+                demand_mean = excluded.demand_mean,
+                demand_std = excluded.demand_std,
+                lead_time_mean = excluded.lead_time_mean,
+                lead_time_std = excluded.lead_time_std,
+                lead_time_source = excluded.lead_time_source,
+                current_safety_stock = excluded.current_safety_stock,
+                safety_stock = excluded.safety_stock,
+                reorder_point = excluded.reorder_point,
+                service_level = excluded.service_level,
+                status = 'proposed',
+                computed_at = CURRENT_TIMESTAMP,
+                applied_at = NULL
+        """, (record + (service_level,) for record in records))
+
+    run_write(save)
+    changed = int(np.count_nonzero(safety[proposed] != current[proposed]))
+    logger.info(f"안전재고 제안 계산: {len(records)}개 품목 (변경 {changed}개), 서비스 수준 {service_level:.1%}")
+    return {
+        'items': len(items),
+        'proposed': len(records),
+        'changed': changed,
+        'service_level': service_level,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+    }
+
+
+def get_proposals(status='proposed', limit=None):
+    """안전재고 제안 목록 - 현재 값과 차이가 큰 순"""
+    query = """
+        SELECT p.item_code, im.item_name, p.demand_mean, p.demand_std,
+               p.lead_time_mean, p.lead_time_std, p.lead_time_source, p.service_level,
+               p.current_safety_stock, p.safety_stock, p.reorder_point, p.status, p.computed_at
+        FROM safety_stock_proposals p
+        LEFT JOIN item_master im ON im.item_code = p.item_code
+        WHERE p.status = ?
+        ORDER BY ABS(p.safety_stock - COALESCE(p.current_safety_stock, 0)) DESC, p.item_code
+    """
+    params = [status]
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+    return read_df(query, params)
+
+
+def apply_proposals(conn, item_codes=None):
+    """제안 안전재고/발주점을 item_master, auto_po_rules 에 반영 - 적용 품목 수
+
+    item_codes 를 주면 그 품목만 적용한다.
+    """
+    filters, params = "", []
+    if item_codes is not None:
+        filters = " AND p.item_code IN (SELECT value FROM json_each(?))"
+        params.append(json.dumps(list(item_codes)))
+    conn.execute(f"""
+        UPDATE item_master SET safety_stock = p.safety_stock
+        FROM safety_stock_proposals p
+        WHERE p.item_code = item_master.item_code AND p.status = 'proposed'{filters}
+    """, params)
+    conn.execute(f"""
+        UPDATE auto_po_rules SET reorder_point = p.reorder_point
+        FROM safety_stock_proposals p
+        WHERE p.item_code = auto_po_rules.item_code AND auto_po_rules.is_active = 1
+          AND p.status = 'proposed'{filters}
+    """, params)
+    cursor = conn.execute(f"""
+        UPDATE safety_stock_proposals AS p SET status = 'applied', applied_at = CURRENT_TIMESTAMP
+        WHERE p.status = 'proposed'{filters}
+    """, params)
+    return cursor.rowcount
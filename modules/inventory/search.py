@@ -0,0 +1,176 @@
+# modules/inventory/search.py - 품목 검색 (FTS5 trigram 색인, core/migrations/0016)
+#
+# 검색어 하나로 품목코드/품목명/분류를 찾고 아래 순서로 순위를 매긴다.
+#
+#   code      품목코드 일치/접두 (기본키 범위 조회)
+#   name      품목명 접두 (idx_item_master_name 범위 조회)
+#   substring 부분 문자열 - 세 글자 이상은 trigram 색인, 1~2 글자는 LIKE 를
+#             limit 까지만 훑음
+#   fuzzy     오타 허용 - 결과가 모자라면 검색어의 드문 trigram 중 두 개 이상을
+#             가진 품목을 찾고 겹치는 trigram 비율로 거름
+#
+# 각 단계는 필요한 행 수만큼만 읽으므로 품목 수가 늘어도 조회 시간이 일정하다.
+
+import json
+import logging
+
+import pandas as pd
+
+from core.database import get_connection
+
+logger = logging.getLogger(__name__)
+
+# 화면 검색 결과 기본 행 수
+SEARCH_LIMIT = 20
+# 부분 문자열 단계에서 색인으로 읽는 후보 상한
+CANDIDATE_LIMIT = 200
+# 부분 문자열은 검색어 trigram 중 가장 드문 것 몇 개만 색인에서 교집합을 구하고
+# 나머지는 문자열 비교로 확인 (흔한 trigram 의 긴 목록을 읽지 않음)
+SUBSTRING_TERMS = 2
+# 오타 검색은 가장 드문 trigram 몇 개 중 두 개 이상을 가진 품목만 후보로 삼음
+# (품목 수가 FUZZY_MAX_DOCS 를 넘는 흔한 trigram 은 후보를 좁히지 못하므로 제외)
+FUZZY_TERMS = 4
+FUZZY_MAX_DOCS = 20000
+FUZZY_CANDIDATES = 500
+# 검색어 trigram 중 이 비율 이상이 겹쳐야 오타 결과로 인정
+FUZZY_MIN_SIMILARITY = 0.5
+
+_MAX_CHAR = '\U0010ffff'
+
+RESULT_COLUMNS = ['item_code', 'item_name', 'category', 'unit', 'safety_stock',
+                  'current_stock', 'match']
+
+
+def _trigrams(text):
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _phrase(text):
+    """FTS5 구문 검색어 (큰따옴표 이스케이프)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _term_docs(conn, grams):
+    """trigram 별 포함 품목 수 - 품목 수 오름차순 [(term, doc)] (색인에 없는 trigram 제외)"""
+    placeholders = ','.join('?' * len(grams))
+    return conn.execute(f"""
+        SELECT term, doc FROM item_search_vocab
+        WHERE term IN ({placeholders})
+        ORDER BY doc
+    """, list(grams)).fetchall()
+
+
+def _prefix_rows(conn, column, term, limit):
+    return [row[0] for row in conn.execute(f"""
+        SELECT rowid FROM item_master
+        WHERE {column} >= ? AND {column} < ?
+        ORDER BY {column}
+        LIMIT ?
+    """, (term, term + _MAX_CHAR, limit))]
+
+
+def _substring_rows(conn, term, limit, docs):
+    if len(term) < 3:
+        # trigram 색인을 쓸 수 없는 1~2 글자는 limit 행을 찾으면 멈추는 LIKE
+        pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        return [row[0] for row in conn.execute("""
+            SELECT rowid FROM item_master
+            WHERE item_code LIKE ? ESCAPE '\\' OR item_name LIKE ? ESCAPE '\\'
+            LIMIT ?
+        """, (pattern, pattern, limit))]
+
+    if len(docs) < len(_trigrams(term)):
+        return []  # 어느 품목에도 없는 trigram 이 있으면 부분 일치 없음
+    needle = term.lower()
+    rows = conn.execute("""
+        SELECT m.rowid, bm25(item_search) FROM item_search s
+        JOIN item_master m ON m.rowid = s.rowid
+        WHERE item_search MATCH ?
+          AND (instr(lower(m.item_code), ?) OR instr(lower(m.item_name), ?)
+               OR instr(lower(COALESCE(m.category, '')), ?))
+        LIMIT ?
+    """, (' AND '.join(_phrase(t) for t, _ in docs[:SUBSTRING_TERMS]),
+          needle, needle, needle, CANDIDATE_LIMIT)).fetchall()
+    return [rowid for rowid, _ in sorted(rows, key=lambda r: r[1])]
+
+
+def _fuzzy_rows(conn, term, docs):
+    """드문 trigram 두 개 이상을 가진 후보를 겹침 비율 순으로"""
+    grams = _trigrams(term)
+    terms = [_phrase(t) for t, doc in docs if doc <= FUZZY_MAX_DOCS][:FUZZY_TERMS]
+    if not terms or len(grams) < 2:
+        return []  # 흔한 trigram 뿐이면 후보를 좁힐 수 없음
+    pairs = [f"({a} AND {b})" for i, a in enumerate(terms) for b in terms[i + 1:]] or terms
+    candidates = conn.execute("""
+        SELECT rowid, item_code, item_name FROM item_search
+        WHERE item_search MATCH ?
+        LIMIT ?
+    """, (' OR '.join(pairs), FUZZY_CANDIDATES)).fetchall()
+
+    scored = []
+    for rowid, code, name in candidates:
+        overlap = max(len(grams & _trigrams(code or '')), len(grams & _trigrams(name or '')))
+        similarity = overlap / len(grams)
+        if similarity >= FUZZY_MIN_SIMILARITY:
+            scored.append((-similarity, rowid))
+    return [rowid for _, rowid in sorted(scored)]
+
+
+def search_items(query, limit=SEARCH_LIMIT, category=None, fuzzy=True):
+    """품목 검색 - 순위순 DataFrame [item_code, item_name, category, unit,
+    safety_stock, current_stock, match]"""
+    term = (query or '').strip()
+    if not term:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    # 분류로 거르면 앞 단계 결과가 빠질 수 있으므로 여유 있게 읽음
+    fetch = limit * 5 if category else limit
+
+    conn = get_connection()
+    try:
+        ranked = {}
+
+        def add(match, rowids):
+            for rowid in rowids:
+                ranked.setdefault(rowid, (len(ranked), match))
+            return len(ranked) >= fetch
+
+        done = (add('code', _prefix_rows(conn, 'item_code', term.upper(), fetch))
+                or (term != term.upper() and add('code', _prefix_rows(conn, 'item_code', term, fetch)))
+                or add('name', _prefix_rows(conn, 'item_name', term, fetch)))
+        if not done:
+            # trigram 별 품목 수는 앞 단계로 결과가 다 차지 않았을 때만 읽음
+            docs = _term_docs(conn, _trigrams(term)) if len(term) >= 3 else []
+            done = add('substring', _substring_rows(conn, term, fetch, docs))
+            if not done and fuzzy and len(term) >= 4:
+                add('fuzzy', _fuzzy_rows(conn, term, docs))
+
+        if not ranked:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        query_sql = """
+            SELECT rowid, item_code, item_name, category, unit, safety_stock, current_stock
+            FROM item_master
+            WHERE rowid IN (SELECT value FROM json_each(?))
+        """
+        params = [json.dumps(list(ranked))]
+        if category:
+            query_sql += " AND category = ?"
+            params.append(category)
+        rows = conn.execute(query_sql, params).fetchall()
+    finally:
+        conn.close()
+
+    rows.sort(key=lambda row: ranked[row[0]][0])
+    df = pd.DataFrame([row[1:] for row in rows[:limit]], columns=RESULT_COLUMNS[:-1])
+    df['match'] = [ranked[row[0]][1] for row in rows[:limit]]
+    return df
+
+
+def rebuild_item_search():
+    """검색 색인 전체 재작성 (트리거를 거치지 않고 item_master 를 고친 경우)"""
+    conn = get_connection()
+    try:
+        conn.execute("INSERT INTO item_search (item_search) VALUES ('rebuild')")
+        conn.commit()
+    finally:
+        conn.close()
@@ -0,0 +1,248 @@
+# modules/inventory/stock.py - 재고 이동 기록 및 품목/창고별 잔액 관리
+#
+# 모든 재고 증감은 post_movement() 로 처리한다. 호출자의 트랜잭션 안에서
+# 원장(stock_movements), 창고 잔액(stock_balances), 품목 현재고
+# (item_master.current_stock)를 함께 갱신하므로 세 값이 항상 일치한다.
+#
+# 같은 트랜잭션에서 품목별 평가(이동평균/FIFO 원가층, valuation.py)도
+# 증분 갱신한다.
+#
+# 재고 확인과 차감은 조건부 UPDATE 한 문장(WHERE quantity >= 출고량)으로
+# 처리하고 rowcount 로 결과를 확인하므로, 동시에 들어온 출고가 같은 잔액을
+# 읽고 함께 통과하는 일이 없다. 자체 트랜잭션이 필요한 호출자(API, 검수,
+# 재고 조정)는 post_stock()/run_write() 로 BEGIN IMMEDIATE 트랜잭션과
+# 잠금 경합(SQLITE_BUSY) 재시도를 함께 사용한다.
+
+import logging
+
+from core.database import get_connection, transaction, run_write
+from core.write_buffer import register_operation
+from .valuation import value_movement
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAREHOUSE = 'wh1'
+
+# 창고 표시명 (등록되지 않은 코드는 코드 그대로 표시)
+WAREHOUSE_NAMES = {
+    'wh1': '창고1',
+    'wh2': '창고2',
+}
+
+
+class InsufficientStockError(ValueError):
+    """출고 수량이 창고 재고보다 많음"""
+
+    def __init__(self, item_code, warehouse, available, requested):
+        self.item_code = item_code
+        self.warehouse = warehouse
+        self.available = available
+        self.requested = requested
+        super().__init__(
+            f"재고가 부족합니다: {item_code} ({warehouse_name(warehouse)}) "
+            f"현재고 {available}, 요청 {requested}"
+        )
+
+
+class ItemNotFoundError(ValueError):
+    """품목 마스터에 없는 품목"""
+
+    def __init__(self, item_code):
+        self.item_code = item_code
+        super().__init__(f"품목을 찾을 수 없습니다: {item_code}")
+
+
+def warehouse_name(warehouse):
+    """창고 표시명"""
+    return WAREHOUSE_NAMES.get(warehouse, warehouse)
+
+
+def get_balance(conn, item_code, warehouse):
+    """품목/창고 재고 잔액"""
+    row = conn.execute(
+        "SELECT quantity FROM stock_balances WHERE item_code = ? AND warehouse = ?",
+        (item_code, warehouse)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def post_movement(conn, movement_date, movement_type, item_code, quantity,
+                  warehouse=None, remarks=None, check_stock=False, unit_cost=None):
+    """재고 이동 기록 및 잔액/평가 반영 (호출자 트랜잭션 안에서 사용)
+
+    quantity 는 입고 양수, 출고 음수. unit_cost 는 입고 단가 (없으면 현재
+    이동평균 단가, 평가 이력이 없으면 품목 기준 단가). check_stock=True 이면 출고 후
+    창고 잔액이 음수가 되는 경우 InsufficientStockError, 품목 마스터에
+    없는 품목이면 ItemNotFoundError 를 발생시키며 이때 아무것도 반영하지
+    않는다. 생성된 stock_movements id 를 반환한다.
+    """
+    warehouse = warehouse or DEFAULT_WAREHOUSE
+
+    conn.execute("SAVEPOINT post_movement")
+    try:
+        cursor = conn.execute("""
+            INSERT INTO stock_movements
+            (movement_date, movement_type, item_code, quantity, warehouse, remarks)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (movement_date, movement_type, item_code, quantity, warehouse, remarks))
+        movement_id = cursor.lastrowid
+
+        if check_stock and quantity < 0:
+            # 확인과 차감을 한 문장으로 - 잔액이 모자라면 갱신되는 행이 없음
+            cursor = conn.execute("""
+                UPDATE stock_balances
+                SET quantity = quantity + ?,
+                    last_movement_id = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE item_code = ? AND warehouse = ? AND quantity >= ?
+            """, (quantity, movement_id, item_code, warehouse, -quantity))
+            if cursor.rowcount == 0:
+                raise InsufficientStockError(item_code, warehouse,
+                                             get_balance(conn, item_code, warehouse), -quantity)
+        else:
+            conn.execute("""
+                INSERT INTO stock_balances (item_code, warehouse, quantity, last_movement_id, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (item_code, warehouse) DO UPDATE SET
+                    quantity = quantity + excluded.quantity,
+                    last_movement_id = excluded.last_movement_id,
+                    updated_at = excluded.updated_at
+            """, (item_code, warehouse, quantity, movement_id))
+
+        cursor = conn.execute("""
+            UPDATE item_master
+            SET current_stock = current_stock + ?
+            WHERE item_code = ?
+        """, (quantity, item_code))
+        if cursor.rowcount == 0:
+            raise ItemNotFoundError(item_code)
+
+        cost = value_movement(conn, movement_id, movement_date, item_code, quantity, unit_cost)
+        conn.execute("UPDATE stock_movements SET unit_cost = ? WHERE id = ?", (cost, movement_id))
+    except Exception:
+        conn.execute("ROLLBACK TO SAVEPOINT post_movement")
+        conn.execute("RELEASE SAVEPOINT post_movement")
+        raise
+    conn.execute("RELEASE SAVEPOINT post_movement")
+
+    return movement_id
+
+
+def post_stock(movement_date, movement_type, item_code, quantity,
+               warehouse=None, remarks=None, check_stock=False, unit_cost=None):
+    """post_movement 를 자체 쓰기 트랜잭션으로 실행 (잠금 경합 시 재시도)"""
+    return run_write(post_movement, movement_date, movement_type, item_code, quantity,
+                     warehouse, remarks, check_stock, unit_cost)
+
+
+def adjust_stock(conn, adjust_date, adjust_type, item_code, adjusted_stock, reason):
+    """실사 수량으로 재고 조정 (호출자 트랜잭션 안에서 사용)
+
+    잠금 상태에서 읽은 현재고와의 차이를 조정 이력에 남기고 기본 창고
+    이동으로 반영한다. 차이 수량을 반환한다.
+    """
+    row = conn.execute(
+        "SELECT current_stock FROM item_master WHERE item_code = ?", (item_code,)
+    ).fetchone()
+    if row is None:
+        raise ItemNotFoundError(item_code)
+    current_stock = row[0]
+    diff = adjusted_stock - current_stock
+
+    conn.execute("""
+        INSERT INTO stock_adjustments
+        (adjustment_date, item_code, adjustment_type,
+         before_qty, after_qty, difference, reason)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (adjust_date, item_code, adjust_type, current_stock, adjusted_stock, diff, reason))
+
+    post_movement(conn, adjust_date, f"ADJUST_{adjust_type}", item_code, diff,
+                  DEFAULT_WAREHOUSE, f"재고조정: {reason}")
+    return diff
+
+
+# 화면 입출고는 쓰기 버퍼 작업으로 실행 (core/write_buffer)
+register_operation('inventory.post_movement', post_movement, topics=('inventory',))
+
+
+def get_warehouse_totals():
+    """창고별 재고 합계 [(warehouse, quantity), ...]"""
+    conn = get_connection()
+    try:
+        return conn.execute("""
+            SELECT warehouse, SUM(quantity)
+            FROM stock_balances
+            GROUP BY warehouse
+            ORDER BY warehouse
+        """).fetchall()
+    finally:
+        conn.close()
+
+
+def reconcile_stock_balances(repair=False):
+    """잔액 테이블과 원장/품목 현재고 대사
+
+    반환값: 불일치 목록 [{'type', 'item_code', 'warehouse', 'expected', 'actual'}, ...]
+      - balance: stock_balances 가 원장 합계와 다름
+      - item: item_master.current_stock 이 창고 잔액 합계와 다름
+    repair=True 이면 원장 기준으로 잔액과 현재고를 다시 계산한다.
+    """
+    with transaction(immediate=repair) as conn:
+        mismatches = []
+
+        rows = conn.execute("""
+            WITH ledger AS (
+                SELECT item_code, COALESCE(warehouse, ?) as warehouse, SUM(quantity) as total
+                FROM stock_movements
+                GROUP BY item_code, COALESCE(warehouse, ?)
+            )
+            SELECT k.item_code, k.warehouse, COALESCE(l.total, 0), COALESCE(b.quantity, 0)
+            FROM (
+                SELECT item_code, warehouse FROM ledger
+                UNION
+                SELECT item_code, warehouse FROM stock_balances
+            ) k
+            LEFT JOIN ledger l ON l.item_code = k.item_code AND l.warehouse = k.warehouse
+            LEFT JOIN stock_balances b ON b.item_code = k.item_code AND b.warehouse = k.warehouse
+            WHERE COALESCE(l.total, 0) != COALESCE(b.quantity, 0)
+        """, (DEFAULT_WAREHOUSE, DEFAULT_WAREHOUSE)).fetchall()
+        for item_code, warehouse, expected, actual in rows:
+            mismatches.append({
+                'type': 'balance', 'item_code': item_code, 'warehouse': warehouse,
+                'expected': expected, 'actual': actual
+            })
+
+        rows = conn.execute("""
+            SELECT im.item_code, COALESCE(b.total, 0), im.current_stock
+            FROM item_master im
+            LEFT JOIN (
+                SELECT item_code, SUM(quantity) as total
+                FROM stock_balances
+                GROUP BY item_code
+            ) b ON b.item_code = im.item_code
+            WHERE im.current_stock != COALESCE(b.total, 0)
+        """).fetchall()
+        for item_code, expected, actual in rows:
+            mismatches.append({
+                'type': 'item', 'item_code': item_code, 'warehouse': None,
+                'expected': expected, 'actual': actual
+            })
+
+        if repair and mismatches:
+            conn.execute("DELETE FROM stock_balances")
+            conn.execute("""
+                INSERT INTO stock_balances (item_code, warehouse, quantity, last_movement_id)
+                SELECT item_code, COALESCE(warehouse, ?), SUM(quantity), MAX(id)
+                FROM stock_movements
+                GROUP BY item_code, COALESCE(warehouse, ?)
+            """, (DEFAULT_WAREHOUSE, DEFAULT_WAREHOUSE))
+            conn.execute("""
+                UPDATE item_master
+                SET current_stock = COALESCE((
+                    SELECT SUM(quantity) FROM stock_balances b
+                    WHERE b.item_code = item_master.item_code
+                ), 0)
+            """)
+            logger.warning(f"재고 잔액 재계산: 불일치 {len(mismatches)}건")
+
+        return mismatches
@@ -0,0 +1,237 @@
+# modules/inventory/valuation.py - 품목별 재고 평가 (이동평균 / 선입선출)
+#
+# post_movement() 가 이동마다 value_movement() 를 같은 트랜잭션에서 호출해
+# stock_valuation(품목별 수량/이동평균 단가/평가액)과 stock_cost_layers(입고
+# 원가층)를 증분 갱신한다 (core/migrations/0014). 이력을 다시 계산하지 않으므로
+# 평가 보고서는 stock_valuation 을 읽기만 한다.
+#
+#   입고  이동평균 = (평가액 + 수량 x 단가) / 새 수량, 원가층 하나 추가
+#         (재고가 음수였다면 부족분 층을 먼저 채움)
+#   출고  이동평균 단가로 평가액 차감, 오래된 원가층부터 remaining 차감
+#         (원가층이 모자라면 마지막 단가로 부족분 층을 남김)
+#
+# 출고는 소진한 층 수만큼 갱신하지만 층은 한 번 소진되면 다시 읽지 않으므로
+# 이동당 상각 O(1) 이다. 입고 단가를 주지 않으면 현재 이동평균 단가, 평가
+# 이력이 없으면 품목 기준 단가(item_master.unit_price)를 사용한다.
+
+import json
+import logging
+
+from core.database import get_connection, read_df, fetch_one
+
+logger = logging.getLogger(__name__)
+
+# 평가 방법 -> stock_valuation 평가액 컬럼 (총평균법은 기간 마감 계산이라
+# 화면/보고서에서는 이동평균으로 표시)
+VALUE_COLUMNS = {
+    'moving_avg': 'avg_value',
+    'fifo': 'fifo_value',
+    'total_avg': 'avg_value',
+}
+DEFAULT_METHOD = 'moving_avg'
+
+# 출고 시 한 번에 읽는 원가층 수
+LAYER_BATCH = 16
+
+
+def get_valuation_method():
+    """재고 설정(system_config.inventory_settings)의 평가 방법"""
+    row = fetch_one("SELECT value FROM system_config WHERE key = 'inventory_settings'")
+    try:
+        method = json.loads(row[0]).get('valuation_method') if row else None
+    except (TypeError, ValueError):
+        method = None
+    return method if method in VALUE_COLUMNS else DEFAULT_METHOD
+
+
+def value_column(method=None):
+    """평가 방법의 stock_valuation 평가액 컬럼명"""
+    return VALUE_COLUMNS.get(method or get_valuation_method(), VALUE_COLUMNS[DEFAULT_METHOD])
+
+
+def _consume_layers(conn, item_code, need):
+    """오래된 원가층부터 need 만큼 차감 - (차감 원가 합계, 남은 수량, 마지막 단가)"""
+    cost, last_cost = 0.0, None
+    while need > 0:
+        layers = conn.execute("""
+            SELECT id, remaining, unit_cost FROM stock_cost_layers
+            WHERE item_code = ? AND remaining != 0
+            ORDER BY id
+            LIMIT ?
+        """, (item_code, LAYER_BATCH)).fetchall()
+        if not layers or layers[0][1] < 0:
+            break
+        for layer_id, remaining, unit_cost in layers:
+            take = min(remaining, need)
+            conn.execute("UPDATE stock_cost_layers SET remaining = remaining - ? WHERE id = ?",
+                         (take, layer_id))
+            cost += take * unit_cost
+            need -= take
+            last_cost = unit_cost
+            if need == 0:
+                break
+    return cost, need, last_cost
+
+
+def _fill_shortage(conn, item_code, quantity):
+    """음수 재고 부족분 층을 입고 수량으로 채움 - (채운 원가 합계, 남은 입고 수량)"""
+    cost = 0.0
+    while quantity > 0:
+        layer = conn.execute("""
+            SELECT id, remaining, unit_cost FROM stock_cost_layers
+            WHERE item_code = ? AND remaining != 0
+            ORDER BY id
+            LIMIT 1
+        """, (item_code,)).fetchone()
+        if layer is None or layer[1] > 0:
+            break
+        layer_id, remaining, unit_cost = layer
+        fill = min(-remaining, quantity)
+        conn.execute("UPDATE stock_cost_layers SET remaining = remaining + ? WHERE id = ?",
+                     (fill, layer_id))
+        cost += fill * unit_cost
+        quantity -= fill
+    return cost, quantity
+
+
+def value_movement(conn, movement_id, movement_date, item_code, quantity, unit_cost=None):
+    """재고 이동 한 건을 평가에 반영 (post_movement 트랜잭션 안에서 호출)
+
+    이 이동의 단가(입고 단가 또는 출고 시점 이동평균 단가)를 반환한다.
+    """
+    row = conn.execute("""
+        SELECT quantity, avg_cost, avg_value, fifo_value
+        FROM stock_valuation WHERE item_code = ?
+    """, (item_code,)).fetchone()
+    if row is None:
+        standard = conn.execute("SELECT unit_price FROM item_master WHERE item_code = ?",
+                                (item_code,)).fetchone()
+        on_hand, avg_cost, avg_value, fifo_value = 0, (standard[0] if standard else 0) or 0, 0.0, 0.0
+    else:
+        on_hand, avg_cost, avg_value, fifo_value = row
+    new_qty = on_hand + quantity
+
+    if quantity > 0:
+        cost = avg_cost if unit_cost is None else unit_cost
+        if on_hand <= 0 or new_qty <= 0:
+            avg_cost = cost
+        else:
+            avg_cost = (avg_value + quantity * cost) / new_qty
+
+        filled, rest = _fill_shortage(conn, item_code, quantity) if on_hand < 0 else (0.0, quantity)
+        fifo_value += filled
+        if rest > 0:
+            conn.execute("""
+                INSERT INTO stock_cost_layers
+                (item_code, movement_id, received_date, quantity, remaining, unit_cost)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (item_code, movement_id, movement_date, quantity, rest, cost))
+            fifo_value += rest * cost
+    elif quantity < 0:
+        cost = avg_cost
+        consumed, short, last_cost = _consume_layers(conn, item_code, -quantity)
+        fifo_value -= consumed
+        if short > 0:
+            # 원가층보다 많이 출고 - 부족분은 마지막 단가로 음수 층에 남김
+            short_cost = avg_cost if last_cost is None else last_cost
+            conn.execute("""
+                INSERT INTO stock_cost_layers
+                (item_code, movement_id, received_date, quantity, remaining, unit_cost)
+                VALUES (?, ?, ?, 0, ?, ?)
+            """, (item_code, movement_id, movement_date, -short, short_cost))
+            fifo_value -= short * short_cost
+    else:
+        cost = avg_cost
+
+    if new_qty == 0:
+        # 수량이 0 이면 평가액도 0 (반올림 오차 누적 방지)
+        avg_value = fifo_value = 0.0
+    else:
+        avg_value = new_qty * avg_cost
+
+    conn.execute("""
+        INSERT INTO stock_valuation
+        (item_code, quantity, avg_cost, avg_value, fifo_value, last_movement_id, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (item_code) DO UPDATE SET
+            quantity = excluded.quantity,
+            avg_cost = excluded.avg_cost,
+            avg_value = excluded.avg_value,
+            fifo_value = excluded.fifo_value,
+            last_movement_id = excluded.last_movement_id,
+            updated_at = excluded.updated_at
+    """, (item_code, new_qty, avg_cost, avg_value, fifo_value, movement_id))
+
+    return cost
+
+
+def get_valuation(method=None, category=None):
+    """품목별 평가 [item_code, item_name, category, quantity, unit_cost, stock_value]
+
+    unit_cost 는 평가액 / 수량 (FIFO 는 남은 원가층의 평균 단가).
+    """
+    column = value_column(method)
+    query = f"""
+        SELECT im.item_code, im.item_name, im.category,
+               COALESCE(sv.quantity, 0) as quantity,
+               CASE WHEN sv.quantity != 0 THEN sv.{column} * 1.0 / sv.quantity
+                    ELSE COALESCE(sv.avg_cost, im.unit_price, 0) END as unit_cost,
+               COALESCE(sv.{column}, 0) as stock_value
+        FROM item_master im
+        LEFT JOIN stock_valuation sv ON sv.item_code = im.item_code
+    """
+    params = []
+    if category:
+        query += " WHERE im.category = ?"
+        params.append(category)
+    query += " ORDER BY im.item_code"
+    return read_df(query, params)
+
+
+def get_total_value(method=None):
+    """전체 재고 평가액"""
+    conn = get_connection()
+    try:
+        row = conn.execute(f"SELECT SUM({value_column(method)}) FROM stock_valuation").fetchone()
+        return row[0] or 0
+    finally:
+        conn.close()
+
+
+def check_valuation(tolerance=1e-6):
+    """평가 테이블 대사
+
+    반환값: 불일치 목록 [{'type', 'item_code', 'expected', 'actual'}, ...]
+      - quantity: stock_valuation.quantity 가 품목 현재고와 다름
+      - layers: 원가층 remaining 합계가 평가 수량과 다름
+      - fifo: 원가층 금액 합계가 fifo_value 와 다름
+    """
+    conn = get_connection()
+    try:
+        rows = conn.execute("""
+            SELECT im.item_code, im.current_stock, COALESCE(sv.quantity, 0),
+                   COALESCE(l.remaining, 0), COALESCE(sv.fifo_value, 0), COALESCE(l.value, 0)
+            FROM item_master im
+            LEFT JOIN stock_valuation sv ON sv.item_code = im.item_code
+            LEFT JOIN (
+                SELECT item_code, SUM(remaining) as remaining, SUM(remaining * unit_cost) as value
+                FROM stock_cost_layers
+                WHERE remaining != 0
+                GROUP BY item_code
+            ) l ON l.item_code = im.item_code
+        """).fetchall()
+    finally:
+        conn.close()
+
+    mismatches = []
+    for item_code, stock, quantity, remaining, fifo_value, layer_value in rows:
+        if stock != quantity:
+            mismatches.append({'type': 'quantity', 'item_code': item_code,
+                               'expected': stock, 'actual': quantity})
+        if remaining != quantity:
+            mismatches.append({'type': 'layers', 'item_code': item_code,
+                               'expected': quantity, 'actual': remaining})
+        if abs(layer_value - fifo_value) > tolerance * max(1.0, abs(layer_value)):
+            mismatches.append({'type': 'fifo', 'item_code': item_code,
+                               'expected': layer_value, 'actual': fifo_value})
+    return mismatches
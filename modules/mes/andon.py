@@ -0,0 +1,234 @@
+# modules/mes/andon.py - 현장 안돈(andon) 보드용 라인별 상태 문서
+#
+# 벽걸이 TV 는 Dash 앱 대신 /andon 최소 페이지를 열고 /andon/stream (SSE) 으로
+# 상태 문서를 받는다. SSE 를 쓸 수 없으면 /andon/status 를 ETag 조건부 GET 으로
+# 폴링한다 (변경이 없으면 304).
+#
+# 문서는 SnapshotService 가 쓰기 이벤트('mes', 'quality') 또는 data_version
+# 변경 시에만 계산해 JSON 바이트로 보관하므로, DB 조회는 화면 수와 관계없이
+# 변경당 한 번이다. 라인 상태가 그대로이면 화면에도 다시 보내지 않는다.
+
+import os
+import json
+import threading
+import logging
+from datetime import datetime, timedelta, timezone
+
+from flask import Response, request, send_from_directory, stream_with_context
+
+from core.database import get_connection, data_version
+from core.events import broker, HEARTBEAT_SECONDS
+from core.snapshot import SnapshotService
+from core.tables import ratio, achievement_rate
+from modules.mes.oee import shift_of
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS = {
+    'interval': 2,               # data_version 확인 주기 (초)
+    'idle_minutes': 30,          # 마지막 실적 이후 이 시간이 지나면 idle
+    'target_defect_rate': 2.0,   # 불량률(%)이 이보다 높으면 quality
+}
+
+PAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def collect_line_status(now=None, idle_minutes=30, target_defect_rate=2.0):
+    """오늘 라인별 계획/실적/불량/비가동 및 현재 LOT
+
+    생산/불량/비가동은 교대 집계(oee_shift_summary), 계획과 현재 LOT 은
+    오늘 실적(work_logs)에서 읽는다. 라인이 없는 실적은 '' 라인으로 묶는다.
+    """
+    now = now or datetime.now()
+    work_date = now.strftime('%Y-%m-%d')
+    shift = shift_of(now.hour)
+
+    conn = get_connection()
+    try:
+        summary = conn.execute("""
+            SELECT line_code, SUM(prod_qty), SUM(defect_qty), SUM(downtime_min),
+                   SUM(CASE WHEN shift = ? THEN prod_qty ELSE 0 END)
+            FROM oee_shift_summary
+            WHERE work_date = ?
+            GROUP BY line_code
+        """, (shift, work_date)).fetchall()
+        latest = conn.execute("""
+            SELECT COALESCE(w.line_code, ''), w.lot_number, w.process, w.created_at, t.plan_qty
+            FROM (
+                SELECT COALESCE(line_code, '') as line_code, SUM(plan_qty) as plan_qty, MAX(id) as last_id
+                FROM work_logs WHERE work_date = ?
+                GROUP BY 1
+            ) t
+            JOIN work_logs w ON w.id = t.last_id
+        """, (work_date,)).fetchall()
+    finally:
+        conn.close()
+
+    lines = {}
+    for line_code, prod, defect, downtime, shift_prod in summary:
+        lines[line_code] = {
+            'line_code': line_code, 'prod_qty': prod or 0, 'defect_qty': defect or 0,
+            'downtime_min': round(downtime or 0, 1), 'shift_prod_qty': shift_prod or 0,
+            'plan_qty': 0, 'current_lot': None, 'current_process': None, 'last_update': None,
+        }
+    for line_code, lot, process, created_at, plan in latest:
+        line = lines.setdefault(line_code, {
+            'line_code': line_code, 'prod_qty': 0, 'defect_qty': 0,
+            'downtime_min': 0, 'shift_prod_qty': 0,
+        })
+        line.update(plan_qty=plan or 0, current_lot=lot, current_process=process,
+                    last_update=created_at)
+
+    rows = [lines[code] for code in sorted(lines)]
+    achievement = achievement_rate([r['plan_qty'] for r in rows], [r['prod_qty'] for r in rows])
+    defect_rate = ratio([r['defect_qty'] for r in rows], [r['prod_qty'] for r in rows])
+    # created_at 은 UTC (CURRENT_TIMESTAMP) - 비교는 UTC, 표시는 현지 시각
+    idle_before = (now - timedelta(minutes=idle_minutes)).astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    for row, achieved, defects in zip(rows, achievement, defect_rate):
+        row['achievement'] = float(achieved)
+        row['defect_rate'] = float(defects)
+        last = row['last_update']
+        if defects > target_defect_rate:
+            row['status'] = 'quality'
+        elif last is None or last < idle_before:
+            row['status'] = 'idle'
+        else:
+            row['status'] = 'running'
+        if last:
+            row['last_update'] = (datetime.fromisoformat(last[:19]).replace(tzinfo=timezone.utc)
+                                  .astimezone().strftime('%H:%M:%S'))
+
+    return {'work_date': work_date, 'shift': shift, 'lines': rows}
+
+
+class AndonBoard:
+    """안돈 상태 스냅샷과 화면 알림 (라인 상태가 바뀐 경우에만 새 순번)"""
+
+    def __init__(self, settings=None):
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.settings.update(settings or {})
+        self.snapshot = SnapshotService(
+            'andon', self._collect, interval=self.settings['interval'],
+            version=self._version, on_update=self._publish
+        )
+        self._changed = threading.Condition()
+        self._seq = 0
+        self._lines = None
+        self._payloads = {}
+
+    def _version(self):
+        # 데이터 변경 또는 분 단위 시각 변경 (idle 판정, 교대/날짜 전환)
+        return (data_version(), datetime.now().strftime('%Y-%m-%d %H:%M'))
+
+    def _collect(self):
+        return collect_line_status(
+            idle_minutes=self.settings['idle_minutes'],
+            target_defect_rate=self.settings['target_defect_rate']
+        )
+
+    def _publish(self, document):
+        if document['lines'] == self._lines:
+            return
+        previous = {line['line_code']: line for line in self._lines or ()}
+        with self._changed:
+            seq = self._seq + 1
+            header = {'work_date': document['work_date'], 'shift': document['shift'],
+                      'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            payloads = {None: (seq, self._encode(seq, header, document['lines']))}
+            # 바뀌지 않은 라인은 이전 문서(순번)를 그대로 사용 - 라인별 화면에는 다시 보내지 않음
+            for line in document['lines']:
+                code = line['line_code']
+                if previous.get(code) == line:
+                    payloads[code] = self._payloads[code]
+                else:
+                    payloads[code] = (seq, self._encode(seq, header, [line]))
+            self._seq, self._lines, self._payloads = seq, document['lines'], payloads
+            self._changed.notify_all()
+
+    @staticmethod
+    def _encode(seq, header, lines):
+        return json.dumps(dict(header, seq=seq, lines=lines), ensure_ascii=False).encode()
+
+    def on_event(self, event):
+        """이벤트 수신자 - MES/품질 쓰기 시 즉시 재계산"""
+        if {'mes', 'quality'} & set(event['topics']):
+            self.snapshot.request_refresh()
+
+    @property
+    def seq(self):
+        """전체 문서 순번 (라인 상태가 바뀔 때마다 증가)"""
+        return self._seq
+
+    def current(self, line_code=None):
+        """(순번, JSON 바이트) - line_code 를 주면 그 라인 문서, 없는 라인은 빈 목록"""
+        if self._seq == 0:
+            self.snapshot.get()
+        with self._changed:
+            entry = self._payloads.get(line_code)
+            if entry is None:
+                entry = (self._seq, json.dumps({'seq': self._seq, 'lines': []}).encode())
+            return entry
+
+    def wait(self, seq, timeout=HEARTBEAT_SECONDS):
+        """전체 순번이 seq 와 달라질 때까지 대기 (시간 초과 시 False)"""
+        with self._changed:
+            return self._changed.wait_for(lambda: self._seq != seq, timeout)
+
+    def stream(self, line_code=None, heartbeat=HEARTBEAT_SECONDS):
+        """SSE 스트림 - 연결 시 현재 문서, 이후 해당 문서가 바뀔 때마다 전송"""
+        yield "retry: 3000\n\n"
+        sent = None
+        while True:
+            with self._changed:
+                seq = self._seq
+                line_seq, payload = self.current(line_code)
+            if line_seq != sent:
+                yield f"id: {line_seq}\nevent: status\ndata: {payload.decode()}\n\n"
+                sent = line_seq
+            if not self.wait(seq, heartbeat):
+                # 프록시 타임아웃 방지용 주석 라인
+                yield ": ping\n\n"
+
+
+_board = None
+
+
+def get_board():
+    """등록된 안돈 보드 (없으면 None)"""
+    return _board
+
+
+def register_andon(server, settings=None, path='/andon'):
+    """Flask 서버에 안돈 페이지/상태/SSE 엔드포인트 등록
+
+    화면은 읽기 전용 현황만 표시하므로 로그인 없이 접근한다.
+    """
+    global _board
+    board = _board = AndonBoard(settings)
+    broker.add_listener(board.on_event)
+
+    @server.route(path)
+    def andon_page():
+        return send_from_directory(PAGE_DIR, 'andon.html')
+
+    @server.route(f"{path}/status")
+    def andon_status():
+        seq, payload = board.current(request.args.get('line'))
+        etag = f'"{seq}"'
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=304, headers={'ETag': etag})
+        return Response(payload, mimetype='application/json',
+                        headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+    @server.route(f"{path}/stream")
+    def andon_stream():
+        return Response(
+            stream_with_context(board.stream(request.args.get('line'))),
+            mimetype='text/event-stream',
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+
+    return board
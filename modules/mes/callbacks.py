@@ -10,8 +10,24 @@ import pandas as pd
 import json
 import logging
 
+from core.database import get_connection
+from core import write_buffer
+from . import ingest  # 쓰기 버퍼 작업 'mes.work_log' 등록
+from .layouts import WORK_LOG_GRID
+
 logger = logging.getLogger(__name__)
 
+
+def work_log_scope(n_clicks, pushed, start_date, end_date, process):
+    """상세 작업 기록 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where = ["w.work_date BETWEEN ? AND ?"]
+    params = [start_date, end_date]
+    if process and process != 'all':
+        where.append("w.process = ?")
+        params.append(process)
+    return where, params
+
+
 def register_mes_callbacks(app):
     """MES 모듈 콜백 등록"""
     
@@ -23,7 +39,7 @@ def register_mes_callbacks(app):
     def render_mes_tab_content(active_tab):
         """활성 탭에 따른 콘텐츠 렌더링"""
         from .layouts import (
-            create_work_input_form, create_status_view, 
+            create_work_input_form, create_status_view, create_schedule_view,
             create_analysis_view, create_mes_settings
         )
         
@@ -31,6 +47,8 @@ def register_mes_callbacks(app):
             return create_work_input_form()
         elif active_tab == "status-view":
             return create_status_view()
+        elif active_tab == "schedule":
+            return create_schedule_view()
         elif active_tab == "analysis":
             return create_analysis_view()
         elif active_tab == "mes-settings":
@@ -73,28 +91,33 @@ def register_mes_callbacks(app):
          State('worker-select', 'value'),
          State('plan-qty', 'value'),
          State('prod-qty', 'value'),
-         State('defect-qty', 'value')],
+         State('defect-qty', 'value'),
+         State('line-code', 'value'),
+         State('shift-select', 'value')],
         prevent_initial_call=True
     )
     def save_work_data(n_clicks, work_date, lot_number, process, worker_id, 
-                      plan_qty, prod_qty, defect_qty):
+                      plan_qty, prod_qty, defect_qty, line_code, shift):
         """작업 데이터 저장"""
         if not all([work_date, lot_number, process, worker_id, plan_qty, prod_qty]):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning", dismissable=True)
         
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO work_logs 
-                (lot_number, work_date, process, worker_id, plan_qty, prod_qty, defect_qty)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (lot_number, work_date, process, int(worker_id), 
-                  plan_qty, prod_qty, defect_qty or 0))
-            
-            conn.commit()
-            conn.close()
+            # 쓰기 버퍼가 켜져 있으면 그룹 커밋, 아니면 바로 저장 (publish 포함)
+            ticket = write_buffer.execute('mes.work_log', {
+                'lot_number': lot_number, 'work_date': work_date, 'process': process,
+                'worker_id': int(worker_id), 'plan_qty': plan_qty, 'prod_qty': prod_qty,
+                'defect_qty': defect_qty or 0, 'line_code': line_code or None, 'shift': shift or None
+            })
+            if ticket.status == write_buffer.FAILED:
+                raise ticket.error
+            if ticket.status == write_buffer.QUEUED:
+                return dbc.Alert(
+                    [html.I(className="fas fa-clock me-2"),
+                     f"접수되었습니다. 저장 대기 중입니다. (접수번호 {ticket.seq})"],
+                    color="info",
+                    dismissable=True
+                )
             
             logger.info(f"작업 데이터 저장 완료: LOT {lot_number}")
             
@@ -137,62 +160,52 @@ def register_mes_callbacks(app):
          Output('defect-rate', 'children'),
          Output('work-count', 'children'),
          Output('daily-production-chart', 'figure'),
-         Output('process-performance-chart', 'figure'),
-         Output('work-logs-table', 'children')],
+         Output('process-performance-chart', 'figure')],
         [Input('search-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')],
+         Input('refresh-mes', 'data')],
         [State('search-start-date', 'value'),
          State('search-end-date', 'value'),
          State('search-process', 'value')]
     )
     def update_status_view(n_clicks, n_intervals, start_date, end_date, process):
         """현황 조회 업데이트"""
-        from .layouts import get_work_logs, create_work_logs_table
+        from .rollups import get_period_totals, get_daily_summary, get_process_summary
         
-        # 데이터 조회
-        df = get_work_logs(start_date, end_date, process)
+        # 통계/차트는 일별 집계 테이블에서 조회
+        totals = get_period_totals(start_date, end_date, process)
         
-        if df.empty:
+        if totals['work_count'] == 0:
             empty_fig = go.Figure()
             empty_fig.add_annotation(
                 text="데이터가 없습니다",
                 xref="paper", yref="paper",
                 x=0.5, y=0.5, showarrow=False
             )
-            return "0", "0%", "0%", "0", empty_fig, empty_fig, "조회된 데이터가 없습니다."
+            return "0", "0%", "0%", "0", empty_fig, empty_fig
         
         # 통계 계산
-        total_production = df['prod_qty'].sum()
-        total_defects = df['defect_qty'].sum()
-        work_count = len(df)
-        
-        # 달성률 계산
-        df['achievement'] = df.apply(
-            lambda row: (row['prod_qty'] / row['plan_qty'] * 100) if row['plan_qty'] > 0 else 0,
-            axis=1
-        )
-        avg_achievement = df['achievement'].mean()
+        total_production = totals['prod_qty']
+        total_defects = totals['defect_qty']
+        work_count = totals['work_count']
+        avg_achievement = totals['avg_achievement']
         
         # 불량률 계산
         defect_rate = (total_defects / total_production * 100) if total_production > 0 else 0
         
         # 일별 생산 추이 차트
-        daily_df = df.groupby('work_date').agg({
-            'prod_qty': 'sum',
-            'defect_qty': 'sum'
-        }).reset_index()
+        daily_df = get_daily_summary(start_date, end_date, process)
         
         daily_fig = go.Figure()
         daily_fig.add_trace(go.Scatter(
             x=daily_df['work_date'],
-            y=daily_df['prod_qty'],
+            y=daily_df['total_prod'],
             mode='lines+markers',
             name='생산량',
             line=dict(color='#0066cc', width=3)
         ))
         daily_fig.add_trace(go.Scatter(
             x=daily_df['work_date'],
-            y=daily_df['defect_qty'],
+            y=daily_df['total_defect'],
             mode='lines+markers',
             name='불량',
             line=dict(color='#dc3545', width=2)
@@ -205,21 +218,18 @@ def register_mes_callbacks(app):
         )
         
         # 공정별 실적 차트
-        process_df = df.groupby('process').agg({
-            'prod_qty': 'sum',
-            'defect_qty': 'sum'
-        }).reset_index()
+        process_df = get_process_summary(start_date, end_date, process)
         
         process_fig = go.Figure()
         process_fig.add_trace(go.Bar(
             x=process_df['process'],
-            y=process_df['prod_qty'],
+            y=process_df['total_prod'],
             name='생산량',
             marker_color='#0066cc'
         ))
         process_fig.add_trace(go.Bar(
             x=process_df['process'],
-            y=process_df['defect_qty'],
+            y=process_df['total_defect'],
             name='불량',
             marker_color='#dc3545'
         ))
@@ -230,50 +240,44 @@ def register_mes_callbacks(app):
             barmode='group'
         )
         
-        # 상세 테이블
-        table = create_work_logs_table(df)
-        
         return (
             f"{total_production:,}",
             f"{avg_achievement:.1f}%",
             f"{defect_rate:.1f}%",
             f"{work_count:,}",
             daily_fig,
-            process_fig,
-            table
+            process_fig
         )
     
+    # 상세 작업 기록 그리드 (현재 페이지만 조회)
+    WORK_LOG_GRID.register(
+        app,
+        inputs=[Input('search-btn', 'n_clicks'),
+                Input('refresh-mes', 'data')],
+        states=[State('search-start-date', 'value'),
+                State('search-end-date', 'value'),
+                State('search-process', 'value')],
+        scope=work_log_scope
+    )
+    
     # 분석 차트 업데이트
     @app.callback(
         [Output('productivity-analysis-chart', 'figure'),
          Output('hourly-analysis-chart', 'figure'),
          Output('worker-performance-chart', 'figure')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-mes', 'data')
     )
     def update_analysis_charts(n_intervals):
         """분석 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        from .rollups import get_daily_summary, get_hourly_summary, get_worker_summary
         
         # 최근 30일 데이터
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
+        period = (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
         
-        # 생산성 분석 차트
-        productivity_query = """
-            SELECT work_date, 
-                   SUM(plan_qty) as total_plan,
-                   SUM(prod_qty) as total_prod,
-                   AVG(CAST(prod_qty AS FLOAT) / NULLIF(plan_qty, 0) * 100) as avg_achievement
-            FROM work_logs
-            WHERE work_date BETWEEN ? AND ?
-            GROUP BY work_date
-            ORDER BY work_date
-        """
-        productivity_df = pd.read_sql_query(
-            productivity_query, 
-            conn, 
-            params=[start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
-        )
+        # 생산성 분석 차트 (일별 집계 테이블)
+        productivity_df = get_daily_summary(*period)
         
         productivity_fig = go.Figure()
         productivity_fig.add_trace(go.Bar(
@@ -309,47 +313,35 @@ def register_mes_callbacks(app):
             barmode='group'
         )
         
-        # 시간대별 분석 (더미 데이터 - 실제로는 시간 정보가 있어야 함)
-        hours = list(range(8, 18))  # 8시~17시
-        hourly_data = [100 + i*10 + (i%3)*20 for i in range(len(hours))]
+        # 시간대별 생산량 (최근 24시간, 시간대별 집계 테이블)
+        current_hour = end_date.replace(minute=0, second=0, microsecond=0)
+        hours = pd.date_range(end=current_hour, periods=24, freq='H')
+        hourly_df = get_hourly_summary(hours[0].strftime('%Y-%m-%d %H:00'),
+                                       hours[-1].strftime('%Y-%m-%d %H:00'))
+        hourly_prod = (hourly_df.set_index('hour_start')['total_prod']
+                       .reindex(hours.strftime('%Y-%m-%d %H:00'), fill_value=0)
+                       .astype(int))
         
         hourly_fig = go.Figure()
         hourly_fig.add_trace(go.Bar(
             x=hours,
-            y=hourly_data,
-            text=hourly_data,
+            y=hourly_prod.values,
+            text=hourly_prod.values,
             textposition='auto',
             marker_color='#17a2b8'
         ))
         hourly_fig.update_layout(
-            title="시간대별 생산량",
+            title="시간대별 생산량 (최근 24시간)",
             xaxis_title="시간",
             yaxis_title="생산량",
             xaxis=dict(
-                tickmode='linear',
-                tick0=8,
-                dtick=1,
-                ticksuffix='시'
+                dtick=3600000,
+                tickformat='%H시'
             )
         )
         
         # 작업자별 실적
-        worker_query = """
-            SELECT u.username,
-                   COUNT(w.id) as work_count,
-                   SUM(w.prod_qty) as total_prod,
-                   AVG(CAST(w.prod_qty AS FLOAT) / NULLIF(w.plan_qty, 0) * 100) as avg_achievement
-            FROM work_logs w
-            JOIN users u ON w.worker_id = u.id
-            WHERE w.work_date BETWEEN ? AND ?
-            GROUP BY u.username
-            ORDER BY total_prod DESC
-        """
-        worker_df = pd.read_sql_query(
-            worker_query,
-            conn,
-            params=[start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
-        )
+        worker_df = get_worker_summary(*period)
         
         worker_fig = go.Figure()
         worker_fig.add_trace(go.Bar(
@@ -365,10 +357,63 @@ def register_mes_callbacks(app):
             yaxis_title="총 생산량"
         )
         
-        conn.close()
-        
         return productivity_fig, hourly_fig, worker_fig
     
+    # OEE 차트 업데이트 (교대별 OEE 집계)
+    @app.callback(
+        [Output('oee-line-chart', 'figure'),
+         Output('oee-shift-trend-chart', 'figure')],
+        Input('refresh-mes', 'data')
+    )
+    def update_oee_charts(n_intervals):
+        """OEE 차트 업데이트 (최근 30일)"""
+        from .oee import get_shift_rows, compute_oee
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=30)
+        rows = get_shift_rows(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        
+        return (create_oee_line_figure(compute_oee(rows, by=('line_code',))),
+                create_oee_trend_figure(compute_oee(rows, by=('work_date', 'shift'))))
+    
+    # 일정 계획 실행 (결과 저장 후 refresh-mes 로 Gantt 갱신)
+    @app.callback(
+        Output('schedule-message', 'children'),
+        Input('run-schedule-btn', 'n_clicks'),
+        prevent_initial_call=True
+    )
+    def run_schedule(n_clicks):
+        """미완료 작업지시 일정 계획"""
+        from .scheduler import schedule_orders
+        
+        try:
+            result = schedule_orders()
+        except Exception as e:
+            logger.error(f"일정 계획 실패: {e}")
+            return dbc.Alert(f"일정 계획 중 오류가 발생했습니다: {str(e)}", color="danger", dismissable=True)
+        
+        return dbc.Alert(
+            f"작업지시 {result['orders']:,}건 / 공정 작업 {result['operations']:,}건 계획 완료 "
+            f"(납기 지연 {result['tardy_orders']:,}건, 최종 완료 {result['makespan_end']}, "
+            f"{result['elapsed_ms']:,.0f}ms)",
+            color="warning" if result['tardy_orders'] else "success",
+            dismissable=True
+        )
+    
+    # 자원별 Gantt 차트
+    @app.callback(
+        Output('schedule-gantt-chart', 'figure'),
+        [Input('refresh-mes', 'data'),
+         Input('schedule-horizon', 'value')]
+    )
+    def update_schedule_gantt(n_intervals, horizon):
+        """계획된 공정 작업 Gantt (지금부터 표시 기간)"""
+        from .scheduler import get_gantt, TIME_FORMAT
+        
+        start = datetime.now()
+        end = start + timedelta(days=int(horizon or 3))
+        return create_gantt_figure(get_gantt(start.strftime(TIME_FORMAT), end.strftime(TIME_FORMAT)))
+    
     # MES 설정 저장
     @app.callback(
         Output('save-mes-settings-btn', 'children'),
@@ -393,7 +438,7 @@ def register_mes_callbacks(app):
             }
             
             # 데이터베이스에 저장
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -417,3 +462,74 @@ def register_mes_callbacks(app):
                 html.I(className="fas fa-times me-2"),
                 "저장 실패"
             ]
+
+def create_oee_line_figure(line_df):
+    """라인별 가동률/성능/품질 막대 + OEE 표시"""
+    labels = line_df['line_code'].replace('', '미지정')
+    fig = go.Figure()
+    for column, name, color in (('availability', '가동률', '#17a2b8'),
+                                ('performance', '성능', '#ffc107'),
+                                ('quality', '품질', '#28a745')):
+        fig.add_trace(go.Bar(x=labels, y=line_df[column], name=name, marker_color=color))
+    fig.add_trace(go.Scatter(
+        x=labels,
+        y=line_df['oee'],
+        name='OEE',
+        mode='markers+text',
+        text=line_df['oee'],
+        textposition='top center',
+        marker=dict(color='#dc3545', size=12, symbol='diamond')
+    ))
+    fig.update_layout(
+        title="라인별 OEE (최근 30일)",
+        yaxis_title="%",
+        barmode='group',
+        hovermode='x unified'
+    )
+    return fig
+
+
+def create_oee_trend_figure(trend_df):
+    """일자 × 교대 OEE 추이"""
+    fig = go.Figure()
+    for shift, shift_df in trend_df.groupby('shift', sort=True):
+        fig.add_trace(go.Scatter(
+            x=shift_df['work_date'],
+            y=shift_df['oee'],
+            name=f"{shift}조",
+            mode='lines+markers'
+        ))
+    fig.update_layout(
+        title="교대별 OEE 추이",
+        xaxis_title="날짜",
+        yaxis_title="OEE (%)",
+        hovermode='x unified'
+    )
+    return fig
+
+
+def create_gantt_figure(gantt_df):
+    """자원별 공정 작업 Gantt (납기 지연 작업은 빨간색)"""
+    if gantt_df.empty:
+        fig = go.Figure()
+        fig.update_layout(title="계획된 작업이 없습니다.")
+        return fig
+    
+    df = gantt_df.copy()
+    df['label'] = df['process'].where(df['late'] == 0, '납기 지연')
+    fig = px.timeline(
+        df,
+        x_start='start_time',
+        x_end='end_time',
+        y='resource_code',
+        color='label',
+        hover_data=['order_no', 'product_code', 'quantity', 'completed_qty', 'due_date'],
+        color_discrete_map={'납기 지연': '#dc3545'}
+    )
+    fig.update_yaxes(autorange='reversed', title="자원")
+    fig.update_layout(
+        title="작업지시 일정",
+        legend_title_text="공정",
+        height=max(300, 40 * df['resource_code'].nunique() + 150)
+    )
+    return fig
@@ -0,0 +1,121 @@
+# modules/mes/export.py - 생산 실적 키셋 페이지 조회 / 스트리밍 내보내기
+#
+# 정렬은 (work_date, id) 내림차순으로 고정하고, 다음 페이지는 마지막 행의
+# (work_date, id) 를 담은 커서로 이어 읽는다 (OFFSET 없음). 스트리밍은
+# SQLite 커서에서 fetchmany 단위로 읽어 바로 NDJSON/CSV 조각으로 내보내므로
+# 기간이 길어도 메모리 사용량은 배치 크기만큼으로 일정하다.
+
+import io
+import csv
+import json
+import base64
+
+from core.database import get_connection
+
+EXPORT_COLUMNS = ('id', 'lot_number', 'work_date', 'process', 'worker_id',
+                  'plan_qty', 'prod_qty', 'defect_qty', 'line_code', 'shift', 'created_at')
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 1000
+
+
+def encode_cursor(work_date, log_id):
+    """(work_date, id) -> 불투명 커서 문자열"""
+    raw = json.dumps([work_date, log_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """커서 문자열 -> (work_date, id) (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        work_date, log_id = json.loads(raw)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(work_date, str) or type(log_id) is not int:
+        raise ValueError("Invalid cursor")
+    return work_date, log_id
+
+
+def _query(start_date=None, end_date=None, cursor=None, limit=None):
+    conditions, params = [], []
+    if start_date:
+        conditions.append("work_date >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append("work_date <= ?")
+        params.append(end_date)
+    if cursor:
+        work_date, log_id = decode_cursor(cursor)
+        conditions.append("work_date <= ? AND (work_date, id) < (?, ?)")
+        params.extend([work_date, work_date, log_id])
+
+    query = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM work_logs"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY work_date DESC, id DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    return query, params
+
+
+def fetch_page(start_date=None, end_date=None, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """한 페이지 조회 -> (레코드 목록, 다음 커서 또는 None)"""
+    limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+    query, params = _query(start_date, end_date, cursor, limit + 1)
+
+    conn = get_connection()
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[2], last[0])
+    return [dict(zip(EXPORT_COLUMNS, row)) for row in rows], next_cursor
+
+
+def iter_batches(start_date=None, end_date=None, cursor=None, limit=None,
+                 batch_size=STREAM_BATCH_SIZE):
+    """조회 결과를 fetchmany 배치 단위로 순회 (조회 커서는 끝까지 열어 둠)"""
+    query, params = _query(start_date, end_date, cursor, limit)
+    conn = get_connection()
+    result = None
+    try:
+        result = conn.execute(query, params)
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        # 클라이언트가 중간에 끊어도 읽기 트랜잭션을 남기지 않도록 커서부터 닫음
+        if result is not None:
+            result.close()
+        conn.close()
+
+
+def stream_ndjson(*args, **kwargs):
+    """NDJSON 조각 생성기 (배치마다 한 조각)"""
+    for rows in iter_batches(*args, **kwargs):
+        yield ''.join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n' for row in rows
+        )
+
+
+def stream_csv(*args, **kwargs):
+    """CSV 조각 생성기 (첫 조각은 헤더)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+    for rows in iter_batches(*args, **kwargs):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
@@ -0,0 +1,152 @@
+# modules/mes/gateway.py - 설비 텔레메트리 수집 게이트웨이 (TCP/UDP)
+#
+# Graphite plaintext 프로토콜 (``<tag> <value> [<unix 초>]\n``) 을 받으므로
+# collectd/Telegraf 의 graphite 출력이나 PLC 게이트웨이, 로컬 시뮬레이터
+# (scripts/benchmark_telemetry.py) 가 그대로 보낼 수 있다. UDP 는 데이터그램
+# 하나에 여러 줄을 담아 보내고, TCP 는 연결을 유지한 채 줄 단위로 보낸다.
+#
+# 수신 스레드는 TelemetryStore 버퍼에만 추가하고, 플러시 스레드가
+# flush_interval 마다 블록/집계를 저장하며 feed_interval 마다 계수기
+# 증가량을 MES 실적으로 반영한다 (modules/mes/telemetry).
+
+import socket
+import threading
+import socketserver
+import logging
+
+from modules.mes.telemetry import TelemetryStore, feed_production
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS = {
+    'enabled': False,
+    'host': '0.0.0.0',
+    'tcp_port': 2003,
+    'udp_port': 2003,
+    'flush_interval': 5,
+    'feed_interval': 60,
+}
+
+UDP_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+class _UDPHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data = self.request[0]
+        self.server.store.ingest_lines(data.decode('utf-8', 'replace'))
+
+
+class _TCPHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        store = self.server.store
+        pending = b''
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                break
+            data = pending + data
+            cut = data.rfind(b'\n') + 1
+            pending = data[cut:]
+            if cut:
+                store.ingest_lines(data[:cut].decode('utf-8', 'replace'))
+        if pending.strip():
+            store.ingest_lines(pending.decode('utf-8', 'replace'))
+
+
+class _UDPServer(socketserver.UDPServer):
+    # 데이터그램은 수신 스레드 하나에서 순서대로 처리 (요청마다 스레드를 만들지 않음)
+    max_packet_size = 65535
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_BUFFER_BYTES)
+        super().server_bind()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class TelemetryGateway:
+    """TCP/UDP 수신 + 주기적 플러시/MES 반영"""
+
+    def __init__(self, store=None, host='0.0.0.0', tcp_port=2003, udp_port=2003,
+                 flush_interval=5, feed_interval=60):
+        self.store = store or TelemetryStore()
+        self.host = host
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+        self.flush_interval = flush_interval
+        self.feed_interval = feed_interval
+        self._servers = []
+        self._threads = []
+        self._stop = threading.Event()
+
+    @property
+    def addresses(self):
+        """{'tcp': (host, port), 'udp': (host, port)} - 포트 0 이면 실제 할당 포트"""
+        return {kind: server.server_address for kind, server in self._servers}
+
+    def start(self):
+        self._stop.clear()
+        if self.tcp_port is not None:
+            self._servers.append(('tcp', _TCPServer((self.host, self.tcp_port), _TCPHandler)))
+        if self.udp_port is not None:
+            self._servers.append(('udp', _UDPServer((self.host, self.udp_port), _UDPHandler)))
+        for kind, server in self._servers:
+            server.store = self.store
+            self._threads.append(threading.Thread(
+                target=server.serve_forever, name=f"telemetry-{kind}", daemon=True))
+        self._threads.append(threading.Thread(target=self._run, name='telemetry-flush', daemon=True))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"텔레메트리 게이트웨이 시작: {self.addresses}")
+
+    def stop(self):
+        """수신 종료 후 남은 버퍼 플러시"""
+        for _, server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._servers, self._threads = [], []
+        self.store.flush()
+
+    def _run(self):
+        elapsed = 0
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.store.flush()
+                elapsed += self.flush_interval
+                if elapsed >= self.feed_interval:
+                    elapsed = 0
+                    feed_production()
+            except Exception as e:
+                logger.error(f"텔레메트리 저장 실패: {e}")
+
+
+_gateway = None
+
+
+def configure_telemetry(telemetry_config=None):
+    """텔레메트리 게이트웨이 설정 적용 (config['telemetry'])"""
+    global _gateway
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(telemetry_config or {})
+
+    if _gateway is not None:
+        _gateway.stop()
+        _gateway = None
+    if settings['enabled']:
+        _gateway = TelemetryGateway(
+            host=settings['host'], tcp_port=settings['tcp_port'], udp_port=settings['udp_port'],
+            flush_interval=settings['flush_interval'], feed_interval=settings['feed_interval']
+        )
+        _gateway.start()
+    return _gateway
+
+
+def get_gateway():
+    """실행 중인 게이트웨이 (사용하지 않으면 None)"""
+    return _gateway
@@ -0,0 +1,308 @@
+# modules/mes/ingest.py - 생산 실적 일괄 등록 (JSON 배열 / NDJSON / CSV)
+#
+# 라인 게이트웨이가 교대 단위로 보내는 수천~수만 건의 실적을 한 요청으로
+# 받아 ProductionSchema 기준으로 검증하고, 유효한 행만 한 트랜잭션에서
+# executemany 로 등록한다. 잘못된 행은 요청 내 행 번호(1부터)와 함께 반환한다.
+#
+# 행마다 marshmallow load 를 호출하면 검증만으로 초당 수만 건에 머물러,
+# 스키마의 load 필드(Int/Str/Date 와 Range/Length/OneOf 검증)에서 빠른 검증기를
+# 만들어 쓴다. 빠른 검증기가 확신할 수 없는 행(형 변환이 필요한 값, 누락,
+# 알 수 없는 필드, 지원하지 않는 검증 규칙 등)은 스키마 load 로 다시 검증해
+# 결과와 오류 메시지는 스키마와 같다.
+
+import io
+import csv
+import json
+from datetime import date
+
+from marshmallow import ValidationError, fields, validate
+
+from core.database import transaction
+from core.write_buffer import register_operation
+from modules.hr.models import ProductionSchema
+from modules.mes.rollups import bulk_load
+
+MAX_BATCH_ROWS = 100000
+MAX_REPORTED_ERRORS = 1000
+
+INSERT_COLUMNS = ('lot_number', 'work_date', 'process', 'worker_id',
+                  'plan_qty', 'prod_qty', 'defect_qty', 'line_code', 'shift')
+
+NDJSON_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl',
+                'application/x-jsonlines')
+CSV_TYPES = ('text/csv', 'application/csv')
+
+# work_logs 에는 트리거가 있어 행 단위 INSERT 는 문장마다 비용이 크므로,
+# 트리거/인덱스 없는 임시 테이블에 executemany 후 INSERT ... SELECT 한 번으로 옮긴다.
+_STAGE_CREATE = f"CREATE TEMP TABLE work_log_stage ({', '.join(INSERT_COLUMNS)})"
+_STAGE_INSERT = f"INSERT INTO temp.work_log_stage VALUES ({', '.join('?' * len(INSERT_COLUMNS))})"
+_STAGE_MOVE = f"""
+    INSERT INTO work_logs ({', '.join(INSERT_COLUMNS)})
+    SELECT {', '.join(INSERT_COLUMNS)} FROM temp.work_log_stage
+"""
+
+# 빠른 검증기가 판단을 스키마에 넘길 때 반환하는 값
+_FALLBACK = object()
+
+
+class IngestError(ValueError):
+    """요청 전체를 처리할 수 없는 경우 (본문 형식 오류, 최대 행 수 초과)"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# ---- 본문 파싱 ----
+
+class _Malformed:
+    """NDJSON 의 해석할 수 없는 줄 - 스키마 대신 그대로 오류로 보고"""
+
+    def __init__(self, message):
+        self.errors = {'_schema': [message]}
+
+
+def parse_body(body, content_type=None):
+    """요청 본문 -> 행 목록 (dict 또는 파싱 실패 오류)
+
+    content_type 으로 형식을 고르며 알 수 없으면 JSON 배열로 읽는다.
+    CSV 의 빈 셀은 값이 없는 것으로 본다.
+    """
+    if isinstance(body, bytes):
+        try:
+            body = body.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise IngestError("Request body must be UTF-8")
+    content_type = (content_type or '').split(';')[0].strip().lower()
+
+    if content_type in CSV_TYPES:
+        reader = csv.DictReader(io.StringIO(body), restkey='_extra')
+        return [{k: v for k, v in row.items() if v not in ('', None)} for row in reader]
+
+    if content_type in NDJSON_TYPES:
+        rows = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                rows.append(_Malformed("Invalid JSON line"))
+        return rows
+
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise IngestError("Invalid JSON body")
+    if isinstance(data, dict):
+        data = data.get('records', [data])
+    if not isinstance(data, list):
+        raise IngestError("JSON body must be an array of records")
+    return data
+
+
+# ---- 검증 ----
+
+def _range_check(rule):
+    def check(value):
+        if rule.min is not None and (value < rule.min if rule.min_inclusive else value <= rule.min):
+            return False
+        if rule.max is not None and (value > rule.max if rule.max_inclusive else value >= rule.max):
+            return False
+        return True
+    return check
+
+
+def _length_check(rule):
+    def check(value):
+        size = len(value)
+        if rule.equal is not None:
+            return size == rule.equal
+        return ((rule.min is None or size >= rule.min)
+                and (rule.max is None or size <= rule.max))
+    return check
+
+
+def _choice_check(rule):
+    choices = set(rule.choices)
+    return lambda value: value in choices
+
+
+def _to_int(value):
+    if type(value) is int:
+        return value
+    if type(value) is str and value.isascii() and value.isdigit():
+        return int(value)
+    return _FALLBACK
+
+
+def _to_strict_int(value):
+    return value if type(value) is int else _FALLBACK
+
+
+def _to_str(value):
+    return value if type(value) is str else _FALLBACK
+
+
+def _to_date(value):
+    # 'YYYY-MM-DD' 만 빠른 경로로 처리 (저장 형식과 같음)
+    if type(value) is str and len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            date.fromisoformat(value)
+            return value
+        except ValueError:
+            pass
+    return _FALLBACK
+
+
+_CONVERTERS = {fields.Integer: _to_int, fields.String: _to_str, fields.Date: _to_date}
+_RULES = {validate.Range: _range_check, validate.Length: _length_check,
+          validate.OneOf: _choice_check}
+
+
+def _compile_field(field):
+    """필드 하나의 빠른 검증 함수 (지원하지 않는 필드면 None)"""
+    convert = _CONVERTERS.get(type(field))
+    if convert is _to_int and field.strict:
+        convert = _to_strict_int
+    if convert is None or field.allow_none:
+        return None
+    checks = []
+    for rule in field.validators:
+        make = _RULES.get(type(rule))
+        if make is None:
+            return None
+        checks.append(make(rule))
+
+    def run(value):
+        value = convert(value)
+        if value is _FALLBACK:
+            return value
+        for check in checks:
+            if not check(value):
+                return _FALLBACK
+        return value
+    return run
+
+
+class RowValidator:
+    """스키마 load 필드에서 만든 빠른 검증기 + 스키마 재검증"""
+
+    def __init__(self, schema=None):
+        self.schema = schema or ProductionSchema()
+        self.fields = {}
+        self.required = set()
+        self.compiled = True
+        for name, field in self.schema.load_fields.items():
+            run = _compile_field(field)
+            if run is None:
+                self.compiled = False
+            self.fields[field.data_key or name] = (name, run)
+            if field.required:
+                self.required.add(field.data_key or name)
+
+    def fast(self, row):
+        """빠른 검증 - 확신할 수 없으면 _FALLBACK"""
+        if not self.compiled or type(row) is not dict:
+            return _FALLBACK
+        loaded = {}
+        for key, value in row.items():
+            spec = self.fields.get(key)
+            if spec is None:
+                return _FALLBACK
+            value = spec[1](value)
+            if value is _FALLBACK:
+                return _FALLBACK
+            loaded[spec[0]] = value
+        if not self.required.issubset(row):
+            return _FALLBACK
+        return loaded
+
+    def load(self, row):
+        """검증된 dict 반환 (실패 시 ValidationError)"""
+        loaded = self.fast(row)
+        if loaded is _FALLBACK:
+            loaded = self.schema.load(row)
+            for key, value in loaded.items():
+                if isinstance(value, date):
+                    loaded[key] = value.isoformat()
+        return loaded
+
+
+def validate_rows(rows, worker_id=None, validator=None):
+    """행 목록 -> (INSERT 파라미터 목록, 오류 목록)
+
+    worker_id 가 없는 행은 요청 사용자, defect_qty 가 없는 행은 0 으로 채운다.
+    """
+    validator = validator or RowValidator()
+    records, errors = [], []
+    for number, row in enumerate(rows, start=1):
+        if isinstance(row, _Malformed):
+            errors.append({'row': number, 'errors': row.errors})
+            continue
+        try:
+            loaded = validator.load(row)
+        except ValidationError as e:
+            errors.append({'row': number, 'errors': e.messages})
+            continue
+        records.append((
+            loaded['lot_number'], loaded['work_date'], loaded['process'],
+            loaded.get('worker_id', worker_id),
+            loaded['plan_qty'], loaded['prod_qty'], loaded.get('defect_qty', 0),
+            loaded.get('line_code'), loaded.get('shift'),
+        ))
+    return records, errors
+
+
+# ---- 등록 ----
+
+def insert_work_logs(records):
+    """검증된 행을 한 트랜잭션에서 등록 (집계는 범위 단위로 한 번에 갱신)"""
+    if not records:
+        return 0
+    with transaction(immediate=True) as conn:
+        conn.execute(_STAGE_CREATE)
+        conn.executemany(_STAGE_INSERT, records)
+        with bulk_load(conn):
+            conn.execute(_STAGE_MOVE)
+        conn.execute("DROP TABLE temp.work_log_stage")
+    return len(records)
+
+
+def insert_work_log(conn, record):
+    """작업 실적 한 건 등록 (호출자 트랜잭션 안에서 사용, 새 id 반환)
+
+    record 는 INSERT_COLUMNS 키의 dict (없는 키는 NULL). 현장 단말 입력은
+    쓰기 버퍼 작업 'mes.work_log' 로 실행된다.
+    """
+    cursor = conn.execute(f"""
+        INSERT INTO work_logs ({', '.join(INSERT_COLUMNS)})
+        VALUES ({', '.join('?' * len(INSERT_COLUMNS))})
+    """, [record.get(column) for column in INSERT_COLUMNS])
+    return cursor.lastrowid
+
+
+register_operation('mes.work_log', insert_work_log, topics=('mes',))
+
+
+def ingest_production(body, content_type=None, worker_id=None):
+    """요청 본문 파싱 -> 검증 -> 등록
+
+    Returns:
+        {'received', 'inserted', 'error_count', 'errors'} - errors 는 최대
+        MAX_REPORTED_ERRORS 건까지 {'row': 행 번호, 'errors': 필드별 메시지}
+    """
+    rows = parse_body(body, content_type)
+    if not rows:
+        raise IngestError("No records")
+    if len(rows) > MAX_BATCH_ROWS:
+        raise IngestError(f"Too many rows (max {MAX_BATCH_ROWS})", status=413)
+
+    records, errors = validate_rows(rows, worker_id)
+    inserted = insert_work_logs(records)
+    return {
+        'received': len(rows),
+        'inserted': inserted,
+        'error_count': len(errors),
+        'errors': errors[:MAX_REPORTED_ERRORS],
+    }
@@ -10,6 +10,37 @@ import sqlite3
 import pandas as pd
 import json
 
+from core.grid import SqlGrid
+from core.query_cache import cached_df
+from .oee import SHIFTS
+
+# 교대 선택 (미선택 시 등록 시각 기준)
+SHIFT_OPTIONS = [
+    {"label": f"{code} ({start:02d}~{end:02d}시)", "value": code}
+    for code, (start, end) in SHIFTS.items()
+]
+
+# 상세 작업 기록 그리드 (달성률/불량률은 SQL 에서 계산)
+WORK_LOG_GRID = SqlGrid(
+    'work-logs-table',
+    "work_logs w LEFT JOIN users u ON w.worker_id = u.id",
+    columns=[
+        {'id': 'work_date', 'name': '작업일', 'sql': 'w.work_date', 'nullable': False},
+        {'id': 'lot_number', 'name': 'LOT 번호', 'sql': 'w.lot_number', 'nullable': False},
+        {'id': 'process', 'name': '공정', 'sql': 'w.process', 'nullable': False},
+        {'id': 'username', 'name': '작업자', 'sql': 'u.username'},
+        {'id': 'plan_qty', 'name': '계획수량', 'sql': 'w.plan_qty', 'type': 'numeric'},
+        {'id': 'prod_qty', 'name': '생산수량', 'sql': 'w.prod_qty', 'type': 'numeric'},
+        {'id': 'defect_qty', 'name': '불량수량', 'sql': 'w.defect_qty', 'type': 'numeric'},
+        {'id': 'achievement_rate', 'name': '달성률(%)', 'type': 'numeric', 'nullable': False,
+         'sql': "COALESCE(MIN(ROUND(CAST(w.prod_qty AS FLOAT) / NULLIF(w.plan_qty, 0) * 100, 1), 100), 0)"},
+        {'id': 'defect_rate', 'name': '불량률(%)', 'type': 'numeric', 'nullable': False,
+         'sql': "COALESCE(ROUND(CAST(w.defect_qty AS FLOAT) / NULLIF(w.prod_qty, 0) * 100, 1), 0)"},
+    ],
+    key='w.id',
+    default_sort=[{'column_id': 'work_date', 'direction': 'desc'}]
+)
+
 def create_mes_layout():
     """MES 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -24,6 +55,7 @@ def create_mes_layout():
         dbc.Tabs([
             dbc.Tab(label="작업 입력", tab_id="work-input"),
             dbc.Tab(label="현황 조회", tab_id="status-view"),
+            dbc.Tab(label="생산 계획", tab_id="schedule"),
             dbc.Tab(label="분석", tab_id="analysis"),
             dbc.Tab(label="설정", tab_id="mes-settings")
         ], id="mes-tabs", active_tab="work-input"),
@@ -87,6 +119,25 @@ def create_work_input_form():
                     ], md=6)
                 ], className="mb-3"),
                 
+                # 라인/교대 정보 (OEE 집계 단위)
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("라인", html_for="line-code"),
+                        dbc.Input(
+                            id="line-code",
+                            placeholder="LINE-01"
+                        )
+                    ], md=6),
+                    dbc.Col([
+                        dbc.Label("교대", html_for="shift-select"),
+                        dbc.Select(
+                            id="shift-select",
+                            options=SHIFT_OPTIONS,
+                            placeholder="자동 (등록 시각 기준)"
+                        )
+                    ], md=6)
+                ], className="mb-3"),
+                
                 # 수량 정보
                 dbc.Row([
                     dbc.Col([
@@ -288,7 +339,44 @@ def create_status_view():
                 )
             ]),
             dbc.CardBody([
-                html.Div(id="work-logs-table")
+                WORK_LOG_GRID.layout()
+            ])
+        ])
+    ])
+
+def create_schedule_view():
+    """생산 계획 (유한 능력 일정) 화면"""
+    return html.Div([
+        dbc.Card([
+            dbc.CardHeader([
+                html.H4([html.I(className="fas fa-stream me-2"), "작업지시 일정"], className="d-inline"),
+                dbc.Button(
+                    [html.I(className="fas fa-calendar-check me-2"), "일정 계획 실행"],
+                    id="run-schedule-btn",
+                    color="primary",
+                    size="sm",
+                    className="float-end"
+                )
+            ]),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("표시 기간"),
+                        dbc.Select(
+                            id="schedule-horizon",
+                            options=[
+                                {"label": "1일", "value": "1"},
+                                {"label": "3일", "value": "3"},
+                                {"label": "7일", "value": "7"}
+                            ],
+                            value="3"
+                        )
+                    ], md=3),
+                    dbc.Col(html.Div(id="schedule-message"), md=9)
+                ], className="mb-3"),
+                
+                # 자원별 Gantt 차트
+                dcc.Graph(id="schedule-gantt-chart")
             ])
         ])
     ])
@@ -324,6 +412,25 @@ def create_analysis_view():
                     ])
                 ])
             ], md=6)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("라인별 OEE"),
+                    dbc.CardBody([
+                        dcc.Graph(id="oee-line-chart")
+                    ])
+                ])
+            ], md=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("교대별 OEE 추이"),
+                    dbc.CardBody([
+                        dcc.Graph(id="oee-shift-trend-chart")
+                    ])
+                ])
+            ], md=6)
         ])
     ])
 
@@ -446,8 +553,7 @@ def calculate_achievement_rate(plan_qty, prod_qty):
     return 0
 
 def get_work_logs(start_date, end_date, process=None):
-    """작업 로그 조회"""
-    conn = sqlite3.connect('data/database.db')
+    """작업 로그 조회 (쓰기 버전 캐시)"""
     query = """
         SELECT w.*, u.username 
         FROM work_logs w
@@ -462,35 +568,4 @@ def get_work_logs(start_date, end_date, process=None):
     
     query += " ORDER BY work_date DESC, created_at DESC"
     
-    df = pd.read_sql_query(query, conn, params=params)
-    conn.close()
-    
-    return df
-
-def create_work_logs_table(df):
-    """작업 로그 테이블 생성"""
-    if df.empty:
-        return html.Div("조회된 데이터가 없습니다.", className="text-center text-muted p-4")
-    
-    # 달성률 계산
-    df['achievement_rate'] = df.apply(
-        lambda row: calculate_achievement_rate(row['plan_qty'], row['prod_qty']), 
-        axis=1
-    )
-    
-    # 불량률 계산
-    df['defect_rate'] = df.apply(
-        lambda row: round((row['defect_qty'] / row['prod_qty'] * 100), 1) if row['prod_qty'] > 0 else 0,
-        axis=1
-    )
-    
-    # 테이블 생성
-    return dbc.Table.from_dataframe(
-        df[['work_date', 'lot_number', 'process', 'username', 'plan_qty', 
-            'prod_qty', 'defect_qty', 'achievement_rate', 'defect_rate']],
-        striped=True,
-        bordered=True,
-        hover=True,
-        responsive=True,
-        className="mb-0"
-    )
+    return cached_df(query, params)
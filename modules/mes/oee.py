@@ -0,0 +1,154 @@
+# modules/mes/oee.py - 설비종합효율(OEE) 계산
+#
+# OEE = 가동률(Availability) × 성능(Performance) × 품질(Quality)
+#   가동률 = 가동 시간 / 계획 가동 시간
+#            (계획 가동 시간 = 교대 시간 - 계획 정지, 가동 시간 = 계획 가동 시간 - 비가동)
+#   성능   = 이상 사이클 타임 × 생산 수량 / 가동 시간
+#   품질   = (생산 수량 - 불량 수량) / 생산 수량
+#
+# 원본 실적/비가동 이력은 트리거가 oee_shift_summary (일자 × 교대 × 라인 × 공정)
+# 로 미리 집계하므로 (core/migrations/0008) 조회 시에는 집계 행만 읽어 기준
+# 정보(oee_standards)와 결합한 뒤 NumPy 로 계산한다. 여러 교대/라인을 묶을
+# 때는 비율을 평균하지 않고 시간/수량 합계로 다시 계산한다.
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from core.database import get_connection, transaction
+from core.tables import ratio
+
+# 교대 (시작 시, 종료 시) - 교대가 없는 실적은 등록 시각으로 정함 (0008 트리거와 같음)
+SHIFTS = {
+    'A': (6, 14),
+    'B': (14, 22),
+    'C': (22, 6),
+}
+
+DEFAULT_SHIFT_MINUTES = 480
+
+GROUP_COLUMNS = ('work_date', 'shift', 'line_code', 'process')
+
+_SUM_COLUMNS = ['planned_min', 'run_min', 'perf_run_min', 'ideal_min',
+                'prod_qty', 'good_qty', 'downtime_min', 'log_count']
+
+
+def shift_of(hour):
+    """시각(0~23) -> 교대 코드"""
+    for code, (start, end) in SHIFTS.items():
+        if start < end and start <= hour < end:
+            return code
+    return 'C'
+
+
+def set_standard(process, ideal_cycle_sec, line_code='', shift_minutes=DEFAULT_SHIFT_MINUTES):
+    """라인/공정 기준 정보 등록 (line_code '' 는 공정 기본값)"""
+    with transaction() as conn:
+        conn.execute("""
+            INSERT INTO oee_standards (line_code, process, ideal_cycle_sec, shift_minutes)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (line_code, process) DO UPDATE SET
+                ideal_cycle_sec = excluded.ideal_cycle_sec,
+                shift_minutes = excluded.shift_minutes,
+                updated_at = CURRENT_TIMESTAMP
+        """, (line_code or '', process, ideal_cycle_sec, shift_minutes))
+
+
+def record_downtime(conn, event_date, process, duration_min, shift=None, line_code='',
+                    reason_code=None, planned=False, start_time=None, remarks=None,
+                    created_by=None):
+    """비가동 이력 등록 (호출자의 트랜잭션 안에서 사용, 새 id 반환)
+
+    shift 가 없으면 start_time('HH:MM', 없으면 현재 시각)으로 정한다.
+    """
+    if shift is None:
+        hour = int(start_time[:2]) if start_time else datetime.now().hour
+        shift = shift_of(hour)
+    if shift not in SHIFTS:
+        raise ValueError(f"Unknown shift: {shift}")
+    if duration_min is None or duration_min < 0:
+        raise ValueError("duration_min must be zero or positive")
+    cursor = conn.execute("""
+        INSERT INTO downtime_events
+        (event_date, shift, line_code, process, start_time, duration_min,
+         reason_code, planned, remarks, created_by)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (event_date, shift, line_code or '', process, start_time, duration_min,
+          reason_code, 1 if planned else 0, remarks, created_by))
+    return cursor.lastrowid
+
+
+def get_shift_rows(start_date, end_date, process=None, line_code=None):
+    """교대별 집계 행 + 기준 정보 (이상 사이클 타임이 없으면 NaN)"""
+    where, params = "s.work_date BETWEEN ? AND ?", [start_date, end_date]
+    if process and process != 'all':
+        where += " AND s.process = ?"
+        params.append(process)
+    if line_code and line_code != 'all':
+        where += " AND s.line_code = ?"
+        params.append(line_code)
+
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(f"""
+            SELECT s.work_date, s.shift, s.line_code, s.process,
+                   s.log_count, s.prod_qty, s.defect_qty,
+                   s.downtime_min, s.planned_stop_min,
+                   COALESCE(st.ideal_cycle_sec, d.ideal_cycle_sec) as ideal_cycle_sec,
+                   COALESCE(st.shift_minutes, d.shift_minutes, ?) as shift_minutes
+            FROM oee_shift_summary s
+            LEFT JOIN oee_standards st ON st.line_code = s.line_code AND st.process = s.process
+            LEFT JOIN oee_standards d ON d.line_code = '' AND d.process = s.process
+            WHERE {where}
+        """, conn, params=[DEFAULT_SHIFT_MINUTES] + params)
+    finally:
+        conn.close()
+
+
+def _add_time_columns(df):
+    """교대 행별 시간/수량 컬럼 (합계 가능한 값만)"""
+    planned = np.maximum(df['shift_minutes'].to_numpy(float) - df['planned_stop_min'].to_numpy(float), 0)
+    run = np.maximum(planned - df['downtime_min'].to_numpy(float), 0)
+    ideal_cycle = df['ideal_cycle_sec'].to_numpy(float)
+    has_standard = ~np.isnan(ideal_cycle)
+    prod = df['prod_qty'].to_numpy(float)
+
+    df['planned_min'] = planned
+    df['run_min'] = run
+    # 이상 사이클 타임이 없는 행은 성능 계산(분자/분모)에서 제외
+    df['perf_run_min'] = np.where(has_standard, run, 0.0)
+    df['ideal_min'] = np.where(has_standard, np.nan_to_num(ideal_cycle) * prod / 60, 0.0)
+    df['good_qty'] = np.maximum(prod - df['defect_qty'].to_numpy(float), 0)
+    return df
+
+
+def _add_factors(df):
+    """합계 컬럼 -> 가동률/성능/품질/OEE (%)"""
+    availability = ratio(df['run_min'], df['planned_min'], digits=6)
+    performance = ratio(df['ideal_min'], df['perf_run_min'], digits=6)
+    quality = ratio(df['good_qty'], df['prod_qty'], digits=6)
+    df['availability'] = np.round(availability, 1)
+    df['performance'] = np.round(performance, 1)
+    df['quality'] = np.round(quality, 1)
+    df['oee'] = np.round(availability * performance * quality / 10000, 1)
+    return df
+
+
+def compute_oee(rows, by=('line_code',)):
+    """교대별 집계 행 -> by 단위 OEE (by 가 비면 전체 한 행)"""
+    by = [c for c in by if c in GROUP_COLUMNS]
+    if rows.empty:
+        return pd.DataFrame(columns=by + _SUM_COLUMNS + ['availability', 'performance', 'quality', 'oee'])
+
+    df = _add_time_columns(rows.copy())
+    if by:
+        df = df.groupby(by, as_index=False, sort=True)[_SUM_COLUMNS].sum()
+    else:
+        df = df[_SUM_COLUMNS].sum().to_frame().T
+    return _add_factors(df)
+
+
+def get_oee(start_date, end_date, by=('line_code',), process=None, line_code=None):
+    """기간 OEE (by: work_date / shift / line_code / process 조합)"""
+    return compute_oee(get_shift_rows(start_date, end_date, process, line_code), by)
@@ -0,0 +1,258 @@
+# modules/mes/rollups.py - 작업 실적 집계 조회 (work_log_daily_summary)
+#
+# 집계 테이블은 work_logs 트리거가 갱신한다 (core/migrations/0003).
+# 원본 행을 다시 GROUP BY 하지 않고 일자 × 공정 × 작업자 단위 집계를 읽는다.
+# 시간대별 집계(work_log_hourly_summary, 0007)는 등록 시각 기준 정시 × 공정 단위,
+# OEE 교대별 집계(oee_shift_summary, 0008)는 일자 × 교대 × 라인 × 공정 단위다.
+# 일괄 등록은 bulk_load() 구간에서 트리거 대신 등록 범위를 한 번에 집계한다 (0005).
+
+from contextlib import contextmanager
+
+import pandas as pd
+
+from core.database import get_connection, transaction
+
+# work_logs -> 집계 행 (WHERE 조건은 호출 측에서 지정)
+_SUMMARY_SELECT = """
+    SELECT work_date, process, COALESCE(worker_id, 0),
+           COUNT(*),
+           COALESCE(SUM(plan_qty), 0),
+           COALESCE(SUM(prod_qty), 0),
+           COALESCE(SUM(defect_qty), 0),
+           COALESCE(SUM(CASE WHEN plan_qty > 0 AND prod_qty IS NOT NULL
+                             THEN CAST(prod_qty AS REAL) / plan_qty * 100 END), 0),
+           SUM(CASE WHEN plan_qty > 0 AND prod_qty IS NOT NULL THEN 1 ELSE 0 END),
+           SUM(CASE WHEN prod_qty >= plan_qty THEN 1 ELSE 0 END)
+    FROM work_logs
+    WHERE {where}
+    GROUP BY work_date, process, COALESCE(worker_id, 0)
+"""
+
+_SUMMARY_COLUMNS = """
+    INSERT INTO work_log_daily_summary
+        (work_date, process, worker_id, log_count, plan_qty, prod_qty, defect_qty,
+         achievement_sum, achievement_count, achieved_count)
+"""
+
+_HOUR_BUCKET = "strftime('%Y-%m-%d %H:00', created_at, 'localtime')"
+
+_HOURLY_INSERT = f"""
+    INSERT INTO work_log_hourly_summary
+        (hour_start, process, log_count, plan_qty, prod_qty, defect_qty)
+    SELECT {_HOUR_BUCKET}, process,
+           COUNT(*),
+           COALESCE(SUM(plan_qty), 0),
+           COALESCE(SUM(prod_qty), 0),
+           COALESCE(SUM(defect_qty), 0)
+    FROM work_logs
+    WHERE created_at IS NOT NULL AND {{where}}
+    GROUP BY {_HOUR_BUCKET}, process
+"""
+
+# 교대가 없는 실적의 교대 (0008 트리거와 같은 기준)
+_SHIFT_BUCKET = """COALESCE(shift,
+    CASE WHEN CAST(strftime('%H', created_at, 'localtime') AS INTEGER) BETWEEN 6 AND 13 THEN 'A'
+         WHEN CAST(strftime('%H', created_at, 'localtime') AS INTEGER) BETWEEN 14 AND 21 THEN 'B'
+         ELSE 'C' END)"""
+
+_SHIFT_INSERT = f"""
+    INSERT INTO oee_shift_summary
+        (work_date, shift, line_code, process, log_count, prod_qty, defect_qty)
+    SELECT work_date, {_SHIFT_BUCKET}, COALESCE(line_code, ''), process,
+           COUNT(*),
+           COALESCE(SUM(prod_qty), 0),
+           COALESCE(SUM(defect_qty), 0)
+    FROM work_logs
+    WHERE {{where}}
+    GROUP BY 1, 2, 3, 4
+"""
+
+
+def _summary_filter(start_date, end_date, process=None):
+    """기간/공정 조건"""
+    where = "work_date BETWEEN ? AND ?"
+    params = [start_date, end_date]
+    if process and process != 'all':
+        where += " AND process = ?"
+        params.append(process)
+    return where, params
+
+
+def get_period_totals(start_date, end_date, process=None):
+    """기간 합계 (건수, 계획, 생산, 불량, 평균 달성률)
+
+    평균 달성률은 계획수량이 없는 작업을 0% 로 포함한 작업별 평균이다.
+    """
+    where, params = _summary_filter(start_date, end_date, process)
+    conn = get_connection()
+    try:
+        row = conn.execute(f"""
+            SELECT COALESCE(SUM(log_count), 0),
+                   COALESCE(SUM(plan_qty), 0),
+                   COALESCE(SUM(prod_qty), 0),
+                   COALESCE(SUM(defect_qty), 0),
+                   COALESCE(SUM(achievement_sum), 0)
+            FROM work_log_daily_summary
+            WHERE {where}
+        """, params).fetchone()
+    finally:
+        conn.close()
+
+    work_count, plan_qty, prod_qty, defect_qty, achievement_sum = row
+    return {
+        'work_count': work_count,
+        'plan_qty': plan_qty,
+        'prod_qty': prod_qty,
+        'defect_qty': defect_qty,
+        'avg_achievement': achievement_sum / work_count if work_count else 0
+    }
+
+
+def get_daily_summary(start_date, end_date, process=None):
+    """일별 집계 (work_date, total_plan, total_prod, total_defect, avg_achievement)"""
+    where, params = _summary_filter(start_date, end_date, process)
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(f"""
+            SELECT work_date,
+                   SUM(plan_qty) as total_plan,
+                   SUM(prod_qty) as total_prod,
+                   SUM(defect_qty) as total_defect,
+                   SUM(achievement_sum) / NULLIF(SUM(achievement_count), 0) as avg_achievement
+            FROM work_log_daily_summary
+            WHERE {where}
+            GROUP BY work_date
+            ORDER BY work_date
+        """, conn, params=params)
+    finally:
+        conn.close()
+
+
+def get_process_summary(start_date, end_date, process=None):
+    """공정별 집계 (process, total_prod, total_defect)"""
+    where, params = _summary_filter(start_date, end_date, process)
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(f"""
+            SELECT process,
+                   SUM(prod_qty) as total_prod,
+                   SUM(defect_qty) as total_defect
+            FROM work_log_daily_summary
+            WHERE {where}
+            GROUP BY process
+            ORDER BY process
+        """, conn, params=params)
+    finally:
+        conn.close()
+
+
+def get_worker_summary(start_date, end_date):
+    """작업자별 집계 (username, work_count, total_prod, avg_achievement)"""
+    conn = get_connection()
+    try:
+        return pd.read_sql_query("""
+            SELECT u.username,
+                   SUM(s.log_count) as work_count,
+                   SUM(s.prod_qty) as total_prod,
+                   SUM(s.achievement_sum) / NULLIF(SUM(s.achievement_count), 0) as avg_achievement
+            FROM work_log_daily_summary s
+            JOIN users u ON s.worker_id = u.id
+            WHERE s.work_date BETWEEN ? AND ?
+            GROUP BY u.username
+            ORDER BY total_prod DESC
+        """, conn, params=[start_date, end_date])
+    finally:
+        conn.close()
+
+
+def get_hourly_summary(start_hour, end_hour, process=None):
+    """시간대별 집계 (hour_start, work_count, total_plan, total_prod, total_defect)
+
+    start_hour / end_hour 는 현지 시각 'YYYY-MM-DD HH:00' 문자열 (양끝 포함)
+    """
+    where, params = "hour_start BETWEEN ? AND ?", [start_hour, end_hour]
+    if process and process != 'all':
+        where += " AND process = ?"
+        params.append(process)
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(f"""
+            SELECT hour_start,
+                   SUM(log_count) as work_count,
+                   SUM(plan_qty) as total_plan,
+                   SUM(prod_qty) as total_prod,
+                   SUM(defect_qty) as total_defect
+            FROM work_log_hourly_summary
+            WHERE {where}
+            GROUP BY hour_start
+            ORDER BY hour_start
+        """, conn, params=params)
+    finally:
+        conn.close()
+
+
+def rebuild_summary():
+    """집계 테이블(일별/시간대별/교대별) 전체 재생성 (트리거 도입 전 데이터 복구용)
+
+    반환값은 일별 집계 행 수
+    """
+    with transaction(immediate=True) as conn:
+        conn.execute("DELETE FROM work_log_daily_summary")
+        conn.execute(_SUMMARY_COLUMNS + _SUMMARY_SELECT.format(where="1"))
+        conn.execute("DELETE FROM work_log_hourly_summary")
+        conn.execute(_HOURLY_INSERT.format(where="1"))
+        conn.execute("DELETE FROM oee_shift_summary")
+        conn.execute(_SHIFT_INSERT.format(where="1"))
+        conn.execute("""
+            INSERT INTO oee_shift_summary
+                (work_date, shift, line_code, process, downtime_min, planned_stop_min)
+            SELECT event_date, shift, line_code, process,
+                   SUM(CASE WHEN planned THEN 0 ELSE duration_min END),
+                   SUM(CASE WHEN planned THEN duration_min ELSE 0 END)
+            FROM downtime_events
+            WHERE 1  -- INSERT ... SELECT ... ON CONFLICT 구문 해석용
+            GROUP BY 1, 2, 3, 4
+            ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+                downtime_min = excluded.downtime_min,
+                planned_stop_min = excluded.planned_stop_min
+        """)
+        return conn.execute("SELECT COUNT(*) FROM work_log_daily_summary").fetchone()[0]
+
+
+@contextmanager
+def bulk_load(conn):
+    """일괄 등록 구간 (호출자의 쓰기 트랜잭션 안에서 사용)
+
+    구간 안의 work_logs INSERT 는 행 단위 집계 트리거를 건너뛰고, 구간이
+    끝나면 새로 등록된 id 범위를 집계 테이블(일별/시간대별/교대별)마다 한 번의
+    GROUP BY 로 더한다.
+    """
+    first_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM work_logs").fetchone()[0]
+    conn.execute("INSERT INTO work_log_bulk_load (started_id) VALUES (?)", (first_id,))
+    try:
+        yield first_id
+    finally:
+        conn.execute(_SUMMARY_COLUMNS + _SUMMARY_SELECT.format(where="id >= ?") + """
+            ON CONFLICT (work_date, process, worker_id) DO UPDATE SET
+                log_count = log_count + excluded.log_count,
+                plan_qty = plan_qty + excluded.plan_qty,
+                prod_qty = prod_qty + excluded.prod_qty,
+                defect_qty = defect_qty + excluded.defect_qty,
+                achievement_sum = achievement_sum + excluded.achievement_sum,
+                achievement_count = achievement_count + excluded.achievement_count,
+                achieved_count = achieved_count + excluded.achieved_count
+        """, (first_id,))
+        conn.execute(_HOURLY_INSERT.format(where="id >= ?") + """
+            ON CONFLICT (hour_start, process) DO UPDATE SET
+                log_count = log_count + excluded.log_count,
+                plan_qty = plan_qty + excluded.plan_qty,
+                prod_qty = prod_qty + excluded.prod_qty,
+                defect_qty = defect_qty + excluded.defect_qty
+        """, (first_id,))
+        conn.execute(_SHIFT_INSERT.format(where="id >= ?") + """
+            ON CONFLICT (work_date, shift, line_code, process) DO UPDATE SET
+                log_count = log_count + excluded.log_count,
+                prod_qty = prod_qty + excluded.prod_qty,
+                defect_qty = defect_qty + excluded.defect_qty
+        """, (first_id,))
+        conn.execute("DELETE FROM work_log_bulk_load")
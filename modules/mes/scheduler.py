@@ -0,0 +1,512 @@
+# modules/mes/scheduler.py - 작업지시 유한 능력 일정 계획
+#
+# 자원(resources)은 공정별 설비이며 capacity 대수만큼 동시에 작업한다. 작업지시의
+# 공정 작업은 라우팅 순서대로만 진행되고, 같은 공정의 자원 중 하나에 배정된다
+# (core/migrations/0012).
+#
+#   1. 우선순위 디스패치: 자원이 비면 대기 중인 작업 중 순위가 가장 높은 작업을
+#      바로 시작한다 (비지연 디스패치, 이벤트 힙으로 O(작업 수 log 작업 수)).
+#      초기 순위는 납기순(EDD)과 최소 여유순 중 지연이 적은 쪽.
+#   2. 로컬 탐색: 지연된 작업지시를 순위 앞쪽으로 옮겨 보고 가중 지연 합계
+#      (같으면 완료 시각)가 줄면 채택한다. time_limit 초 안에서 반복한다.
+#   3. 부분 재계획: 작업 실적이 들어와 공정 진행 수량이 바뀌면 (부족분 포함)
+#      현재 계획 순서를 유지한 채 시작 전 작업과 부족분만 다시 배정한다.
+#
+# 이미 시작된 작업(계획 시작 <= 기준 시각 < 계획 종료, 실적 없음)은 그대로 두고
+# 해당 자원은 계획 종료까지 사용 중으로 본다. 작업 실적은 작업지시 LOT 번호와
+# 공정으로 연결하므로 한 라우팅에 같은 공정은 한 번만 둔다.
+
+import heapq
+import time
+import threading
+import logging
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from core.database import get_connection, get_db_path, transaction
+from core.events import broker, publish
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ('released', 'in_progress')
+
+# 로컬 탐색 시간 (초)
+DEFAULT_TIME_LIMIT = 0.5
+
+# 'mes' 이벤트를 모아 실적을 반영하는 간격 (초)
+SYNC_DEBOUNCE = 0.5
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def priority_weight(priority):
+    """우선순위(1 = 가장 높음 ~ 9) -> 지연 가중치"""
+    return max(10 - int(priority), 1)
+
+
+class Job:
+    """일정 계획 단위 작업지시 (시각은 기준 시각부터의 분)"""
+
+    __slots__ = ('order_no', 'release', 'due', 'weight', 'ops')
+
+    def __init__(self, order_no, release, due, weight, ops):
+        self.order_no = order_no
+        self.release = release
+        self.due = due
+        self.weight = weight
+        # [(seq, process, 표준 작업 시간(분))]
+        self.ops = ops
+
+
+# ---- 디스패치 / 로컬 탐색 ----
+
+def dispatch(jobs, units, rank, unit_free=None):
+    """순위(rank[job index], 작을수록 먼저)로 비지연 디스패치
+
+    units: [(resource_code, process, efficiency)] - capacity 만큼 펼친 자원 대수
+    unit_free: 대수별 사용 가능 시각 (이미 시작된 작업)
+    Returns:
+        (plan [(job, op index, unit, start, end)], 가중 지연 합계, 완료 시각 목록)
+    """
+    idle = {process: [] for _, process, _ in units}
+    queues = {process: [] for process in idle}
+
+    # 이벤트: (시각, 종류 0=자원 반납 1=작업 준비, 자원 또는 (job, op))
+    events = [(unit_free[u] if unit_free else 0.0, 0, u) for u in range(len(units))]
+    events += [(job.release, 1, (j, 0)) for j, job in enumerate(jobs) if job.ops]
+    heapq.heapify(events)
+
+    plan = []
+    completion = [job.release for job in jobs]
+    while events:
+        now = events[0][0]
+        touched = set()
+        while events and events[0][0] == now:
+            _, kind, item = heapq.heappop(events)
+            if kind == 0:
+                _, process, efficiency = units[item]
+                heapq.heappush(idle[process], (-efficiency, item))
+                touched.add(process)
+            else:
+                j, k = item
+                process = jobs[j].ops[k][1]
+                if process not in queues:
+                    raise ValueError(f"자원이 없는 공정: {process}")
+                heapq.heappush(queues[process], (rank[j], j, k))
+                touched.add(process)
+
+        for process in touched:
+            waiting, free = queues[process], idle[process]
+            while waiting and free:
+                _, j, k = heapq.heappop(waiting)
+                neg_efficiency, u = heapq.heappop(free)
+                end = now + jobs[j].ops[k][2] / -neg_efficiency
+                plan.append((j, k, u, now, end))
+                heapq.heappush(events, (end, 0, u))
+                if k + 1 < len(jobs[j].ops):
+                    heapq.heappush(events, (end, 1, (j, k + 1)))
+                else:
+                    completion[j] = end
+
+    tardiness = sum(job.weight * max(completion[j] - job.due, 0.0) for j, job in enumerate(jobs))
+    return plan, tardiness, completion
+
+
+def _evaluate(jobs, units, sequence, unit_free):
+    rank = [0] * len(jobs)
+    for position, j in enumerate(sequence):
+        rank[j] = position
+    plan, tardiness, completion = dispatch(jobs, units, rank, unit_free)
+    return (tardiness, max(completion, default=0.0)), plan, completion
+
+
+def initial_sequence(jobs):
+    """초기 순위 후보 - 납기순(EDD), 최소 여유순 (납기 - 남은 작업 시간)"""
+    edd = sorted(range(len(jobs)), key=lambda j: (jobs[j].due, -jobs[j].weight))
+    slack = sorted(range(len(jobs)),
+                   key=lambda j: (jobs[j].due - sum(op[2] for op in jobs[j].ops), -jobs[j].weight))
+    return [edd, slack]
+
+
+def improve(jobs, units, sequence, unit_free=None, time_limit=DEFAULT_TIME_LIMIT):
+    """지연 작업지시를 앞으로 옮기는 로컬 탐색
+
+    Returns: (sequence, (가중 지연 합계, 완료 시각), plan, 평가 횟수)
+    """
+    best, plan, completion = _evaluate(jobs, units, sequence, unit_free)
+    deadline = time.perf_counter() + time_limit
+    evaluations = 1
+
+    improved = True
+    while improved and best[0] > 0 and time.perf_counter() < deadline:
+        improved = False
+        lateness = [(jobs[j].weight * (completion[j] - jobs[j].due), j) for j in range(len(jobs))]
+        tardy = [j for late, j in sorted(lateness, reverse=True) if late > 0]
+        position = {j: p for p, j in enumerate(sequence)}
+        for j in tardy:
+            pos = position[j]
+            step = 1
+            while step <= pos and time.perf_counter() < deadline:
+                candidate = sequence[:pos - step] + [j] + sequence[pos - step:pos] + sequence[pos + 1:]
+                score, candidate_plan, candidate_completion = _evaluate(jobs, units, candidate, unit_free)
+                evaluations += 1
+                if score < best:
+                    sequence, best, plan, completion = candidate, score, candidate_plan, candidate_completion
+                    improved = True
+                    break
+                step *= 2
+            if improved or time.perf_counter() >= deadline:
+                break
+    return sequence, best, plan, evaluations
+
+
+# ---- 기준 정보 / 작업지시 ----
+
+def set_resource(resource_code, process, capacity=1, efficiency=1.0, resource_name=None,
+                 line_code=None, is_active=True):
+    """설비 자원 등록/수정"""
+    with transaction() as conn:
+        conn.execute("""
+            INSERT INTO resources
+            (resource_code, resource_name, process, line_code, capacity, efficiency, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (resource_code) DO UPDATE SET
+                resource_name = excluded.resource_name,
+                process = excluded.process,
+                line_code = excluded.line_code,
+                capacity = excluded.capacity,
+                efficiency = excluded.efficiency,
+                is_active = excluded.is_active
+        """, (resource_code, resource_name, process, line_code, capacity, efficiency,
+              1 if is_active else 0))
+
+
+def set_routing(product_code, steps):
+    """품목 라우팅 교체 - steps: [(process, setup_min, run_min), ...] 순서대로"""
+    processes = [step[0] for step in steps]
+    if len(set(processes)) != len(processes):
+        raise ValueError("한 라우팅에 같은 공정은 한 번만 둘 수 있습니다.")
+    with transaction() as conn:
+        conn.execute("DELETE FROM routings WHERE product_code = ?", (product_code,))
+        conn.executemany("""
+            INSERT INTO routings (product_code, seq, process, setup_min, run_min)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(product_code, (i + 1) * 10, process, setup, run)
+              for i, (process, setup, run) in enumerate(steps)])
+
+
+def create_work_order(conn, order_no, product_code, quantity, due_date, priority=5,
+                      release_date=None, lot_number=None, sales_order_number=None):
+    """작업지시 등록 및 라우팅 공정 작업 생성 (호출자 트랜잭션 안에서 사용)"""
+    routing = conn.execute("""
+        SELECT seq, process, setup_min, run_min FROM routings
+        WHERE product_code = ? ORDER BY seq
+    """, (product_code,)).fetchall()
+    if not routing:
+        raise ValueError(f"라우팅이 없는 품목: {product_code}")
+    if quantity is None or quantity <= 0:
+        raise ValueError("quantity must be positive")
+    if len(str(due_date)) == 10:
+        # 납기일만 주면 그날 끝까지
+        due_date = f"{due_date} 23:59:59"
+
+    conn.execute("""
+        INSERT INTO work_orders
+        (order_no, product_code, quantity, due_date, release_date, priority, lot_number, sales_order_number)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, (order_no, product_code, quantity, due_date, release_date, priority,
+          lot_number or order_no, sales_order_number))
+    conn.executemany("""
+        INSERT INTO work_order_operations (order_no, seq, process, quantity, setup_min, run_min)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [(order_no, seq, process, quantity, setup, run) for seq, process, setup, run in routing])
+    return len(routing)
+
+
+# ---- 일정 계획 ----
+
+def _minutes(value, origin):
+    if value is None:
+        return 0.0
+    return (datetime.fromisoformat(str(value)) - origin).total_seconds() / 60
+
+
+def _load(conn, origin):
+    """미완료 작업 -> (jobs, units, 대수별 사용 가능 시각, 현재 계획 시작, 현재 배정)"""
+    units, unit_index = [], {}
+    for code, process, capacity, efficiency in conn.execute("""
+        SELECT resource_code, process, capacity, efficiency
+        FROM resources WHERE is_active = 1 ORDER BY resource_code
+    """):
+        unit_index[code] = []
+        for _ in range(capacity):
+            unit_index[code].append(len(units))
+            units.append((code, process, efficiency))
+    unit_free = [0.0] * len(units)
+
+    rows = conn.execute(f"""
+        SELECT o.order_no, o.due_date, o.release_date, o.priority,
+               op.seq, op.process, op.quantity, op.completed_qty, op.setup_min, op.run_min,
+               op.resource_code, op.start_time, op.end_time, op.status
+        FROM work_orders o
+        JOIN work_order_operations op ON op.order_no = o.order_no
+        WHERE o.status IN ({', '.join('?' * len(OPEN_STATUSES))}) AND op.status != 'completed'
+        ORDER BY o.order_no, op.seq
+    """, OPEN_STATUSES).fetchall()
+
+    jobs, planned_start, current = [], [], {}
+    origin_text = origin.strftime(TIME_FORMAT)
+    for row in rows:
+        (order_no, due, release, priority, seq, process, qty, done, setup, run,
+         resource, start, end, status) = row
+        if not jobs or jobs[-1].order_no != order_no:
+            jobs.append(Job(order_no, max(_minutes(release, origin), 0.0), _minutes(due, origin),
+                            priority_weight(priority), []))
+            planned_start.append(start or '9999')
+        job = jobs[-1]
+        current[(order_no, seq)] = (resource, start, end)
+
+        # 시작된 작업은 고정 - 자원은 계획 종료까지 사용 중, 다음 공정은 그 뒤에 준비
+        if (status == 'open' and start and end and start <= origin_text < end
+                and not job.ops and resource in unit_index):
+            busy_until = _minutes(end, origin)
+            free_units = unit_index[resource]
+            u = min(free_units, key=lambda i: unit_free[i])
+            unit_free[u] = max(unit_free[u], busy_until)
+            job.release = max(job.release, busy_until)
+            continue
+
+        remaining = qty - done
+        duration = (setup if done == 0 else 0.0) + run * remaining
+        job.ops.append((seq, process, duration))
+
+    return jobs, units, unit_free, planned_start, current
+
+
+def _save(conn, jobs, units, plan, origin, current):
+    """바뀐 배정만 저장 - 저장한 공정 작업 수 반환"""
+    rows = []
+    for j, k, u, start, end in plan:
+        job = jobs[j]
+        seq = job.ops[k][0]
+        assigned = (units[u][0],
+                    (origin + timedelta(minutes=start)).strftime(TIME_FORMAT),
+                    (origin + timedelta(minutes=end)).strftime(TIME_FORMAT))
+        if current.get((job.order_no, seq)) != assigned:
+            rows.append(assigned + (job.order_no, seq))
+    conn.executemany("""
+        UPDATE work_order_operations
+        SET resource_code = ?, start_time = ?, end_time = ?
+        WHERE order_no = ? AND seq = ?
+    """, rows)
+    return len(rows)
+
+
+def schedule_orders(start=None, time_limit=DEFAULT_TIME_LIMIT, keep_sequence=False):
+    """미완료 작업지시 일정 계획 후 저장
+
+    keep_sequence=True 이면 현재 계획 순서(공정 작업 계획 시작순)를 유지하고
+    로컬 탐색 없이 다시 배정한다 (부분 재계획).
+
+    Returns:
+        {'orders', 'operations', 'changed_operations', 'tardy_orders', 'weighted_tardiness',
+         'makespan_end', 'evaluations', 'elapsed_ms'}
+    """
+    started = time.perf_counter()
+    origin = (start or datetime.now()).replace(second=0, microsecond=0)
+
+    with transaction(immediate=True) as conn:
+        jobs, units, unit_free, planned_start, current = _load(conn, origin)
+        if keep_sequence:
+            sequence = sorted(range(len(jobs)), key=lambda j: (planned_start[j], jobs[j].due))
+            (tardiness, makespan), plan, _ = _evaluate(jobs, units, sequence, unit_free)
+            evaluations = 1
+        else:
+            candidates = [(_evaluate(jobs, units, s, unit_free)[0], s) for s in initial_sequence(jobs)]
+            sequence = min(candidates)[1] if jobs else []
+            sequence, (tardiness, makespan), plan, evaluations = improve(
+                jobs, units, sequence, unit_free, time_limit)
+            evaluations += len(candidates)
+        changed = _save(conn, jobs, units, plan, origin, current)
+
+    completion = {}
+    for j, k, u, s, end in plan:
+        completion[j] = max(completion.get(j, end), end)
+    tardy = sum(1 for j, job in enumerate(jobs) if completion.get(j, job.release) > job.due + 1e-9)
+
+    publish('mes')
+    return {
+        'orders': len(jobs),
+        'operations': len(plan),
+        'changed_operations': changed,
+        'tardy_orders': tardy,
+        'weighted_tardiness': round(tardiness, 1),
+        'makespan_end': (origin + timedelta(minutes=makespan)).strftime(TIME_FORMAT),
+        'evaluations': evaluations,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def reschedule(now=None):
+    """부분 재계획 (현재 순서 유지)"""
+    return schedule_orders(now, keep_sequence=True)
+
+
+# ---- 실적 반영 ----
+
+def sync_progress(now=None):
+    """작업 실적(work_logs) 합계로 공정 진행 수량 갱신 - 바뀌면 부분 재계획
+
+    양품(생산 - 불량)이 수량에 못 미치는 공정은 short 로 표시하고 남은
+    수량만 다시 배정한다. 갱신된 공정 작업 수를 반환한다.
+    """
+    with transaction(immediate=True) as conn:
+        rows = conn.execute(f"""
+            SELECT op.order_no, op.seq, op.quantity, op.completed_qty,
+                   COALESCE(SUM(w.prod_qty - COALESCE(w.defect_qty, 0)), 0), COUNT(w.id)
+            FROM work_orders o
+            JOIN work_order_operations op ON op.order_no = o.order_no
+            LEFT JOIN work_logs w ON w.lot_number = o.lot_number AND w.process = op.process
+            WHERE o.status IN ({', '.join('?' * len(OPEN_STATUSES))})
+            GROUP BY op.order_no, op.seq
+        """, OPEN_STATUSES).fetchall()
+
+        changed = []
+        for order_no, seq, qty, done, good, logs in rows:
+            good = max(int(good), 0)
+            if good == done:
+                continue
+            status = 'completed' if good >= qty else ('short' if logs else 'open')
+            changed.append((min(good, qty), status, order_no, seq))
+        if not changed:
+            return 0
+
+        conn.executemany("""
+            UPDATE work_order_operations SET completed_qty = ?, status = ?
+            WHERE order_no = ? AND seq = ?
+        """, changed)
+        conn.executemany("""
+            UPDATE work_orders SET status = CASE
+                WHEN NOT EXISTS (SELECT 1 FROM work_order_operations
+                                 WHERE order_no = ? AND status != 'completed') THEN 'completed'
+                ELSE 'in_progress' END
+            WHERE order_no = ?
+        """, sorted({(order_no, order_no) for _, _, order_no, _ in changed}))
+
+    reschedule(now)
+    return len(changed)
+
+
+class ProgressSync:
+    """작업 실적 반영 백그라운드 작업자
+
+    'mes' 이벤트는 쓰기 버퍼/수집/텔레메트리 스레드에서도 발행되므로 발행한
+    스레드에서 바로 반영하지 않고 단일 스레드에 넘긴다. 이벤트가 몰리면
+    debounce 초 동안 모아 한 번만 확인하고, 마지막 확인 이후 들어온 실적
+    (work_logs.id 기준) 중 진행 중인 작업지시 LOT 가 없으면 건너뛴다.
+    """
+
+    def __init__(self, debounce=SYNC_DEBOUNCE):
+        self.debounce = debounce
+        self.stats = {'checks': 0, 'syncs': 0}
+        self._checked = {}          # {데이터베이스 경로: 마지막으로 확인한 work_logs.id}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def on_event(self, event):
+        """이벤트 수신자 - 'mes' 변경이면 확인 요청만 남김"""
+        if 'mes' in event['topics']:
+            self._wake.set()
+
+    def check(self, now=None):
+        """새 실적이 진행 중인 작업지시 LOT 이면 sync_progress - 갱신된 공정 작업 수"""
+        path = get_db_path()
+        since = self._checked.get(path)
+        conn = get_connection()
+        try:
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM work_logs").fetchone()[0]
+            # 처음 확인할 때는 이전 실적을 알 수 없으므로 전체 반영
+            relevant = since is None or (last_id > since and conn.execute(f"""
+                SELECT 1 FROM work_logs w
+                JOIN work_orders o ON o.lot_number = w.lot_number
+                WHERE w.id > ? AND w.id <= ? AND o.status IN ({', '.join('?' * len(OPEN_STATUSES))})
+                LIMIT 1
+            """, (since, last_id) + OPEN_STATUSES).fetchone() is not None)
+        finally:
+            conn.close()
+
+        self.stats['checks'] += 1
+        changed = 0
+        if relevant:
+            self.stats['syncs'] += 1
+            changed = sync_progress(now)
+        self._checked[path] = last_id
+        return changed
+
+    def start(self):
+        """백그라운드 스레드 시작"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='mes-progress-sync', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """백그라운드 스레드 종료"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait()
+            # 연달아 오는 이벤트를 모아 한 번만 확인
+            self._stop.wait(self.debounce)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"작업 실적 반영 오류: {e}")
+
+
+# 프로세스 공용 작업자 - 앱 시작 시 progress_sync.start()
+progress_sync = ProgressSync()
+broker.add_listener(progress_sync.on_event)
+
+
+# ---- 조회 ----
+
+def get_gantt(start=None, end=None, resource_code=None):
+    """계획된 공정 작업 (Gantt 차트용)"""
+    where, params = ["op.start_time IS NOT NULL", "o.status IN ('released', 'in_progress')"], []
+    if start:
+        where.append("op.end_time >= ?")
+        params.append(start)
+    if end:
+        where.append("op.start_time <= ?")
+        params.append(end)
+    if resource_code:
+        where.append("op.resource_code = ?")
+        params.append(resource_code)
+
+    conn = get_connection()
+    try:
+        return pd.read_sql_query(f"""
+            SELECT op.order_no, op.seq, op.process, op.resource_code, op.start_time, op.end_time,
+                   op.quantity, op.completed_qty, op.status, o.product_code, o.due_date, o.priority,
+                   CASE WHEN op.end_time > o.due_date THEN 1 ELSE 0 END as late
+            FROM work_order_operations op
+            JOIN work_orders o ON o.order_no = op.order_no
+            WHERE {' AND '.join(where)}
+            ORDER BY op.resource_code, op.start_time
+        """, conn, params=params)
+    finally:
+        conn.close()
@@ -0,0 +1,320 @@
+# modules/mes/telemetry.py - 설비 텔레메트리 시계열 저장소
+#
+# 설비 계수기/센서 값은 초당 수천~수만 포인트로 들어오므로 포인트마다
+# 행을 쓰지 않는다 (core/migrations/0011).
+#   1. 수집: 태그별 메모리 버퍼(시각/값 목록)에 추가
+#   2. 플러시: 태그별로 정렬한 배열을 한 블록(zlib 압축)으로 저장하고,
+#      같은 트랜잭션에서 NumPy 로 계산한 1분/1시간 집계를 갱신
+#   3. MES 반영: 완료된 1분 버킷의 계수기 증가량을 태그(라인/공정)당 한 건의
+#      work_logs 로 등록 -> 일별/시간별/OEE 집계 트리거가 그대로 반영
+#
+# 계수기 증가량은 직전 값과의 차이로 계산하며, 값이 줄면 설비 계수기가
+# 리셋된 것으로 보고 리셋 후 값을 증가량으로 쓴다. 같은 태그의 포인트는
+# 시각 순서로 들어온다고 가정한다 (한 플러시 안에서는 정렬한다).
+
+import time
+import zlib
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from core.database import get_connection, transaction
+from core.events import publish
+from modules.mes.oee import shift_of
+
+TAG_KINDS = ('counter', 'gauge')
+
+# 다운샘플 단위 (초)
+RESOLUTIONS = (60, 3600)
+
+# 한 블록의 최대 포인트 수
+MAX_CHUNK_POINTS = 4096
+
+# 버킷이 끝나고 이 시간(초)이 지나야 MES 에 반영 (늦게 도착한 포인트 대기)
+FEED_LAG = 60
+
+_ROLLUP_UPSERT = """
+    INSERT INTO telemetry_rollups
+    (tag, resolution, bucket, point_count, sum_value, min_value, max_value, last_value, delta)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (tag, resolution, bucket) DO UPDATE SET
+        point_count = point_count + excluded.point_count,
+        sum_value = sum_value + excluded.sum_value,
+        min_value = MIN(min_value, excluded.min_value),
+        max_value = MAX(max_value, excluded.max_value),
+        last_value = excluded.last_value,
+        delta = delta + excluded.delta
+"""
+
+
+def register_tag(tag, kind='gauge', line_code=None, process=None, unit=None, description=None):
+    """태그 등록/수정 (계수기를 MES 에 반영하려면 process 필요)"""
+    if kind not in TAG_KINDS:
+        raise ValueError(f"Unknown tag kind: {kind}")
+    with transaction() as conn:
+        conn.execute("""
+            INSERT INTO telemetry_tags (tag, kind, line_code, process, unit, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (tag) DO UPDATE SET
+                kind = excluded.kind,
+                line_code = excluded.line_code,
+                process = excluded.process,
+                unit = excluded.unit,
+                description = excluded.description
+        """, (tag, kind, line_code, process, unit, description))
+
+
+# ---- 블록 인코딩 ----
+
+def encode_chunk(ts, values):
+    """시각(초)/값 배열 -> (ts, vals) BLOB"""
+    ms = np.round(np.asarray(ts, dtype=float) * 1000).astype(np.int64)
+    steps = np.diff(ms, prepend=0)
+    return (zlib.compress(steps.tobytes(), 1),
+            zlib.compress(np.asarray(values, dtype=np.float64).tobytes(), 1))
+
+
+def decode_chunk(ts_blob, vals_blob):
+    """(ts, vals) BLOB -> 시각(초)/값 배열"""
+    ms = np.cumsum(np.frombuffer(zlib.decompress(ts_blob), dtype=np.int64))
+    return ms / 1000.0, np.frombuffer(zlib.decompress(vals_blob), dtype=np.float64)
+
+
+def counter_deltas(values, previous=None):
+    """계수기 값 -> 포인트별 증가량 (감소는 리셋으로 보고 리셋 후 값)"""
+    before = np.empty_like(values)
+    before[0] = values[0] if previous is None else previous
+    before[1:] = values[:-1]
+    steps = values - before
+    return np.where(steps >= 0, steps, values)
+
+
+def bucket_rows(ts, values, deltas, resolution):
+    """정렬된 배열 -> 버킷별 [(bucket, count, sum, min, max, last, delta)]"""
+    keys = (ts // resolution).astype(np.int64) * resolution
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)]
+    return list(zip(
+        keys[starts].tolist(),
+        (ends - starts).tolist(),
+        np.add.reduceat(values, starts).tolist(),
+        np.minimum.reduceat(values, starts).tolist(),
+        np.maximum.reduceat(values, starts).tolist(),
+        values[ends - 1].tolist(),
+        np.add.reduceat(deltas, starts).tolist(),
+    ))
+
+
+# ---- 수집 / 플러시 ----
+
+class TelemetryStore:
+    """태그별 메모리 버퍼 + 블록/집계 플러시"""
+
+    def __init__(self, max_chunk_points=MAX_CHUNK_POINTS):
+        self.max_chunk_points = max_chunk_points
+        self.stats = {'received': 0, 'rejected': 0, 'flushed': 0, 'chunks': 0}
+        self._buffers = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @property
+    def pending(self):
+        """플러시 대기 포인트 수"""
+        with self._lock:
+            return sum(len(ts) for ts, _ in self._buffers.values())
+
+    def append(self, tag, value, ts=None):
+        """포인트 한 건 추가"""
+        self.append_many([(tag, value, ts)])
+
+    def append_many(self, points):
+        """[(tag, value, ts)] 추가 (ts 가 None 이면 현재 시각)"""
+        now = time.time()
+        with self._lock:
+            for tag, value, ts in points:
+                buffer = self._buffers.get(tag)
+                if buffer is None:
+                    buffer = self._buffers[tag] = ([], [])
+                buffer[0].append(now if ts is None else ts)
+                buffer[1].append(value)
+            self.stats['received'] += len(points)
+
+    def ingest_lines(self, text):
+        """Graphite plaintext 형식 ``<tag> <value> [<unix 초>]`` 줄 단위 수집
+
+        해석할 수 없는 줄은 버리고 건수만 센다. 추가한 포인트 수 반환.
+        """
+        now = time.time()
+        parsed = {}
+        rejected = 0
+        for line in text.splitlines():
+            parts = line.split()
+            try:
+                if len(parts) == 3:
+                    ts = float(parts[2])
+                elif len(parts) == 2:
+                    ts = now
+                else:
+                    if parts:
+                        rejected += 1
+                    continue
+                value = float(parts[1])
+            except ValueError:
+                rejected += 1
+                continue
+            buffer = parsed.get(parts[0])
+            if buffer is None:
+                buffer = parsed[parts[0]] = ([], [])
+            buffer[0].append(ts)
+            buffer[1].append(value)
+
+        count = 0
+        with self._lock:
+            for tag, (ts, values) in parsed.items():
+                buffer = self._buffers.get(tag)
+                if buffer is None:
+                    self._buffers[tag] = (ts, values)
+                else:
+                    buffer[0].extend(ts)
+                    buffer[1].extend(values)
+                count += len(ts)
+            self.stats['received'] += count
+            self.stats['rejected'] += rejected
+        return count
+
+    def flush(self):
+        """버퍼를 블록/집계로 저장 - 저장한 포인트 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                buffers, self._buffers = self._buffers, {}
+            if not buffers:
+                return 0
+
+            chunks, rollups, counters = [], [], []
+            with transaction(immediate=True) as conn:
+                conn.executemany("INSERT OR IGNORE INTO telemetry_tags (tag) VALUES (?)",
+                                 [(tag,) for tag in buffers])
+                state = {tag: (kind, last) for tag, kind, last in conn.execute(
+                    "SELECT tag, kind, last_value FROM telemetry_tags"
+                )}
+
+                for tag, (ts, values) in buffers.items():
+                    ts = np.asarray(ts, dtype=float)
+                    values = np.asarray(values, dtype=float)
+                    if np.any(ts[1:] < ts[:-1]):
+                        order = np.argsort(ts, kind='stable')
+                        ts, values = ts[order], values[order]
+
+                    kind, last = state[tag]
+                    if kind == 'counter':
+                        deltas = counter_deltas(values, last)
+                        counters.append((float(values[-1]), float(ts[-1]), tag))
+                    else:
+                        deltas = np.zeros_like(values)
+
+                    for start in range(0, len(ts), self.max_chunk_points):
+                        part = slice(start, start + self.max_chunk_points)
+                        chunks.append((tag, float(ts[part][0]), float(ts[part][-1]),
+                                       len(ts[part])) + encode_chunk(ts[part], values[part]))
+                    for resolution in RESOLUTIONS:
+                        rollups.extend((tag, resolution) + row
+                                       for row in bucket_rows(ts, values, deltas, resolution))
+
+                conn.executemany("""
+                    INSERT INTO telemetry_chunks (tag, start_ts, end_ts, point_count, ts, vals)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, chunks)
+                conn.executemany(_ROLLUP_UPSERT, rollups)
+                conn.executemany("UPDATE telemetry_tags SET last_value = ?, last_ts = ? WHERE tag = ?",
+                                 counters)
+
+            flushed = sum(len(ts) for ts, _ in buffers.values())
+            self.stats['flushed'] += flushed
+            self.stats['chunks'] += len(chunks)
+            return flushed
+
+
+# ---- MES 반영 ----
+
+def feed_production(until=None):
+    """완료된 1분 버킷의 계수기 증가량을 work_logs 로 등록 - 등록 건수 반환
+
+    태그 × 작업일 × 교대마다 한 건 (계획 수량 없음). 반영 위치는 태그별
+    fed_until 에 기록되어 같은 버킷은 한 번만 반영된다.
+    """
+    until = int((until if until is not None else time.time() - FEED_LAG) // 60 * 60)
+    with transaction(immediate=True) as conn:
+        rows = conn.execute("""
+            SELECT t.tag, t.line_code, t.process, r.bucket, r.delta
+            FROM telemetry_tags t
+            JOIN telemetry_rollups r
+              ON r.tag = t.tag AND r.resolution = 60
+             AND r.bucket >= t.fed_until AND r.bucket < ?
+            WHERE t.kind = 'counter' AND t.process IS NOT NULL
+            ORDER BY t.tag, r.bucket
+        """, (until,)).fetchall()
+
+        groups = {}
+        for tag, line_code, process, bucket, delta in rows:
+            started = datetime.fromtimestamp(bucket)
+            key = (tag, started.strftime('%Y-%m-%d'), shift_of(started.hour))
+            if key not in groups:
+                groups[key] = [f"TLM-{tag}-{started:%Y%m%d%H%M}", process, line_code, 0.0]
+            groups[key][3] += delta
+
+        records = [(lot, work_date, process, int(round(qty)), line_code, shift)
+                   for (tag, work_date, shift), (lot, process, line_code, qty) in groups.items()
+                   if round(qty) > 0]
+        conn.executemany("""
+            INSERT INTO work_logs (lot_number, work_date, process, prod_qty, defect_qty, line_code, shift)
+            VALUES (?, ?, ?, ?, 0, ?, ?)
+        """, records)
+        conn.execute("""
+            UPDATE telemetry_tags SET fed_until = ?
+            WHERE kind = 'counter' AND process IS NOT NULL AND fed_until < ?
+        """, (until, until))
+
+    if records:
+        publish('mes')
+    return len(records)
+
+
+# ---- 조회 ----
+
+def get_series(tag, start_ts, end_ts, resolution=None):
+    """시계열 조회 (unix 초 구간)
+
+    resolution 이 없으면 원본 포인트 (ts, value), 60/3600 이면 버킷별
+    (ts, count, avg, min, max, last, delta).
+    """
+    conn = get_connection()
+    try:
+        if resolution:
+            if resolution not in RESOLUTIONS:
+                raise ValueError(f"resolution must be one of {RESOLUTIONS}")
+            df = pd.read_sql_query("""
+                SELECT bucket as ts, point_count as count, sum_value / point_count as avg,
+                       min_value as min, max_value as max, last_value as last, delta
+                FROM telemetry_rollups
+                WHERE tag = ? AND resolution = ? AND bucket BETWEEN ? AND ?
+                ORDER BY bucket
+            """, conn, params=[tag, resolution, int(start_ts // resolution * resolution), end_ts])
+            return df
+
+        blocks = conn.execute("""
+            SELECT ts, vals FROM telemetry_chunks
+            WHERE tag = ? AND end_ts >= ? AND start_ts <= ?
+            ORDER BY start_ts
+        """, (tag, start_ts, end_ts)).fetchall()
+    finally:
+        conn.close()
+
+    if not blocks:
+        return pd.DataFrame({'ts': pd.Series(dtype=float), 'value': pd.Series(dtype=float)})
+    decoded = [decode_chunk(ts, vals) for ts, vals in blocks]
+    ts = np.concatenate([d[0] for d in decoded])
+    values = np.concatenate([d[1] for d in decoded])
+    mask = (ts >= start_ts) & (ts <= end_ts)
+    return pd.DataFrame({'ts': ts[mask], 'value': values[mask]})
@@ -11,8 +11,72 @@ import pandas as pd
 import json
 import logging
 
+from core.database import get_connection, run_write
+from core.events import publish
+from core.query_cache import cached_df
+from modules.inventory.stock import post_movement, DEFAULT_WAREHOUSE
+from .layouts import PO_LIST_GRID, SUPPLIER_LIST_GRID
+
 logger = logging.getLogger(__name__)
 
+# 진행중 발주 건수
+ACTIVE_PO_QUERY = """
+    SELECT COUNT(*)
+    FROM purchase_orders
+    WHERE status IN ('draft', 'pending', 'approved', 'receiving')
+"""
+
+# 입고 대기 건수
+PENDING_DELIVERY_QUERY = """
+    SELECT COUNT(*)
+    FROM receiving_schedule
+    WHERE status = 'pending'
+      AND scheduled_date >= date('now')
+"""
+
+# 검수 이력 (최근 10건)
+INSPECTION_HISTORY_QUERY = """
+    SELECT ri.receiving_date,
+           ri.po_number,
+           ri.item_code,
+           im.item_name,
+           ri.received_qty,
+           ri.accepted_qty,
+           ri.rejected_qty,
+           ri.inspection_result,
+           u.username as inspector
+    FROM receiving_inspection ri
+             JOIN item_master im ON ri.item_code = im.item_code
+             LEFT JOIN users u ON ri.inspector_id = u.id
+    ORDER BY ri.created_at DESC
+    LIMIT 10
+"""
+
+
+def po_list_scope(search_clicks, new_clicks, pushed, start_date, end_date, status, supplier):
+    """발주서 리스트 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where = ["po.po_date BETWEEN ? AND ?"]
+    params = [start_date, end_date]
+    if status != 'all':
+        where.append("po.status = ?")
+        params.append(status)
+    if supplier != 'all':
+        where.append("po.supplier_code = ?")
+        params.append(supplier)
+    return where, params
+
+
+def supplier_list_scope(filter_clicks, save_clicks, pushed, search_value, rating_filter):
+    """거래처 리스트 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where, params = [], []
+    if search_value:
+        where.append("(supplier_name LIKE ? OR business_no LIKE ?)")
+        params.extend([f"%{search_value}%", f"%{search_value}%"])
+    if rating_filter != 'all':
+        where.append("rating = ?")
+        params.append(rating_filter)
+    return where, params
+
 
 def register_purchase_callbacks(app):
     """구매관리 모듈 콜백 등록"""
@@ -47,29 +111,20 @@ def register_purchase_callbacks(app):
          Output('pending-delivery', 'children'),
          Output('urgent-po', 'children'),
          Output('monthly-purchase', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-purchase', 'data')
     )
     def update_po_summary(n):
         """발주 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
 
         try:
             # 진행중 발주
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM purchase_orders
-                WHERE status IN ('draft', 'pending', 'approved', 'receiving')
-            """)
+            cursor.execute(ACTIVE_PO_QUERY)
             active_po = cursor.fetchone()[0]
 
             # 입고 대기
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM receiving_schedule
-                WHERE status = 'pending'
-                  AND scheduled_date >= date('now')
-            """)
+            cursor.execute(PENDING_DELIVERY_QUERY)
             pending = cursor.fetchone()[0]
 
             # 긴급 발주 (안전재고 미만 품목)
@@ -101,164 +156,28 @@ def register_purchase_callbacks(app):
         finally:
             conn.close()
 
-    # 발주서 리스트 조회
-    @app.callback(
-        Output('po-list-table', 'children'),
-        [Input('search-po-btn', 'n_clicks'),
-         Input('new-po-btn', 'n_clicks')],
-        [State('po-start-date', 'value'),
-         State('po-end-date', 'value'),
-         State('po-status-filter', 'value'),
-         State('po-supplier-filter', 'value')]
+    # 발주서 리스트 그리드 (현재 페이지만 조회)
+    PO_LIST_GRID.register(
+        app,
+        inputs=[Input('search-po-btn', 'n_clicks'),
+                Input('new-po-btn', 'n_clicks'),
+                Input('refresh-purchase', 'data')],
+        states=[State('po-start-date', 'value'),
+                State('po-end-date', 'value'),
+                State('po-status-filter', 'value'),
+                State('po-supplier-filter', 'value')],
+        scope=po_list_scope
     )
-    def update_po_list(search_clicks, new_clicks, start_date, end_date, status, supplier):
-        """발주서 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-
-        query = """
-            SELECT po.po_number,
-                   po.po_date,
-                   s.supplier_name,
-                   po.total_amount,
-                   po.status,
-                   po.delivery_date,
-                   u.username as created_by
-            FROM purchase_orders po
-                     LEFT JOIN supplier_master s ON po.supplier_code = s.supplier_code
-                     LEFT JOIN users u ON po.created_by = u.id
-            WHERE po.po_date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
-
-        if status != 'all':
-            query += " AND po.status = ?"
-            params.append(status)
-
-        if supplier != 'all':
-            query += " AND po.supplier_code = ?"
-            params.append(supplier)
-
-        query += " ORDER BY po.po_date DESC, po.created_at DESC"
-
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-
-            if df.empty:
-                return html.Div("발주서가 없습니다.", className="text-center p-4")
-
-            # 상태 한글화 및 색상
-            status_mapping = {
-                'draft': ('작성중', 'secondary'),
-                'pending': ('승인대기', 'warning'),
-                'approved': ('승인완료', 'success'),
-                'receiving': ('입고중', 'info'),
-                'completed': ('완료', 'primary'),
-                'cancelled': ('취소', 'danger')
-            }
-
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("발주번호"),
-                        html.Th("발주일"),
-                        html.Th("거래처"),
-                        html.Th("금액"),
-                        html.Th("상태"),
-                        html.Th("납기일"),
-                        html.Th("작성자"),
-                        html.Th("작업")
-                    ])
-                ])
-            ]
-
-            table_body = []
-            for idx, row in df.iterrows():
-                status_info = status_mapping.get(row['status'], ('알 수 없음', 'secondary'))
-                status_badge = dbc.Badge(status_info[0], color=status_info[1])
-
-                # 납기일 임박 체크
-                if row['delivery_date'] and row['status'] in ['approved', 'receiving']:
-                    delivery_date = datetime.strptime(row['delivery_date'], '%Y-%m-%d')
-                    days_left = (delivery_date - datetime.now()).days
-                    if days_left <= 2:
-                        delivery_display = html.Span([
-                            row['delivery_date'],
-                            dbc.Badge(f"D-{days_left}", color="danger", className="ms-1")
-                        ])
-                    else:
-                        delivery_display = row['delivery_date']
-                else:
-                    delivery_display = row['delivery_date'] or '-'
-
-                table_body.append(
-                    html.Tr([
-                        html.Td(
-                            html.A(
-                                row['po_number'],
-                                href="#",
-                                id={"type": "po-link", "index": row['po_number']}
-                            )
-                        ),
-                        html.Td(row['po_date']),
-                        html.Td(row['supplier_name']),
-                        html.Td(f"₩{row['total_amount']:,.0f}"),
-                        html.Td(status_badge),
-                        html.Td(delivery_display),
-                        html.Td(row['created_by']),
-                        html.Td(
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-eye"),
-                                    id={"type": "view-po", "index": row['po_number']},
-                                    color="info",
-                                    size="sm",
-                                    title="보기"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-po", "index": row['po_number']},
-                                    color="primary",
-                                    size="sm",
-                                    title="수정",
-                                    disabled=row['status'] not in ['draft', 'pending']
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-trash"),
-                                    id={"type": "delete-po", "index": row['po_number']},
-                                    color="danger",
-                                    size="sm",
-                                    title="삭제",
-                                    disabled=row['status'] not in ['draft']
-                                )
-                            ])
-                        )
-                    ])
-                )
-
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-
-        except Exception as e:
-            logger.error(f"발주서 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
 
     # 자동 발주 제안
     @app.callback(
         Output('auto-po-suggestions', 'children'),
         [Input('auto-po-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')]
+         Input('refresh-purchase', 'data')]
     )
     def update_auto_po_suggestions(n_clicks, n_intervals):
         """자동 발주 제안 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
 
         try:
             # 발주가 필요한 품목 조회
@@ -281,7 +200,7 @@ def register_purchase_callbacks(app):
                 LIMIT 10
             """
 
-            df = pd.read_sql_query(query, conn)
+            df = cached_df(query)
 
             if df.empty:
                 return dbc.Alert(
@@ -360,7 +279,7 @@ def register_purchase_callbacks(app):
     )
     def update_receiving_schedule(n_clicks, filter_date):
         """입고 예정 테이블 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
 
         query = """
             SELECT rs.id,
@@ -491,7 +410,7 @@ def register_purchase_callbacks(app):
     )
     def update_purchase_analysis(period):
         """구매 분석 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
 
         # 기간 설정
         if period == 'month':
@@ -659,7 +578,7 @@ def register_purchase_callbacks(app):
                 }
             }
 
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -711,7 +630,7 @@ def register_purchase_callbacks(app):
             return dbc.Alert("거래처 코드와 거래처명은 필수입니다.", color="warning")
 
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -728,6 +647,7 @@ def register_purchase_callbacks(app):
             conn.close()
 
             logger.info(f"거래처 저장 완료: {supplier_code}")
+            publish('purchase')
 
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"), "거래처가 등록되었습니다!"],
@@ -740,108 +660,16 @@ def register_purchase_callbacks(app):
             logger.error(f"거래처 저장 실패: {e}")
             return dbc.Alert(f"저장 중 오류가 발생했습니다: {str(e)}", color="danger")
 
-    # 거래처 리스트 조회
-    @app.callback(
-        Output('supplier-list-table', 'children'),
-        [Input('filter-supplier-btn', 'n_clicks'),
-         Input('save-supplier-btn', 'n_clicks')],
-        [State('supplier-search', 'value'),
-         State('supplier-rating-filter', 'value')]
+    # 거래처 리스트 그리드 (현재 페이지만 조회)
+    SUPPLIER_LIST_GRID.register(
+        app,
+        inputs=[Input('filter-supplier-btn', 'n_clicks'),
+                Input('save-supplier-btn', 'n_clicks'),
+                Input('refresh-purchase', 'data')],
+        states=[State('supplier-search', 'value'),
+                State('supplier-rating-filter', 'value')],
+        scope=supplier_list_scope
     )
-    def update_supplier_list(filter_clicks, save_clicks, search_value, rating_filter):
-        """거래처 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-
-        query = "SELECT * FROM supplier_master WHERE is_active = 1"
-        params = []
-
-        if search_value:
-            query += " AND (supplier_name LIKE ? OR business_no LIKE ?)"
-            params.extend([f"%{search_value}%", f"%{search_value}%"])
-
-        if rating_filter != 'all':
-            query += " AND rating = ?"
-            params.append(rating_filter)
-
-        query += " ORDER BY supplier_name"
-
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-
-            if df.empty:
-                return html.Div("등록된 거래처가 없습니다.", className="text-center p-4")
-
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("거래처코드"),
-                        html.Th("거래처명"),
-                        html.Th("담당자"),
-                        html.Th("연락처"),
-                        html.Th("결제조건"),
-                        html.Th("리드타임"),
-                        html.Th("등급"),
-                        html.Th("작업")
-                    ])
-                ])
-            ]
-
-            table_body = []
-            for idx, row in df.iterrows():
-                # 등급 표시
-                rating_stars = "⭐" * int(row['rating'])
-
-                # 결제조건 한글화
-                payment_terms_map = {
-                    'CASH': '현금',
-                    'NET30': '30일',
-                    'NET60': '60일',
-                    'NET90': '90일'
-                }
-                payment_terms = payment_terms_map.get(row['payment_terms'], row['payment_terms'])
-
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['supplier_code']),
-                        html.Td(row['supplier_name']),
-                        html.Td(row['contact_person'] or '-'),
-                        html.Td(row['phone'] or '-'),
-                        html.Td(payment_terms),
-                        html.Td(f"{row['lead_time']}일"),
-                        html.Td(rating_stars),
-                        html.Td(
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-supplier", "index": row['supplier_code']},
-                                    color="primary",
-                                    size="sm"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-chart-line"),
-                                    id={"type": "supplier-stats", "index": row['supplier_code']},
-                                    color="info",
-                                    size="sm"
-                                )
-                            ])
-                        )
-                    ])
-                )
-
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-
-        except Exception as e:
-            logger.error(f"거래처 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
 
     # 발주서 저장
     @app.callback(
@@ -868,7 +696,7 @@ def register_purchase_callbacks(app):
         total_amount_value = float(total_amount.replace('₩', '').replace(',', ''))
 
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
 
             # 발주번호 생성
@@ -913,6 +741,7 @@ def register_purchase_callbacks(app):
             conn.close()
 
             logger.info(f"발주서 생성 완료: {po_number}")
+            publish('purchase')
 
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -941,82 +770,73 @@ def register_purchase_callbacks(app):
             return dbc.Alert("발주번호를 입력하세요.", color="warning")
 
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
-
-            # 검수자 ID
-            inspector_id = session_data.get('user_id', 1) if session_data else 1
-
-            # 발주 품목 조회
-            cursor.execute("""
-                SELECT pod.item_code, pod.quantity, im.item_name
-                FROM purchase_order_details pod
-                         JOIN item_master im ON pod.item_code = im.item_code
-                WHERE pod.po_number = ?
-            """, (po_number,))
+            # 쓰기 트랜잭션 안에서 실행 (잠금 경합 시 처음부터 재시도)
+            def apply_inspection(conn):
+                cursor = conn.cursor()
 
-            items = cursor.fetchall()
+                # 검수자 ID
+                inspector_id = session_data.get('user_id', 1) if session_data else 1
 
-            if not items:
-                return dbc.Alert("해당 발주번호를 찾을 수 없습니다.", color="danger")
-
-            # 각 품목에 대해 검수 처리
-            for item in items:
-                item_code, expected_qty, item_name = item
-
-                # 실제로는 UI에서 입력받은 수량 사용
-                received_qty = expected_qty  # 임시로 전량 입고
-                accepted_qty = received_qty
-                rejected_qty = 0
-
-                # 검수 기록
+                # 발주 품목 조회
                 cursor.execute("""
-                    INSERT INTO receiving_inspection
-                    (receiving_date, po_number, item_code, received_qty,
-                     accepted_qty, rejected_qty, inspection_result, inspector_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (inspection_date, po_number, item_code, received_qty,
-                      accepted_qty, rejected_qty, '합격', inspector_id))
-
-                # 재고 반영
+                    SELECT pod.item_code, pod.quantity, im.item_name, pod.unit_price
+                    FROM purchase_order_details pod
+                             JOIN item_master im ON pod.item_code = im.item_code
+                    WHERE pod.po_number = ?
+                """, (po_number,))
+
+                items = cursor.fetchall()
+
+                if not items:
+                    return False
+
+                # 각 품목에 대해 검수 처리
+                for item in items:
+                    item_code, expected_qty, item_name, unit_price = item
+
+                    # 실제로는 UI에서 입력받은 수량 사용
+                    received_qty = expected_qty  # 임시로 전량 입고
+                    accepted_qty = received_qty
+                    rejected_qty = 0
+
+                    # 검수 기록
+                    cursor.execute("""
+                        INSERT INTO receiving_inspection
+                        (receiving_date, po_number, item_code, received_qty,
+                         accepted_qty, rejected_qty, inspection_result, inspector_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (inspection_date, po_number, item_code, received_qty,
+                          accepted_qty, rejected_qty, '합격', inspector_id))
+
+                    # 재고 이동 기록 및 창고/품목 재고, 발주 단가로 재고 평가 반영
+                    post_movement(conn, inspection_date, 'IN_purchase', item_code, accepted_qty,
+                                  DEFAULT_WAREHOUSE, f'발주번호: {po_number}', unit_cost=unit_price)
+
+                    # 입고 예정 업데이트
+                    cursor.execute("""
+                        UPDATE receiving_schedule
+                        SET received_qty = received_qty + ?,
+                            status = CASE
+                                         WHEN received_qty + ? >= expected_qty THEN 'completed'
+                                         ELSE 'partial'
+                                END
+                        WHERE po_number = ?
+                          AND item_code = ?
+                    """, (accepted_qty, accepted_qty, po_number, item_code))
+
+                # 발주서 상태 업데이트
                 cursor.execute("""
-                    UPDATE item_master
-                    SET current_stock = current_stock + ?
-                    WHERE item_code = ?
-                """, (accepted_qty, item_code))
-
-                # 재고 이동 기록
-                cursor.execute("""
-                    INSERT INTO stock_movements
-                    (movement_date, movement_type, item_code, quantity,
-                     warehouse, remarks)
-                    VALUES (?, 'IN_purchase', ?, ?, 'wh1', ?)
-                """, (inspection_date, item_code, accepted_qty,
-                      f'발주번호: {po_number}'))
-
-                # 입고 예정 업데이트
-                cursor.execute("""
-                    UPDATE receiving_schedule
-                    SET received_qty = received_qty + ?,
-                        status = CASE
-                                     WHEN received_qty + ? >= expected_qty THEN 'completed'
-                                     ELSE 'partial'
-                            END
+                    UPDATE purchase_orders
+                    SET status = 'receiving'
                     WHERE po_number = ?
-                      AND item_code = ?
-                """, (accepted_qty, accepted_qty, po_number, item_code))
-
-            # 발주서 상태 업데이트
-            cursor.execute("""
-                UPDATE purchase_orders
-                SET status = 'receiving'
-                WHERE po_number = ?
-            """, (po_number,))
+                """, (po_number,))
+                return True
 
-            conn.commit()
-            conn.close()
+            if not run_write(apply_inspection):
+                return dbc.Alert("해당 발주번호를 찾을 수 없습니다.", color="danger")
 
             logger.info(f"입고 검수 완료: {po_number}")
+            publish('purchase', 'inventory')
 
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -1037,31 +857,14 @@ def register_purchase_callbacks(app):
     @app.callback(
         Output('inspection-history', 'children'),
         [Input('complete-inspection-btn', 'n_clicks'),
-         Input('interval-component', 'n_intervals')]
+         Input('refresh-purchase', 'data')]
     )
     def update_inspection_history(n_clicks, n_intervals):
         """검수 이력 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-
-        query = """
-            SELECT ri.receiving_date,
-                   ri.po_number,
-                   ri.item_code,
-                   im.item_name,
-                   ri.received_qty,
-                   ri.accepted_qty,
-                   ri.rejected_qty,
-                   ri.inspection_result,
-                   u.username as inspector
-            FROM receiving_inspection ri
-                     JOIN item_master im ON ri.item_code = im.item_code
-                     LEFT JOIN users u ON ri.inspector_id = u.id
-            ORDER BY ri.created_at DESC
-            LIMIT 10
-        """
+        conn = get_connection()
 
         try:
-            df = pd.read_sql_query(query, conn)
+            df = pd.read_sql_query(INSPECTION_HISTORY_QUERY, conn)
 
             if df.empty:
                 return html.Div("검수 이력이 없습니다.", className="text-center p-4")
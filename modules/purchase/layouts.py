@@ -8,6 +8,65 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 
+from core.grid import SqlGrid, label_case, badge_styles
+
+# 발주 상태 (표시명, 배지 색상)
+PO_STATUS = {
+    'draft': ('작성중', 'secondary'),
+    'pending': ('승인대기', 'warning'),
+    'approved': ('승인완료', 'success'),
+    'receiving': ('입고중', 'info'),
+    'completed': ('완료', 'primary'),
+    'cancelled': ('취소', 'danger')
+}
+
+# 결제조건 표시명
+PAYMENT_TERMS = {
+    'CASH': '현금',
+    'NET30': '30일',
+    'NET60': '60일',
+    'NET90': '90일'
+}
+
+# 발주서 리스트 그리드
+PO_LIST_GRID = SqlGrid(
+    'po-list-table',
+    """purchase_orders po
+       LEFT JOIN supplier_master s ON po.supplier_code = s.supplier_code
+       LEFT JOIN users u ON po.created_by = u.id""",
+    columns=[
+        {'id': 'po_number', 'name': '발주번호', 'sql': 'po.po_number', 'nullable': False},
+        {'id': 'po_date', 'name': '발주일', 'sql': 'po.po_date', 'nullable': False},
+        {'id': 'supplier_name', 'name': '거래처', 'sql': 's.supplier_name'},
+        {'id': 'total_amount', 'name': '금액', 'sql': 'po.total_amount', 'type': 'numeric',
+         'format': {'specifier': '$,.0f', 'locale': {'symbol': ['₩', '']}}},
+        {'id': 'status', 'name': '상태', 'sql': label_case('po.status', PO_STATUS, '알 수 없음')},
+        {'id': 'delivery_date', 'name': '납기일', 'sql': 'po.delivery_date'},
+        {'id': 'created_by', 'name': '작성자', 'sql': 'u.username'},
+    ],
+    key='po.po_number',
+    default_sort=[{'column_id': 'po_date', 'direction': 'desc'}],
+    style_data_conditional=badge_styles('status', PO_STATUS)
+)
+
+# 거래처 리스트 그리드
+SUPPLIER_LIST_GRID = SqlGrid(
+    'supplier-list-table',
+    "supplier_master",
+    columns=[
+        {'id': 'supplier_code', 'name': '거래처코드', 'nullable': False},
+        {'id': 'supplier_name', 'name': '거래처명', 'nullable': False},
+        {'id': 'contact_person', 'name': '담당자'},
+        {'id': 'phone', 'name': '연락처'},
+        {'id': 'payment_terms', 'name': '결제조건', 'sql': label_case('payment_terms', PAYMENT_TERMS)},
+        {'id': 'lead_time', 'name': '리드타임(일)', 'type': 'numeric'},
+        {'id': 'rating', 'name': '등급', 'type': 'numeric'},
+    ],
+    key='supplier_code',
+    default_sort=[{'column_id': 'supplier_name', 'direction': 'asc'}],
+    where="is_active = 1"
+)
+
 def create_purchase_layout():
     """구매관리 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -166,7 +225,7 @@ def create_po_management():
                 ], className="mb-3"),
                 
                 # 발주서 리스트
-                html.Div(id="po-list-table")
+                PO_LIST_GRID.layout()
             ])
         ]),
         
@@ -320,7 +379,7 @@ def create_supplier_management():
                 ], className="mb-3"),
                 
                 # 거래처 리스트
-                html.Div(id="supplier-list-table")
+                SUPPLIER_LIST_GRID.layout()
             ])
         ]),
         
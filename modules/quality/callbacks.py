@@ -13,8 +13,37 @@ import numpy as np
 import json
 import logging
 
+from core.database import get_connection
+from core.events import publish
+from core.query_cache import cached_df
+from core.tables import pass_rate, badge_colors, number_cells, text_cells, render_table
+
 logger = logging.getLogger(__name__)
 
+# 일자별 검사 건수 (수입/공정/출하 검사 합계)
+DAILY_INSPECTIONS_QUERY = """
+    SELECT COUNT(*) FROM (
+        SELECT id FROM incoming_inspection WHERE inspection_date = ?
+        UNION ALL
+        SELECT id FROM process_inspection WHERE inspection_date = ?
+        UNION ALL
+        SELECT id FROM final_inspection WHERE inspection_date = ?
+    )
+"""
+
+# 불량 파레토 (기간 내 불량 유형별 건수/수량)
+DEFECT_PARETO_QUERY = """
+    SELECT
+        dt.defect_name,
+        COUNT(*) as count,
+        SUM(dh.defect_qty) as total_qty
+    FROM defect_history dh
+    JOIN defect_types dt ON dh.defect_code = dt.defect_code
+    WHERE dh.defect_date BETWEEN ? AND ?
+    GROUP BY dt.defect_name
+    ORDER BY total_qty DESC
+"""
+
 def register_quality_callbacks(app):
     """품질관리 모듈 콜백 등록"""
     
@@ -28,7 +57,7 @@ def register_quality_callbacks(app):
         from .layouts import (
             create_inspection_management, create_defect_management,
             create_spc_dashboard, create_certificate_management,
-            create_quality_analysis, create_quality_settings
+            create_lot_trace, create_quality_analysis, create_quality_settings
         )
         
         if active_tab == "inspection":
@@ -39,6 +68,8 @@ def register_quality_callbacks(app):
             return create_spc_dashboard()
         elif active_tab == "certificate":
             return create_certificate_management()
+        elif active_tab == "lot-trace":
+            return create_lot_trace()
         elif active_tab == "quality-analysis":
             return create_quality_analysis()
         elif active_tab == "quality-settings":
@@ -50,26 +81,18 @@ def register_quality_callbacks(app):
          Output('quality-pass-rate', 'children'),
          Output('quality-defect-rate', 'children'),
          Output('quality-calibration-due', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-quality', 'data')
     )
     def update_inspection_summary(n):
         """검사 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
             
             # 오늘 검사
             today = datetime.now().strftime('%Y-%m-%d')
-            cursor.execute("""
-                SELECT COUNT(*) FROM (
-                    SELECT id FROM incoming_inspection WHERE inspection_date = ?
-                    UNION ALL
-                    SELECT id FROM process_inspection WHERE inspection_date = ?
-                    UNION ALL
-                    SELECT id FROM final_inspection WHERE inspection_date = ?
-                )
-            """, (today, today, today))
+            cursor.execute(DAILY_INSPECTIONS_QUERY, (today, today, today))
             today_inspections = cursor.fetchone()[0]
             
             # 이번 주 합격률
@@ -116,11 +139,11 @@ def register_quality_callbacks(app):
     @app.callback(
         Output('inspection-list', 'children'),
         [Input('inspection-type-tabs', 'active_tab'),
-         Input('interval-component', 'n_intervals')]
+         Input('refresh-quality', 'data')]
     )
     def update_inspection_list(inspection_type, n):
         """검사 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             if inspection_type == "incoming":
@@ -174,7 +197,7 @@ def register_quality_callbacks(app):
                     LIMIT 50
                 """
             
-            df = pd.read_sql_query(query, conn)
+            df = cached_df(query)
             
             if df.empty:
                 return html.Div("검사 이력이 없습니다.", className="text-center p-4")
@@ -187,58 +210,26 @@ def register_quality_callbacks(app):
                 'rework': 'info'
             }
             
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("검사번호"),
-                        html.Th("검사일자"),
-                        html.Th("품목코드"),
-                        html.Th("품목명"),
-                        html.Th("검사수량"),
-                        html.Th("샘플수"),
-                        html.Th("합격수"),
-                        html.Th("결과"),
-                        html.Th("검사자")
-                    ])
-                ])
+            # 합격률/배지 색상은 컬럼 단위로 계산
+            rates = pass_rate(df['passed_qty'], df['sample_qty'])
+            colors = badge_colors(df['inspection_result'], result_colors)
+            result_cells = [
+                [dbc.Badge(str(result).upper(), color=color),
+                 dbc.Badge(f"{rate:.1f}%", color="info", className="ms-1") if rate == rate else ""]
+                for result, color, rate in zip(df['inspection_result'].tolist(), colors, rates)
             ]
             
-            table_body = []
-            for idx, row in df.iterrows():
-                # 합격률 계산
-                if row['sample_qty'] > 0:
-                    pass_rate = (row['passed_qty'] / row['sample_qty']) * 100
-                    pass_rate_badge = dbc.Badge(f"{pass_rate:.1f}%", color="info", className="ms-1")
-                else:
-                    pass_rate_badge = ""
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(row['inspection_no']),
-                        html.Td(row['inspection_date']),
-                        html.Td(row['item_code']),
-                        html.Td(row['item_name']),
-                        html.Td(f"{row['received_qty']:,}"),
-                        html.Td(f"{row['sample_qty']:,}"),
-                        html.Td(f"{row['passed_qty']:,}"),
-                        html.Td([
-                            dbc.Badge(
-                                row['inspection_result'].upper(),
-                                color=result_colors.get(row['inspection_result'], 'secondary')
-                            ),
-                            pass_rate_badge
-                        ]),
-                        html.Td(row['inspector'] or '-')
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
+            return render_table(
+                ["검사번호", "검사일자", "품목코드", "품목명", "검사수량", "샘플수", "합격수", "결과", "검사자"],
+                df['inspection_no'].tolist(),
+                df['inspection_date'].tolist(),
+                df['item_code'].tolist(),
+                df['item_name'].tolist(),
+                number_cells(df['received_qty']),
+                number_cells(df['sample_qty']),
+                number_cells(df['passed_qty']),
+                result_cells,
+                text_cells(df['inspector'])
             )
             
         except Exception as e:
@@ -250,11 +241,11 @@ def register_quality_callbacks(app):
     # 일별 검사 현황 차트
     @app.callback(
         Output('daily-inspection-chart', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-quality', 'data')
     )
     def update_daily_inspection_chart(n):
         """일별 검사 현황 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             # 최근 30일 데이터
@@ -340,11 +331,11 @@ def register_quality_callbacks(app):
     # 검사 유형별 합격률 차트
     @app.callback(
         Output('inspection-pass-rate-chart', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('refresh-quality', 'data')
     )
     def update_pass_rate_chart(n):
         """검사 유형별 합격률 차트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             # 최근 30일 데이터
@@ -454,11 +445,11 @@ def register_quality_callbacks(app):
          Output('quality-critical-defects', 'children'),
          Output('quality-open-defects', 'children'),
          Output('quality-closed-defects', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-quality', 'data')
     )
     def update_defect_summary(n):
         """불량 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
@@ -663,22 +654,10 @@ def register_quality_callbacks(app):
     )
     def update_defect_pareto(start_date, end_date):
         """불량 파레토 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
-            query = """
-                SELECT 
-                    dt.defect_name,
-                    COUNT(*) as count,
-                    SUM(dh.defect_qty) as total_qty
-                FROM defect_history dh
-                JOIN defect_types dt ON dh.defect_code = dt.defect_code
-                WHERE dh.defect_date BETWEEN ? AND ?
-                GROUP BY dt.defect_name
-                ORDER BY total_qty DESC
-            """
-            
-            df = pd.read_sql_query(query, conn, params=[start_date, end_date])
+            df = pd.read_sql_query(DEFECT_PARETO_QUERY, conn, params=[start_date, end_date])
             
             if df.empty:
                 fig = go.Figure()
@@ -809,7 +788,7 @@ def register_quality_callbacks(app):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             # 검사번호 생성
@@ -848,6 +827,7 @@ def register_quality_callbacks(app):
             conn.close()
             
             logger.info(f"검사 데이터 저장 완료: {inspection_no}")
+            publish('quality')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -899,7 +879,7 @@ def register_quality_callbacks(app):
                 }
             }
             
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -1065,3 +1045,67 @@ def register_quality_callbacks(app):
         )
         
         return fig
+    
+    # LOT 추적 / 리콜 보고
+    @app.callback(
+        Output('lot-trace-result', 'children'),
+        Input('trace-lot-btn', 'n_clicks'),
+        [State('trace-lot-number', 'value'),
+         State('trace-direction', 'value')],
+        prevent_initial_call=True
+    )
+    def search_lot_trace(n_clicks, lot_number, direction):
+        """LOT 계보 추적 결과"""
+        from .genealogy import trace, get_lot_events, recall_report
+        
+        lot_number = (lot_number or '').strip()
+        if not lot_number:
+            return dbc.Alert("LOT 번호를 입력하세요.", color="warning")
+        
+        try:
+            result = trace(lot_number, direction)
+            events = get_lot_events(lot_number, direction)
+            
+            summary = [
+                html.Span(f"연결 LOT {len(result['lots']) - 1:,}개", className="me-3"),
+                html.Span(f"연결 {len(result['links']):,}건", className="me-3"),
+            ]
+            if result['truncated']:
+                summary.append(dbc.Badge("최대 LOT 수 초과 - 일부만 표시", color="warning"))
+            
+            sections = [dbc.Alert(summary, color="info")]
+            
+            # 정방향 추적은 리콜 범위 (출하 고객) 를 함께 표시
+            if direction == 'forward':
+                customers = recall_report(lot_number)['customers']
+                if not customers.empty:
+                    sections += [
+                        html.H5("영향 고객", className="mt-3"),
+                        render_table(
+                            ["고객코드", "고객명", "출하 건수", "출하 수량"],
+                            customers['customer_code'].tolist(),
+                            text_cells(customers['customer_name']),
+                            number_cells(customers['shipments']),
+                            number_cells(customers['quantity'])
+                        )
+                    ]
+            
+            sections.append(html.H5("LOT 이력", className="mt-3"))
+            if events.empty:
+                sections.append(html.Div("이력이 없습니다.", className="text-center p-4"))
+            else:
+                sections.append(render_table(
+                    ["구분", "LOT 번호", "일자", "품목/공정", "수량", "결과/고객", "참조번호"],
+                    events['source'].tolist(),
+                    events['lot_number'].tolist(),
+                    text_cells(events['event_date']),
+                    text_cells(events['item']),
+                    number_cells(events['quantity']),
+                    text_cells(events['result']),
+                    text_cells(events['reference'])
+                ))
+            return html.Div(sections)
+            
+        except Exception as e:
+            logger.error(f"LOT 추적 오류: {e}")
+            return dbc.Alert(f"추적 중 오류가 발생했습니다: {str(e)}", color="danger")
@@ -0,0 +1,179 @@
+# modules/quality/genealogy.py - LOT 계보 추적 및 리콜 보고
+#
+# lot_links (core/migrations/0009) 를 재귀 CTE 로 따라가며 한 단계마다
+# parent_lot / child_lot 인덱스만 탐색하므로, 비용은 전체 LOT 수가 아니라
+# 연결된 LOT 수에 비례한다. UNION 으로 이미 방문한 LOT 은 다시 펼치지 않아
+# 여러 경로로 합류하는 계보나 잘못 입력된 순환 연결에서도 끝난다.
+#
+# 정방향(forward): 투입 LOT -> 이를 사용한 산출 LOT (자재 LOT 리콜 범위)
+# 역방향(backward): 산출 LOT -> 투입된 LOT (제품 불량 원인 추적)
+
+import pandas as pd
+
+from core.database import get_connection
+
+LINK_TYPES = ('consume', 'split', 'merge', 'rework')
+
+# 화면/API 추적 결과 최대 LOT 수 (리콜 보고는 제한 없음)
+MAX_TRACE_LOTS = 10000
+
+_STEP = {
+    'forward': "SELECT l.child_lot FROM lot_links l JOIN trace t ON l.parent_lot = t.lot",
+    'backward': "SELECT l.parent_lot FROM lot_links l JOIN trace t ON l.child_lot = t.lot",
+}
+
+# LOT 별 이력 (출처, LOT, 일자, 품목, 수량, 결과, 참조 번호)
+_EVENT_SOURCES = [
+    ("SELECT 'production', lot_number, work_date, process, prod_qty, NULL, CAST(id AS TEXT) "
+     "FROM work_logs WHERE lot_number IN trace"),
+    ("SELECT 'incoming_inspection', lot_number, inspection_date, item_code, received_qty, "
+     "inspection_result, inspection_no FROM incoming_inspection WHERE lot_number IN trace"),
+    ("SELECT 'process_inspection', lot_number, inspection_date, item_code, production_qty, "
+     "inspection_result, inspection_no FROM process_inspection WHERE lot_number IN trace"),
+    ("SELECT 'final_inspection', lot_number, inspection_date, product_code, inspection_qty, "
+     "inspection_result, inspection_no FROM final_inspection WHERE lot_number IN trace"),
+    ("SELECT 'certificate', lot_number, issue_date, product_code, NULL, "
+     "overall_result, certificate_no FROM quality_certificates WHERE lot_number IN trace"),
+    ("SELECT 'shipment', lot_number, ship_date, product_code, quantity, "
+     "customer_code, COALESCE(delivery_number, order_number) FROM lot_shipments WHERE lot_number IN trace"),
+]
+
+EVENT_COLUMNS = ['source', 'lot_number', 'event_date', 'item', 'quantity', 'result', 'reference']
+
+
+def _trace_cte(direction, limit=None):
+    """시작 LOT 에서 연결된 LOT 집합 (trace) CTE"""
+    if direction not in _STEP:
+        raise ValueError(f"Unknown direction: {direction}")
+    return f"""
+        WITH RECURSIVE trace(lot) AS (
+            SELECT ?
+            UNION
+            {_STEP[direction]}
+            {'LIMIT ?' if limit else ''}
+        )
+    """
+
+
+def _trace_params(lot_number, limit=None):
+    return [lot_number, limit] if limit else [lot_number]
+
+
+def link_lots(conn, links):
+    """투입/산출 LOT 연결 등록 (호출자의 트랜잭션 안에서 사용)
+
+    links: [{'parent_lot', 'child_lot', 'link_type'?, 'item_code'?, 'quantity'?, 'work_log_id'?}]
+    같은 연결은 수량을 덮어쓴다.
+    """
+    rows = []
+    for link in links:
+        link_type = link.get('link_type') or 'consume'
+        if link_type not in LINK_TYPES:
+            raise ValueError(f"Unknown link_type: {link_type}")
+        if not link.get('parent_lot') or not link.get('child_lot'):
+            raise ValueError("parent_lot and child_lot are required")
+        if link['parent_lot'] == link['child_lot']:
+            raise ValueError("A lot cannot be linked to itself")
+        rows.append((link['parent_lot'], link['child_lot'], link_type, link.get('item_code'),
+                     link.get('quantity'), link.get('work_log_id')))
+
+    conn.executemany("""
+        INSERT INTO lot_links (parent_lot, child_lot, link_type, item_code, quantity, work_log_id)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (parent_lot, child_lot, link_type) DO UPDATE SET
+            item_code = COALESCE(excluded.item_code, item_code),
+            quantity = excluded.quantity,
+            work_log_id = COALESCE(excluded.work_log_id, work_log_id)
+    """, rows)
+    return len(rows)
+
+
+def record_shipment(conn, lot_number, ship_date, customer_code, order_number=None,
+                    delivery_number=None, product_code=None, quantity=None):
+    """출하 LOT 등록 (호출자의 트랜잭션 안에서 사용, 새 id 반환)"""
+    cursor = conn.execute("""
+        INSERT INTO lot_shipments
+        (lot_number, ship_date, customer_code, order_number, delivery_number, product_code, quantity)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (lot_number, ship_date, customer_code, order_number, delivery_number, product_code, quantity))
+    return cursor.lastrowid
+
+
+def trace(lot_number, direction='forward', limit=MAX_TRACE_LOTS):
+    """LOT 계보 추적
+
+    Returns:
+        {'lots': [LOT, ...] (시작 LOT 포함), 'links': DataFrame, 'truncated': bool}
+    """
+    cte = _trace_cte(direction, limit)
+    key = 'parent_lot' if direction == 'forward' else 'child_lot'
+    conn = get_connection()
+    try:
+        lots = [row[0] for row in conn.execute(
+            cte + "SELECT lot FROM trace", _trace_params(lot_number, limit)
+        )]
+        links = pd.read_sql_query(cte + f"""
+            SELECT l.parent_lot, l.child_lot, l.link_type, l.item_code, l.quantity
+            FROM trace t
+            JOIN lot_links l ON l.{key} = t.lot
+            ORDER BY l.parent_lot, l.child_lot
+        """, conn, params=_trace_params(lot_number, limit))
+    finally:
+        conn.close()
+    return {'lots': lots, 'links': links, 'truncated': bool(limit) and len(lots) >= limit}
+
+
+def get_lot_events(lot_number, direction='forward', limit=MAX_TRACE_LOTS):
+    """추적된 LOT 들의 생산/검사/성적서/출하 이력"""
+    query = _trace_cte(direction, limit) + "\nUNION ALL\n".join(_EVENT_SOURCES) + " ORDER BY 3, 2"
+    conn = get_connection()
+    try:
+        rows = conn.execute(query, _trace_params(lot_number, limit)).fetchall()
+    finally:
+        conn.close()
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def recall_report(lot_number):
+    """리콜 보고 - 자재 LOT 이 들어간 모든 하위 LOT 의 출하/성적서
+
+    Returns:
+        {'lot_number', 'affected_lots', 'shipments', 'customers', 'certificates'}
+    """
+    cte = _trace_cte('forward')
+    params = _trace_params(lot_number)
+    conn = get_connection()
+    try:
+        affected = conn.execute(cte + "SELECT COUNT(*) FROM trace", params).fetchone()[0]
+        shipments = pd.read_sql_query(cte + """
+            SELECT s.ship_date, s.customer_code, c.customer_name, s.order_number,
+                   s.delivery_number, s.product_code, s.lot_number, s.quantity
+            FROM trace t
+            JOIN lot_shipments s ON s.lot_number = t.lot
+            LEFT JOIN customers c ON c.customer_code = s.customer_code
+            ORDER BY s.ship_date, s.customer_code
+        """, conn, params=params)
+        certificates = pd.read_sql_query(cte + """
+            SELECT q.certificate_no, q.issue_date, q.customer_code, q.product_code,
+                   q.lot_number, q.overall_result
+            FROM trace t
+            JOIN quality_certificates q ON q.lot_number = t.lot
+            ORDER BY q.issue_date
+        """, conn, params=params)
+    finally:
+        conn.close()
+
+    if shipments.empty:
+        customers = pd.DataFrame(columns=['customer_code', 'customer_name', 'shipments', 'quantity'])
+    else:
+        customers = (shipments.groupby(['customer_code'], as_index=False, dropna=False)
+                     .agg(customer_name=('customer_name', 'first'),
+                          shipments=('lot_number', 'size'),
+                          quantity=('quantity', 'sum')))
+    return {
+        'lot_number': lot_number,
+        'affected_lots': affected,
+        'shipments': shipments,
+        'customers': customers,
+        'certificates': certificates,
+    }
@@ -25,6 +25,7 @@ def create_quality_layout():
             dbc.Tab(label="불량 관리", tab_id="defect"),
             dbc.Tab(label="SPC", tab_id="spc"),
             dbc.Tab(label="성적서", tab_id="certificate"),
+            dbc.Tab(label="LOT 추적", tab_id="lot-trace"),
             dbc.Tab(label="분석", tab_id="quality-analysis"),
             dbc.Tab(label="설정", tab_id="quality-settings")
         ], id="quality-tabs", active_tab="inspection"),
@@ -483,6 +484,47 @@ def create_certificate_management():
         ])
     ])
 
+def create_lot_trace():
+    """LOT 추적 / 리콜 화면"""
+    return html.Div([
+        dbc.Card([
+            dbc.CardHeader([
+                html.H4([html.I(className="fas fa-project-diagram me-2"), "LOT 추적"])
+            ]),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Label("LOT 번호"),
+                        dbc.Input(id="trace-lot-number", type="text", placeholder="LOT 번호 입력")
+                    ], md=4),
+                    dbc.Col([
+                        dbc.Label("추적 방향"),
+                        dbc.Select(
+                            id="trace-direction",
+                            options=[
+                                {"label": "정방향 (사용처 / 리콜)", "value": "forward"},
+                                {"label": "역방향 (투입 원자재)", "value": "backward"}
+                            ],
+                            value="forward"
+                        )
+                    ], md=4),
+                    dbc.Col([
+                        dbc.Label("　"),
+                        dbc.Button(
+                            [html.I(className="fas fa-search me-2"), "추적"],
+                            id="trace-lot-btn",
+                            color="primary",
+                            className="w-100"
+                        )
+                    ], md=2)
+                ], className="mb-3"),
+
+                # 추적 결과 (요약 / 영향 고객 / 이력)
+                dcc.Loading(html.Div(id="lot-trace-result"))
+            ])
+        ])
+    ])
+
 def create_quality_analysis():
     """품질 분석 화면"""
     return html.Div([
@@ -12,8 +12,26 @@ import pandas as pd
 import json
 import logging
 
+from core.database import get_connection
+from core.events import publish
+from .layouts import QUOTATION_LIST_GRID
+
 logger = logging.getLogger(__name__)
 
+
+def quotation_list_scope(n_clicks, pushed, start_date, end_date, status, customer):
+    """견적서 리스트 그리드 조회 조건 (where 목록, 파라미터 목록)"""
+    where = ["q.quote_date BETWEEN ? AND ?"]
+    params = [start_date, end_date]
+    if status != 'all':
+        where.append("q.status = ?")
+        params.append(status)
+    if customer != 'all':
+        where.append("q.customer_code = ?")
+        params.append(customer)
+    return where, params
+
+
 def register_sales_callbacks(app):
     """영업관리 모듈 콜백 등록"""
     
@@ -49,11 +67,11 @@ def register_sales_callbacks(app):
          Output('conversion-rate', 'children'),
          Output('pending-quotes', 'children'),
          Output('monthly-quotes', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-sales', 'data')
     )
     def update_quote_summary(n):
         """견적 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
@@ -105,153 +123,17 @@ def register_sales_callbacks(app):
         finally:
             conn.close()
     
-    # 견적서 리스트 조회
-    @app.callback(
-        Output('quotation-list-table', 'children'),
-        [Input('search-quotes-btn', 'n_clicks')],
-        [State('quote-start-date', 'value'),
-         State('quote-end-date', 'value'),
-         State('quote-status-filter', 'value'),
-         State('quote-customer-filter', 'value')]
+    # 견적서 리스트 그리드 (현재 페이지만 조회)
+    QUOTATION_LIST_GRID.register(
+        app,
+        inputs=[Input('search-quotes-btn', 'n_clicks'),
+                Input('refresh-sales', 'data')],
+        states=[State('quote-start-date', 'value'),
+                State('quote-end-date', 'value'),
+                State('quote-status-filter', 'value'),
+                State('quote-customer-filter', 'value')],
+        scope=quotation_list_scope
     )
-    def update_quotation_list(n_clicks, start_date, end_date, status, customer):
-        """견적서 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
-        
-        query = """
-            SELECT q.quote_number,
-                   q.quote_date,
-                   c.customer_name,
-                   q.total_amount,
-                   q.status,
-                   q.validity_date,
-                   u.username as created_by
-            FROM quotations q
-            LEFT JOIN customers c ON q.customer_code = c.customer_code
-            LEFT JOIN users u ON q.created_by = u.id
-            WHERE q.quote_date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
-        
-        if status != 'all':
-            query += " AND q.status = ?"
-            params.append(status)
-        
-        if customer != 'all':
-            query += " AND q.customer_code = ?"
-            params.append(customer)
-        
-        query += " ORDER BY q.quote_date DESC, q.created_at DESC"
-        
-        try:
-            df = pd.read_sql_query(query, conn, params=params)
-            
-            if df.empty:
-                return html.Div("견적서가 없습니다.", className="text-center p-4")
-            
-            # 상태 한글화 및 색상
-            status_mapping = {
-                'draft': ('작성중', 'secondary'),
-                'sent': ('발송완료', 'info'),
-                'reviewing': ('고객검토', 'warning'),
-                'won': ('수주확정', 'success'),
-                'lost': ('수주실패', 'danger'),
-                'expired': ('만료', 'dark')
-            }
-            
-            # 테이블 생성
-            table_header = [
-                html.Thead([
-                    html.Tr([
-                        html.Th("견적번호"),
-                        html.Th("견적일자"),
-                        html.Th("고객명"),
-                        html.Th("견적금액"),
-                        html.Th("상태"),
-                        html.Th("유효기간"),
-                        html.Th("작성자"),
-                        html.Th("작업")
-                    ])
-                ])
-            ]
-            
-            table_body = []
-            for idx, row in df.iterrows():
-                status_info = status_mapping.get(row['status'], ('알 수 없음', 'secondary'))
-                status_badge = dbc.Badge(status_info[0], color=status_info[1])
-                
-                # 유효기간 체크
-                if row['validity_date'] and row['status'] in ['sent', 'reviewing']:
-                    validity_date = datetime.strptime(row['validity_date'], '%Y-%m-%d')
-                    days_left = (validity_date - datetime.now()).days
-                    if days_left <= 3:
-                        validity_display = html.Span([
-                            row['validity_date'],
-                            dbc.Badge(f"D-{days_left}", color="danger", className="ms-1")
-                        ])
-                    else:
-                        validity_display = row['validity_date']
-                else:
-                    validity_display = row['validity_date'] or '-'
-                
-                table_body.append(
-                    html.Tr([
-                        html.Td(
-                            html.A(
-                                row['quote_number'],
-                                href="#",
-                                id={"type": "quote-link", "index": row['quote_number']}
-                            )
-                        ),
-                        html.Td(row['quote_date']),
-                        html.Td(row['customer_name']),
-                        html.Td(f"₩{row['total_amount']:,.0f}"),
-                        html.Td(status_badge),
-                        html.Td(validity_display),
-                        html.Td(row['created_by']),
-                        html.Td(
-                            dbc.ButtonGroup([
-                                dbc.Button(
-                                    html.I(className="fas fa-eye"),
-                                    id={"type": "view-quote", "index": row['quote_number']},
-                                    color="info",
-                                    size="sm",
-                                    title="보기"
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-edit"),
-                                    id={"type": "edit-quote", "index": row['quote_number']},
-                                    color="primary",
-                                    size="sm",
-                                    title="수정",
-                                    disabled=row['status'] not in ['draft']
-                                ),
-                                dbc.Button(
-                                    html.I(className="fas fa-handshake"),
-                                    id={"type": "convert-quote", "index": row['quote_number']},
-                                    color="success",
-                                    size="sm",
-                                    title="수주 전환",
-                                    disabled=row['status'] != 'reviewing'
-                                )
-                            ])
-                        )
-                    ])
-                )
-            
-            return dbc.Table(
-                table_header + [html.Tbody(table_body)],
-                striped=True,
-                bordered=True,
-                hover=True,
-                responsive=True
-            )
-            
-        except Exception as e:
-            logger.error(f"견적서 조회 오류: {e}")
-            return html.Div("조회 중 오류가 발생했습니다.", className="text-center p-4")
-        finally:
-            conn.close()
     
     # 수주 현황 업데이트
     @app.callback(
@@ -259,11 +141,11 @@ def register_sales_callbacks(app):
          Output('active-orders', 'children'),
          Output('pending-delivery-orders', 'children'),
          Output('completed-orders', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-sales', 'data')
     )
     def update_order_summary(n):
         """수주 현황 요약 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
@@ -322,7 +204,7 @@ def register_sales_callbacks(app):
     )
     def update_customer_list(filter_clicks, save_clicks, search_value, grade_filter):
         """고객 리스트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         query = """
             SELECT c.customer_code,
@@ -451,7 +333,7 @@ def register_sales_callbacks(app):
     )
     def update_sales_analysis(period):
         """영업 분석 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         # 기간 설정
         if period == 'month':
@@ -647,7 +529,7 @@ def register_sales_callbacks(app):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             # 견적번호 생성
@@ -674,6 +556,7 @@ def register_sales_callbacks(app):
             conn.close()
             
             logger.info(f"견적서 생성 완료: {quote_number}")
+            publish('sales')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -704,7 +587,7 @@ def register_sales_callbacks(app):
             return dbc.Alert("모든 필수 항목을 입력하세요.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             # 수주번호 생성
@@ -738,6 +621,7 @@ def register_sales_callbacks(app):
             conn.close()
             
             logger.info(f"수주 생성 완료: {order_number}")
+            publish('sales')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"),
@@ -773,7 +657,7 @@ def register_sales_callbacks(app):
             return dbc.Alert("고객 코드와 고객명은 필수입니다.", color="warning")
         
         try:
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -789,6 +673,7 @@ def register_sales_callbacks(app):
             conn.close()
             
             logger.info(f"고객 저장 완료: {customer_code}")
+            publish('sales')
             
             return dbc.Alert(
                 [html.I(className="fas fa-check-circle me-2"), "고객이 등록되었습니다!"],
@@ -835,7 +720,7 @@ def register_sales_callbacks(app):
                 }
             }
             
-            conn = sqlite3.connect('data/database.db')
+            conn = get_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -870,11 +755,11 @@ def register_sales_callbacks(app):
          Output('hot-leads', 'children'),
          Output('activity-list', 'children'),
          Output('opportunity-list', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-sales', 'data')
     )
     def update_crm_dashboard(n):
         """CRM 대시보드 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             cursor = conn.cursor()
@@ -958,11 +843,11 @@ def register_sales_callbacks(app):
     @app.callback(
         [Output('monthly-quote-trend', 'figure'),
          Output('quote-status-pie', 'figure')],
-        Input('interval-component', 'n_intervals')
+        Input('refresh-sales', 'data')
     )
     def update_quote_charts(n):
         """견적 관련 차트 업데이트"""
-        conn = sqlite3.connect('data/database.db')
+        conn = get_connection()
         
         try:
             # 월별 견적 추이 (최근 6개월)
@@ -9,6 +9,39 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 
+from core.grid import SqlGrid, label_case, badge_styles
+
+# 견적 상태 (표시명, 배지 색상)
+QUOTE_STATUS = {
+    'draft': ('작성중', 'secondary'),
+    'sent': ('발송완료', 'info'),
+    'reviewing': ('고객검토', 'warning'),
+    'won': ('수주확정', 'success'),
+    'lost': ('수주실패', 'danger'),
+    'expired': ('만료', 'dark')
+}
+
+# 견적서 리스트 그리드
+QUOTATION_LIST_GRID = SqlGrid(
+    'quotation-list-table',
+    """quotations q
+       LEFT JOIN customers c ON q.customer_code = c.customer_code
+       LEFT JOIN users u ON q.created_by = u.id""",
+    columns=[
+        {'id': 'quote_number', 'name': '견적번호', 'sql': 'q.quote_number', 'nullable': False},
+        {'id': 'quote_date', 'name': '견적일자', 'sql': 'q.quote_date', 'nullable': False},
+        {'id': 'customer_name', 'name': '고객명', 'sql': 'c.customer_name'},
+        {'id': 'total_amount', 'name': '견적금액', 'sql': 'q.total_amount', 'type': 'numeric',
+         'format': {'specifier': '$,.0f', 'locale': {'symbol': ['₩', '']}}},
+        {'id': 'status', 'name': '상태', 'sql': label_case('q.status', QUOTE_STATUS, '알 수 없음')},
+        {'id': 'validity_date', 'name': '유효기간', 'sql': 'q.validity_date', 'nullable': False},
+        {'id': 'created_by', 'name': '작성자', 'sql': 'u.username'},
+    ],
+    key='q.quote_number',
+    default_sort=[{'column_id': 'quote_date', 'direction': 'desc'}],
+    style_data_conditional=badge_styles('status', QUOTE_STATUS)
+)
+
 def create_sales_layout():
     """영업관리 모듈 메인 레이아웃"""
     return dbc.Container([
@@ -169,7 +202,7 @@ def create_quotation_management():
                 ], className="mb-3"),
                 
                 # 견적서 리스트
-                html.Div(id="quotation-list-table")
+                QUOTATION_LIST_GRID.layout()
             ])
         ]),
         
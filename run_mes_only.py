@@ -2,8 +2,10 @@
 
 import os
 import sys
-import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from core.database import get_connection
+from core.migrations import migrate
 
 def setup_mes_database():
     """MES 전용 데이터베이스 설정"""
@@ -12,58 +14,13 @@ def setup_mes_database():
     os.makedirs('logs', exist_ok=True)
     os.makedirs('backups', exist_ok=True)
     
-    # 데이터베이스 연결
-    conn = sqlite3.connect('data/database.db')
-    cursor = conn.cursor()
-    
     print("🔧 MES 데이터베이스 초기화 중...")
     
-    # 1. 사용자 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            role TEXT DEFAULT 'user',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 2. 작업 로그 테이블 (MES 핵심)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS work_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lot_number TEXT NOT NULL,
-            work_date DATE NOT NULL,
-            process TEXT NOT NULL,
-            worker_id INTEGER,
-            plan_qty INTEGER,
-            prod_qty INTEGER,
-            defect_qty INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES users (id)
-        )
-    ''')
-    
-    # 3. 시스템 설정 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS system_config (
-            key TEXT PRIMARY KEY,
-            value TEXT,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    # 스키마 마이그레이션 적용 (core/migrations)
+    migrate()
     
-    # 4. 폼 템플릿 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS form_templates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            config TEXT NOT NULL,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    conn = get_connection()
+    cursor = conn.cursor()
     
     # 기본 관리자 계정 생성
     cursor.execute("SELECT COUNT(*) FROM users WHERE username = 'admin'")
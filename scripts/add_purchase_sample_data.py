@@ -4,6 +4,11 @@ import sqlite3
 from datetime import datetime, timedelta
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from modules.inventory.stock import post_movement
 
 def add_purchase_sample_data():
     """구매관리 샘플 데이터 추가"""
@@ -58,12 +63,21 @@ def add_purchase_sample_data():
             ('OIL-10W30', '엔진오일 10W30', '소모품', 'L', 50, 60, 8000)
         ]
         
-        for item in basic_items:
+        for code, name, category, unit, safety, stock, price in basic_items:
             cursor.execute("""
-                INSERT OR REPLACE INTO item_master 
+                INSERT INTO item_master 
                 (item_code, item_name, category, unit, safety_stock, current_stock, unit_price)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, item)
+                VALUES (?, ?, ?, ?, ?, 0, ?)
+                ON CONFLICT (item_code) DO UPDATE SET
+                    item_name = excluded.item_name,
+                    category = excluded.category,
+                    unit = excluded.unit,
+                    safety_stock = excluded.safety_stock,
+                    unit_price = excluded.unit_price
+            """, (code, name, category, unit, safety, price))
+            # 현재고는 재고 이동으로만 바뀜 - 기초재고 기록 (창고 잔액/재고 평가 반영)
+            post_movement(conn, datetime.now().strftime('%Y-%m-%d'), 'OPENING', code, stock,
+                          remarks='기초재고')
         print(f"  ✅ {len(basic_items)}개 기본 품목 추가 완료")
     
     # 3. 발주서 샘플 데이터
@@ -0,0 +1,153 @@
+# File: /scripts/benchmark_andon.py
+# 안돈 보드 벤치마크 - 실제 HTTP 서버에 SSE 화면 수백 대를 연결한 채 실적을
+# 등록하고, 쓰기 -> 모든 화면 수신 지연, 상태 문서 계산 횟수(DB 조회), 조건부
+# GET 폴링 처리량을 측정. 비교 기준은 화면마다 2초 주기로 직접 조회하는 경우
+
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import tempfile
+import threading
+import statistics
+import http.client
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from flask import Flask
+from werkzeug.serving import make_server
+
+from core import database
+from core.events import publish
+from core.migrations import migrate
+from modules.mes.andon import register_andon, collect_line_status
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def insert_log(i, lines):
+    with database.transaction() as conn:
+        conn.execute("""
+            INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty, line_code)
+            VALUES (?, ?, '조립', 100, ?, ?, ?)
+        """, (f"LOT-{i:06d}", datetime.now().strftime('%Y-%m-%d'), 90 + i % 10, i % 3,
+              f"LINE-{i % lines + 1:02d}"))
+
+
+def display(port, received, connected):
+    """SSE 화면 - 수신한 문서 순번별 도착 시각 기록"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    conn.request('GET', '/andon/stream')
+    response = conn.getresponse()
+    connected.release()
+    try:
+        while True:
+            line = response.fp.readline()
+            if not line:
+                break
+            if line.startswith(b'data: '):
+                received.append((json.loads(line[6:])['seq'], time.perf_counter()))
+    except OSError:
+        pass
+
+
+def poll(port, requests, etag):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    not_modified = 0
+    for _ in range(requests):
+        conn.request('GET', '/andon/status', headers={'If-None-Match': etag})
+        response = conn.getresponse()
+        response.read()
+        not_modified += response.status == 304
+    conn.close()
+    return not_modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description="안돈 보드 벤치마크")
+    parser.add_argument('--displays', type=int, default=300, help="SSE 화면 수")
+    parser.add_argument('--lines', type=int, default=20, help="라인 수")
+    parser.add_argument('--logs', type=int, default=20000, help="오늘 실적 건수 (사전 적재)")
+    parser.add_argument('--writes', type=int, default=20, help="측정 중 실적 등록 건수")
+    parser.add_argument('--polls', type=int, default=5000, help="조건부 GET 요청 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'andon.db')})
+        migrate()
+        for i in range(args.logs):
+            insert_log(i, args.lines)
+
+        collect_ms = measure(collect_line_status)
+        print(f"\n라인 {args.lines}개, 오늘 실적 {args.logs:,}건, 화면 {args.displays}대")
+        print(f"  상태 문서 계산 {collect_ms:.1f}ms - 화면별 2초 조회 시 DB 사용 "
+              f"{collect_ms * args.displays / 2000 * 100:.0f}% (코어 기준)")
+
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+        app = Flask(__name__)
+        board = register_andon(app, {'interval': 2})
+        computed = []
+        compute = board.snapshot.compute
+        board.snapshot.compute = lambda: computed.append(1) or compute()
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        port = server.server_port
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        received = [[] for _ in range(args.displays)]
+        connected = threading.Semaphore(0)
+        for r in received:
+            threading.Thread(target=display, args=(port, r, connected), daemon=True).start()
+        for _ in range(args.displays):
+            connected.acquire()
+
+        # 실적 등록 -> 새 순번 -> 모든 화면 수신까지
+        committed = {}
+        computed.clear()
+        started = time.perf_counter()
+        for i in range(args.writes):
+            seq = board.seq
+            insert_log(args.logs + i, args.lines)
+            publish('mes')
+            written = time.perf_counter()
+            board.wait(seq, timeout=5)
+            committed[board.seq] = written
+            time.sleep(0.05)
+        time.sleep(0.5)
+        elapsed = time.perf_counter() - started
+
+        latencies = [(arrived - committed[seq]) * 1000
+                     for r in received for seq, arrived in r if seq in committed]
+        latencies.sort()
+        print(f"  쓰기 {args.writes}건 -> 화면 수신 {len(latencies):,}/{args.writes * args.displays:,}건, "
+              f"지연 p50 {latencies[len(latencies) // 2]:.1f}ms / "
+              f"p95 {latencies[int(len(latencies) * 0.95)]:.1f}ms")
+        print(f"  상태 문서 계산 {len(computed)}회 ({elapsed:.1f}s 동안, 화면 수와 무관)")
+
+        etag = f'"{board.seq}"'
+        workers = 16
+        started = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            not_modified = sum(pool.map(lambda _: poll(port, args.polls // workers, etag), range(workers)))
+        elapsed = time.perf_counter() - started
+        print(f"  조건부 GET {not_modified:,}건 304, {not_modified / elapsed:,.0f} 요청/s")
+
+        server.shutdown()
+        board.snapshot.stop()
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# File: /scripts/benchmark_bom.py
+# BOM 전개 벤치마크 - 10단계, 하위 품목 5만 개 BOM 의 정전개/총소요량
+# (최초 = 적재 포함, 반복 = 메모), 사용처 조회, 개정 후 재전개 시간
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory import bom
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def populate(components, levels, shared=0.1, seed=42):
+    """단계별로 품목 수가 늘어나는 BOM - 일부 품목은 상위가 둘 (공용 반제품)"""
+    rng = np.random.default_rng(seed)
+    # 단계별 품목 수 (기하급수, 합계 = components)
+    ratio = components ** (1 / levels)
+    sizes = np.maximum(1, np.round(ratio ** np.arange(1, levels + 1))).astype(int)
+    sizes[-1] += components - sizes.sum()
+
+    rows, previous = [], ['TOP']
+    for level, size in enumerate(sizes, start=1):
+        codes = [f"L{level:02d}-{i:06d}" for i in range(size)]
+        parents = rng.integers(0, len(previous), size)
+        for i, code in enumerate(codes):
+            rows.append((previous[parents[i]], code, float(rng.integers(1, 4)), 10 * (i + 1)))
+            if len(previous) > 1 and rng.random() < shared:
+                other = previous[(parents[i] + 1) % len(previous)]
+                rows.append((other, code, 1.0, 10 * (i + 1)))
+        previous = codes
+
+    with database.transaction(immediate=True) as conn:
+        conn.executemany("""
+            INSERT INTO bom_lines (parent_code, component_code, quantity, seq)
+            VALUES (?, ?, ?, ?)
+        """, rows)
+    return len(rows), previous[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BOM 전개 벤치마크")
+    parser.add_argument('--components', type=int, default=50000, help="하위 품목 수")
+    parser.add_argument('--levels', type=int, default=10, help="BOM 단계 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'bom.db')})
+        migrate()
+        lines, leaf = populate(args.components, args.levels)
+
+        started = time.perf_counter()
+        closure = bom.rebuild_where_used()
+        rebuild_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        rows = len(bom.explode('TOP'))
+        cold_ms = (time.perf_counter() - started) * 1000
+
+        print(f"\nBOM {args.levels}단계, 품목 {args.components:,}개, 구성 {lines:,}행 "
+              f"(정전개 {rows:,}행, 사용처 폐포 {closure:,}행)")
+        print(f"  사용처 폐포 전체 재계산 {rebuild_ms:8.1f}ms")
+        print(f"  정전개 (최초, 적재 포함) {cold_ms:8.1f}ms")
+        print(f"  정전개 (메모)           {measure(lambda: bom.explode('TOP', 3)):8.1f}ms")
+        print(f"  총소요량 (메모)         {measure(lambda: bom.requirements('TOP', 3)):8.1f}ms")
+        print(f"  사용처 ({leaf})  {measure(lambda: bom.where_used(leaf)):8.2f}ms")
+        print(f"  역전개 ({leaf})  {measure(lambda: bom.implode(leaf)):8.2f}ms")
+
+        def revise():
+            parent = bom.where_used(leaf).iloc[0]['ancestor_code']
+            bom.set_bom(parent, [(leaf, 2.0)])
+            bom.requirements('TOP')
+
+        print(f"  개정 + 총소요량 재계산  {measure(revise, repeat=3):8.1f}ms")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# File: /scripts/benchmark_item_search.py
+# 품목 검색 벤치마크 - 대량 품목을 적재한 뒤 이전 방식(LIKE '%x%' 전체 검색)과
+# FTS5 trigram 색인 검색(search_items)의 조회 시간을 검색어 유형별로 비교.
+# 색인 검색은 품목 20만 개에서도 20ms 이내여야 함
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.search import search_items
+
+MATERIALS = ['SUS', 'STEEL', '알루미늄', '황동', 'PVC', 'NYLON', '주철', '티타늄']
+PARTS = ['볼트', '너트', '와셔', '볼베어링', '스프링', '서보모터', '기어', '샤프트',
+         '커플링', '볼밸브', '실린더', '근접센서', '케이블', '브라켓', '플랜지', '풀리']
+CATEGORIES = ['material', 'component', 'product', 'consumable']
+
+QUERIES = [
+    ('코드 접두', 'ITEM0123'),
+    ('코드 (소문자)', 'item012345'),
+    ('이름 접두', '티타늄 풀리'),
+    ('한글 부분', '베어링'),
+    ('두 글자', '밸브'),
+    ('규격 부분', 'M12x100'),
+    ('오타', '티타늄 커플링 M8x4O'),
+    ('결과 없음', '존재하지않는품목'),
+]
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def like_search(term):
+    """이전 방식 - 품목 마스터 화면의 LIKE '%x%' 전체 검색 (행 수 제한 없음)"""
+    return database.fetch_all("""
+        SELECT * FROM item_master
+        WHERE item_code LIKE ? OR item_name LIKE ?
+    """, (f"%{term}%", f"%{term}%"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="품목 검색 벤치마크")
+    parser.add_argument('--items', type=int, default=200000, help="품목 수")
+    parser.add_argument('--limit', type=int, default=100, help="검색 결과 행 수")
+    args = parser.parse_args()
+
+    rng = random.Random(24)
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'item_search.db')})
+        migrate()
+        started = time.perf_counter()
+        with database.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO item_master (item_code, item_name, category) VALUES (?, ?, ?)",
+                ((f"ITEM{i:06d}",
+                  f"{rng.choice(MATERIALS)} {rng.choice(PARTS)} M{rng.randint(3, 30)}x{rng.randint(5, 200)}",
+                  rng.choice(CATEGORIES))
+                 for i in range(args.items))
+            )
+        load = time.perf_counter() - started
+        print(f"\n품목 {args.items:,}개 적재 (색인 트리거 포함) {load:.1f}s, 결과 {args.limit}행")
+
+        slowest = 0
+        for label, term in QUERIES:
+            like_ms = measure(lambda: like_search(term), 3)
+            index_ms = measure(lambda: search_items(term, limit=args.limit))
+            df = search_items(term, limit=args.limit)
+            top = f"{df['item_code'].iloc[0]} {df['item_name'].iloc[0]} ({df['match'].iloc[0]})" \
+                if not df.empty else "-"
+            print(f"  {label:<10} '{term}': LIKE {like_ms:6.1f}ms, 색인 {index_ms:5.1f}ms, "
+                  f"{len(df)}건, 1위 {top}")
+            slowest = max(slowest, index_ms)
+
+        print(f"  색인 검색 최대 {slowest:.1f}ms ({'통과' if slowest < 20 else '20ms 초과'})")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# File: /scripts/benchmark_lot_trace.py
+# LOT 계보 벤치마크 - 자재 -> 반제품 -> 제품 3단계 계보에서 리콜 보고/추적 응답 시간
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.quality import genealogy
+
+
+def populate(materials, wips, products, inputs, seed=42):
+    """LOT 연결/출하 샘플 적재 (반제품/제품마다 하위 단계 LOT inputs 개 투입)"""
+    rng = np.random.default_rng(seed)
+    wip_parents = rng.integers(0, materials, (wips, inputs))
+    product_parents = rng.integers(0, wips, (products, inputs))
+
+    links = [(f"M{p:07d}", f"W{w:07d}") for w, parents in enumerate(wip_parents.tolist()) for p in set(parents)]
+    links += [(f"W{p:07d}", f"P{c:07d}") for c, parents in enumerate(product_parents.tolist()) for p in set(parents)]
+    customers = rng.integers(0, 500, products).tolist()
+    shipments = [(f"P{c:07d}", '2026-01-15', f"C{cust:04d}", f"SO-{c:07d}", 10)
+                 for c, cust in enumerate(customers)]
+
+    with database.transaction(immediate=True) as conn:
+        conn.executemany("INSERT OR IGNORE INTO lot_links (parent_lot, child_lot) VALUES (?, ?)", links)
+        conn.executemany("""
+            INSERT INTO lot_shipments (lot_number, ship_date, customer_code, order_number, quantity)
+            VALUES (?, ?, ?, ?, ?)
+        """, shipments)
+    return len(links), len(shipments)
+
+
+def measure(func, samples):
+    """샘플 LOT 별 소요 시간 중앙값 / 최대 (밀리초)"""
+    timings = []
+    for lot in samples:
+        started = time.perf_counter()
+        func(lot)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LOT 계보 벤치마크")
+    parser.add_argument('--materials', type=int, default=200000, help="자재 LOT 수")
+    parser.add_argument('--wips', type=int, default=600000, help="반제품 LOT 수")
+    parser.add_argument('--products', type=int, default=600000, help="제품 LOT 수")
+    parser.add_argument('--inputs', type=int, default=2, help="LOT 당 투입 LOT 수")
+    parser.add_argument('--samples', type=int, default=50, help="측정할 LOT 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'lots.db')})
+        migrate()
+
+        started = time.perf_counter()
+        link_count, shipment_count = populate(args.materials, args.wips, args.products, args.inputs)
+        total_lots = args.materials + args.wips + args.products
+        print(f"\nLOT {total_lots:,}개, 연결 {link_count:,}건, 출하 {shipment_count:,}건 "
+              f"(적재 {time.perf_counter() - started:.1f}s)")
+
+        rng = np.random.default_rng(7)
+        materials = [f"M{i:07d}" for i in rng.integers(0, args.materials, args.samples)]
+        products = [f"P{i:07d}" for i in rng.integers(0, args.products, args.samples)]
+
+        report = genealogy.recall_report(materials[0])
+        print(f"  예시 {materials[0]}: 하위 LOT {report['affected_lots']}개, "
+              f"출하 {len(report['shipments'])}건, 고객 {len(report['customers'])}곳")
+
+        results = [
+            ('리콜 보고 (자재 LOT)', genealogy.recall_report, materials),
+            ('정방향 추적 (자재 LOT)', lambda lot: genealogy.trace(lot, 'forward'), materials),
+            ('역방향 추적 (제품 LOT)', lambda lot: genealogy.trace(lot, 'backward'), products),
+            ('LOT 이력 (제품 LOT)', lambda lot: genealogy.get_lot_events(lot, 'backward'), products),
+        ]
+        print(f"  {'':<24} {'중앙값':>8} {'최대':>8}  ({args.samples}개 LOT)")
+        for name, func, samples in results:
+            median, worst = measure(func, samples)
+            print(f"  {name:<24} {median:7.2f}ms {worst:7.2f}ms")
+
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
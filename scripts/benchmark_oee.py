@@ -0,0 +1,109 @@
+# File: /scripts/benchmark_oee.py
+# OEE 조회/차트 벤치마크 - 30일 × 20라인 × 3교대 교대별 집계에서 OEE 계산 + 차트 생성
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.mes import oee, rollups
+from modules.mes.callbacks import create_oee_line_figure, create_oee_trend_figure
+
+PROCESSES = ['절단', '가공', '조립', '검사', '포장']
+
+
+def populate(days, lines, logs_per_shift, seed=42):
+    """실적/비가동/기준 정보 샘플 적재 (라인마다 공정 하나)"""
+    rng = np.random.default_rng(seed)
+    start = date(2026, 1, 1)
+    line_codes = [f"LINE-{i + 1:02d}" for i in range(lines)]
+
+    logs, events = [], []
+    for d in range(days):
+        work_date = (start + timedelta(days=d)).isoformat()
+        for i, line in enumerate(line_codes):
+            process = PROCESSES[i % len(PROCESSES)]
+            for shift in oee.SHIFTS:
+                prod = rng.integers(20, 80, logs_per_shift)
+                defect = rng.integers(0, 3, logs_per_shift)
+                logs.extend(
+                    (f"LOT-{d}-{i}-{shift}-{n}", work_date, process, int(p), int(p), int(q), line, shift)
+                    for n, (p, q) in enumerate(zip(prod, defect))
+                )
+                events.append((work_date, shift, line, process, float(rng.integers(0, 90))))
+
+    with database.transaction(immediate=True) as conn:
+        with rollups.bulk_load(conn):
+            conn.executemany("""
+                INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty,
+                                       line_code, shift)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, logs)
+        conn.executemany("""
+            INSERT INTO downtime_events (event_date, shift, line_code, process, duration_min)
+            VALUES (?, ?, ?, ?, ?)
+        """, events)
+    for process in PROCESSES:
+        oee.set_standard(process, 60)
+
+    end = (start + timedelta(days=days - 1)).isoformat()
+    return start.isoformat(), end, len(logs)
+
+
+def render(start, end):
+    """분석 화면 OEE 콜백과 같은 처리"""
+    rows = oee.get_shift_rows(start, end)
+    line_fig = create_oee_line_figure(oee.compute_oee(rows, by=('line_code',)))
+    trend_fig = create_oee_trend_figure(oee.compute_oee(rows, by=('work_date', 'shift')))
+    return line_fig, trend_fig
+
+
+def measure(func, repeat):
+    """중앙값 (밀리초)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OEE 조회/차트 벤치마크")
+    parser.add_argument('--days', type=int, default=30, help="기간 (일)")
+    parser.add_argument('--lines', type=int, default=20, help="라인 수")
+    parser.add_argument('--logs-per-shift', type=int, default=10, help="라인/교대당 실적 건수")
+    parser.add_argument('--repeat', type=int, default=10, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'oee.db')})
+        migrate()
+        start, end, log_count = populate(args.days, args.lines, args.logs_per_shift)
+        shift_rows = database.fetch_scalar("SELECT COUNT(*) FROM oee_shift_summary")
+
+        print(f"\n{args.days}일 × {args.lines}라인 × {len(oee.SHIFTS)}교대 "
+              f"(실적 {log_count:,}건, 교대별 집계 {shift_rows:,}행, 중앙값 {args.repeat}회)")
+        results = [
+            ('집계 행 조회', lambda: oee.get_shift_rows(start, end)),
+            ('라인별 OEE', lambda: oee.get_oee(start, end, by=('line_code',))),
+            ('일자 × 교대 OEE', lambda: oee.get_oee(start, end, by=('work_date', 'shift'))),
+            ('조회 + 계산 + 차트 2개', lambda: render(start, end)),
+        ]
+        for name, func in results:
+            print(f"  {name:<24} {measure(func, args.repeat):8.1f} ms")
+
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# File: /scripts/benchmark_production_ingest.py
+# 생산 실적 일괄 등록 벤치마크 - 본문 파싱 + 검증 + 등록 처리량 (행/초)
+
+import os
+import sys
+import csv
+import io
+import json
+import time
+import argparse
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.hr.models import ProductionSchema
+from modules.mes.ingest import ingest_production, INSERT_COLUMNS
+
+FORMATS = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def make_records(rows, seed=42):
+    """게이트웨이 전송 형식의 샘플 실적"""
+    rng = np.random.default_rng(seed)
+    plan = rng.integers(50, 200, rows).tolist()
+    prod = [int(p * f) for p, f in zip(plan, rng.uniform(0.7, 1.2, rows))]
+    processes = rng.choice(['절단', '가공', '조립', '검사', '포장'], rows).tolist()
+    days = rng.integers(1, 29, rows).tolist()
+    defects = rng.integers(0, 5, rows).tolist()
+    return [
+        {'lot_number': f"LOT-{i:07d}", 'work_date': f"2026-02-{d:02d}", 'process': p,
+         'plan_qty': pq, 'prod_qty': q, 'defect_qty': dq}
+        for i, (d, p, pq, q, dq) in enumerate(zip(days, processes, plan, prod, defects))
+    ]
+
+
+def make_body(records, fmt):
+    if fmt == 'json':
+        return json.dumps(records).encode()
+    if fmt == 'ndjson':
+        return "\n".join(json.dumps(r) for r in records).encode()
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+    return out.getvalue().encode()
+
+
+def schema_baseline(body):
+    """비교용 - 행마다 ProductionSchema.load 후 트리거 집계로 executemany"""
+    rows = ProductionSchema(many=True).load(json.loads(body))
+    params = [(r['lot_number'], r['work_date'].isoformat(), r['process'], 1,
+               r['plan_qty'], r['prod_qty'], r.get('defect_qty', 0),
+               r.get('line_code'), r.get('shift')) for r in rows]
+    with database.transaction(immediate=True) as conn:
+        conn.executemany(f"""
+            INSERT INTO work_logs ({', '.join(INSERT_COLUMNS)})
+            VALUES ({', '.join('?' * len(INSERT_COLUMNS))})
+        """, params)
+    return len(params)
+
+
+def run(label, func, rows):
+    start = time.perf_counter()
+    inserted = func()
+    elapsed = time.perf_counter() - start
+    assert inserted == rows
+    print(f"  {label:<28} {elapsed * 1000:9.0f} ms  {rows / elapsed:10,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생산 실적 일괄 등록 벤치마크")
+    parser.add_argument('--rows', type=int, default=100000, help="요청당 행 수")
+    parser.add_argument('--formats', nargs='+', default=list(FORMATS), choices=list(FORMATS))
+    parser.add_argument('--baseline', action='store_true', help="스키마 load + 트리거 방식도 측정")
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    print(f"\n{args.rows:,}행 / 요청 (파싱 + 검증 + 등록)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats:
+            database.configure({'path': os.path.join(tmp, f"{fmt}.db")})
+            migrate()
+            body = make_body(records, fmt)
+            run(f"{fmt} ({len(body) / 1e6:.1f} MB)",
+                lambda: ingest_production(body, FORMATS[fmt], worker_id=1)['inserted'], args.rows)
+
+        if args.baseline:
+            database.configure({'path': os.path.join(tmp, 'baseline.db')})
+            migrate()
+            body = make_body(records, 'json')
+            run("json (schema + trigger)", lambda: schema_baseline(body), args.rows)
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
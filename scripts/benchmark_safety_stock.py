@@ -0,0 +1,118 @@
+# File: /scripts/benchmark_safety_stock.py
+# 안전재고 최적화 벤치마크 - 대량 품목에 180일 출고와 발주/입고 실적을 적재한
+# 뒤 전 품목 안전재고/발주점 재계산(propose_safety_stock) 시간을 측정하고,
+# 품목별로 수요/리드타임을 따로 조회해 계산하는 방식과 비교 (표본 품목으로 추정,
+# receiving_inspection 에 품목 인덱스가 없어 품목마다 입고 실적 전체를 읽음).
+# 10만 품목 재계산이 수 초 안에 끝나야 함
+
+import os
+import sys
+import time
+import math
+import random
+import argparse
+import tempfile
+import statistics
+from datetime import date, timedelta
+from statistics import NormalDist
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.safety_stock import propose_safety_stock, get_proposals, DEMAND_TYPES
+
+AS_OF = date(2024, 6, 30)
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def per_item(item_code, service_level):
+    """이전 방식 - 품목 하나씩 수요/리드타임 조회 후 계산"""
+    start = (AS_OF - timedelta(days=179)).isoformat()
+    placeholders = ','.join('?' * len(DEMAND_TYPES))
+    daily = dict(database.fetch_all(f"""
+        SELECT movement_date, -SUM(quantity) FROM stock_movements
+        WHERE item_code = ? AND movement_date >= ? AND movement_date <= ?
+          AND movement_type IN ({placeholders})
+        GROUP BY movement_date
+    """, (item_code, start, AS_OF.isoformat(), *DEMAND_TYPES)))
+    demand = [daily.get((AS_OF - timedelta(days=i)).isoformat(), 0) for i in range(180)]
+    leads = [r[0] for r in database.fetch_all("""
+        SELECT julianday(MIN(ri.receiving_date)) - julianday(po.po_date)
+        FROM receiving_inspection ri JOIN purchase_orders po ON po.po_number = ri.po_number
+        WHERE ri.item_code = ? GROUP BY ri.po_number
+    """, (item_code,))]
+    d, sd = statistics.mean(demand), statistics.stdev(demand)
+    lead = statistics.mean(leads) if len(leads) >= 3 else 7
+    sl = statistics.stdev(leads) if len(leads) >= 3 else 0
+    return math.ceil(NormalDist().inv_cdf(service_level) * math.sqrt(lead * sd ** 2 + d ** 2 * sl ** 2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="안전재고 최적화 벤치마크")
+    parser.add_argument('--items', type=int, default=100000, help="품목 수")
+    parser.add_argument('--active-days', type=int, default=20, help="품목별 180일 중 출고 일수")
+    parser.add_argument('--receipts', type=int, default=4, help="품목별 입고 실적 건수")
+    args = parser.parse_args()
+
+    rng = random.Random(25)
+    codes = [f"ITEM{i:06d}" for i in range(args.items)]
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'safety_stock.db')})
+        migrate()
+        started = time.perf_counter()
+        with database.transaction() as conn:
+            conn.executemany("INSERT INTO item_master (item_code, item_name) VALUES (?, ?)",
+                             ((code, f"품목{code}") for code in codes))
+            conn.executemany("INSERT INTO supplier_master (supplier_code, supplier_name, lead_time) VALUES (?, ?, ?)",
+                             ((f"SUP{s:03d}", f"거래처{s}", rng.randint(3, 20)) for s in range(200)))
+            conn.executemany("""
+                INSERT INTO stock_movements (movement_date, movement_type, item_code, quantity)
+                VALUES (?, ?, ?, ?)
+            """, ((((AS_OF - timedelta(days=rng.randrange(180))).isoformat(),
+                    rng.choice(DEMAND_TYPES), code, -rng.randint(1, 50))
+                   for code in codes for _ in range(args.active_days))))
+            pos, receipts = [], []
+            for n, code in enumerate(codes):
+                supplier = f"SUP{n % 200:03d}"
+                for r in range(args.receipts):
+                    ordered = AS_OF - timedelta(days=rng.randrange(30, 360))
+                    po = f"PO{n:06d}-{r}"
+                    pos.append((po, ordered.isoformat(), supplier))
+                    receipts.append(((ordered + timedelta(days=rng.randint(3, 21))).isoformat(), po, code))
+            conn.executemany("INSERT INTO purchase_orders (po_number, po_date, supplier_code) VALUES (?, ?, ?)", pos)
+            conn.executemany("""
+                INSERT INTO receiving_inspection (receiving_date, po_number, item_code, received_qty, accepted_qty)
+                VALUES (?, ?, ?, 1, 1)
+            """, receipts)
+        movements = database.fetch_scalar("SELECT COUNT(*) FROM stock_movements")
+        print(f"\n품목 {args.items:,}개, 출고 {movements:,}건, 입고 실적 {len(receipts):,}건 "
+              f"적재 {time.perf_counter() - started:.1f}s")
+
+        batch_ms = measure(lambda: propose_safety_stock(0.95, AS_OF.isoformat()), 3)
+        summary = propose_safety_stock(0.95, AS_OF.isoformat())
+        print(f"  전 품목 일괄 계산 + 제안 저장: {batch_ms / 1000:.2f}s (제안 {summary['proposed']:,}개)")
+
+        sample = rng.sample(codes, 200)
+        sample_ms = measure(lambda: [per_item(code, 0.95) for code in sample], 1)
+        print(f"  품목별 조회 방식: {len(sample)}개 {sample_ms:.0f}ms -> "
+              f"{args.items:,}개 추정 {sample_ms / len(sample) * args.items / 1000:.0f}s")
+
+        proposals = get_proposals().set_index('item_code')
+        same = all(per_item(code, 0.95) == proposals.loc[code, 'safety_stock'] for code in sample[:50])
+        print(f"  표본 50개 품목별 계산과 일치: {'예' if same else '아니오'}")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
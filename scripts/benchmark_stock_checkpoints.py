@@ -0,0 +1,101 @@
+# File: /scripts/benchmark_stock_checkpoints.py
+# 기준일 재고 벤치마크 - 수년치 재고 이동을 적재한 뒤 기준일 재고와 월말 재고
+# 추이를 원장 전체 합산(이전 방식)과 체크포인트 + 이후 이동 방식으로 조회해
+# 시간을 비교. 이력이 길어져도 체크포인트 방식은 조회 시간이 일정해야 함
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.checkpoints import balances_as_of, month_end_report, ensure_checkpoints
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def replay_as_of(as_of):
+    """이전 방식 - 기준일까지 원장 전체 합산"""
+    return database.fetch_all("""
+        SELECT item_code, COALESCE(warehouse, 'wh1'), SUM(quantity)
+        FROM stock_movements
+        WHERE movement_date <= ?
+        GROUP BY 1, 2
+        HAVING SUM(quantity) != 0
+    """, (as_of,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기준일 재고 벤치마크")
+    parser.add_argument('--years', type=int, default=5, help="이력 기간 (년)")
+    parser.add_argument('--movements', type=int, default=1000000, help="재고 이동 건수")
+    parser.add_argument('--items', type=int, default=2000, help="품목 수")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    first = date(2020, 1, 1)
+    days = args.years * 365
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'checkpoints.db')})
+        migrate()
+        with database.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO item_master (item_code, item_name) VALUES (?, ?)",
+                ((f"ITEM{i:05d}", f"품목{i}") for i in range(args.items))
+            )
+            conn.executemany("""
+                INSERT INTO stock_movements (movement_date, movement_type, item_code, quantity, warehouse)
+                VALUES (?, ?, ?, ?, ?)
+            """, sorted(
+                ((first + timedelta(days=rng.randrange(days))).isoformat(), 'IN_bench',
+                 f"ITEM{rng.randrange(args.items):05d}", rng.randint(-20, 25),
+                 'wh1' if rng.random() < 0.7 else 'wh2')
+                for _ in range(args.movements)
+            ))
+        last = (first + timedelta(days=days - 1)).isoformat()
+        print(f"\n{args.years}년 ({first} ~ {last}), 이동 {args.movements:,}건, 품목 {args.items:,}개")
+
+        started = time.perf_counter()
+        created = ensure_checkpoints(last)
+        build = time.perf_counter() - started
+        rows = database.fetch_scalar("SELECT COUNT(*) FROM stock_checkpoints")
+        print(f"  월말 체크포인트 {len(created)}개 최초 생성 {build:.1f}s (잔액 {rows:,}행)")
+
+        for as_of in (f"{first.year}-06-15", f"{first.year + args.years - 1}-06-15"):
+            replay_ms = measure(lambda: replay_as_of(as_of), 3)
+            checkpoint_ms = measure(lambda: balances_as_of(as_of))
+            same = sorted(map(tuple, replay_as_of(as_of))) == sorted(
+                map(tuple, balances_as_of(as_of)[['item_code', 'warehouse', 'quantity']].values.tolist()))
+            print(f"  기준일 {as_of}: 원장 합산 {replay_ms:.0f}ms, 체크포인트 {checkpoint_ms:.1f}ms "
+                  f"(결과 일치 {'예' if same else '아니오'})")
+
+        item_ms = measure(lambda: balances_as_of(f"{first.year + args.years - 1}-06-15", 'ITEM00001'))
+        print(f"  한 품목 기준일 재고 {item_ms:.2f}ms")
+
+        start_month, end_month = f"{first.year}-01", last[:7]
+        year_ends = [f"{year}-12-31" for year in range(first.year, first.year + args.years)]
+        replay_ms = measure(lambda: [replay_as_of(year_end) for year_end in year_ends], 1)
+        report_ms = measure(lambda: month_end_report(start_month, end_month), 3)
+        print(f"  월말 재고 {args.years * 12}개월: 체크포인트 {report_ms:.0f}ms "
+              f"(원장 합산은 연말 {args.years}회만으로 {replay_ms:.0f}ms)")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
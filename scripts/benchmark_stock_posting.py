@@ -0,0 +1,160 @@
+# File: /scripts/benchmark_stock_posting.py
+# 재고 전기 동시성 벤치마크 - 여러 스레드가 목표 속도(기본 500건/s)로 입출고를
+# 전기하고, 스레드가 직접 집계한 통과 수량과 DB 의 창고 잔액/품목 현재고/원장을
+# 비교해 누락된 갱신(lost update)이 없는지 확인. 이어서 한 품목의 재고를 여러
+# 스레드가 동시에 1개씩 출고해 정확히 재고 수량만 통과하는지(초과 출고 없음) 확인
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+import statistics
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.stock import (post_movement, post_stock, reconcile_stock_balances,
+                                     InsufficientStockError)
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run(args):
+    """스레드별로 일정 간격(목표 속도)으로 전기
+
+    반환값: (지연 ms 목록, 통과 건수, 재고부족 건수, 경과 초, 통과 수량 {(품목, 창고): 합계})
+    """
+    per_thread = args.postings // args.threads
+    interval = args.threads / args.rate
+    latencies, applied = [], Counter()
+    counts = {'accepted': 0, 'rejected': 0}
+    lock = threading.Lock()
+    start_at = time.perf_counter() + 0.1
+
+    def worker(seed):
+        rng = random.Random(seed)
+        local, totals, accepted, rejected = [], Counter(), 0, 0
+        for i in range(per_thread):
+            due = start_at + (i + seed / args.threads) * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            item = f"ITEM{rng.randrange(args.items):03d}"
+            warehouse = 'wh1' if rng.random() < 0.7 else 'wh2'
+            # 출고가 조금 더 많아 재고가 바닥을 오가도록
+            quantity = rng.randint(1, 5) if rng.random() < 0.45 else -rng.randint(1, 5)
+            started = time.perf_counter()
+            try:
+                post_stock('2026-01-02', 'IN_bench' if quantity > 0 else 'OUT_bench',
+                           item, quantity, warehouse, check_stock=True)
+                totals[(item, warehouse)] += quantity
+                accepted += 1
+            except InsufficientStockError:
+                rejected += 1
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+            applied.update(totals)
+            counts['accepted'] += accepted
+            counts['rejected'] += rejected
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start_at
+    return sorted(latencies), counts['accepted'], counts['rejected'], elapsed, applied
+
+
+def drain(item, threads, attempts):
+    """여러 스레드가 같은 품목/창고에서 동시에 1개씩 출고 - 통과 건수"""
+    accepted = []
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(attempts):
+            try:
+                post_stock('2026-01-03', 'OUT_drain', item, -1, 'wh1', check_stock=True)
+                accepted.append(1)
+            except InsufficientStockError:
+                pass
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return len(accepted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 전기 동시성 벤치마크")
+    parser.add_argument('--postings', type=int, default=5000, help="전기 건수")
+    parser.add_argument('--rate', type=float, default=500, help="목표 속도 (건/s)")
+    parser.add_argument('--threads', type=int, default=16, help="전기 스레드 수")
+    parser.add_argument('--items', type=int, default=20, help="품목 수 (적을수록 경합 증가)")
+    parser.add_argument('--opening', type=int, default=30, help="품목/창고별 기초재고")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'stock.db')})
+        migrate()
+        with database.transaction() as conn:
+            for i in range(args.items):
+                conn.execute("INSERT INTO item_master (item_code, item_name) VALUES (?, ?)",
+                             (f"ITEM{i:03d}", f"품목{i}"))
+                for warehouse in ('wh1', 'wh2'):
+                    post_movement(conn, '2026-01-01', 'OPENING', f"ITEM{i:03d}",
+                                  args.opening, warehouse)
+
+        single_ms = measure(lambda: post_stock('2026-01-01', 'OPENING', 'ITEM000', 0, 'wh1'), 50)
+        latencies, accepted, rejected, elapsed, applied = run(args)
+
+        balances = {(item, warehouse): quantity for item, warehouse, quantity in database.fetch_all(
+            "SELECT item_code, warehouse, quantity FROM stock_balances")}
+        lost = sum(1 for key, quantity in balances.items() if quantity != args.opening + applied[key])
+        stock_total = database.fetch_scalar("SELECT SUM(current_stock) FROM item_master")
+        movements = database.fetch_scalar(
+            "SELECT COUNT(*) FROM stock_movements WHERE movement_type != 'OPENING'")
+        negative = database.fetch_scalar("SELECT COUNT(*) FROM stock_balances WHERE quantity < 0")
+
+        print(f"\n{args.threads}개 스레드, 목표 {args.rate:.0f}건/s, 품목 {args.items}개 x 창고 2곳")
+        print(f"  처리 {accepted + rejected:,}건 / {elapsed:.1f}s = {(accepted + rejected) / elapsed:,.0f}건/s "
+              f"(통과 {accepted:,}, 재고부족 {rejected:,}), 단건 {single_ms:.2f}ms")
+        print(f"  지연 p50 {latencies[len(latencies) // 2]:.2f}ms / "
+              f"p99 {latencies[int(len(latencies) * 0.99)]:.2f}ms")
+        print(f"  통과 수량과 다른 잔액 {lost}건, 원장 {movements:,}건 (통과 {accepted:,}), "
+              f"현재고 합계 {stock_total:,} (기대 {args.opening * 2 * args.items + sum(applied.values()):,}), "
+              f"음수 잔액 {negative}건, 대사 불일치 {len(reconcile_stock_balances())}건")
+
+        # 같은 잔액을 두고 동시 출고 - 재고 수량만큼만 통과해야 함
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('HOT', '경합 품목')")
+            post_movement(conn, '2026-01-01', 'OPENING', 'HOT', args.opening, 'wh1')
+        started = time.perf_counter()
+        drained = drain('HOT', args.threads, args.opening)
+        drain_ms = (time.perf_counter() - started) * 1000
+        remaining = database.fetch_scalar("SELECT quantity FROM stock_balances WHERE item_code = 'HOT'")
+        print(f"  동시 출고 {args.threads * args.opening:,}건 중 통과 {drained}건 (재고 {args.opening}), "
+              f"잔액 {remaining}, {drain_ms:.0f}ms")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
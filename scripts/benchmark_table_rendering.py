@@ -0,0 +1,145 @@
+# File: /scripts/benchmark_table_rendering.py
+# 테이블 렌더링 벤치마크 - 행 단위(df.apply / iterrows) 대비 core.tables 벡터화 처리
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+import numpy as np
+import pandas as pd
+from dash import html
+import dash_bootstrap_components as dbc
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import tables
+
+RECORD_COLUMNS = ['item_code', 'item_name', 'safety_stock', 'current_stock', 'stock_status']
+
+
+def make_frames(rows, seed=42):
+    """작업 실적/품목 샘플 데이터"""
+    rng = np.random.default_rng(seed)
+    plan = rng.integers(0, 200, rows)
+    work_logs = pd.DataFrame({
+        'work_date': '2026-01-01',
+        'lot_number': [f"LOT-{i:06d}" for i in range(rows)],
+        'process': rng.choice(['절단', '가공', '조립', '검사', '포장'], rows),
+        'plan_qty': plan,
+        'prod_qty': (plan * rng.uniform(0.7, 1.2, rows)).astype(int),
+        'defect_qty': rng.integers(0, 5, rows),
+    })
+    items = pd.DataFrame({
+        'item_code': [f"ITEM{i:06d}" for i in range(rows)],
+        'item_name': '품목',
+        'current_stock': rng.integers(0, 300, rows),
+        'safety_stock': rng.integers(0, 100, rows),
+    })
+    return work_logs, items
+
+
+# ---- 기존 행 단위 방식 ----
+
+def legacy_derived(work_logs, items):
+    df = work_logs.copy()
+    df['achievement_rate'] = df.apply(
+        lambda row: min(round((row['prod_qty'] / row['plan_qty']) * 100, 1), 100) if row['plan_qty'] > 0 else 0,
+        axis=1
+    )
+    df['defect_rate'] = df.apply(
+        lambda row: round((row['defect_qty'] / row['prod_qty'] * 100), 1) if row['prod_qty'] > 0 else 0,
+        axis=1
+    )
+    items = items.copy()
+    items['stock_status'] = items.apply(
+        lambda row: '부족' if row['current_stock'] < row['safety_stock']
+        else '과잉' if row['current_stock'] > row['safety_stock'] * 2
+        else '정상', axis=1
+    )
+    return df, items
+
+
+def legacy_rows(items):
+    body = []
+    for idx, row in items.iterrows():
+        status_badge = dbc.Badge(
+            row['stock_status'],
+            color="danger" if row['stock_status'] == '부족'
+            else "warning" if row['stock_status'] == '과잉'
+            else "success"
+        )
+        body.append(html.Tr([
+            html.Td(row['item_code']),
+            html.Td(row['item_name']),
+            html.Td(f"{row['safety_stock']:,}"),
+            html.Td(f"{row['current_stock']:,}"),
+            html.Td(status_badge)
+        ]))
+    return body
+
+
+# ---- core.tables ----
+
+def vector_derived(work_logs, items):
+    df = work_logs.copy()
+    df['achievement_rate'] = tables.achievement_rate(df['plan_qty'], df['prod_qty'])
+    df['defect_rate'] = tables.defect_rate(df['defect_qty'], df['prod_qty'])
+    items = items.copy()
+    items['stock_status'] = tables.stock_status(items['current_stock'], items['safety_stock'])
+    return df, items
+
+
+def vector_rows(items):
+    return tables.table_rows(
+        items['item_code'].tolist(),
+        items['item_name'].tolist(),
+        tables.number_cells(items['safety_stock']),
+        tables.number_cells(items['current_stock']),
+        tables.badge_cells(items['stock_status'],
+                           tables.badge_colors(items['stock_status'], tables.STOCK_STATUS_COLORS))
+    )
+
+
+def measure(func, repeat):
+    """중앙값 (밀리초)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="테이블 렌더링 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000], help="행 수")
+    parser.add_argument('--repeat', type=int, default=3, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        work_logs, items = make_frames(rows)
+
+        # 결과 일치 확인
+        legacy_df, legacy_items = legacy_derived(work_logs, items)
+        vector_df, vector_items = vector_derived(work_logs, items)
+        for column in ('achievement_rate', 'defect_rate'):
+            assert np.allclose(legacy_df[column].astype(float), vector_df[column])
+        assert (legacy_items['stock_status'] == vector_items['stock_status']).all()
+
+        results = [
+            ('파생 컬럼 (행 단위)', lambda: legacy_derived(work_logs, items)),
+            ('파생 컬럼 (벡터화)', lambda: vector_derived(work_logs, items)),
+            ('행 생성 (iterrows)', lambda: legacy_rows(legacy_items)),
+            ('행 생성 (컬럼 zip)', lambda: vector_rows(vector_items)),
+            ('DataTable 레코드', lambda: tables.table_records(vector_items, RECORD_COLUMNS)),
+        ]
+
+        print(f"\n{rows:,}행 (중앙값, {args.repeat}회)")
+        for name, func in results:
+            print(f"  {name:<20} {measure(func, args.repeat):10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# File: /scripts/benchmark_telemetry.py
+# 텔레메트리 게이트웨이 벤치마크 - 별도 프로세스의 설비 시뮬레이터가 TCP/UDP 로
+# 계수기/센서 값을 보내고, 게이트웨이(수신 + 블록/집계 플러시)의 처리량(포인트/초)과
+# 게이트웨이 프로세스 CPU 사용 시간을 측정
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.mes import telemetry
+from modules.mes.gateway import TelemetryGateway
+
+
+def simulate(transport, address, machines, points, rate, lines_per_packet=50):
+    """설비 시뮬레이터 - 설비마다 계수기 1개 + 센서 1개, rate 포인트/초로 전송"""
+    tags = [f"M{m:03d}.count" for m in range(machines)] + [f"M{m:03d}.temp" for m in range(machines)]
+    start = time.time() - points / len(tags)
+    if transport == 'udp':
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    else:
+        sock = socket.create_connection(address)
+
+    sent = 0
+    begin = time.perf_counter()
+    while sent < points:
+        lines = []
+        for i in range(sent, min(sent + lines_per_packet, points)):
+            tag = tags[i % len(tags)]
+            step = i // len(tags)
+            value = step if tag.endswith('count') else 60 + (step % 7)
+            lines.append(f"{tag} {value} {start + step:.3f}\n")
+        payload = ''.join(lines).encode()
+        if transport == 'udp':
+            sock.sendto(payload, address)
+        else:
+            sock.sendall(payload)
+        sent += len(lines)
+        # 목표 전송률 유지
+        ahead = sent / rate - (time.perf_counter() - begin)
+        if ahead > 0:
+            time.sleep(ahead)
+    sock.close()
+
+
+def run(transport, machines, points, rate, flush_interval):
+    gateway = TelemetryGateway(host='127.0.0.1', tcp_port=0, udp_port=0,
+                               flush_interval=flush_interval, feed_interval=3600)
+    gateway.start()
+    store = gateway.store
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    sender = multiprocessing.Process(
+        target=simulate, args=(transport, gateway.addresses[transport], machines, points, rate))
+    sender.start()
+    sender.join()
+    # UDP 는 수신 버퍼에 남은 데이터그램까지 처리될 때까지 대기
+    deadline = time.perf_counter() + 5
+    while store.stats['received'] < points and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    gateway.stop()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    stats = store.stats
+    print(f"  {transport:<4} 수신 {stats['received']:,}/{points:,} ({stats['received'] / elapsed:8,.0f} 포인트/s)  "
+          f"게이트웨이 CPU {cpu:5.2f}s ({cpu / elapsed * 100:3.0f}%)  "
+          f"블록 {stats['chunks']:,}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텔레메트리 게이트웨이 벤치마크")
+    parser.add_argument('--machines', type=int, default=100, help="설비 수 (설비당 태그 2개)")
+    parser.add_argument('--points', type=int, default=300000, help="전송 포인트 수")
+    parser.add_argument('--rate', type=int, default=20000, help="목표 전송률 (포인트/초)")
+    parser.add_argument('--flush-interval', type=float, default=1, help="플러시 주기 (초)")
+    parser.add_argument('--transports', nargs='+', default=['udp', 'tcp'], choices=['udp', 'tcp'])
+    args = parser.parse_args()
+
+    print(f"\n설비 {args.machines}대, {args.points:,} 포인트, 목표 {args.rate:,} 포인트/s, "
+          f"플러시 {args.flush_interval}s")
+    with tempfile.TemporaryDirectory() as tmp:
+        for transport in args.transports:
+            database.configure({'path': os.path.join(tmp, f"{transport}.db")})
+            migrate()
+            for m in range(args.machines):
+                telemetry.register_tag(f"M{m:03d}.count", 'counter', f"LINE-{m % 20 + 1:02d}", '조립')
+            run(transport, args.machines, args.points, args.rate, args.flush_interval)
+
+            chunk_bytes = database.fetch_scalar(
+                "SELECT SUM(LENGTH(ts) + LENGTH(vals)) FROM telemetry_chunks")
+            rollups = database.fetch_scalar("SELECT COUNT(*) FROM telemetry_rollups")
+            fed = telemetry.feed_production(until=time.time() + 60)
+            print(f"       블록 {chunk_bytes / args.points:.1f} 바이트/포인트, 집계 {rollups:,}행, "
+                  f"MES 실적 {fed}건 등록")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
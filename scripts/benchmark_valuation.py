@@ -0,0 +1,109 @@
+# File: /scripts/benchmark_valuation.py
+# 재고 평가 벤치마크 - 품목 10만 개에 입출고 이력을 쌓은 뒤 전기 1건당 평가 갱신
+# 비용, 평가 보고서(이동평균/FIFO) 조회 시간을 측정. 비교 기준은 보고서를 만들
+# 때마다 원장(stock_movements) 전체를 다시 읽어 품목별 이동평균을 계산하는 방식
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.stock import post_movement, post_stock
+from modules.inventory.valuation import get_valuation, get_total_value, check_valuation
+
+
+def measure(func, repeat=5):
+    """실행 시간 중앙값 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def replay_moving_average():
+    """이전 방식 - 원장 전체를 읽어 품목별 이동평균 평가액 재계산"""
+    state = {}
+    conn = database.get_connection()
+    try:
+        rows = conn.execute("""
+            SELECT item_code, quantity, unit_cost FROM stock_movements ORDER BY id
+        """)
+        for item_code, quantity, unit_cost in rows:
+            qty, avg = state.get(item_code, (0, unit_cost))
+            if quantity > 0:
+                avg = unit_cost if qty <= 0 or qty + quantity <= 0 else \
+                    (qty * avg + quantity * unit_cost) / (qty + quantity)
+            state[item_code] = (qty + quantity, avg)
+    finally:
+        conn.close()
+    return sum(qty * avg for qty, avg in state.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 평가 벤치마크")
+    parser.add_argument('--items', type=int, default=100000, help="품목 수")
+    parser.add_argument('--movements', type=int, default=300000, help="사전 적재 입출고 건수")
+    parser.add_argument('--postings', type=int, default=2000, help="측정할 전기 건수")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'valuation.db')})
+        migrate()
+
+        started = time.perf_counter()
+        with database.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO item_master (item_code, item_name, unit_price) VALUES (?, ?, ?)",
+                ((f"ITEM{i:06d}", f"품목{i}", rng.randint(100, 10000)) for i in range(args.items))
+            )
+            for i in range(args.movements):
+                item = f"ITEM{rng.randrange(args.items):06d}"
+                if rng.random() < 0.55:
+                    post_movement(conn, '2026-01-01', 'IN_purchase', item, rng.randint(1, 50),
+                                  unit_cost=rng.randint(100, 10000))
+                else:
+                    post_movement(conn, '2026-01-02', 'OUT_production', item, -rng.randint(1, 30))
+        load = time.perf_counter() - started
+        print(f"\n품목 {args.items:,}개, 입출고 {args.movements:,}건 적재 {load:.1f}s "
+              f"({load / args.movements * 1e6:.0f}us/건, 평가 갱신 포함)")
+
+        timings = []
+        for _ in range(args.postings):
+            item = f"ITEM{rng.randrange(args.items):06d}"
+            quantity = rng.randint(1, 50) if rng.random() < 0.5 else -rng.randint(1, 30)
+            started = time.perf_counter()
+            post_stock('2026-01-03', 'IN_bench' if quantity > 0 else 'OUT_bench', item, quantity,
+                       unit_cost=rng.randint(100, 10000) if quantity > 0 else None)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        layers = database.fetch_scalar("SELECT COUNT(*) FROM stock_cost_layers")
+        open_layers = database.fetch_scalar("SELECT COUNT(*) FROM stock_cost_layers WHERE remaining != 0")
+        print(f"  전기 1건 (트랜잭션 포함) p50 {timings[len(timings) // 2]:.2f}ms / "
+              f"p99 {timings[int(len(timings) * 0.99)]:.2f}ms, 원가층 {layers:,}개 중 잔량 {open_layers:,}개")
+
+        for method in ('moving_avg', 'fifo'):
+            report_ms = measure(lambda: get_valuation(method), 3)
+            total_ms = measure(lambda: get_total_value(method))
+            print(f"  {method:10s} 품목별 보고서 {report_ms:.0f}ms, 총 평가액 {total_ms:.1f}ms "
+                  f"({get_total_value(method):,.0f})")
+
+        replay_ms = measure(replay_moving_average, 3)
+        print(f"  원장 재계산 (이전 방식) {replay_ms:.0f}ms - 증분 평가액과 차이 "
+              f"{abs(replay_moving_average() - get_total_value('moving_avg')):,.2f}")
+        print(f"  평가 대사 불일치 {len(check_valuation())}건")
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# File: /scripts/benchmark_work_log_rollup.py
+# 작업 실적 집계 테이블 벤치마크 - 원본 GROUP BY 대비 최근 30일 분석 쿼리 시간
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.mes import rollups
+
+PROCESSES = ['절단', '가공', '조립', '검사', '포장']
+
+RAW_DAILY = """
+    SELECT work_date, SUM(plan_qty), SUM(prod_qty),
+           AVG(CAST(prod_qty AS FLOAT) / NULLIF(plan_qty, 0) * 100)
+    FROM work_logs
+    WHERE work_date BETWEEN ? AND ?
+    GROUP BY work_date
+    ORDER BY work_date
+"""
+
+RAW_WORKER = """
+    SELECT u.username, COUNT(w.id), SUM(w.prod_qty),
+           AVG(CAST(w.prod_qty AS FLOAT) / NULLIF(w.plan_qty, 0) * 100)
+    FROM work_logs w
+    JOIN users u ON w.worker_id = u.id
+    WHERE w.work_date BETWEEN ? AND ?
+    GROUP BY u.username
+    ORDER BY 3 DESC
+"""
+
+
+def seed(days, per_day, workers):
+    """작업자 및 작업 실적 생성"""
+    today = date.today()
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO users (username, password, role) VALUES (?, 'x', 'worker')",
+            [(f"worker{i}",) for i in range(1, workers + 1)]
+        )
+        rows = []
+        for d in range(days):
+            work_date = (today - timedelta(days=d)).isoformat()
+            for j in range(per_day):
+                plan = random.randint(50, 200)
+                rows.append((
+                    f"LOT-{work_date}-{j:04d}", work_date, random.choice(PROCESSES),
+                    random.randint(1, workers), plan,
+                    int(plan * random.uniform(0.7, 1.2)), random.randint(0, 5)
+                ))
+        conn.executemany("""
+            INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty, defect_qty)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+    return len(rows)
+
+
+def measure(func, repeat):
+    """중앙값 (밀리초)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작업 실적 집계 테이블 벤치마크")
+    parser.add_argument('--days', type=int, default=730, help="생성 기간 (일)")
+    parser.add_argument('--per-day', type=int, default=200, help="일별 작업 건수")
+    parser.add_argument('--workers', type=int, default=30, help="작업자 수")
+    parser.add_argument('--repeat', type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.configure({'path': os.path.join(tmp, 'bench.db')})
+        migrate()
+
+        start = time.perf_counter()
+        total = seed(args.days, args.per_day, args.workers)
+        print(f"📦 작업 실적 {total:,}건 생성 (트리거 포함 {time.perf_counter() - start:.1f}초)")
+
+        end_date = date.today()
+        period = ((end_date - timedelta(days=30)).isoformat(), end_date.isoformat())
+
+        results = [
+            ('일별 생산성 (원본)', lambda: database.fetch_all(RAW_DAILY, period)),
+            ('일별 생산성 (집계)', lambda: rollups.get_daily_summary(*period)),
+            ('작업자별 실적 (원본)', lambda: database.fetch_all(RAW_WORKER, period)),
+            ('작업자별 실적 (집계)', lambda: rollups.get_worker_summary(*period)),
+            ('기간 합계 (집계)', lambda: rollups.get_period_totals(*period)),
+        ]
+
+        print(f"\n최근 30일 분석 쿼리 (중앙값, {args.repeat}회)")
+        for name, func in results:
+            print(f"  {name:<20} {measure(func, args.repeat):8.2f} ms")
+
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# File: /scripts/benchmark_write_buffer.py
+# 쓰기 버퍼 벤치마크 - 동시 단말 N대가 작업 실적을 저장하고 완료 응답을 기다릴 때
+# 요청별 커밋과 그룹 커밋의 처리량(건/초)과 응답 시간 비교
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database, write_buffer
+from core.migrations import migrate
+from core.write_buffer import COMMITTED
+import modules.mes.ingest  # 'mes.work_log' 작업 등록
+
+
+def run_terminals(terminals, entries):
+    """단말마다 entries 건을 순서대로 저장 (건마다 완료 응답 대기)"""
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(terminals + 1)
+
+    def terminal(n):
+        timings = []
+        barrier.wait()
+        for i in range(entries):
+            started = time.perf_counter()
+            ticket = write_buffer.execute('mes.work_log', {
+                'lot_number': f"LOT-{n:03d}-{i:05d}", 'work_date': '2026-03-02',
+                'process': '조립', 'worker_id': n, 'plan_qty': 100, 'prod_qty': 98,
+                'defect_qty': 1, 'line_code': f"LINE-{n % 10:02d}", 'shift': 'A'
+            }, timeout=30)
+            timings.append((time.perf_counter() - started) * 1000)
+            if ticket.status != COMMITTED:
+                failures.append(ticket.error)
+        with lock:
+            latencies.extend(timings)
+
+    threads = [threading.Thread(target=terminal, args=(n,)) for n in range(terminals)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return elapsed, latencies, failures
+
+
+def report(label, terminals, entries, elapsed, latencies, failures):
+    total = terminals * entries
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"  {label:<20} {total / elapsed:9,.0f} 건/s  "
+          f"응답 중앙값 {statistics.median(latencies):7.2f}ms  p95 {p95:7.2f}ms  실패 {len(failures)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쓰기 버퍼 벤치마크")
+    parser.add_argument('--terminals', type=int, default=50, help="동시 단말 수")
+    parser.add_argument('--entries', type=int, default=200, help="단말당 저장 건수")
+    parser.add_argument('--synchronous', default='NORMAL', choices=('OFF', 'NORMAL', 'FULL'),
+                        help="PRAGMA synchronous (FULL = 커밋마다 fsync)")
+    args = parser.parse_args()
+
+    print(f"\n단말 {args.terminals}대 × {args.entries}건 (synchronous={args.synchronous})")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, buffered in (('요청별 커밋', False), ('쓰기 버퍼 (그룹 커밋)', True)):
+            database.configure({
+                'path': os.path.join(tmp, f"{'buffer' if buffered else 'direct'}.db"),
+                'pool_size': args.terminals,
+                'pragmas': {'synchronous': args.synchronous, 'busy_timeout': 30000},
+            })
+            migrate()
+            write_buffer.configure_write_buffer({
+                'enabled': buffered, 'journal': os.path.join(tmp, 'buffer.journal')
+            })
+            result = run_terminals(args.terminals, args.entries)
+            buffer = write_buffer.get_write_buffer()
+            report(label, args.terminals, args.entries, *result)
+            if buffer:
+                stats = buffer.stats
+                print(f"  {'':<20} 커밋 {stats['batches']:,}회, "
+                      f"평균 {stats['committed'] / max(stats['batches'], 1):.1f}건/커밋")
+            write_buffer.configure_write_buffer({'enabled': False})
+
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# File: /scripts/check_query_plans.py
+# 스키마 버전 및 주요 쿼리 실행계획 점검 스크립트
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core.migrations import migrate, current_version
+from core.query_plans import check_query_plans, LARGE_TABLE_ROWS
+
+
+def main():
+    """마이그레이션 적용 후 전체 스캔 쿼리 보고"""
+    print("🔍 스키마/쿼리 실행계획 점검 시작...\n")
+
+    applied = migrate()
+    if applied:
+        print(f"  ✅ 마이그레이션 적용: {', '.join(f'{v:04d}' for v in applied)}")
+    print(f"  📋 현재 스키마 버전: {current_version():04d}\n")
+
+    min_rows = int(sys.argv[1]) if len(sys.argv) > 1 else LARGE_TABLE_ROWS
+    findings = check_query_plans(min_rows=min_rows)
+    if not findings:
+        print(f"  ✅ {min_rows}행 이상 테이블을 전체 스캔하는 쿼리가 없습니다.")
+        return 0
+
+    for finding in findings:
+        print(f"  ❌ {finding['name']}: {finding['table']} ({finding['rows']:,}행) - {finding['detail']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
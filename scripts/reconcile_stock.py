@@ -0,0 +1,45 @@
+# File: /scripts/reconcile_stock.py
+# 재고 잔액 대사 스크립트 - stock_balances / item_master 를 재고 이동 원장과 비교
+#
+# 사용법: python scripts/reconcile_stock.py [--repair]
+# 주기 실행(cron 등)용으로 불일치가 있으면 종료 코드 1 을 반환한다.
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from core.migrations import migrate
+from modules.inventory.stock import reconcile_stock_balances, warehouse_name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 잔액 대사")
+    parser.add_argument('--repair', action='store_true', help="원장 기준으로 잔액/현재고 재계산")
+    args = parser.parse_args()
+
+    print("🔍 재고 잔액 대사 시작...\n")
+    migrate()
+
+    mismatches = reconcile_stock_balances(repair=args.repair)
+    if not mismatches:
+        print("  ✅ 창고 잔액, 품목 현재고가 원장과 일치합니다.")
+        return 0
+
+    for m in mismatches:
+        if m['type'] == 'balance':
+            target = f"{m['item_code']} / {warehouse_name(m['warehouse'])}"
+        else:
+            target = f"{m['item_code']} (현재고)"
+        print(f"  ❌ {target}: 기대값 {m['expected']:,}, 실제값 {m['actual']:,}")
+
+    if args.repair:
+        print(f"\n  🔧 {len(mismatches)}건 재계산 완료")
+        return 0
+    print(f"\n  ⚠️ 불일치 {len(mismatches)}건 - --repair 로 재계산할 수 있습니다.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -151,498 +151,21 @@ def initialize_database():
     """데이터베이스 초기화 및 모든 테이블 생성"""
     print("\n🗄️ 데이터베이스 초기화 중...")
     
-    conn = sqlite3.connect('data/database.db')
-    cursor = conn.cursor()
-    
-    # 기본 시스템 테이블
-    print("  📋 기본 시스템 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            role TEXT DEFAULT 'user',
-            department TEXT,
-            email TEXT,
-            phone TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS system_config (
-            key TEXT PRIMARY KEY,
-            value TEXT,
-            description TEXT,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS system_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            action TEXT NOT NULL,
-            module TEXT,
-            details TEXT,
-            ip_address TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ 시스템 테이블 완료")
-    
-    # MES 테이블
-    print("  🏭 MES 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS work_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lot_number TEXT NOT NULL,
-            work_date DATE NOT NULL,
-            process TEXT NOT NULL,
-            worker_id INTEGER,
-            plan_qty INTEGER,
-            prod_qty INTEGER,
-            defect_qty INTEGER DEFAULT 0,
-            start_time TIMESTAMP,
-            end_time TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ MES 테이블 완료")
-    
-    # 재고관리 테이블
-    print("  📦 재고관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS item_master (
-            item_code TEXT PRIMARY KEY,
-            item_name TEXT NOT NULL,
-            category TEXT,
-            unit TEXT DEFAULT 'EA',
-            safety_stock INTEGER DEFAULT 0,
-            current_stock INTEGER DEFAULT 0,
-            unit_price REAL DEFAULT 0,
-            location TEXT,
-            barcode TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS stock_movements (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            movement_date DATE NOT NULL,
-            movement_type TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            warehouse TEXT,
-            lot_number TEXT,
-            remarks TEXT,
-            created_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code),
-            FOREIGN KEY (created_by) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ 재고관리 테이블 완료")
-    
-    # 구매관리 테이블
-    print("  🛒 구매관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS supplier_master (
-            supplier_code TEXT PRIMARY KEY,
-            supplier_name TEXT NOT NULL,
-            business_no TEXT,
-            ceo_name TEXT,
-            contact_person TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            payment_terms TEXT DEFAULT 'CASH',
-            lead_time INTEGER DEFAULT 7,
-            rating INTEGER DEFAULT 3,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS purchase_orders (
-            po_number TEXT PRIMARY KEY,
-            po_date DATE NOT NULL,
-            supplier_code TEXT NOT NULL,
-            delivery_date DATE,
-            warehouse TEXT,
-            total_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            remarks TEXT,
-            created_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (supplier_code) REFERENCES supplier_master (supplier_code),
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ 구매관리 테이블 완료")
-    
-    # 영업관리 테이블 (V1.0)
-    print("  💼 영업관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS customers (
-            customer_code TEXT PRIMARY KEY,
-            customer_name TEXT NOT NULL,
-            business_no TEXT,
-            ceo_name TEXT,
-            contact_person TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            grade TEXT DEFAULT 'Bronze',
-            payment_terms TEXT DEFAULT 'NET30',
-            credit_limit REAL DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS quotations (
-            quote_number TEXT PRIMARY KEY,
-            quote_date DATE NOT NULL,
-            customer_code TEXT NOT NULL,
-            validity_date DATE NOT NULL,
-            total_amount REAL DEFAULT 0,
-            discount_rate REAL DEFAULT 0,
-            discount_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            notes TEXT,
-            created_by INTEGER,
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            sent_date TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sales_orders (
-            order_number TEXT PRIMARY KEY,
-            order_date DATE NOT NULL,
-            customer_code TEXT NOT NULL,
-            quote_number TEXT,
-            delivery_date DATE,
-            total_amount REAL DEFAULT 0,
-            status TEXT DEFAULT 'received',
-            payment_status TEXT DEFAULT 'pending',
-            shipping_address TEXT,
-            notes TEXT,
-            created_by INTEGER,
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (customer_code) REFERENCES customers (customer_code),
-            FOREIGN KEY (quote_number) REFERENCES quotations (quote_number),
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS products (
-            product_code TEXT PRIMARY KEY,
-            product_name TEXT NOT NULL,
-            category TEXT,
-            description TEXT,
-            unit_price REAL DEFAULT 0,
-            cost_price REAL DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    print("    ✅ 영업관리 테이블 완료")
-    
-    # 품질관리 테이블 (V1.1)
-    print("  🔍 품질관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS inspection_standards (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            item_code TEXT NOT NULL,
-            inspection_type TEXT NOT NULL,
-            inspection_item TEXT NOT NULL,
-            standard_value TEXT,
-            upper_limit REAL,
-            lower_limit REAL,
-            unit TEXT,
-            inspection_method TEXT,
-            sampling_rate REAL DEFAULT 100,
-            is_critical BOOLEAN DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS incoming_inspection (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            inspection_no TEXT UNIQUE NOT NULL,
-            inspection_date DATE NOT NULL,
-            po_number TEXT NOT NULL,
-            item_code TEXT NOT NULL,
-            lot_number TEXT,
-            received_qty INTEGER NOT NULL,
-            sample_qty INTEGER NOT NULL,
-            passed_qty INTEGER NOT NULL,
-            failed_qty INTEGER DEFAULT 0,
-            inspection_result TEXT NOT NULL,
-            defect_type TEXT,
-            defect_description TEXT,
-            inspector_id INTEGER,
-            approval_status TEXT DEFAULT 'pending',
-            approved_by INTEGER,
-            approved_date TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (po_number) REFERENCES purchase_orders (po_number),
-            FOREIGN KEY (item_code) REFERENCES item_master (item_code),
-            FOREIGN KEY (inspector_id) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS defect_types (
-            defect_code TEXT PRIMARY KEY,
-            defect_name TEXT NOT NULL,
-            defect_category TEXT,
-            severity_level INTEGER DEFAULT 3,
-            description TEXT,
-            corrective_action TEXT,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS measurement_equipment (
-            equipment_id TEXT PRIMARY KEY,
-            equipment_name TEXT NOT NULL,
-            equipment_type TEXT,
-            manufacturer TEXT,
-            model_no TEXT,
-            serial_no TEXT,
-            calibration_date DATE,
-            next_calibration_date DATE,
-            calibration_cycle INTEGER DEFAULT 365,
-            location TEXT,
-            status TEXT DEFAULT 'active',
-            responsible_person INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (responsible_person) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ 품질관리 테이블 완료")
-    
-    # 인사관리 테이블 (V1.2)
-    print("  👥 인사관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS employees (
-            emp_id TEXT PRIMARY KEY,
-            emp_name TEXT NOT NULL,
-            emp_name_en TEXT,
-            department TEXT NOT NULL,
-            position TEXT NOT NULL,
-            hire_date DATE NOT NULL,
-            birth_date DATE,
-            gender TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            emergency_contact TEXT,
-            emergency_phone TEXT,
-            employee_type TEXT DEFAULT 'regular',
-            work_status TEXT DEFAULT 'active',
-            resignation_date DATE,
-            photo BLOB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS attendance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            work_date DATE NOT NULL,
-            check_in_time TIMESTAMP,
-            check_out_time TIMESTAMP,
-            work_hours REAL DEFAULT 0,
-            overtime_hours REAL DEFAULT 0,
-            status TEXT DEFAULT 'normal',
-            late_minutes INTEGER DEFAULT 0,
-            early_leave_minutes INTEGER DEFAULT 0,
-            remarks TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            UNIQUE(emp_id, work_date)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS leave_requests (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            leave_type TEXT NOT NULL,
-            start_date DATE NOT NULL,
-            end_date DATE NOT NULL,
-            leave_days REAL NOT NULL,
-            reason TEXT,
-            status TEXT DEFAULT 'pending',
-            approver_id TEXT,
-            approval_date TIMESTAMP,
-            approval_comment TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            FOREIGN KEY (approver_id) REFERENCES employees (emp_id)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS salary (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            emp_id TEXT NOT NULL,
-            salary_month TEXT NOT NULL,
-            basic_salary REAL DEFAULT 0,
-            position_allowance REAL DEFAULT 0,
-            meal_allowance REAL DEFAULT 0,
-            transport_allowance REAL DEFAULT 0,
-            overtime_pay REAL DEFAULT 0,
-            bonus REAL DEFAULT 0,
-            other_allowance REAL DEFAULT 0,
-            total_earning REAL DEFAULT 0,
-            income_tax REAL DEFAULT 0,
-            resident_tax REAL DEFAULT 0,
-            health_insurance REAL DEFAULT 0,
-            pension REAL DEFAULT 0,
-            employment_insurance REAL DEFAULT 0,
-            accident_insurance REAL DEFAULT 0,
-            other_deduction REAL DEFAULT 0,
-            total_deduction REAL DEFAULT 0,
-            net_salary REAL DEFAULT 0,
-            payment_date DATE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (emp_id) REFERENCES employees (emp_id),
-            UNIQUE(emp_id, salary_month)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS departments (
-            dept_code TEXT PRIMARY KEY,
-            dept_name TEXT NOT NULL,
-            dept_name_en TEXT,
-            parent_dept TEXT,
-            dept_head TEXT,
-            location TEXT,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (dept_head) REFERENCES employees (emp_id)
-        )
-    ''')
+    # 스키마는 core/migrations 의 버전 파일로 관리
+    sys.path.insert(0, os.path.abspath('.'))
+    from core.migrations import migrate
     
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS positions (
-            position_code TEXT PRIMARY KEY,
-            position_name TEXT NOT NULL,
-            position_name_en TEXT,
-            position_level INTEGER,
-            min_salary REAL,
-            max_salary REAL,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    print("    ✅ 인사관리 테이블 완료")
-    
-    # 회계관리 테이블
-    print("  💰 회계관리 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS account_master (
-            account_code TEXT PRIMARY KEY,
-            account_name TEXT NOT NULL,
-            account_type TEXT NOT NULL,
-            parent_code TEXT,
-            level INTEGER DEFAULT 1,
-            is_control BOOLEAN DEFAULT 0,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS journal_header (
-            voucher_no TEXT PRIMARY KEY,
-            voucher_date DATE NOT NULL,
-            voucher_type TEXT NOT NULL,
-            description TEXT,
-            total_debit REAL DEFAULT 0,
-            total_credit REAL DEFAULT 0,
-            status TEXT DEFAULT 'draft',
-            created_by INTEGER,
-            approved_by INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (created_by) REFERENCES users (id),
-            FOREIGN KEY (approved_by) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ 회계관리 테이블 완료")
-    
-    # API 관련 테이블 (V1.2)
-    print("  🔌 API 테이블 생성...")
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS api_tokens (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            token TEXT UNIQUE NOT NULL,
-            name TEXT,
-            permissions TEXT,
-            expires_at TIMESTAMP,
-            last_used_at TIMESTAMP,
-            is_active BOOLEAN DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS api_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            endpoint TEXT NOT NULL,
-            method TEXT NOT NULL,
-            user_id INTEGER,
-            ip_address TEXT,
-            request_body TEXT,
-            response_code INTEGER,
-            response_time REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    print("    ✅ API 테이블 완료")
-    
-    conn.commit()
-    conn.close()
+    applied = migrate()
+    print(f"  📋 마이그레이션 적용: {len(applied)}건")
     print("  ✅ 데이터베이스 초기화 완료")
 
 def insert_sample_data():
     """샘플 데이터 추가"""
     print("\n📊 샘플 데이터 추가 중...")
     
+    sys.path.insert(0, os.path.abspath('.'))
+    from modules.inventory.stock import post_movement
+    
     conn = sqlite3.connect('data/database.db')
     cursor = conn.cursor()
     
@@ -734,11 +257,16 @@ def insert_sample_data():
             ('ITEM005', '베어링 6201', '부품', 'EA', 50, 80, 3000)
         ]
         
-        cursor.executemany("""
-            INSERT OR IGNORE INTO item_master 
-            (item_code, item_name, category, unit, safety_stock, current_stock, unit_price)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, items)
+        for code, name, category, unit, safety, stock, price in items:
+            cursor.execute("""
+                INSERT OR IGNORE INTO item_master 
+                (item_code, item_name, category, unit, safety_stock, current_stock, unit_price)
+                VALUES (?, ?, ?, ?, ?, 0, ?)
+            """, (code, name, category, unit, safety, price))
+            if cursor.rowcount:
+                # 기초재고는 재고 이동으로 기록 (창고 잔액/재고 평가와 현재고 일치)
+                post_movement(conn, datetime.now().strftime('%Y-%m-%d'), 'OPENING', code, stock,
+                              remarks='기초재고')
         print("    ✅ 품목 5개")
         
         # 고객 데이터 (V1.0)
@@ -1331,6 +859,7 @@ def create_run_api_file():
 import os
 import sys
 import yaml
+from core.database import configure as configure_database
 from api import create_api_app
 
 if __name__ == '__main__':
@@ -1338,6 +867,9 @@ if __name__ == '__main__':
     with open('config.yaml', 'r', encoding='utf-8') as f:
         config = yaml.safe_load(f)
     
+    # 데이터베이스 설정 (대시보드와 같은 앱에서 실행할 때는 app.py 가 이미 적용)
+    configure_database(config['database'])
+    
     # API 앱 생성
     app, api = create_api_app(config)
     
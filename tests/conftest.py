@@ -0,0 +1,73 @@
+# File: /tests/conftest.py
+# 공용 테스트 fixture - 모듈 테스트는 temp_db 를 받아 자기 데이터만 추가한다
+#
+#   @pytest.fixture
+#   def temp_db(temp_db):
+#       """임시 데이터베이스 설정 (품목 1개)"""
+#       with database.transaction() as conn:
+#           conn.execute("INSERT INTO item_master ...")
+#       return temp_db
+#
+# REST API 테스트는 api_client 와 auth_headers(관리자 로그인) 를 사용한다.
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+
+
+@pytest.fixture
+def empty_db(tmp_path):
+    """마이그레이션하지 않은 임시 데이터베이스 - tmp_path 반환 (파일은 test.db)"""
+    database.configure({'path': str(tmp_path / 'test.db')})
+    yield tmp_path
+    database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+@pytest.fixture
+def temp_db(empty_db):
+    """마이그레이션한 임시 데이터베이스 - tmp_path 반환"""
+    migrate()
+    return empty_db
+
+
+# REST API 테스트 설정 (config.yaml 의 authentication/api 항목)
+API_CONFIG = {
+    'authentication': {
+        'jwt_secret_key': 'test-jwt-secret-key-for-api-tests',
+        'jwt_access_token_expires': 3600
+    },
+    'api': {'cors_origins': []}
+}
+
+
+@pytest.fixture
+def api_client(temp_db):
+    """REST API 테스트 클라이언트 - 관리자(admin/admin123), 사용자(user/user123) 등록"""
+    from api import create_api_app
+    from api.auth import hash_password
+
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+            [('admin', hash_password('admin123'), 'admin'),
+             ('user', hash_password('user123'), 'user')]
+        )
+    app, _ = create_api_app(API_CONFIG)
+    return app.test_client()
+
+
+def login(client, username, password):
+    """로그인 후 Authorization 헤더 반환"""
+    response = client.post('/api/auth/login', json={'username': username, 'password': password})
+    assert response.status_code == 200, response.get_json()
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+@pytest.fixture
+def auth_headers(api_client):
+    """관리자 로그인 헤더"""
+    return login(api_client, 'admin', 'admin123')
@@ -0,0 +1,77 @@
+# File: /tests/test_andon.py
+
+import pytest
+import sys
+import os
+import json
+from datetime import datetime
+sys.path.insert(0, os.path.abspath('.'))
+
+from flask import Flask
+
+from core import database
+from core.events import publish
+from modules.mes.andon import collect_line_status, register_andon
+
+
+def _log(lot, line_code, plan, prod, defect, created_at=None):
+    with database.transaction() as conn:
+        conn.execute("""
+            INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty, line_code, created_at)
+            VALUES (?, ?, '조립', ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+        """, (lot, datetime.now().strftime('%Y-%m-%d'), plan, prod, defect, line_code, created_at))
+
+
+def test_line_status(temp_db):
+    """라인별 계획 대비 실적, 불량률, 현재 LOT, 상태"""
+    _log('LOT-1', 'LINE-01', 100, 60, 0)
+    _log('LOT-2', 'LINE-01', 100, 30, 1)
+    _log('LOT-3', 'LINE-02', 50, 40, 4)
+    _log('LOT-4', 'LINE-03', 10, 10, 0, created_at='2000-01-01 00:00:00')
+
+    status = collect_line_status(idle_minutes=30, target_defect_rate=2.0)
+    lines = {line['line_code']: line for line in status['lines']}
+    assert [lines['LINE-01'][k] for k in ('plan_qty', 'prod_qty', 'achievement', 'current_lot', 'status')] == \
+        [200, 90, 45.0, 'LOT-2', 'running']
+    assert lines['LINE-02']['defect_rate'] == 10.0 and lines['LINE-02']['status'] == 'quality'
+    assert lines['LINE-03']['status'] == 'idle'
+
+    print("✅ 안돈 라인 상태")
+
+
+def test_status_etag_and_stream(temp_db):
+    """조건부 GET(304), 쓰기 이벤트 후 새 문서, 라인별 SSE"""
+    app = Flask(__name__)
+    board = register_andon(app, {'interval': 3600})
+    client = app.test_client()
+    try:
+        _log('LOT-1', 'LINE-01', 100, 50, 0)
+        first = client.get('/andon/status')
+        assert first.status_code == 200 and first.json['lines'][0]['prod_qty'] == 50
+        etag = first.headers['ETag']
+        assert client.get('/andon/status', headers={'If-None-Match': etag}).status_code == 304
+
+        stream = board.stream('LINE-01', heartbeat=5)
+        assert next(stream).startswith('retry')
+        assert json.loads(next(stream).split('data: ')[1])['lines'][0]['current_lot'] == 'LOT-1'
+
+        # 다른 라인만 바뀌면 LINE-01 스트림은 보내지 않고, LINE-01 이 바뀌면 전송
+        seq = board.seq
+        _log('LOT-9', 'LINE-02', 10, 10, 0)
+        publish('mes')
+        assert board.wait(seq, timeout=5)
+        assert client.get('/andon/status?line=LINE-01', headers={'If-None-Match': etag}).status_code == 304
+        _log('LOT-2', 'LINE-01', 100, 20, 0)
+        publish('mes')
+        assert json.loads(next(stream).split('data: ')[1])['lines'][0]['prod_qty'] == 70
+
+        assert client.get('/andon/status').json['seq'] == 3
+        assert client.get('/andon').status_code == 200
+    finally:
+        board.snapshot.stop()
+
+    print("✅ 안돈 상태/스트림")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,83 @@
+# File: /tests/test_api.py
+# REST API 인증/라우트 테스트 (Flask 테스트 클라이언트)
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from conftest import API_CONFIG, login
+
+
+def test_login(api_client):
+    """해시된 비밀번호로 로그인, 토큰으로 현재 사용자 조회"""
+    response = api_client.post('/api/auth/login', json={'username': 'admin', 'password': 'wrong'})
+    assert response.status_code == 401
+
+    headers = login(api_client, 'admin', 'admin123')
+    me = api_client.get('/api/auth/me', headers=headers).get_json()['user']
+    assert me['username'] == 'admin'
+    assert me['role'] == 'admin'
+    assert isinstance(me['user_id'], int)
+    print("✅ 로그인/토큰 확인")
+
+
+def test_token_required(api_client):
+    """토큰 없는 요청은 거부"""
+    assert api_client.get('/api/production').status_code == 401
+    assert api_client.get('/api/inventory').status_code == 401
+    print("✅ 인증 필요 확인")
+
+
+def test_user_admin_only(api_client, auth_headers):
+    """사용자 목록/생성은 관리자만 - 생성한 사용자는 바로 로그인 가능"""
+    user_headers = login(api_client, 'user', 'user123')
+    assert api_client.get('/api/users', headers=user_headers).status_code == 403
+
+    response = api_client.post('/api/users', headers=auth_headers,
+                               json={'username': 'planner', 'password': 'plan123', 'role': 'manager'})
+    assert response.status_code == 201
+    duplicate = api_client.post('/api/users', headers=auth_headers,
+                                json={'username': 'planner', 'password': 'x'})
+    assert duplicate.status_code == 400
+
+    users = api_client.get('/api/users', headers=auth_headers).get_json()['users']
+    assert {u['username'] for u in users} == {'admin', 'user', 'planner'}
+    # 화면 로그인과 같은 해시로 저장
+    stored = database.fetch_scalar("SELECT password FROM users WHERE username = 'planner'", default=None)
+    assert stored != 'plan123'
+    login(api_client, 'planner', 'plan123')
+    print("✅ 사용자 관리 권한 확인")
+
+
+def test_check_permission(api_client, auth_headers):
+    """manager 이상 권한이 필요한 작업은 일반 사용자 거부"""
+    user_headers = login(api_client, 'user', 'user123')
+    standard = {'process': '조립', 'ideal_cycle_sec': 30}
+    assert api_client.post('/api/oee/standards', headers=user_headers, json=standard).status_code == 403
+    assert api_client.post('/api/oee/standards', headers=auth_headers, json=standard).status_code == 200
+    print("✅ 역할 권한 확인")
+
+
+def test_query_string_arguments(api_client, auth_headers):
+    """GET 인자는 쿼리 문자열에서 읽음 (JSON 본문 없음)"""
+    response = api_client.get('/api/production?limit=10', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json() == {'data': [], 'total': 0, 'next_cursor': None}
+    print("✅ 쿼리 문자열 인자 확인")
+
+
+def test_create_app_keeps_pool(temp_db):
+    """API 앱 생성은 데이터베이스 설정/연결 풀을 다시 만들지 않음"""
+    from api import create_api_app
+
+    generation, path = database._generation, database.get_db_path()
+    create_api_app(API_CONFIG)
+    assert database._generation == generation
+    assert database.get_db_path() == path
+    print("✅ 연결 풀 유지 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
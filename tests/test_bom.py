@@ -0,0 +1,108 @@
+# File: /tests/test_bom.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.inventory import bom
+from conftest import login
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정"""
+    # 자전거: 프레임 1, 바퀴 2 (스크랩 5%) / 바퀴: 볼트 4, 림 1 / 프레임: 볼트 10
+    bom.set_bom('BIKE', [('FRAME', 1), ('WHEEL', 2, 0.05)])
+    bom.set_bom('WHEEL', [('BOLT', 4), ('RIM', 1)])
+    bom.set_bom('FRAME', [('BOLT', 10)])
+    return temp_db
+
+
+def test_explode_requirements_and_revisions(temp_db):
+    """정전개/총소요량/역전개, 유효 기간 개정과 캐시 무효화"""
+    tree = bom.explode('BIKE', quantity=10)
+    assert tree[['level', 'parent_code', 'component_code']].values.tolist() == [
+        [1, 'BIKE', 'FRAME'], [2, 'FRAME', 'BOLT'],
+        [1, 'BIKE', 'WHEEL'], [2, 'WHEEL', 'BOLT'], [2, 'WHEEL', 'RIM'],
+    ]
+    assert tree['extended_qty'].round(6).tolist() == [10, 100, 21, 84, 21]
+
+    totals = bom.requirements('BIKE', quantity=10).set_index('component_code')
+    assert totals.loc['BOLT', 'quantity'] == pytest.approx(184)
+    assert totals.loc['BOLT', 'low_level'] == 2 and totals.loc['BOLT', 'is_leaf']
+    assert bom.implode('BOLT').set_index('ancestor_code').loc['BIKE', 'quantity'] == pytest.approx(18.4)
+
+    # 2030년부터 프레임 볼트 6개 - 이전 기준일은 기존 판 유지
+    bom.set_bom('FRAME', [('BOLT', 6)], valid_from='2030-01-01')
+    after = bom.requirements('BIKE', as_of='2030-06-30').set_index('component_code')
+    before = bom.requirements('BIKE', as_of='2029-12-31').set_index('component_code')
+    assert after.loc['BOLT', 'quantity'] == pytest.approx(14.4)
+    assert before.loc['BOLT', 'quantity'] == pytest.approx(18.4)
+
+    # 다른 연결에서 직접 고쳐도 판 번호로 다시 읽음
+    with database.transaction() as conn:
+        conn.execute("UPDATE bom_lines SET quantity = 3 WHERE parent_code = 'BIKE' AND component_code = 'WHEEL'")
+    assert bom.explode('BIKE', as_of='2029-12-31')['extended_qty'].round(6).tolist()[2:] == [3.15, 12.6, 3.15]
+
+    print("✅ BOM 전개/개정")
+
+
+def test_where_used_closure_and_cycles(temp_db):
+    """사용처 폐포 증분 갱신, 순환 거부, 직접 수정 후 재계산"""
+    used = bom.where_used('BOLT')
+    assert used[['ancestor_code', 'min_level', 'is_top']].values.tolist() == [
+        ['FRAME', 1, False], ['WHEEL', 1, False], ['BIKE', 2, True]]
+    assert bom.where_used('BOLT', top_only=True)['ancestor_code'].tolist() == ['BIKE']
+
+    with pytest.raises(bom.BomCycleError):
+        bom.set_bom('BOLT', [('BIKE', 1)])
+    with pytest.raises(ValueError):
+        bom.set_bom('WHEEL', [('RIM', 1), ('RIM', 2)])
+
+    # 바퀴에서 볼트를 빼면 바퀴만 사용처에서 빠짐 (자전거는 프레임 경로로 유지)
+    bom.set_bom('WHEEL', [('RIM', 1), ('HUB', 1)])
+    assert bom.where_used('BOLT')['ancestor_code'].tolist() == ['FRAME', 'BIKE']
+    assert bom.where_used('HUB')['ancestor_code'].tolist() == ['WHEEL', 'BIKE']
+
+    # 트리거로 판 번호가 바뀌면 다음 조회에서 전체 재계산
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO bom_lines (parent_code, component_code, quantity) VALUES ('TRIKE', 'WHEEL', 3)")
+    assert bom.where_used('HUB', top_only=True)['ancestor_code'].tolist() == ['BIKE', 'TRIKE']
+
+    print("✅ BOM 사용처 폐포")
+
+
+def test_bom_api(api_client, auth_headers):
+    """/api/bom/<item> 정전개/총소요량/등록, /api/bom/<item>/where-used 사용처"""
+    body = api_client.get('/api/bom/BIKE?quantity=10', headers=auth_headers).get_json()
+    assert body['view'] == 'indented'
+    assert [round(row['extended_qty'], 6) for row in body['data']] == [10, 100, 21, 84, 21]
+
+    body = api_client.get('/api/bom/BIKE', headers=auth_headers, query_string={
+        'view': 'summary', 'quantity': 10, 'leaves_only': 'true'}).get_json()
+    totals = {row['component_code']: row['quantity'] for row in body['data']}
+    assert totals == {'BOLT': pytest.approx(184), 'RIM': pytest.approx(21)}
+
+    body = api_client.get('/api/bom/BOLT/where-used', headers=auth_headers).get_json()
+    assert [row['ancestor_code'] for row in body['data']] == ['FRAME', 'WHEEL', 'BIKE']
+    body = api_client.get('/api/bom/BOLT/where-used?as_of=2026-01-01&top_only=true', headers=auth_headers).get_json()
+    assert [(row['ancestor_code'], round(row['quantity'], 6)) for row in body['data']] == [('BIKE', 18.4)]
+
+    # 등록/개정은 manager 이상, 순환은 400
+    revision = {'components': [{'component_code': 'BOLT', 'quantity': 6}], 'valid_from': '2030-01-01'}
+    user_headers = login(api_client, 'user', 'user123')
+    assert api_client.post('/api/bom/FRAME', headers=user_headers, json=revision).status_code == 403
+    response = api_client.post('/api/bom/FRAME', headers=auth_headers, json=revision)
+    assert response.status_code == 201 and response.get_json()['count'] == 1
+    cycle = {'components': [{'component_code': 'BIKE', 'quantity': 1}]}
+    assert api_client.post('/api/bom/BOLT', headers=auth_headers, json=cycle).status_code == 400
+
+    body = api_client.get('/api/bom/BIKE?view=summary&as_of=2030-06-30', headers=auth_headers).get_json()
+    assert {row['component_code']: row['quantity'] for row in body['data']}['BOLT'] == pytest.approx(14.4)
+    print("✅ BOM API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,102 @@
+# File: /tests/test_database.py
+
+import pytest
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+
+
+@pytest.fixture
+def temp_db(empty_db):
+    """임시 데이터베이스 설정 (마이그레이션 없이 items 테이블만)"""
+    conn = database.get_connection()
+    conn.execute("CREATE TABLE items (code TEXT PRIMARY KEY, qty INTEGER)")
+    conn.commit()
+    conn.close()
+    return empty_db
+
+
+def test_pragmas(temp_db):
+    """WAL 모드 및 PRAGMA 적용 확인"""
+    conn = database.get_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    conn.close()
+    print("✅ PRAGMA 적용 확인")
+
+
+def test_connection_reuse(temp_db):
+    """close() 후 같은 연결이 풀에서 재사용되는지 확인"""
+    first = database.get_connection()
+    first.close()
+    second = database.get_connection()
+    assert first is second
+    second.close()
+
+    # 다른 스레드는 다른 연결을 사용
+    held = database.get_connection()
+    result = {}
+
+    def worker():
+        conn = database.get_connection()
+        result['conn'] = conn
+        conn.close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert result['conn'] is not held
+    held.close()
+    print("✅ 연결 풀 재사용 확인")
+
+
+def test_transaction_commit_and_rollback(temp_db):
+    """트랜잭션 커밋/롤백 확인"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('A', 1)")
+
+    with pytest.raises(ValueError):
+        with database.transaction(immediate=True) as conn:
+            conn.execute("INSERT INTO items VALUES ('B', 2)")
+            raise ValueError("rollback")
+
+    rows = database.fetch_all("SELECT code FROM items ORDER BY code")
+    assert rows == [('A',)]
+    print("✅ 트랜잭션 커밋/롤백 확인")
+
+
+def test_nested_transaction(temp_db):
+    """중첩 트랜잭션은 SAVEPOINT 로 처리"""
+    with database.transaction() as outer:
+        outer.execute("INSERT INTO items VALUES ('A', 1)")
+        with pytest.raises(ValueError):
+            with database.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('B', 2)")
+                raise ValueError("inner rollback")
+
+    assert database.fetch_scalar("SELECT COUNT(*) FROM items") == 1
+    print("✅ 중첩 트랜잭션 확인")
+
+
+def test_data_version_and_refresh_signal(temp_db):
+    """커밋 시 data_version 변경, 미변경 시 갱신 신호 생략"""
+    import dash
+    from core.refresh import next_signal
+
+    signal = next_signal(None)
+    assert next_signal(signal) is dash.no_update
+
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('A', 1)")
+
+    changed = next_signal(signal)
+    assert changed is not dash.no_update
+    assert changed['version'] != signal['version']
+    print("✅ 데이터 변경 감지 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,51 @@
+# File: /tests/test_events.py
+
+import pytest
+import sys
+import os
+import json
+sys.path.insert(0, os.path.abspath('.'))
+
+from core.events import EventBroker, broker, stream_events
+
+
+def test_publish_to_subscribers():
+    """발행된 이벤트는 모든 구독자와 수신자에게 전달"""
+    events = EventBroker()
+    first, second = events.subscribe(), events.subscribe()
+    received = []
+    events.add_listener(received.append)
+
+    event = events.publish('inventory', 'purchase')
+
+    assert first.get_nowait() == event
+    assert second.get_nowait() == event
+    assert received == [event]
+    assert event['topics'] == ['inventory', 'purchase']
+
+    with pytest.raises(ValueError):
+        events.publish('unknown')
+    print("✅ 이벤트 발행 확인")
+
+
+def test_sse_stream_format():
+    """SSE 메시지 형식 및 연결 종료 시 구독 해제"""
+    q = broker.subscribe()
+    stream = stream_events(q, heartbeat=0.01)
+
+    assert next(stream).startswith('retry:')
+    assert next(stream) == ": ping\n\n"
+
+    event = broker.publish('mes')
+    message = next(stream)
+    assert message.startswith(f"id: {event['seq']}\nevent: change\n")
+    assert json.loads(message.split('data: ')[1])['topics'] == ['mes']
+
+    stream.close()
+    broker.publish('mes')
+    assert q.qsize() == 0
+    print("✅ SSE 스트림 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
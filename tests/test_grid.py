@@ -0,0 +1,63 @@
+# File: /tests/test_grid.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.mes.layouts import WORK_LOG_GRID
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (작업 실적 45건, 작업일 중복)"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO users (username, password, role) VALUES ('kim', 'x', 'worker')")
+        conn.executemany("""
+            INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty, defect_qty)
+            VALUES (?, ?, ?, 1, 100, ?, 1)
+        """, [(f"LOT-{i:03d}", f"2026-01-{i % 5 + 1:02d}", '조립' if i % 2 else '가공', 80 + i)
+              for i in range(45)])
+    return temp_db
+
+
+def test_keyset_pages_match_full_order(temp_db):
+    """키셋 페이지 이동 결과가 전체 정렬 순서와 일치"""
+    expected = [row[0] for row in database.fetch_all(
+        "SELECT lot_number FROM work_logs ORDER BY work_date DESC, id DESC"
+    )]
+
+    cursor, lots = None, []
+    for page in range(3):
+        records, page_count, total, cursor = WORK_LOG_GRID.fetch(page, 20, cursor=cursor)
+        assert (page_count, total) == (3, 45)
+        assert str(page) in cursor['anchors']
+        lots += [r['lot_number'] for r in records]
+    assert lots == expected
+
+    # 기준점 없이 임의 페이지로 이동하면 OFFSET 으로 같은 결과
+    records, _, _, _ = WORK_LOG_GRID.fetch(2, 20)
+    assert [r['lot_number'] for r in records] == expected[40:]
+    print("✅ 키셋 페이지 확인")
+
+
+def test_filter_and_sort_whitelist(temp_db):
+    """컬럼 필터/정렬 변환 및 미등록 컬럼 무시"""
+    records, _, total, _ = WORK_LOG_GRID.fetch(
+        0, 50,
+        sort_by=[{'column_id': 'prod_qty', 'direction': 'asc'}],
+        filter_query='{process} contains "조립" && {prod_qty} ge 110 && {plan_qty; DROP TABLE x} = 1',
+        where=["w.work_date BETWEEN ? AND ?"], params=['2026-01-01', '2026-01-31']
+    )
+    assert total == 7
+    assert [r['prod_qty'] for r in records] == sorted(r['prod_qty'] for r in records)
+    assert all(r['process'] == '조립' and r['achievement_rate'] == 100 for r in records)
+
+    # LIKE 특수문자는 그대로 비교
+    _, _, total, _ = WORK_LOG_GRID.fetch(0, 20, filter_query='{lot_number} contains "%"')
+    assert total == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
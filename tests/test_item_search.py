@@ -0,0 +1,82 @@
+# File: /tests/test_item_search.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.inventory.search import search_items, rebuild_item_search
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (품목 5개)"""
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO item_master (item_code, item_name, category) VALUES (?, ?, ?)",
+            [('BRG-001', '깊은홈 볼베어링 6204', 'component'),
+             ('BRG-002', '테이퍼 롤러베어링 30205', 'component'),
+             ('BLT-010', '육각볼트 M12x50', 'material'),
+             ('SFT-100', '구동 샤프트 20mm', 'component'),
+             ('MTR-200', '서보모터 400W', 'product')]
+        )
+    return temp_db
+
+
+def _codes(df):
+    return df['item_code'].tolist()
+
+
+def test_ranked_prefix_substring_and_typo(temp_db):
+    """코드 접두 > 이름 접두 > 부분 문자열 순위, 한글 부분 문자열, 오타 허용"""
+    df = search_items('brg')
+    assert _codes(df) == ['BRG-001', 'BRG-002']
+    assert set(df['match']) == {'code'}
+
+    # 한글 이름 중간의 부분 문자열 (trigram)
+    assert _codes(search_items('롤러베어')) == ['BRG-002']
+    assert set(_codes(search_items('베어링'))) == {'BRG-001', 'BRG-002'}
+    # 두 글자는 LIKE 로 찾음
+    assert _codes(search_items('모터')) == ['MTR-200']
+
+    # 이름 접두가 부분 일치보다 앞
+    df = search_items('구동')
+    assert _codes(df) == ['SFT-100'] and df['match'].tolist() == ['name']
+
+    # 오타 (샤프트 -> 샤프드)
+    df = search_items('구동 샤프드 20mm')
+    assert _codes(df)[:1] == ['SFT-100'] and df['match'].iloc[0] == 'fuzzy'
+    assert search_items('구동 샤프드 20mm', fuzzy=False).empty
+
+    assert len(search_items('베어링', limit=1)) == 1
+    assert _codes(search_items('베어링', category='material')) == []
+    assert search_items('  ').empty
+    print("✅ 품목 검색 순위")
+
+
+def test_index_follows_item_master(temp_db):
+    """등록/수정/삭제가 트리거로 색인에 바로 반영"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('VLV-300', '볼밸브 50A')")
+        conn.execute("UPDATE item_master SET item_name = '육각너트 M12' WHERE item_code = 'BLT-010'")
+        conn.execute("DELETE FROM item_master WHERE item_code = 'MTR-200'")
+        # 현재고 변경은 색인을 건드리지 않음
+        conn.execute("UPDATE item_master SET current_stock = 10 WHERE item_code = 'BRG-001'")
+
+    assert _codes(search_items('볼밸브')) == ['VLV-300']
+    assert _codes(search_items('육각너트')) == ['BLT-010']
+    assert search_items('육각볼트', fuzzy=False).empty
+    assert search_items('서보모터').empty
+    assert search_items('6204')['current_stock'].tolist() == [10]
+
+    # 색인이 item_master 와 다르면 integrity-check 가 오류를 냄
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO item_search (item_search, rank) VALUES ('integrity-check', 1)")
+    rebuild_item_search()
+    assert _codes(search_items('볼밸브')) == ['VLV-300']
+    print("✅ 색인 동기화")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
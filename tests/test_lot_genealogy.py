@@ -0,0 +1,94 @@
+# File: /tests/test_lot_genealogy.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.quality import genealogy
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 - 자재 M1/M2 -> 반제품 W1 -> 제품 P1/P2 (P2 는 M2 도 직접 투입)"""
+    with database.transaction() as conn:
+        genealogy.link_lots(conn, [
+            {'parent_lot': 'M1', 'child_lot': 'W1', 'quantity': 10},
+            {'parent_lot': 'M2', 'child_lot': 'W1', 'quantity': 5},
+            {'parent_lot': 'W1', 'child_lot': 'P1'},
+            {'parent_lot': 'W1', 'child_lot': 'P2'},
+            {'parent_lot': 'M2', 'child_lot': 'P2'},
+            # 잘못 입력된 순환 연결도 추적이 끝나야 함
+            {'parent_lot': 'P2', 'child_lot': 'W1', 'link_type': 'rework'},
+        ])
+        conn.execute("INSERT INTO customers (customer_code, customer_name) VALUES ('C1', '고객1')")
+        genealogy.record_shipment(conn, 'P1', '2026-01-10', 'C1', order_number='SO-1', quantity=100)
+        genealogy.record_shipment(conn, 'P2', '2026-01-11', 'C2', order_number='SO-2', quantity=50)
+        conn.execute("""
+            INSERT INTO incoming_inspection (inspection_no, inspection_date, item_code, lot_number,
+                                             received_qty, sample_qty, passed_qty, inspection_result)
+            VALUES ('IQC-1', '2026-01-02', 'RAW-1', 'M1', 100, 10, 10, 'pass')
+        """)
+    return temp_db
+
+
+def test_trace_directions(temp_db):
+    """정방향/역방향 추적"""
+    forward = genealogy.trace('M1', 'forward')
+    assert sorted(forward['lots']) == ['M1', 'P1', 'P2', 'W1']
+    assert not forward['truncated']
+
+    backward = genealogy.trace('P1', 'backward')
+    assert sorted(backward['lots']) == ['M1', 'M2', 'P1', 'P2', 'W1']
+    assert set(backward['links']['parent_lot']) >= {'M1', 'M2', 'W1'}
+
+    events = genealogy.get_lot_events('P1', 'backward')
+    assert list(events['source']) == ['incoming_inspection', 'shipment', 'shipment']
+
+    with pytest.raises(ValueError):
+        genealogy.trace('M1', 'sideways')
+    print("✅ LOT 추적 확인")
+
+
+def test_recall_report(temp_db):
+    """자재 LOT 이 포함된 출하/고객"""
+    report = genealogy.recall_report('M1')
+    assert report['affected_lots'] == 4
+    assert list(report['shipments']['order_number']) == ['SO-1', 'SO-2']
+    assert list(report['customers']['customer_name'].fillna('')) == ['고객1', '']
+
+    report = genealogy.recall_report('P1')
+    assert report['affected_lots'] == 1
+    assert list(report['shipments']['customer_code']) == ['C1']
+
+
+def test_lot_api(api_client, auth_headers):
+    """/api/lots/links, /api/lots/shipments 등록 후 추적/리콜 조회"""
+    response = api_client.post('/api/lots/links', headers=auth_headers, json={'links': [
+        {'parent_lot': 'M9', 'child_lot': 'P9', 'quantity': 3},
+    ]})
+    assert response.status_code == 201 and response.get_json()['count'] == 1
+    response = api_client.post('/api/lots/links', headers=auth_headers,
+                               json={'parent_lot': 'M9', 'child_lot': 'M9'})
+    assert response.status_code == 400
+
+    response = api_client.post('/api/lots/shipments', headers=auth_headers, json={
+        'lot_number': 'P9', 'ship_date': '2026-01-12', 'customer_code': 'C1', 'order_number': 'SO-9'})
+    assert response.status_code == 201
+
+    body = api_client.get('/api/lots/P1/trace?direction=backward', headers=auth_headers).get_json()
+    assert sorted(body['lots']) == ['M1', 'M2', 'P1', 'P2', 'W1']
+    body = api_client.get('/api/lots/M9/trace?events=true', headers=auth_headers).get_json()
+    assert sorted(body['lots']) == ['M9', 'P9']
+    assert [event['source'] for event in body['events']] == ['shipment']
+
+    body = api_client.get('/api/lots/M9/recall', headers=auth_headers).get_json()
+    assert body['affected_lots'] == 2
+    assert [s['order_number'] for s in body['shipments']] == ['SO-9']
+    assert [c['customer_name'] for c in body['customers']] == ['고객1']
+    print("✅ LOT 추적 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,122 @@
+# File: /tests/test_mes_rollup.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.mes import rollups
+
+RAW_SUMMARY = """
+    SELECT work_date, process, COALESCE(worker_id, 0), COUNT(*),
+           SUM(plan_qty), SUM(prod_qty), SUM(defect_qty),
+           SUM(CASE WHEN prod_qty >= plan_qty THEN 1 ELSE 0 END)
+    FROM work_logs
+    GROUP BY work_date, process, COALESCE(worker_id, 0)
+    ORDER BY 1, 2, 3
+"""
+
+ROLLUP_SUMMARY = """
+    SELECT work_date, process, worker_id, log_count,
+           plan_qty, prod_qty, defect_qty, achieved_count
+    FROM work_log_daily_summary
+    ORDER BY 1, 2, 3
+"""
+
+RAW_HOURLY = """
+    SELECT strftime('%Y-%m-%d %H:00', created_at, 'localtime'), process, COUNT(*),
+           SUM(plan_qty), SUM(prod_qty), SUM(defect_qty)
+    FROM work_logs
+    WHERE created_at IS NOT NULL
+    GROUP BY 1, 2
+    ORDER BY 1, 2
+"""
+
+ROLLUP_HOURLY = """
+    SELECT hour_start, process, log_count, plan_qty, prod_qty, defect_qty
+    FROM work_log_hourly_summary
+    ORDER BY 1, 2
+"""
+
+
+def insert_log(conn, lot, work_date, process, worker_id, plan, prod, defect=0):
+    conn.execute("""
+        INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty, defect_qty)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (lot, work_date, process, worker_id, plan, prod, defect))
+
+
+def test_rollup_follows_work_logs(temp_db):
+    """INSERT/UPDATE/DELETE 시 집계가 원본과 일치"""
+    with database.transaction() as conn:
+        insert_log(conn, 'LOT-1', '2026-01-01', '조립', 1, 100, 90, 2)
+        insert_log(conn, 'LOT-2', '2026-01-01', '조립', 1, 100, 110, 1)
+        insert_log(conn, 'LOT-3', '2026-01-02', '가공', None, 50, 50)
+        insert_log(conn, 'LOT-4', '2026-01-02', '가공', 2, 0, 10)
+
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+
+    with database.transaction() as conn:
+        conn.execute("UPDATE work_logs SET process = '검사', prod_qty = 40 WHERE lot_number = 'LOT-3'")
+        conn.execute("DELETE FROM work_logs WHERE lot_number = 'LOT-1'")
+
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+    print("✅ 집계 테이블 동기화 확인")
+
+
+def test_rollup_queries(temp_db):
+    """집계 조회 결과"""
+    with database.transaction() as conn:
+        insert_log(conn, 'LOT-1', '2026-01-01', '조립', 1, 100, 90, 2)
+        insert_log(conn, 'LOT-2', '2026-01-01', '조립', 1, 100, 110, 1)
+        insert_log(conn, 'LOT-3', '2026-01-02', '가공', 1, 0, 10)
+
+    totals = rollups.get_period_totals('2026-01-01', '2026-01-31')
+    assert totals['work_count'] == 3
+    assert totals['prod_qty'] == 210
+    # 계획수량 없는 작업은 0% 로 평균에 포함
+    assert totals['avg_achievement'] == pytest.approx((90 + 110 + 0) / 3)
+
+    daily = rollups.get_daily_summary('2026-01-01', '2026-01-31')
+    assert list(daily['total_prod']) == [200, 10]
+    assert daily['avg_achievement'][0] == pytest.approx(100.0)
+
+    process = rollups.get_process_summary('2026-01-01', '2026-01-31', '조립')
+    assert list(process['process']) == ['조립']
+
+    assert rollups.rebuild_summary() == 2
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+
+
+def test_hourly_rollup(temp_db):
+    """시간대별 집계 - 트리거/일괄 등록 구간 모두 원본과 일치"""
+    insert = """
+        INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty, created_at)
+        VALUES (?, '2026-01-01', ?, 10, ?, 1, ?)
+    """
+    with database.transaction() as conn:
+        conn.execute(insert, ('LOT-1', '조립', 10, '2026-01-01 08:10:00'))
+        conn.execute(insert, ('LOT-2', '조립', 12, '2026-01-01 08:50:00'))
+        conn.execute(insert, ('LOT-3', '가공', 7, '2026-01-01 09:05:00'))
+        with rollups.bulk_load(conn):
+            conn.executemany(insert, [
+                ('LOT-4', '조립', 5, '2026-01-01 09:30:00'),
+                ('LOT-5', '조립', 6, '2026-01-01 10:00:00'),
+            ])
+
+    assert database.fetch_all(ROLLUP_HOURLY) == database.fetch_all(RAW_HOURLY)
+
+    with database.transaction() as conn:
+        conn.execute("UPDATE work_logs SET created_at = '2026-01-01 11:00:00' WHERE lot_number = 'LOT-1'")
+        conn.execute("DELETE FROM work_logs WHERE lot_number = 'LOT-3'")
+
+    assert database.fetch_all(ROLLUP_HOURLY) == database.fetch_all(RAW_HOURLY)
+
+    hourly = rollups.get_hourly_summary('2026-01-01 00:00', '2026-01-01 23:00')
+    assert hourly['total_prod'].sum() == 10 + 12 + 5 + 6
+    print("✅ 시간대별 집계 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
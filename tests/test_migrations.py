@@ -0,0 +1,110 @@
+# File: /tests/test_migrations.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core import migrations
+from core.query_plans import hot_queries, statements, check_query_plans
+
+
+def test_migrate_idempotent(empty_db):
+    """마이그레이션은 한 번만 적용"""
+    versions = [m['version'] for m in migrations.discover()]
+    assert migrations.migrate() == versions
+    assert migrations.migrate() == []
+    assert migrations.pending() == []
+    assert migrations.current_version() == versions[-1]
+    print("✅ 마이그레이션 재실행 확인")
+
+
+def test_split_statements():
+    """트리거 본문을 포함한 문장 분리"""
+    script = """
+        -- 주석
+        CREATE TABLE a (x INTEGER);
+        CREATE TRIGGER t AFTER INSERT ON a BEGIN
+            UPDATE a SET x = x + 1;
+        END;
+    """
+    statements = migrations.split_statements(script)
+    assert len(statements) == 2
+    assert statements[1].endswith('END;')
+
+
+def test_setup_script_sample_data(tmp_path, monkeypatch):
+    """설치 스크립트 - 새로 마이그레이션한 데이터베이스에 샘플 데이터 입력"""
+    sys.path.insert(0, os.path.abspath('scripts'))
+    import setup_v1_3
+    from modules.inventory.stock import reconcile_stock_balances
+    from modules.inventory.valuation import check_valuation
+
+    # 스크립트는 작업 디렉터리의 data/database.db 를 사용
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    database.configure({'path': 'data/database.db'})
+    try:
+        setup_v1_3.initialize_database()
+        setup_v1_3.insert_sample_data()
+
+        assert database.fetch_scalar("SELECT COUNT(*) FROM users") == 5
+        assert database.fetch_scalar("SELECT COUNT(*) FROM defect_types") > 0
+        assert database.fetch_scalar("SELECT COUNT(*) FROM measurement_equipment") > 0
+        assert database.fetch_scalar(
+            "SELECT current_stock FROM item_master WHERE item_code = 'ITEM001'") == 150
+        assert reconcile_stock_balances() == [] and check_valuation() == []
+    finally:
+        database.configure({'path': database.DEFAULT_DB_PATH})
+    print("✅ 설치 스크립트 샘플 데이터")
+
+
+def test_setup_columns_on_legacy_schema(empty_db):
+    """이전 설치 스크립트로 만든 테이블 (컬럼이 이미 있음) 도 마이그레이션"""
+    with database.transaction() as conn:
+        conn.execute("""
+            CREATE TABLE defect_types (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                defect_code TEXT UNIQUE NOT NULL,
+                defect_name TEXT NOT NULL,
+                defect_category TEXT,
+                severity_level INTEGER DEFAULT 1,
+                description TEXT,
+                corrective_action TEXT,
+                is_active BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+    migrations.migrate()
+    columns = [row[1] for row in database.fetch_all("PRAGMA table_info(defect_types)")]
+    assert columns.count('corrective_action') == 1
+    print("✅ 기존 스키마 컬럼 복원")
+
+
+def test_hot_queries_use_indexes(empty_db):
+    """주요 조회 쿼리는 전체 스캔하지 않음"""
+    migrations.migrate()
+    findings = check_query_plans(min_rows=0)
+    assert findings == [], findings
+    print("✅ 실행계획 인덱스 사용 확인")
+
+
+def test_hot_queries_come_from_callbacks(empty_db):
+    """점검 목록은 콜백이 실제로 실행하는 쿼리 - 모든 항목이 실행되고 조회 문장을 보냄"""
+    migrations.migrate()
+    for name, source, args in hot_queries():
+        checked = statements(name, source, args)
+        assert checked, name
+        for _, query, params in checked:
+            database.fetch_all(query, params)
+
+    # 콜백 상수를 바꾸면 점검 대상도 바뀜
+    from modules.purchase import callbacks
+    sql = {name: source for name, source, _ in hot_queries()}['purchase.active_po']
+    assert sql is callbacks.ACTIVE_PO_QUERY
+    print("✅ 점검 목록 출처 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
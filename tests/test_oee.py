@@ -0,0 +1,107 @@
+# File: /tests/test_oee.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.mes import oee, rollups
+
+SHIFT_SUMMARY = """
+    SELECT work_date, shift, line_code, process, log_count, prod_qty, defect_qty,
+           downtime_min, planned_stop_min
+    FROM oee_shift_summary
+    ORDER BY 1, 2, 3, 4
+"""
+
+
+def insert_log(conn, lot, line_code, shift, prod, defect, created_at='2026-01-05 07:00:00'):
+    conn.execute("""
+        INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty,
+                               line_code, shift, created_at)
+        VALUES (?, '2026-01-05', '조립', ?, ?, ?, ?, ?, ?)
+    """, (lot, prod, prod, defect, line_code, shift, created_at))
+
+
+def test_oee_factors(temp_db):
+    """가동률 × 성능 × 품질 계산 (합계 기준으로 묶음)"""
+    oee.set_standard('조립', 60)                      # 공정 기본값 1분/개
+    oee.set_standard('조립', 30, line_code='L2')      # L2 는 30초/개
+
+    with database.transaction() as conn:
+        insert_log(conn, 'LOT-1', 'L1', 'A', 300, 30)
+        insert_log(conn, 'LOT-2', 'L2', 'A', 600, 0)
+        oee.record_downtime(conn, '2026-01-05', '조립', 60, shift='A', line_code='L1')
+        oee.record_downtime(conn, '2026-01-05', '조립', 30, shift='A', line_code='L1', planned=True)
+
+    lines = oee.get_oee('2026-01-01', '2026-01-31', by=('line_code',)).set_index('line_code')
+    # L1: 계획 450분, 가동 390분, 이상 300분, 양품 270/300
+    assert lines.loc['L1', 'availability'] == pytest.approx(86.7)
+    assert lines.loc['L1', 'performance'] == pytest.approx(76.9)
+    assert lines.loc['L1', 'quality'] == pytest.approx(90.0)
+    assert lines.loc['L1', 'oee'] == pytest.approx(60.0)
+    # L2: 비가동 없음, 이상 300분 / 480분
+    assert lines.loc['L2', 'oee'] == pytest.approx(62.5)
+
+    total = oee.get_oee('2026-01-01', '2026-01-31', by=())
+    assert total['planned_min'][0] == 930 and total['ideal_min'][0] == 600
+    print("✅ OEE 계산 확인")
+
+
+def test_shift_summary_follows_changes(temp_db):
+    """실적/비가동 변경 및 일괄 등록 후에도 교대별 집계가 재계산 결과와 일치"""
+    with database.transaction() as conn:
+        insert_log(conn, 'LOT-1', 'L1', None, 100, 5, created_at='2026-01-05 15:00:00')
+        insert_log(conn, 'LOT-2', None, 'C', 50, 0)
+        event_id = oee.record_downtime(conn, '2026-01-05', '조립', 20, start_time='23:30')
+        with rollups.bulk_load(conn):
+            insert_log(conn, 'LOT-3', 'L1', 'B', 40, 1)
+
+    with database.transaction() as conn:
+        conn.execute("UPDATE work_logs SET shift = 'A', prod_qty = 80 WHERE lot_number = 'LOT-1'")
+        conn.execute("DELETE FROM work_logs WHERE lot_number = 'LOT-2'")
+        conn.execute("UPDATE downtime_events SET duration_min = 25 WHERE id = ?", (event_id,))
+
+    incremental = database.fetch_all(SHIFT_SUMMARY)
+    rollups.rebuild_summary()
+    assert incremental == database.fetch_all(SHIFT_SUMMARY)
+    assert ('2026-01-05', 'C', '', '조립', 0, 0, 0, 25.0, 0.0) in incremental
+
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM downtime_events")
+    assert all(row[2] == 'L1' for row in database.fetch_all(SHIFT_SUMMARY))
+
+
+def test_oee_api(api_client, auth_headers):
+    """/api/oee/standards, /api/oee/downtime 등록 후 /api/oee 조회"""
+    response = api_client.post('/api/oee/standards', headers=auth_headers,
+                               json={'process': '조립', 'ideal_cycle_sec': 60})
+    assert response.status_code == 200
+
+    with database.transaction() as conn:
+        insert_log(conn, 'LOT-1', 'L1', 'A', 300, 30)
+    for downtime in ({'duration_min': 60}, {'duration_min': 30, 'planned': True}):
+        response = api_client.post('/api/oee/downtime', headers=auth_headers, json=dict(
+            downtime, event_date='2026-01-05', process='조립', shift='A', line_code='L1'))
+        assert response.status_code == 201
+    bad_shift = api_client.post('/api/oee/downtime', headers=auth_headers, json={
+        'event_date': '2026-01-05', 'process': '조립', 'duration_min': 10, 'shift': 'X'})
+    assert bad_shift.status_code == 400
+
+    response = api_client.get('/api/oee', headers=auth_headers, query_string={
+        'start_date': '2026-01-01', 'end_date': '2026-01-31', 'group_by': 'line_code,shift'})
+    assert response.status_code == 200
+    row = response.get_json()['data'][0]
+    assert (row['line_code'], row['shift']) == ('L1', 'A')
+    assert row['oee'] == pytest.approx(60.0)
+    assert row['planned_min'] == 450
+
+    response = api_client.get('/api/oee', headers=auth_headers, query_string={
+        'start_date': '2026-01-01', 'end_date': '2026-01-31', 'group_by': 'worker'})
+    assert response.status_code == 400
+    print("✅ OEE API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
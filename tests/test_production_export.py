@@ -0,0 +1,143 @@
+# File: /tests/test_production_export.py
+
+import pytest
+import sys
+import os
+import csv
+import io
+import json
+import sqlite3
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.query_plans import explain
+from modules.mes import export
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (같은 날짜에 여러 건)"""
+    with database.transaction() as conn:
+        conn.executemany("""
+            INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty)
+            VALUES (?, ?, '조립', 10, 10)
+        """, [(f"LOT-{i:03d}", f"2026-01-{i % 5 + 1:02d}") for i in range(23)])
+    return temp_db
+
+
+def test_keyset_pages(temp_db):
+    """커서로 이어 읽은 페이지가 전체 정렬 결과와 일치 (중복/누락 없음)"""
+    expected = database.fetch_all(
+        "SELECT id FROM work_logs WHERE work_date >= '2026-01-02' ORDER BY work_date DESC, id DESC"
+    )
+    seen, cursor = [], None
+    while True:
+        records, cursor = export.fetch_page('2026-01-02', None, limit=4, cursor=cursor)
+        seen.extend((r['id'],) for r in records)
+        if cursor is None:
+            break
+    assert seen == expected
+
+    with pytest.raises(ValueError):
+        export.decode_cursor('not-a-cursor')
+
+    # 정렬용 임시 B-tree 없이 인덱스 순서로 읽음
+    query, params = export._query('2026-01-01', '2026-01-31', export.encode_cursor('2026-01-03', 10), 5)
+    conn = database.get_connection()
+    try:
+        plan = explain(conn, query, params)
+    finally:
+        conn.close()
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+    print("✅ 키셋 페이지 확인")
+
+
+def test_streaming_export(temp_db):
+    """NDJSON/CSV 스트리밍 - 배치 단위 조각, 전체 행 포함"""
+    chunks = export.stream_ndjson(batch_size=10)
+    first = next(chunks)
+    assert len(first.splitlines()) == 10
+    lines = (first + ''.join(chunks)).splitlines()
+    assert len(lines) == 23
+    assert set(json.loads(lines[0])) == set(export.EXPORT_COLUMNS)
+
+    rows = list(csv.reader(io.StringIO(''.join(export.stream_csv('2026-01-05', limit=3)))))
+    assert rows[0] == list(export.EXPORT_COLUMNS)
+    assert len(rows) == 4 and rows[1][2] == '2026-01-05'
+    print("✅ 스트리밍 내보내기 확인")
+
+
+def test_api_cursor_round_trip(api_client, auth_headers):
+    """/api/production 의 next_cursor 를 그대로 넘겨 끝까지 읽음"""
+    expected = [row[0] for row in database.fetch_all(
+        "SELECT id FROM work_logs ORDER BY work_date DESC, id DESC"
+    )]
+    seen, cursor = [], None
+    while True:
+        query = {'limit': 5}
+        if cursor:
+            query['cursor'] = cursor
+        body = api_client.get('/api/production', query_string=query, headers=auth_headers).get_json()
+        seen.extend(record['id'] for record in body['data'])
+        cursor = body['next_cursor']
+        if cursor is None:
+            break
+    assert seen == expected
+
+    response = api_client.get('/api/production?cursor=not-a-cursor', headers=auth_headers)
+    assert response.status_code == 400
+    print("✅ API 커서 왕복 확인")
+
+
+def test_api_streaming(api_client, auth_headers):
+    """format=ndjson/csv 스트리밍 응답 - 커서 이후 행만 내보냄"""
+    response = api_client.get('/api/production?format=ndjson', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(records) == 23
+
+    first = api_client.get('/api/production?limit=5', headers=auth_headers).get_json()
+    response = api_client.get('/api/production', headers=auth_headers, query_string={
+        'format': 'csv', 'cursor': first['next_cursor']
+    })
+    assert response.mimetype == 'text/csv'
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0] == list(export.EXPORT_COLUMNS)
+    assert [int(row[0]) for row in rows[1:]] == [r['id'] for r in records[5:]]
+    print("✅ API 스트리밍 확인")
+
+
+def test_api_stream_disconnect_closes_cursor(api_client, auth_headers, monkeypatch):
+    """클라이언트가 중간에 끊으면 조회 커서를 닫고 연결을 풀에 반환"""
+    cursors = []
+    original_execute = database.PooledConnection.execute
+
+    def execute(conn, sql, *args):
+        cursor = original_execute(conn, sql, *args)
+        if sql.lstrip().startswith('SELECT id, lot_number'):
+            cursors.append(cursor)
+        return cursor
+
+    def is_closed(cursor):
+        try:
+            cursor.fetchone()
+        except sqlite3.ProgrammingError:
+            return True
+        return False
+
+    monkeypatch.setattr(database.PooledConnection, 'execute', execute)
+
+    response = api_client.get('/api/production?format=ndjson', headers=auth_headers, buffered=False)
+    assert next(response.response)
+    assert len(cursors) == 1 and not is_closed(cursors[0])
+    assert getattr(database._local, 'conn', None) is not None
+
+    response.close()
+    assert is_closed(cursors[0])
+    assert getattr(database._local, 'conn', None) is None
+    print("✅ 연결 종료 시 커서 정리 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,148 @@
+# File: /tests/test_production_ingest.py
+
+import pytest
+import sys
+import os
+import json
+sys.path.insert(0, os.path.abspath('.'))
+
+from marshmallow import ValidationError
+
+from core import database
+from modules.hr.models import ProductionSchema
+from modules.mes.ingest import (parse_body, validate_rows, ingest_production,
+                                RowValidator, IngestError)
+
+RAW_SUMMARY = """
+    SELECT work_date, process, COALESCE(worker_id, 0), COUNT(*),
+           SUM(plan_qty), SUM(prod_qty), SUM(defect_qty),
+           SUM(CASE WHEN prod_qty >= plan_qty THEN 1 ELSE 0 END)
+    FROM work_logs
+    GROUP BY work_date, process, COALESCE(worker_id, 0)
+    ORDER BY 1, 2, 3
+"""
+
+ROLLUP_SUMMARY = """
+    SELECT work_date, process, worker_id, log_count,
+           plan_qty, prod_qty, defect_qty, achieved_count
+    FROM work_log_daily_summary
+    ORDER BY 1, 2, 3
+"""
+
+
+def test_parse_formats():
+    """JSON 배열 / NDJSON / CSV 본문 파싱"""
+    record = {'lot_number': 'LOT-1', 'work_date': '2026-01-01', 'process': '조립',
+              'plan_qty': 10, 'prod_qty': 9}
+    assert parse_body(json.dumps([record]).encode(), 'application/json') == [record]
+
+    ndjson = json.dumps(record) + "\n\n{broken\n"
+    rows = parse_body(ndjson, 'application/x-ndjson; charset=utf-8')
+    assert rows[0] == record and len(rows) == 2
+
+    csv_body = "﻿lot_number,work_date,process,plan_qty,prod_qty,defect_qty\nLOT-1,2026-01-01,조립,10,9,\n"
+    assert parse_body(csv_body.encode('utf-8'), 'text/csv') == [
+        {'lot_number': 'LOT-1', 'work_date': '2026-01-01', 'process': '조립',
+         'plan_qty': '10', 'prod_qty': '9'}
+    ]
+
+    with pytest.raises(IngestError):
+        parse_body(b'{"lot_number": ', 'application/json')
+    print("✅ 본문 형식 파싱 확인")
+
+
+def test_fast_validator_matches_schema():
+    """빠른 검증기 결과와 오류가 ProductionSchema 와 동일"""
+    validator = RowValidator()
+    base = {'lot_number': 'LOT-1', 'work_date': '2026-01-01', 'process': '조립',
+            'plan_qty': 10, 'prod_qty': 9}
+    cases = [
+        base,
+        dict(base, plan_qty='10', worker_id=3),
+        dict(base, plan_qty=-1),
+        dict(base, prod_qty='9.5'),
+        dict(base, work_date='2026-02-30'),
+        dict(base, work_date='2026-1-5'),
+        dict(base, lot_number='L' * 51),
+        dict(base, defect_qty=None),
+        dict(base, extra=1),
+        {k: v for k, v in base.items() if k != 'process'},
+        ['not', 'a', 'record'],
+    ]
+    schema = ProductionSchema()
+    for case in cases:
+        try:
+            expected = schema.load(case)
+            expected = {k: v.isoformat() if k == 'work_date' else v for k, v in expected.items()}
+        except ValidationError as e:
+            with pytest.raises(ValidationError) as info:
+                validator.load(case)
+            assert info.value.messages == e.messages
+            continue
+        assert validator.load(case) == expected
+
+
+def test_bulk_ingest_rollup(temp_db):
+    """일괄 등록 - 행별 오류 보고, 집계 테이블 일치, 이후 단건 트리거 정상"""
+    with database.transaction() as conn:
+        conn.execute("""
+            INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty)
+            VALUES ('LOT-0', '2026-01-01', '조립', 7, 100, 100)
+        """)
+
+    body = "\n".join(json.dumps(r) for r in [
+        {'lot_number': 'LOT-1', 'work_date': '2026-01-01', 'process': '조립',
+         'plan_qty': 100, 'prod_qty': 90, 'defect_qty': 2},
+        {'lot_number': 'LOT-2', 'work_date': '2026-01-01', 'process': '조립',
+         'worker_id': 9, 'plan_qty': 50, 'prod_qty': 60},
+        {'lot_number': 'LOT-3', 'work_date': '2026-01-02', 'process': '가공',
+         'plan_qty': -5, 'prod_qty': 10},
+        {'lot_number': 'LOT-4', 'work_date': '2026-01-02', 'process': '가공',
+         'plan_qty': 0, 'prod_qty': 10},
+    ])
+    result = ingest_production(body, 'application/x-ndjson', worker_id=7)
+    assert result['inserted'] == 3
+    assert [e['row'] for e in result['errors']] == [3]
+    assert 'plan_qty' in result['errors'][0]['errors']
+
+    assert database.fetch_scalar("SELECT worker_id FROM work_logs WHERE lot_number = 'LOT-1'") == 7
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_log_bulk_load") == 0
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+
+    # 일괄 등록 후에도 단건 INSERT 는 트리거로 집계
+    with database.transaction() as conn:
+        conn.execute("""
+            INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty)
+            VALUES ('LOT-5', '2026-01-01', '조립', 7, 10, 10)
+        """)
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+
+    records, errors = validate_rows([{'lot_number': 'X'}])
+    assert records == [] and errors[0]['row'] == 1
+    print("✅ 일괄 등록 및 집계 확인")
+
+
+def test_batch_api(api_client, auth_headers):
+    """/api/production/batch - 전체 성공 201, 일부 오류 207, 전부 오류 400 (토큰 사용자로 등록)"""
+    rows = [{'lot_number': f'LOT-{i}', 'work_date': '2026-01-01', 'process': '조립',
+             'plan_qty': 10, 'prod_qty': 10} for i in range(3)]
+    response = api_client.post('/api/production/batch', headers=auth_headers, json=rows)
+    assert response.status_code == 201 and response.get_json()['inserted'] == 3
+
+    csv_body = "lot_number,work_date,process,plan_qty,prod_qty\nLOT-9,2026-01-02,가공,5,4\nLOT-X,bad,가공,5,4\n"
+    response = api_client.post('/api/production/batch', headers=auth_headers,
+                               data=csv_body.encode(), content_type='text/csv')
+    assert response.status_code == 207
+    assert [e['row'] for e in response.get_json()['errors']] == [2]
+
+    response = api_client.post('/api/production/batch', headers=auth_headers, json=[{'lot_number': 'X'}])
+    assert response.status_code == 400
+
+    admin_id = database.fetch_scalar("SELECT id FROM users WHERE username = 'admin'")
+    assert database.fetch_all("SELECT DISTINCT worker_id FROM work_logs") == [(admin_id,)]
+    assert database.fetch_all(ROLLUP_SUMMARY) == database.fetch_all(RAW_SUMMARY)
+    print("✅ 일괄 등록 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,117 @@
+# File: /tests/test_query_cache.py
+
+import pytest
+import sys
+import os
+import sqlite3
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.query_cache import query_cache, cached_all
+
+WORK_COUNT = "SELECT COUNT(*) FROM work_logs WHERE work_date = ?"
+USER_COUNT = "SELECT COUNT(*) FROM users"
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (캐시 비움) - 파일 경로 반환"""
+    query_cache.clear()
+    return str(temp_db / 'test.db')
+
+
+def add_work_log(conn):
+    conn.execute("""
+        INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty)
+        VALUES ('LOT-1', '2026-01-01', '조립', 10, 10)
+    """)
+
+
+def test_commit_invalidates_only_written_tables(temp_db):
+    """쓰기 커밋 시 해당 테이블을 읽는 캐시만 무효화"""
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(0,)]
+    assert cached_all(USER_COUNT) == [(0,)]
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(0,)]
+    assert query_cache.stats()['hits'] == 1
+
+    with database.transaction() as conn:
+        add_work_log(conn)
+        # 커밋 전 트랜잭션 안에서는 캐시를 사용하지 않음
+        assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(1,)]
+
+    hits = query_cache.stats()['hits']
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(1,)]
+    assert cached_all(USER_COUNT) == [(0,)]
+    assert query_cache.stats()['hits'] == hits + 1
+
+    # 트리거로 갱신되는 집계 테이블도 함께 무효화
+    summary = "SELECT COALESCE(SUM(log_count), 0) FROM work_log_daily_summary"
+    assert cached_all(summary) == [(1,)]
+    with database.transaction() as conn:
+        add_work_log(conn)
+    assert cached_all(summary) == [(2,)]
+    print("✅ 테이블별 무효화 확인")
+
+
+def test_named_params_key(temp_db):
+    """이름 파라미터는 값이 다르면 다른 캐시 항목"""
+    query = "SELECT COUNT(*) FROM work_logs WHERE work_date = :day"
+    with database.transaction() as conn:
+        add_work_log(conn)
+    assert cached_all(query, {'day': '2026-01-01'}) == [(1,)]
+    assert cached_all(query, {'day': '2026-01-02'}) == [(0,)]
+    assert cached_all(query, {'day': '2026-01-01'}) == [(1,)]
+    assert query_cache.stats()['hits'] == 1
+    print("✅ 이름 파라미터 캐시 키")
+
+
+def test_external_write_clears_cache(temp_db):
+    """풀 밖 연결(다른 프로세스 등)의 커밋도 감지"""
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(0,)]
+
+    conn = sqlite3.connect(temp_db)
+    add_work_log(conn)
+    conn.commit()
+    conn.close()
+
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(1,)]
+
+
+def test_external_write_then_local_commit(temp_db):
+    """외부 커밋 뒤 조회 없이 로컬 커밋이 이어져도 외부 쓰기를 놓치지 않음"""
+    config = "SELECT value FROM system_config WHERE key = 'cache_test'"
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO system_config (key, value) VALUES ('cache_test', 'a')")
+    assert cached_all(config) == [('a',)]
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute("UPDATE system_config SET value = 'EXTERNAL' WHERE key = 'cache_test'")
+    conn.commit()
+    conn.close()
+
+    # 다른 테이블 로컬 커밋 - 기준점을 옮기면서 외부 쓰기를 흡수하면 안 됨
+    with database.transaction() as conn:
+        add_work_log(conn)
+
+    assert cached_all(config) == [('EXTERNAL',)]
+    print("✅ 외부 쓰기 후 로컬 커밋")
+
+
+def test_temp_staging_table_does_not_clear_cache(temp_db):
+    """적재용 임시 테이블 DDL 은 스키마 변경으로 보지 않음 (관련 테이블만 무효화)"""
+    from modules.mes.ingest import insert_work_logs
+
+    assert cached_all(USER_COUNT) == [(0,)]
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(0,)]
+    hits = query_cache.stats()['hits']
+
+    insert_work_logs([('LOT-1', '2026-01-01', '조립', None, 10, 10, 0, None, None)])
+
+    assert cached_all(USER_COUNT) == [(0,)]
+    assert query_cache.stats()['hits'] == hits + 1
+    assert cached_all(WORK_COUNT, ('2026-01-01',)) == [(1,)]
+    print("✅ 임시 테이블 무효화 제외")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,145 @@
+# File: /tests/test_safety_stock.py
+
+import math
+import pytest
+import sys
+import os
+from datetime import date, timedelta
+from statistics import NormalDist
+sys.path.insert(0, os.path.abspath('.'))
+
+import numpy as np
+
+from core import database
+from modules.inventory.safety_stock import (propose_safety_stock, get_proposals, apply_proposals,
+                                            policy)
+from conftest import login
+
+AS_OF = '2024-06-30'
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정
+
+    ITEM001 매일 10개 출고, 입고 실적 리드타임 5/7/9일
+    ITEM002 격일 출고, 입고 실적 없음 (자동 발주 규칙 거래처 리드타임 10일)
+    ITEM003 출고 없음
+    """
+    end = date(2024, 6, 30)
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO item_master (item_code, item_name, safety_stock) VALUES (?, ?, ?)",
+            [('ITEM001', '볼트', 50), ('ITEM002', '너트', 0), ('ITEM003', '와셔', 5)]
+        )
+        conn.execute("INSERT INTO supplier_master (supplier_code, supplier_name, lead_time) "
+                     "VALUES ('SUP001', '한국부품', 10)")
+        conn.execute("INSERT INTO auto_po_rules (item_code, supplier_code, reorder_point, order_qty) "
+                     "VALUES ('ITEM002', 'SUP001', 0, 100)")
+        conn.executemany("""
+            INSERT INTO stock_movements (movement_date, movement_type, item_code, quantity)
+            VALUES (?, ?, ?, ?)
+        """, [((end - timedelta(days=i)).isoformat(), 'OUT_sales', 'ITEM001', -10) for i in range(180)]
+            + [((end - timedelta(days=i)).isoformat(), 'OUT_production', 'ITEM002', -4)
+               for i in range(0, 180, 2)]
+            + [(end.isoformat(), 'OUT_disposal', 'ITEM003', -3)])
+        for n, (ordered, received) in enumerate([('2024-03-01', '2024-03-06'),
+                                                 ('2024-04-01', '2024-04-08'),
+                                                 ('2024-05-01', '2024-05-10')]):
+            conn.execute("INSERT INTO purchase_orders (po_number, po_date, supplier_code) VALUES (?, ?, 'SUP002')",
+                         (f"PO{n}", ordered))
+            conn.execute("""
+                INSERT INTO receiving_inspection (receiving_date, po_number, item_code, received_qty, accepted_qty)
+                VALUES (?, ?, 'ITEM001', 100, 100)
+            """, (received, f"PO{n}"))
+    return temp_db
+
+
+def test_propose_from_demand_and_lead_times(temp_db):
+    """수요/리드타임 분포로 안전재고/발주점 제안"""
+    summary = propose_safety_stock(0.95, as_of=AS_OF)
+    assert summary['proposed'] == 2 and summary['items'] == 3
+
+    z = NormalDist().inv_cdf(0.95)
+    proposals = get_proposals().set_index('item_code')
+    assert 'ITEM003' not in proposals.index  # 폐기는 수요가 아님
+
+    # 일정한 수요 (σd = 0), 리드타임 평균 7 / 표준편차 2
+    row = proposals.loc['ITEM001']
+    assert row['lead_time_source'] == 'item'
+    assert (row['lead_time_mean'], row['lead_time_std']) == (7, 2)
+    assert row['safety_stock'] == math.ceil(z * 10 * 2)
+    assert row['reorder_point'] == math.ceil(10 * 7 + z * 10 * 2)
+
+    # 격일 4개 - 평균 2, 실적이 없어 거래처 기준 리드타임 10일 (σL = 0)
+    row = proposals.loc['ITEM002']
+    assert row['lead_time_source'] == 'master' and row['lead_time_mean'] == 10
+    std = np.std([4, 0] * 90, ddof=1)
+    assert row['safety_stock'] == math.ceil(z * math.sqrt(10) * std)
+
+    # 서비스 수준이 높을수록 안전재고 증가
+    propose_safety_stock(0.99, as_of=AS_OF)
+    assert get_proposals().set_index('item_code').loc['ITEM001', 'safety_stock'] > row['safety_stock']
+    print("✅ 안전재고 제안")
+
+
+def test_apply_proposals(temp_db):
+    """검토한 제안만 item_master / auto_po_rules 에 반영"""
+    propose_safety_stock(0.95, as_of=AS_OF)
+    proposals = get_proposals().set_index('item_code')
+
+    assert database.run_write(apply_proposals, ['ITEM002']) == 1
+    assert database.fetch_scalar("SELECT safety_stock FROM item_master WHERE item_code = 'ITEM002'") == \
+        proposals.loc['ITEM002', 'safety_stock']
+    assert database.fetch_scalar("SELECT reorder_point FROM auto_po_rules WHERE item_code = 'ITEM002'") == \
+        proposals.loc['ITEM002', 'reorder_point']
+    assert database.fetch_scalar("SELECT safety_stock FROM item_master WHERE item_code = 'ITEM001'") == 50
+    assert get_proposals()['item_code'].tolist() == ['ITEM001']
+    assert get_proposals('applied')['item_code'].tolist() == ['ITEM002']
+
+    # 재계산하면 적용한 품목도 다시 제안 상태가 됨
+    propose_safety_stock(0.95, as_of=AS_OF)
+    assert database.run_write(apply_proposals) == 2
+    assert get_proposals().empty
+
+    # 배열 계산은 품목별 공식과 같아야 함
+    safety, reorder = policy([0, 5, 2.5], [0, 1, 3], [7, 3, 12], [0, 0.5, 4], 0.9)
+    z = NormalDist().inv_cdf(0.9)
+    assert safety.tolist() == [0, math.ceil(z * math.sqrt(3 + 25 * 0.25)),
+                               math.ceil(z * math.sqrt(12 * 9 + 6.25 * 16))]
+    assert reorder.tolist()[0] == 0
+    with pytest.raises(ValueError):
+        policy([1], [1], [1], [1], 1.0)
+    print("✅ 제안 적용")
+
+
+def test_safety_stock_api(api_client, auth_headers):
+    """/api/inventory/safety-stock 계산/조회/적용 (계산·적용은 manager 이상)"""
+    user_headers = login(api_client, 'user', 'user123')
+    compute = {'action': 'compute', 'service_level': 0.95, 'as_of': AS_OF}
+    assert api_client.post('/api/inventory/safety-stock', headers=user_headers, json=compute).status_code == 403
+
+    response = api_client.post('/api/inventory/safety-stock', headers=auth_headers, json=compute)
+    assert response.status_code == 200
+    assert response.get_json()['proposed'] == 2
+
+    body = api_client.get('/api/inventory/safety-stock', headers=user_headers).get_json()
+    assert [row['item_code'] for row in body['data']] == ['ITEM001', 'ITEM002']
+    proposed = {row['item_code']: row['safety_stock'] for row in body['data']}
+
+    response = api_client.post('/api/inventory/safety-stock', headers=auth_headers,
+                               json={'action': 'apply', 'item_codes': ['ITEM002']})
+    assert response.status_code == 200 and response.get_json()['applied'] == 1
+    assert database.fetch_scalar("SELECT safety_stock FROM item_master WHERE item_code = 'ITEM002'") == \
+        proposed['ITEM002']
+    body = api_client.get('/api/inventory/safety-stock?status=applied', headers=auth_headers).get_json()
+    assert [row['item_code'] for row in body['data']] == ['ITEM002']
+
+    for bad in ({'action': 'apply', 'item_codes': 'ITEM001'}, {'action': 'delete'},
+                {'action': 'compute', 'service_level': 1.0}):
+        assert api_client.post('/api/inventory/safety-stock', headers=auth_headers, json=bad).status_code == 400
+    print("✅ 안전재고 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
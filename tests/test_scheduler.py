@@ -0,0 +1,152 @@
+# File: /tests/test_scheduler.py
+
+import pytest
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.mes import scheduler
+from conftest import login
+
+ORIGIN = datetime(2026, 3, 2, 8, 0)
+
+
+def _setup(orders):
+    scheduler.set_resource('CUT-1', '절단')
+    scheduler.set_resource('ASM-1', '조립', capacity=2)
+    scheduler.set_routing('P1', [('절단', 10, 1.0), ('조립', 0, 2.0)])
+    with database.transaction() as conn:
+        for order_no, qty, due_hours, priority in orders:
+            scheduler.create_work_order(
+                conn, order_no, 'P1', qty,
+                (ORIGIN + timedelta(hours=due_hours)).strftime(scheduler.TIME_FORMAT), priority=priority)
+
+
+def _operations():
+    return database.fetch_all("""
+        SELECT order_no, seq, resource_code, start_time, end_time, completed_qty, status
+        FROM work_order_operations ORDER BY order_no, seq
+    """)
+
+
+def test_schedule_capacity_and_routing(temp_db):
+    """라우팅 순서, 자원 능력(대수) 준수, 급한 주문 우선 배정"""
+    _setup([('WO-1', 60, 24, 5), ('WO-2', 30, 2, 1), ('WO-3', 30, 24, 5)])
+
+    result = scheduler.schedule_orders(ORIGIN, time_limit=0.1)
+    assert result['orders'] == 3 and result['operations'] == 6
+    assert result['changed_operations'] == 6 and result['tardy_orders'] == 0
+
+    ops = _operations()
+    by_order = {}
+    for order_no, seq, resource, start, end, _, _ in ops:
+        by_order.setdefault(order_no, []).append((start, end))
+    for steps in by_order.values():
+        # 다음 공정은 앞 공정이 끝난 뒤 시작
+        assert steps[0][1] <= steps[1][0]
+    # 절단기 1대 - 구간이 겹치지 않고, 납기가 급한 WO-2 가 먼저
+    cuts = sorted((start, end, order_no) for order_no, seq, res, start, end, _, _ in ops if res == 'CUT-1')
+    assert cuts[0][2] == 'WO-2' and cuts[0][0] == ORIGIN.strftime(scheduler.TIME_FORMAT)
+    assert all(a[1] <= b[0] for a, b in zip(cuts, cuts[1:]))
+
+    # 같은 조건으로 다시 계획하면 바뀌는 배정 없음
+    assert scheduler.schedule_orders(ORIGIN, time_limit=0)['changed_operations'] == 0
+
+    print("✅ 유한 능력 일정 계획")
+
+
+def test_shortfall_reschedules_remaining(temp_db):
+    """실적 부족 공정은 short 표시 후 남은 수량만 재배정"""
+    _setup([('WO-1', 60, 24, 5)])
+    scheduler.schedule_orders(ORIGIN, time_limit=0)
+
+    with database.transaction() as conn:
+        conn.execute("""
+            INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty)
+            VALUES ('WO-1', '2026-03-02', '절단', 60, 45, 5)
+        """)
+    now = ORIGIN + timedelta(hours=2)
+    assert scheduler.sync_progress(now) == 1
+
+    cut, assembly = _operations()
+    assert cut[5:] == (40, 'short')
+    # 남은 20개 x 1분 (준비 시간 제외), 조립은 그 뒤 60개 x 2분
+    assert cut[3] == now.strftime(scheduler.TIME_FORMAT)
+    assert cut[4] == (now + timedelta(minutes=20)).strftime(scheduler.TIME_FORMAT)
+    assert assembly[3] == cut[4]
+    assert database.fetch_scalar("SELECT status FROM work_orders WHERE order_no = 'WO-1'") == 'in_progress'
+
+    print("✅ 부족 실적 부분 재계획")
+
+
+def test_progress_sync_worker(temp_db):
+    """'mes' 이벤트는 백그라운드에서 모아 반영, 작업지시와 무관한 실적은 건너뜀"""
+    _setup([('WO-1', 60, 24, 5)])
+    scheduler.schedule_orders(ORIGIN, time_limit=0)
+
+    def log(lot, qty):
+        with database.transaction() as conn:
+            conn.execute("""
+                INSERT INTO work_logs (lot_number, work_date, process, plan_qty, prod_qty, defect_qty)
+                VALUES (?, '2026-03-02', '절단', ?, ?, 0)
+            """, (lot, qty, qty))
+
+    sync = scheduler.ProgressSync(debounce=0.05)
+    assert sync.check() == 0 and sync.stats['syncs'] == 1  # 처음은 전체 확인
+
+    # 작업지시가 없는 LOT 실적은 sync_progress 없이 건너뜀
+    log('LOT-X', 10)
+    assert sync.check() == 0 and sync.stats == {'checks': 2, 'syncs': 1}
+
+    # 발행한 스레드는 기다리지 않고, 연달아 온 이벤트는 한 번에 반영
+    sync.start()
+    try:
+        log('WO-1', 20)
+        for _ in range(5):
+            sync.on_event({'topics': ['mes']})
+        deadline = time.time() + 5
+        while sync.stats['syncs'] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)
+    finally:
+        sync.stop(timeout=5)
+
+    assert sync.stats['syncs'] == 2 and sync.stats['checks'] <= 4
+    cut, _ = _operations()
+    assert cut[5:] == (20, 'short')
+
+    print("✅ 실적 반영 백그라운드 작업자")
+
+
+def test_work_order_api(api_client, auth_headers):
+    """/api/work-orders 등록(일정 반영), /api/work-orders/schedule 조회/재계획"""
+    _setup([])
+    order = {'order_no': 'WO-1', 'product_code': 'P1', 'quantity': 30,
+             'due_date': (datetime.now() + timedelta(days=2)).strftime('%Y-%m-%d'), 'schedule': True}
+    response = api_client.post('/api/work-orders', headers=auth_headers, json=order)
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['operations'] == 2 and body['schedule']['orders'] == 1
+    assert api_client.post('/api/work-orders', headers=auth_headers, json=order).status_code == 409
+    response = api_client.post('/api/work-orders', headers=auth_headers,
+                               json=dict(order, order_no='WO-2', product_code='NO-ROUTING'))
+    assert response.status_code == 400
+
+    rows = api_client.get('/api/work-orders/schedule', headers=auth_headers).get_json()['data']
+    assert sorted((row['order_no'], row['resource_code']) for row in rows) == [('WO-1', 'ASM-1'), ('WO-1', 'CUT-1')]
+    rows = api_client.get('/api/work-orders/schedule?resource_code=ASM-1', headers=auth_headers).get_json()['data']
+    assert len(rows) == 1
+
+    # 전체 재계획은 manager 이상
+    user_headers = login(api_client, 'user', 'user123')
+    assert api_client.post('/api/work-orders/schedule', headers=user_headers, json={}).status_code == 403
+    response = api_client.post('/api/work-orders/schedule', headers=auth_headers, json={'time_limit': 0})
+    assert response.status_code == 200 and response.get_json()['changed_operations'] == 0
+    print("✅ 작업지시 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
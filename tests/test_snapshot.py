@@ -0,0 +1,74 @@
+# File: /tests/test_snapshot.py
+
+import pytest
+import sys
+import os
+import threading
+from datetime import date
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.snapshot import SnapshotService
+from core.dashboard import collect_dashboard_stats
+
+
+def test_snapshot_shared_between_sessions():
+    """동시 요청은 하나의 스냅샷을 공유"""
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'value': len(calls)}
+
+    service = SnapshotService('test', compute, interval=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.get())) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    service.stop()
+
+    assert len(calls) == 1
+    assert all(r == {'value': 1} for r in results)
+    print("✅ 스냅샷 공유 확인")
+
+
+def test_snapshot_keeps_last_value_on_error():
+    """계산 오류 시 이전 스냅샷 유지"""
+    state = {'fail': False}
+
+    def compute():
+        if state['fail']:
+            raise RuntimeError("db error")
+        return {'ok': True}
+
+    service = SnapshotService('test', compute, interval=60)
+    assert service.refresh() == {'ok': True}
+    state['fail'] = True
+    assert service.refresh() == {'ok': True}
+
+
+def test_dashboard_stats(temp_db):
+    """대시보드 집계 값 확인"""
+    today = date.today().isoformat()
+    with database.transaction() as conn:
+        conn.execute(
+            "INSERT INTO work_logs (lot_number, work_date, process, worker_id, plan_qty, prod_qty, defect_qty) "
+            "VALUES ('LOT-1', ?, '조립', 1, 100, 120, 0)", (today,)
+        )
+        conn.execute(
+            "INSERT INTO item_master (item_code, item_name, safety_stock, current_stock) "
+            "VALUES ('ITEM001', '볼트', 100, 10)"
+        )
+
+    stats = collect_dashboard_stats()
+    assert stats['today_production'] == 120
+    assert stats['low_stock'] == 1
+    assert stats['achieved'] == 1
+    assert len(stats['activities']) == 1
+    assert stats['pending_leaves'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
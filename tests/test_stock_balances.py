@@ -0,0 +1,165 @@
+# File: /tests/test_stock_balances.py
+
+import pytest
+import sys
+import os
+import sqlite3
+import threading
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.stock import (post_movement, post_stock, reconcile_stock_balances,
+                                     get_warehouse_totals, InsufficientStockError,
+                                     ItemNotFoundError)
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (품목 1개)"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('ITEM001', '볼트')")
+    return temp_db
+
+
+def test_post_movement_updates_balances(temp_db):
+    """입출고 시 창고 잔액과 현재고 동시 반영"""
+    with database.transaction(immediate=True) as conn:
+        post_movement(conn, '2026-01-01', 'IN_purchase', 'ITEM001', 100, 'wh1')
+        post_movement(conn, '2026-01-01', 'IN_purchase', 'ITEM001', 30, 'wh2')
+        post_movement(conn, '2026-01-02', 'OUT_production', 'ITEM001', -40, 'wh1', check_stock=True)
+
+    assert get_warehouse_totals() == [('wh1', 60), ('wh2', 30)]
+    assert database.fetch_scalar("SELECT current_stock FROM item_master") == 90
+
+    # 창고별 재고로 출고 가능 여부 판단
+    with pytest.raises(InsufficientStockError):
+        with database.transaction(immediate=True) as conn:
+            post_movement(conn, '2026-01-03', 'OUT_production', 'ITEM001', -50, 'wh2', check_stock=True)
+
+    assert database.fetch_scalar("SELECT COUNT(*) FROM stock_movements") == 3
+    assert reconcile_stock_balances() == []
+    print("✅ 창고별 잔액 반영 확인")
+
+
+def test_reconcile_detects_and_repairs(temp_db):
+    """원장과 다른 잔액 검출 및 재계산"""
+    with database.transaction() as conn:
+        post_movement(conn, '2026-01-01', 'IN_purchase', 'ITEM001', 100, 'wh1')
+        conn.execute("UPDATE stock_balances SET quantity = 70")
+
+    mismatches = reconcile_stock_balances()
+    assert {m['type'] for m in mismatches} == {'balance', 'item'}
+
+    reconcile_stock_balances(repair=True)
+    assert reconcile_stock_balances() == []
+    assert database.fetch_scalar("SELECT current_stock FROM item_master") == 100
+
+
+def test_opening_balance_migration(tmp_path):
+    """잔액 테이블 도입 전 현재고는 기초재고 이동으로 이관"""
+    database.configure({'path': str(tmp_path / 'legacy.db')})
+    try:
+        migrate(target=3)
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO item_master (item_code, item_name, current_stock) VALUES ('A', 'a', 50)")
+            conn.execute("""
+                INSERT INTO stock_movements (movement_date, movement_type, item_code, quantity, warehouse)
+                VALUES ('2026-01-01', 'IN_purchase', 'A', 20, 'wh2')
+            """)
+        migrate()
+
+        assert reconcile_stock_balances() == []
+        assert get_warehouse_totals() == [('wh1', 30), ('wh2', 20)]
+    finally:
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+def test_concurrent_postings_no_lost_updates(temp_db):
+    """여러 스레드의 동시 출고 - 재고만큼만 통과하고 잔액/현재고 누락 없음"""
+    post_stock('2026-01-01', 'IN_purchase', 'ITEM001', 100, 'wh1')
+    accepted, rejected = [], []
+
+    def worker():
+        for _ in range(25):
+            try:
+                accepted.append(post_stock('2026-01-02', 'OUT_production', 'ITEM001', -1,
+                                           'wh1', check_stock=True))
+            except InsufficientStockError:
+                rejected.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(accepted) == 100 and len(rejected) == 100
+    assert get_warehouse_totals() == [('wh1', 0)]
+    assert database.fetch_scalar("SELECT current_stock FROM item_master") == 0
+    assert reconcile_stock_balances() == []
+
+    # 없는 품목은 원장에도 남기지 않음
+    with pytest.raises(ItemNotFoundError):
+        post_stock('2026-01-03', 'IN_purchase', 'NOPE', 5)
+    assert database.fetch_scalar("SELECT COUNT(*) FROM stock_movements WHERE item_code = 'NOPE'") == 0
+    print("✅ 동시 출고 잔액 누락 없음")
+
+
+def test_run_write_retries_when_busy(tmp_path):
+    """다른 연결이 쓰기 잠금을 잡고 있으면 busy_timeout 후 재시도"""
+    path = str(tmp_path / 'busy.db')
+    database.configure({'path': path, 'pragmas': {'busy_timeout': 20}})
+    try:
+        migrate()
+        with database.transaction() as conn:
+            conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('ITEM001', '볼트')")
+
+        blocker = sqlite3.connect(path, check_same_thread=False)
+        blocker.execute("BEGIN IMMEDIATE")
+        timer = threading.Timer(0.2, blocker.commit)
+        timer.start()
+        movement_id = database.run_write(post_movement, '2026-01-01', 'IN_purchase',
+                                         'ITEM001', 10, retries=50)
+        timer.join()
+        blocker.close()
+
+        assert movement_id == database.fetch_scalar("SELECT MAX(id) FROM stock_movements")
+        assert database.fetch_scalar("SELECT current_stock FROM item_master") == 10
+    finally:
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+def test_stock_movement_api(api_client, auth_headers):
+    """/api/inventory/movements 동시 출고 - 재고만큼만 201, 나머지는 400"""
+    movement = {'movement_date': '2026-01-01', 'item_code': 'ITEM001', 'quantity': 10}
+    response = api_client.post('/api/inventory/movements', headers=auth_headers,
+                               json=dict(movement, movement_type='in', quantity=50))
+    assert response.status_code == 201
+
+    statuses = []
+
+    def ship():
+        response = api_client.post('/api/inventory/movements', headers=auth_headers,
+                                   json=dict(movement, movement_type='out'))
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=ship) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(statuses) == [201] * 5 + [400] * 3
+
+    response = api_client.post('/api/inventory/movements', headers=auth_headers,
+                               json=dict(movement, movement_type='in', item_code='NOPE'))
+    assert response.status_code == 404
+
+    items = api_client.get('/api/inventory', headers=auth_headers).get_json()['data']
+    assert [(item['item_code'], item['current_stock']) for item in items] == [('ITEM001', 0)]
+    assert api_client.get('/api/inventory?low_stock=false', headers=auth_headers).get_json()['total'] == 1
+    print("✅ 재고 이동 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,92 @@
+# File: /tests/test_stock_checkpoints.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from modules.inventory.stock import post_stock
+from modules.inventory.checkpoints import (balances_as_of, month_end_report, ensure_checkpoints,
+                                           period_ends)
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (1~3월 입출고)"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('ITEM001', '볼트')")
+        conn.execute("INSERT INTO item_master (item_code, item_name) VALUES ('ITEM002', '너트')")
+    post_stock('2024-01-10', 'IN_purchase', 'ITEM001', 100, 'wh1')
+    post_stock('2024-01-31', 'IN_purchase', 'ITEM002', 50, 'wh2')
+    post_stock('2024-02-15', 'OUT_production', 'ITEM001', -30, 'wh1')
+    post_stock('2024-03-05', 'IN_purchase', 'ITEM001', 10, 'wh2')
+    return temp_db
+
+
+def _quantities(df):
+    return {(r.item_code, r.warehouse): r.quantity for r in df.itertuples()}
+
+
+def test_balances_as_of_from_checkpoints(temp_db):
+    """월말 체크포인트 + 이후 이동으로 기준일 재고"""
+    assert period_ends('2024-01-10', '2024-03-31') == ['2024-01-31', '2024-02-29', '2024-03-31']
+    assert ensure_checkpoints('2024-03-31') == ['2024-01-31', '2024-02-29', '2024-03-31']
+    assert ensure_checkpoints('2024-03-31') == []
+
+    assert _quantities(balances_as_of('2024-01-09')) == {}
+    assert _quantities(balances_as_of('2024-02-20')) == {('ITEM001', 'wh1'): 70, ('ITEM002', 'wh2'): 50}
+    assert _quantities(balances_as_of('2024-03-31', 'ITEM001')) == {('ITEM001', 'wh1'): 70, ('ITEM001', 'wh2'): 10}
+    assert _quantities(balances_as_of('2024-03-31', warehouse='wh2')) == {('ITEM001', 'wh2'): 10, ('ITEM002', 'wh2'): 50}
+
+    report = month_end_report('2024-01', '2024-03', 'ITEM001')
+    assert report[['month', 'quantity']].values.tolist() == [['2024-01', 100], ['2024-02', 70], ['2024-03', 80]]
+    print("✅ 기준일 재고")
+
+
+def test_backdated_movement_updates_checkpoints(temp_db):
+    """체크포인트 이전 날짜로 소급된 이동/삭제는 이후 체크포인트에 바로 반영"""
+    ensure_checkpoints('2024-03-31')
+    post_stock('2024-01-20', 'OUT_production', 'ITEM001', -5, 'wh1')
+    post_stock('2024-02-01', 'IN_purchase', 'ITEM002', 7, 'wh1')
+
+    assert _quantities(balances_as_of('2024-01-31', 'ITEM001')) == {('ITEM001', 'wh1'): 95}
+    assert database.fetch_scalar("""
+        SELECT quantity FROM stock_checkpoints
+        WHERE checkpoint_date = '2024-03-31' AND item_code = 'ITEM002' AND warehouse = 'wh1'
+    """) == 7
+
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM stock_movements WHERE movement_date = '2024-02-15'")
+    assert _quantities(balances_as_of('2024-02-29', 'ITEM001')) == {('ITEM001', 'wh1'): 95}
+
+    # 체크포인트 결과는 원장 전체 합계와 같아야 함
+    ledger = database.fetch_all("""
+        SELECT item_code, warehouse, SUM(quantity) FROM stock_movements
+        WHERE movement_date <= '2024-03-31' GROUP BY 1, 2 HAVING SUM(quantity) != 0
+    """)
+    assert _quantities(balances_as_of('2024-03-31')) == {(i, w): q for i, w, q in ledger}
+    print("✅ 소급 이동 반영")
+
+
+def test_as_of_api(api_client, auth_headers):
+    """/api/inventory/as-of 기준일 재고와 월말 추이"""
+    body = api_client.get('/api/inventory/as-of?date=2024-02-20', headers=auth_headers).get_json()
+    assert {(r['item_code'], r['warehouse']): r['quantity'] for r in body['data']} == {
+        ('ITEM001', 'wh1'): 70, ('ITEM002', 'wh2'): 50}
+
+    body = api_client.get('/api/inventory/as-of', headers=auth_headers, query_string={
+        'date': '2024-03-31', 'item_code': 'ITEM001', 'warehouse': 'wh2'}).get_json()
+    assert [(r['item_code'], r['quantity']) for r in body['data']] == [('ITEM001', 10)]
+
+    body = api_client.get('/api/inventory/as-of', headers=auth_headers, query_string={
+        'date': '2024-03-15', 'month_end_from': '2024-01', 'item_code': 'ITEM001'}).get_json()
+    assert [(r['month'], r['quantity']) for r in body['data']] == [('2024-01', 100), ('2024-02', 70), ('2024-03', 80)]
+
+    assert api_client.get('/api/inventory/as-of?date=2024-13-01', headers=auth_headers).status_code == 400
+    assert api_client.get('/api/inventory/as-of', headers=auth_headers).status_code == 400
+    print("✅ 기준일 재고 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,48 @@
+# File: /tests/test_tables.py
+
+import pytest
+import sys
+import os
+import math
+sys.path.insert(0, os.path.abspath('.'))
+
+import pandas as pd
+
+from core import tables
+
+
+def test_derived_columns():
+    """달성률/불량률/합격률/재고 상태 벡터 계산"""
+    df = pd.DataFrame({
+        'plan_qty': [100, 0, 80, None],
+        'prod_qty': [95, 10, 100, 5],
+        'defect_qty': [2, 0, 3, 1],
+    })
+    assert tables.achievement_rate(df['plan_qty'], df['prod_qty']).tolist() == [95.0, 0.0, 100.0, 0.0]
+    assert tables.defect_rate(df['defect_qty'], df['prod_qty']).tolist() == [2.1, 0.0, 3.0, 20.0]
+
+    rates = tables.pass_rate([9, 0], [10, 0])
+    assert rates[0] == 90.0 and math.isnan(rates[1])
+
+    status = tables.stock_status([5, 50, 250], [10, 40, 100])
+    assert status.tolist() == ['부족', '정상', '과잉']
+    assert tables.badge_colors(status, tables.STOCK_STATUS_COLORS).tolist() == ['danger', 'success', 'warning']
+    print("✅ 파생 컬럼 확인")
+
+
+def test_render_table_cells():
+    """컬럼별 셀 목록으로 행 생성"""
+    table = tables.render_table(
+        ["코드", "수량", "비고"],
+        ['A', 'B'],
+        tables.number_cells([1200, None]),
+        tables.text_cells(['메모', None])
+    )
+    body = table.children[1].children
+    assert len(body) == 2
+    assert [td.children for td in body[1].children] == ['B', '-', '-']
+    assert body[0].children[1].children == '1,200'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
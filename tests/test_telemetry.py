@@ -0,0 +1,104 @@
+# File: /tests/test_telemetry.py
+
+import pytest
+import sys
+import os
+import time
+import socket
+from datetime import datetime
+sys.path.insert(0, os.path.abspath('.'))
+
+import numpy as np
+
+from core import database
+from modules.mes import telemetry
+from modules.mes.gateway import TelemetryGateway
+
+# 2026-01-01 00:00 UTC (분/시 경계)
+BASE = 1767225600
+
+
+def test_chunks_rollups_and_feed(temp_db):
+    """블록 저장, 1분/1시간 집계, 계수기 리셋, MES 실적 반영"""
+    telemetry.register_tag('M1.count', 'counter', 'LINE-01', '조립')
+    store = telemetry.TelemetryStore(max_chunk_points=50)
+
+    # 0~89초 계수기 0..89, 90초에 리셋 후 0..29 (순서 섞어서 수집)
+    counts = [(BASE + i, float(i)) for i in range(90)] + [(BASE + 90 + i, float(i)) for i in range(30)]
+    store.append_many([('M1.count', v, ts) for ts, v in reversed(counts)])
+    store.ingest_lines("M1.temp 20.5 %d\nM1.temp 21.5 %d\nbad line here x\n" % (BASE, BASE + 30))
+    assert store.flush() == 122 and store.pending == 0
+    assert store.stats['rejected'] == 1
+
+    raw = telemetry.get_series('M1.count', BASE, BASE + 200)
+    assert np.array_equal(raw['value'].to_numpy(), [v for _, v in counts])
+    assert database.fetch_scalar("SELECT COUNT(*) FROM telemetry_chunks WHERE tag = 'M1.count'") == 3
+
+    minutes = telemetry.get_series('M1.count', BASE, BASE + 200, resolution=60)
+    assert minutes['delta'].tolist() == [59.0, 30.0 + 29.0]
+    hours = telemetry.get_series('M1.temp', BASE, BASE + 3600, resolution=3600)
+    assert hours[['count', 'avg', 'min', 'max', 'last']].values.tolist() == [[2, 21.0, 20.5, 21.5, 21.5]]
+
+    # 다음 플러시는 저장된 마지막 값에서 이어서 증가량 계산
+    store.append('M1.count', 35.0, BASE + 125)
+    store.flush()
+
+    assert telemetry.feed_production(until=BASE + 7200) == 1
+    assert telemetry.feed_production(until=BASE + 7200) == 0
+    started = datetime.fromtimestamp(BASE)
+    row = database.fetch_one("SELECT work_date, process, plan_qty, prod_qty, line_code FROM work_logs")
+    assert tuple(row) == (started.strftime('%Y-%m-%d'), '조립', None, 59 + 59 + 6, 'LINE-01')
+    assert database.fetch_scalar("SELECT SUM(prod_qty) FROM oee_shift_summary") == 124
+
+    print("✅ 텔레메트리 블록/집계/MES 반영")
+
+
+def test_gateway_tcp_udp(temp_db):
+    """TCP/UDP 수신 후 종료 시 플러시"""
+    gateway = TelemetryGateway(host='127.0.0.1', tcp_port=0, udp_port=0, flush_interval=3600)
+    gateway.start()
+    try:
+        with socket.create_connection(gateway.addresses['tcp']) as tcp:
+            tcp.sendall(b"".join(b"P1.press %d %d\n" % (i, BASE + i) for i in range(500)))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+            udp.sendto(b"P1.temp 40 %d\nP1.temp 41 %d" % (BASE, BASE + 1), gateway.addresses['udp'])
+        for _ in range(200):
+            if gateway.store.stats['received'] == 502:
+                break
+            time.sleep(0.01)
+    finally:
+        gateway.stop()
+
+    assert len(telemetry.get_series('P1.press', BASE, BASE + 1000)) == 500
+    assert len(telemetry.get_series('P1.temp', BASE, BASE + 1000)) == 2
+
+    print("✅ 텔레메트리 게이트웨이 수신")
+
+
+def test_series_api(api_client, auth_headers):
+    """/api/telemetry/<tag> 원본/1분 집계 조회"""
+    store = telemetry.TelemetryStore()
+    store.append_many([('M1.temp', 20.0 + i, BASE + i * 30) for i in range(4)])
+    store.flush()
+
+    window = {'start': datetime.fromtimestamp(BASE).isoformat(),
+              'end': datetime.fromtimestamp(BASE + 120).isoformat()}
+    body = api_client.get('/api/telemetry/M1.temp', headers=auth_headers,
+                          query_string=dict(window, resolution='raw')).get_json()
+    assert [row['value'] for row in body['data']] == [20.0, 21.0, 22.0, 23.0]
+    assert body['data'][0]['ts'] == window['start']
+
+    body = api_client.get('/api/telemetry/M1.temp', headers=auth_headers, query_string=window).get_json()
+    assert body['resolution'] == '1m'
+    assert [(row['count'], row['avg']) for row in body['data']] == [(2, 20.5), (2, 22.5)]
+
+    response = api_client.get('/api/telemetry/M1.temp', headers=auth_headers,
+                              query_string=dict(window, resolution='5m'))
+    assert response.status_code == 400
+    response = api_client.get('/api/telemetry/M1.temp?start=yesterday', headers=auth_headers)
+    assert response.status_code == 400
+    print("✅ 텔레메트리 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,101 @@
+# File: /tests/test_valuation.py
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database
+from core.migrations import migrate
+from modules.inventory.stock import post_stock
+from modules.inventory.valuation import get_valuation, get_total_value, check_valuation
+
+
+@pytest.fixture
+def temp_db(temp_db):
+    """임시 데이터베이스 설정 (기준 단가 100 품목 1개)"""
+    with database.transaction() as conn:
+        conn.execute("INSERT INTO item_master (item_code, item_name, unit_price) VALUES ('ITEM001', '볼트', 100)")
+    return temp_db
+
+
+def _valuation(method):
+    return get_valuation(method).set_index('item_code').loc['ITEM001']
+
+
+def test_moving_average_and_fifo_layers(temp_db):
+    """입고 단가별 이동평균 / 선입선출 평가액 증분 갱신"""
+    post_stock('2026-01-01', 'IN_purchase', 'ITEM001', 10, unit_cost=100)
+    post_stock('2026-01-02', 'IN_purchase', 'ITEM001', 10, 'wh2', unit_cost=130)
+    post_stock('2026-01-03', 'OUT_production', 'ITEM001', -15, check_stock=False)
+
+    # 이동평균 115 x 5 / FIFO 는 100원 층 소진, 130원 층 5개 남음
+    assert _valuation('moving_avg')['stock_value'] == pytest.approx(575)
+    assert _valuation('fifo')['stock_value'] == pytest.approx(650)
+    assert _valuation('fifo')['unit_cost'] == pytest.approx(130)
+    assert database.fetch_scalar(
+        "SELECT unit_cost FROM stock_movements WHERE movement_type = 'OUT_production'") == pytest.approx(115)
+
+    # 단가 없는 입고는 현재 이동평균 단가
+    post_stock('2026-01-04', 'IN_return', 'ITEM001', 5)
+    assert _valuation('moving_avg')['unit_cost'] == pytest.approx(115)
+    assert get_total_value('fifo') == pytest.approx(650 + 575)
+    assert check_valuation() == []
+    print("✅ 이동평균/FIFO 평가")
+
+
+def test_negative_stock_and_opening_layer(tmp_path):
+    """도입 전 현재고는 기준 단가 기초층, 재고보다 많은 출고는 부족분 층"""
+    database.configure({'path': str(tmp_path / 'legacy.db')})
+    try:
+        migrate(target=13)
+        with database.transaction() as conn:
+            conn.execute("""
+                INSERT INTO item_master (item_code, item_name, current_stock, unit_price)
+                VALUES ('A', 'a', 4, 50)
+            """)
+            conn.execute("""
+                INSERT INTO stock_balances (item_code, warehouse, quantity) VALUES ('A', 'wh1', 4)
+            """)
+        migrate()
+        assert get_total_value('fifo') == pytest.approx(200)
+
+        post_stock('2026-01-01', 'OUT_production', 'A', -6)
+        assert get_valuation('fifo').loc[0, 'quantity'] == -2
+        assert get_total_value('fifo') == pytest.approx(-100)
+        assert check_valuation() == []
+
+        # 다음 입고가 부족분을 먼저 채우고 나머지만 새 원가층
+        post_stock('2026-01-02', 'IN_purchase', 'A', 5, unit_cost=80)
+        assert get_total_value('fifo') == pytest.approx(240)
+        assert get_total_value('moving_avg') == pytest.approx(240)
+        assert database.fetch_scalar(
+            "SELECT COUNT(*) FROM stock_cost_layers WHERE remaining != 0") == 1
+        assert check_valuation() == []
+    finally:
+        database.configure({'path': database.DEFAULT_DB_PATH})
+
+
+def test_valuation_api(api_client, auth_headers):
+    """/api/inventory/movements 단가 입고 후 /api/inventory/valuation 평가액"""
+    movement = {'movement_date': '2026-01-01', 'item_code': 'ITEM001'}
+    for extra in ({'movement_type': 'in', 'quantity': 10, 'unit_cost': 100},
+                  {'movement_type': 'in', 'quantity': 10, 'unit_cost': 130},
+                  {'movement_type': 'out', 'quantity': 15}):
+        response = api_client.post('/api/inventory/movements', headers=auth_headers, json=dict(movement, **extra))
+        assert response.status_code == 201
+    response = api_client.post('/api/inventory/movements', headers=auth_headers, json=dict(
+        movement, movement_type='in', quantity=1, unit_cost=-1))
+    assert response.status_code == 400
+
+    for method, value in (('moving_avg', 575), ('fifo', 650)):
+        body = api_client.get(f'/api/inventory/valuation?method={method}', headers=auth_headers).get_json()
+        assert body['method'] == method
+        assert body['total_value'] == pytest.approx(value)
+        assert body['data'][0]['item_code'] == 'ITEM001'
+    assert api_client.get('/api/inventory/valuation?method=lifo', headers=auth_headers).status_code == 400
+    print("✅ 재고 평가 API 확인")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
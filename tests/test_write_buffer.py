@@ -0,0 +1,186 @@
+# File: /tests/test_write_buffer.py
+
+import pytest
+import sys
+import os
+import time
+import sqlite3
+import threading
+import subprocess
+sys.path.insert(0, os.path.abspath('.'))
+
+from core import database, write_buffer
+from core.write_buffer import WriteBuffer, COMMITTED, FAILED
+from modules.inventory.stock import InsufficientStockError
+import modules.mes.ingest  # 'mes.work_log' 작업 등록
+
+
+def work_log(lot, qty=10):
+    return {'lot_number': lot, 'work_date': '2026-03-02', 'process': '조립',
+            'worker_id': 1, 'plan_qty': qty, 'prod_qty': qty, 'defect_qty': 0}
+
+
+def test_group_commit_and_failed_entry(temp_db):
+    """동시 접수는 묶음으로 커밋되고, 실패한 작업만 되돌려진다"""
+    buffer = WriteBuffer(journal=str(temp_db / 'buffer.journal'))
+    buffer.start()
+    try:
+        tickets = []
+
+        def terminal(n):
+            for i in range(20):
+                tickets.append(buffer.submit('mes.work_log', work_log(f"LOT-{n}-{i}")))
+
+        threads = [threading.Thread(target=terminal, args=(n,)) for n in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 재고 없는 출고는 실패 - 앞뒤 작업은 커밋
+        out = buffer.submit('inventory.post_movement', '2026-03-02', 'OUT_test', 'RM001', -5,
+                            'wh1', None, True)
+        after = buffer.submit('mes.work_log', work_log('LOT-after'))
+        assert buffer.flush(timeout=10)
+    finally:
+        buffer.stop()
+
+    assert all(t.wait(0) == COMMITTED for t in tickets + [after])
+    assert out.status == FAILED and isinstance(out.error, InsufficientStockError)
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_logs") == 201
+    assert database.fetch_scalar("SELECT COUNT(*) FROM stock_movements") == 0
+    assert database.fetch_scalar("SELECT SUM(log_count) FROM work_log_daily_summary") == 201
+    assert buffer.stats['committed'] == 201 and buffer.stats['failed'] == 1
+    assert buffer.stats['batches'] < 202
+
+    print(f"✅ 그룹 커밋: 202건 / {buffer.stats['batches']}회 커밋")
+
+
+def test_journal_fsync_before_ack(temp_db, monkeypatch):
+    """접수 응답 전에 저널이 fsync 되고, 동시 접수는 fsync 를 함께 쓴다"""
+    synced = []
+    real_fsync = os.fsync
+
+    def slow_fsync(fd):
+        time.sleep(0.02)
+        real_fsync(fd)
+        synced.append(fd)
+
+    buffer = WriteBuffer(journal=str(temp_db / 'buffer.journal'))
+    buffer.start()
+    monkeypatch.setattr(write_buffer.os, 'fsync', slow_fsync)
+    try:
+        late = []
+
+        def terminal(n):
+            for i in range(5):
+                ticket = buffer.submit('mes.work_log', work_log(f"LOT-{n}-{i}"))
+                if buffer._synced < ticket.seq:
+                    late.append(ticket.seq)
+
+        threads = [threading.Thread(target=terminal, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert buffer.flush(timeout=10)
+    finally:
+        buffer.stop()
+
+    assert late == []
+    assert 0 < len(synced) < 40
+    print(f"✅ 저널 fsync: 40건 / {len(synced)}회")
+
+
+def test_busy_commit_backs_off(temp_db, monkeypatch):
+    """쓰기 잠금 경합 시 대기 후 재시도"""
+    real_transaction = write_buffer.transaction
+    busy = [2]
+    delays = []
+
+    def contended(immediate=False):
+        if immediate and busy[0]:
+            busy[0] -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return real_transaction(immediate)
+
+    monkeypatch.setattr(write_buffer, 'transaction', contended)
+    monkeypatch.setattr(write_buffer, 'busy_backoff', delays.append)
+    buffer = WriteBuffer()
+    buffer.start()
+    try:
+        ticket = buffer.submit('mes.work_log', work_log('LOT-busy'))
+        assert ticket.wait(10) == COMMITTED
+    finally:
+        buffer.stop()
+    assert delays == [0, 1]
+    print("✅ 잠금 경합 백오프")
+
+
+def test_journal_recovery(temp_db):
+    """커밋되지 않은 저널 항목만 재시작 시 다시 적용된다"""
+    journal = str(temp_db / 'buffer.journal')
+    buffer = WriteBuffer(journal=journal)
+    buffer.start()
+    buffer.submit('mes.work_log', work_log('LOT-1')).wait(10)
+    buffer.stop()
+
+    # 접수 후 커밋 전에 종료된 작업 (마지막 줄은 기록 도중 종료)
+    with open(journal, 'a', encoding='utf-8') as f:
+        f.write('2\t["mes.work_log", [{"lot_number": "LOT-2", "work_date": "2026-03-02", '
+                '"process": "조립", "plan_qty": 5, "prod_qty": 5, "defect_qty": 0}]]\n')
+        f.write('3\t["mes.work_lo')
+
+    buffer = WriteBuffer(journal=journal)
+    buffer.start()
+    assert buffer.flush(timeout=10)
+    ticket = buffer.submit('mes.work_log', work_log('LOT-3'))
+    assert ticket.wait(10) == COMMITTED and ticket.seq == 3
+    buffer.stop()
+
+    lots = [r[0] for r in database.fetch_all("SELECT lot_number FROM work_logs ORDER BY id")]
+    assert lots == ['LOT-1', 'LOT-2', 'LOT-3']
+    assert database.fetch_scalar("SELECT last_seq FROM write_buffer_state") == 3
+
+    # 버퍼를 사용하지 않으면 바로 실행
+    assert write_buffer.get_write_buffer() is None
+    assert write_buffer.execute('mes.work_log', work_log('LOT-4')).status == COMMITTED
+
+    print("✅ 저널 복구")
+
+
+def test_mes_screen_registers_work_log(temp_db):
+    """MES 화면 모듈만 불러와도 'mes.work_log' 가 등록되어 저장된다
+
+    이 테스트 파일은 ingest 를 직접 불러오므로 새 인터프리터에서 확인
+    """
+    script = f"""
+from core import database, write_buffer
+database.configure({{'path': {str(temp_db / 'test.db')!r}}})
+import modules.mes.callbacks
+ticket = write_buffer.execute('mes.work_log', {work_log('LOT-screen')!r})
+print(ticket.status, ticket.error)
+"""
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.abspath('.'), timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == 'committed None'
+    assert database.fetch_scalar("SELECT lot_number FROM work_logs") == 'LOT-screen'
+    print("✅ 화면 모듈 작업 등록")
+
+
+def test_recovery_refuses_unregistered_operation(temp_db):
+    """등록되지 않은 작업이 저널에 남아 있으면 위치를 넘기지 않고 시작 실패"""
+    journal = str(temp_db / 'buffer.journal')
+    with open(journal, 'w', encoding='utf-8') as f:
+        f.write('1\t["unknown.op", []]\n')
+    buffer = WriteBuffer(journal=journal)
+    with pytest.raises(RuntimeError):
+        buffer.start()
+    assert not buffer.running
+    assert database.fetch_scalar("SELECT COUNT(*) FROM write_buffer_state") == 0
+    print("✅ 미등록 작업 복구 거부")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])